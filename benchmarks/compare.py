@@ -0,0 +1,81 @@
+# benchmarks/compare.py
+"""Compare two benchmark result files and flag regressions.
+
+Usage::
+
+    python -m benchmarks.compare BASELINE.json CURRENT.json [--stat median] [--threshold 0.10]
+
+Benchmarks are matched by their full pytest node id. The exit status is 1 if
+any benchmark got slower than ``threshold`` (a fraction, 0.10 = 10%) on the
+chosen statistic, so the command can gate an upgrade in CI.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+STATISTICS = ("min", "median", "mean")
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """Load a results file and index its benchmarks by full name."""
+    with open(path, encoding="utf-8") as handle:
+        document = json.load(handle)
+    return {benchmark["fullname"]: benchmark for benchmark in document.get("benchmarks", [])}
+
+
+def compare(baseline: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]],
+            stat: str = "median") -> List[Tuple[str, Optional[float], Optional[float], Optional[float]]]:
+    """Pair up benchmarks and compute the relative change of ``stat``.
+
+    Returns:
+        List of ``(fullname, baseline_value, current_value, change)`` tuples,
+        where ``change`` is ``current / baseline - 1`` and is None when the
+        benchmark exists on one side only.
+    """
+    rows = []
+    for name in sorted(set(baseline) | set(current)):
+        old = baseline[name]["stats"][stat] if name in baseline else None
+        new = current[name]["stats"][stat] if name in current else None
+        change = new / old - 1 if old and new is not None else None
+        rows.append((name, old, new, change))
+    return rows
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("baseline", help="Results JSON of the reference run.")
+    parser.add_argument("current", help="Results JSON of the run to check.")
+    parser.add_argument("--stat", choices=STATISTICS, default="median", help="Statistic to compare (default median).")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed slowdown as a fraction (default 0.10).")
+    args = parser.parse_args(argv)
+
+    rows = compare(load_results(args.baseline), load_results(args.current), args.stat)
+    regressions = [row for row in rows if row[3] is not None and row[3] > args.threshold]
+
+    width = max((len(row[0]) for row in rows), default=4)
+    print(f"{'benchmark':<{width}}  {'baseline':>10}  {'current':>10}  {'change':>8}")
+    for name, old, new, change in rows:
+        marker = "  REGRESSION" if change is not None and change > args.threshold else ""
+        change_text = f"{change:+.1%}" if change is not None else "-"
+        print(f"{name:<{width}}  {_format_time(old):>10}  {_format_time(new):>10}  {change_text:>8}{marker}")
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than {args.threshold:.0%} on {args.stat}.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+# benchmarks/conftest.py
+"""Benchmark harness for the ORM hot paths.
+
+Provides a ``benchmark`` fixture whose calling conventions follow
+pytest-benchmark (``benchmark(fn, *args)`` and ``benchmark.pedantic(...)``),
+so that the suite runs with nothing but pytest installed. Results are printed
+at the end of the session and, with ``--bench-json PATH``, written as JSON that
+``python -m benchmarks.compare`` can diff across commits.
+
+Benchmarks that take the ``sqlite_database`` fixture run once per database
+kind selected with ``--bench-db`` (``memory``, ``file``, or both).
+"""
+
+import datetime
+import json
+import logging
+import math
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+from rhosocial.activerecord.logging import configure_logging
+
+from .compare import _format_time
+from .models import configure_models
+
+RESULT_FORMAT_VERSION = 1
+DATABASE_KINDS = ("memory", "file")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-json", metavar="PATH", default=None,
+                    help="Write benchmark results as JSON to PATH.")
+    group.addoption("--bench-db", default=",".join(DATABASE_KINDS),
+                    help="Comma-separated SQLite database kinds to run against: memory, file.")
+    group.addoption("--bench-max-time", type=float, default=1.0,
+                    help="Approximate seconds spent measuring each benchmark (default 1.0).")
+    group.addoption("--bench-min-rounds", type=int, default=5,
+                    help="Minimum number of measured rounds per benchmark (default 5).")
+    group.addoption("--bench-log-level", default="WARNING",
+                    help="ActiveRecord log level while benchmarking (default WARNING).")
+
+
+def pytest_configure(config):
+    level = config.getoption("--bench-log-level")
+    configure_logging(level=getattr(logging, str(level).upper()))
+    config._bench_results = []
+
+
+def pytest_generate_tests(metafunc):
+    if "sqlite_database" in metafunc.fixturenames:
+        kinds = [kind.strip() for kind in metafunc.config.getoption("--bench-db").split(",") if kind.strip()]
+        unknown = set(kinds) - set(DATABASE_KINDS)
+        if unknown:
+            raise pytest.UsageError(f"--bench-db: unknown database kind(s): {', '.join(sorted(unknown))}")
+        metafunc.parametrize("sqlite_database", kinds, indirect=True)
+
+
+@pytest.fixture
+def sqlite_database(request, tmp_path) -> str:
+    """The SQLite database to benchmark against: ``:memory:`` or a file path."""
+    if request.param == "memory":
+        return ":memory:"
+    return str(tmp_path / "bench.sqlite")
+
+
+@pytest.fixture
+def bench_backend(sqlite_database):
+    """The benchmark models bound to an empty ``sqlite_database``."""
+    backend = configure_models(sqlite_database)
+    yield backend
+    backend.disconnect()
+
+
+class BenchmarkFixture:
+    """Times a callable and records its statistics.
+
+    Calibration picks the number of iterations per round so that one round
+    lasts at least ``MIN_ROUND_TIME``, and the number of rounds so that the
+    benchmark takes about ``max_time`` seconds (never fewer than
+    ``min_rounds``). Statistics are per call, in seconds.
+    """
+
+    MIN_ROUND_TIME = 0.001
+    MAX_ROUNDS = 10000
+
+    def __init__(self, node, max_time: float, min_rounds: int):
+        self._node = node
+        self._max_time = max_time
+        self._min_rounds = min_rounds
+        self.group: Optional[str] = None
+        self.extra_info: Dict[str, Any] = {}
+        self.stats: Optional[Dict[str, float]] = None
+
+    def __call__(self, fn: Callable, *args, **kwargs) -> Any:
+        timer = time.perf_counter
+        start = timer()
+        result = fn(*args, **kwargs)
+        duration = max(timer() - start, 1e-9)
+
+        iterations = max(1, int(math.ceil(self.MIN_ROUND_TIME / duration)))
+        round_time = duration * iterations
+        rounds = max(self._min_rounds, min(self.MAX_ROUNDS, int(self._max_time / round_time)))
+
+        timings = []
+        for _ in range(rounds):
+            start = timer()
+            for _ in range(iterations):
+                result = fn(*args, **kwargs)
+            timings.append((timer() - start) / iterations)
+        self._record(timings, iterations)
+        return result
+
+    def pedantic(self, fn: Callable, args: tuple = (), kwargs: Optional[Dict[str, Any]] = None,
+                 setup: Optional[Callable[[], Any]] = None, rounds: int = 1, iterations: int = 1,
+                 warmup_rounds: int = 0) -> Any:
+        """Run ``fn`` for an exact number of rounds.
+
+        Args:
+            fn: The callable to time.
+            args: Positional arguments for ``fn``.
+            kwargs: Keyword arguments for ``fn``.
+            setup: Called before every round, untimed. If it returns a value,
+                that value is used as ``(args, kwargs)`` for the round.
+            rounds: Number of measured rounds.
+            iterations: Calls per round; must be 1 when ``setup`` is given.
+            warmup_rounds: Unmeasured rounds run first.
+
+        Returns:
+            The result of the last call.
+        """
+        if setup is not None and iterations != 1:
+            raise ValueError("pedantic(): setup requires iterations=1")
+        kwargs = kwargs or {}
+        timer = time.perf_counter
+        result = None
+        timings = []
+        for round_index in range(warmup_rounds + rounds):
+            call_args, call_kwargs = args, kwargs
+            if setup is not None:
+                prepared = setup()
+                if prepared is not None:
+                    call_args, call_kwargs = prepared
+            start = timer()
+            for _ in range(iterations):
+                result = fn(*call_args, **call_kwargs)
+            if round_index >= warmup_rounds:
+                timings.append((timer() - start) / iterations)
+        self._record(timings, iterations)
+        return result
+
+    def _record(self, timings: List[float], iterations: int) -> None:
+        if self.stats is not None:
+            raise RuntimeError("benchmark fixture can only be used once per test")
+        mean = statistics.fmean(timings)
+        self.stats = {
+            "min": min(timings),
+            "max": max(timings),
+            "mean": mean,
+            "median": statistics.median(timings),
+            "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            "rounds": len(timings),
+            "iterations": iterations,
+            "ops": 1.0 / mean if mean > 0 else 0.0,
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        callspec = getattr(self._node, "callspec", None)
+        return {
+            "name": self._node.name,
+            "fullname": self._node.nodeid,
+            "group": self.group or self._node.module.__name__.rsplit(".", 1)[-1],
+            "params": {key: str(value) for key, value in callspec.params.items()} if callspec else {},
+            "stats": self.stats,
+            "extra_info": self.extra_info,
+        }
+
+
+@pytest.fixture
+def benchmark(request):
+    """Time a callable: ``benchmark(fn, *args)`` or ``benchmark.pedantic(fn, ...)``."""
+    config = request.config
+    fixture = BenchmarkFixture(
+        request.node,
+        max_time=config.getoption("--bench-max-time"),
+        min_rounds=config.getoption("--bench-min-rounds"),
+    )
+    yield fixture
+    if fixture.stats is not None:
+        config._bench_results.append(fixture.as_dict())
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _commit_info() -> Dict[str, Any]:
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "id": _git("rev-parse", "HEAD"),
+        "branch": _git("rev-parse", "--abbrev-ref", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+    }
+
+
+def _machine_info() -> Dict[str, Any]:
+    return {
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "sqlite_version": sqlite3.sqlite_version,
+    }
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    results = getattr(config, "_bench_results", [])
+    if not results:
+        return
+    terminalreporter.section("benchmark results (per call)")
+    width = max(len(result["name"]) for result in results)
+    terminalreporter.write_line(f"{'name':<{width}}  {'min':>10}  {'median':>10}  {'mean':>10}  {'ops/s':>12}  rounds")
+    for result in sorted(results, key=lambda item: (item["group"], item["name"])):
+        stats = result["stats"]
+        terminalreporter.write_line(
+            f"{result['name']:<{width}}  {_format_time(stats['min']):>10}  {_format_time(stats['median']):>10}  "
+            f"{_format_time(stats['mean']):>10}  {stats['ops']:>12.1f}  {stats['rounds']}"
+        )
+
+    path = config.getoption("--bench-json")
+    if path:
+        document = {
+            "version": RESULT_FORMAT_VERSION,
+            "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "machine_info": _machine_info(),
+            "commit_info": _commit_info(),
+            "argv": sys.argv[1:],
+            "benchmarks": results,
+        }
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+        terminalreporter.write_line(f"benchmark results written to {path}")
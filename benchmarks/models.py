@@ -0,0 +1,127 @@
+# benchmarks/models.py
+"""Models and schema shared by the benchmarks."""
+
+import json
+from typing import Any, ClassVar, Dict, Optional
+
+from typing_extensions import Annotated
+
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteBackend
+from rhosocial.activerecord.backend.impl.sqlite.adapters import SQLiteJSONAdapter
+from rhosocial.activerecord.backend.impl.sqlite.config import SQLiteConnectionConfig
+from rhosocial.activerecord.base.field_proxy import FieldProxy
+from rhosocial.activerecord.base.fields import UseAdapter
+from rhosocial.activerecord.field import IntegerPKMixin, TimestampMixin
+from rhosocial.activerecord.model import ActiveRecord
+from rhosocial.activerecord.relation import BelongsTo, HasMany
+
+SCHEMA = (
+    "CREATE TABLE bench_users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT NOT NULL, "
+    "email TEXT NOT NULL, age INTEGER, balance REAL NOT NULL DEFAULT 0, is_active INTEGER NOT NULL DEFAULT 1, "
+    "created_at TEXT, updated_at TEXT)",
+    "CREATE TABLE bench_posts (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL, "
+    "title TEXT NOT NULL, body TEXT NOT NULL, views INTEGER NOT NULL DEFAULT 0)",
+    "CREATE INDEX idx_bench_posts_user_id ON bench_posts (user_id)",
+)
+
+
+class BenchUser(IntegerPKMixin, TimestampMixin, ActiveRecord):
+    c: ClassVar[FieldProxy] = FieldProxy()
+    __table_name__ = "bench_users"
+
+    id: Optional[int] = None
+    username: str
+    email: str
+    age: Optional[int] = None
+    balance: float = 0.0
+    is_active: bool = True
+
+    posts: ClassVar[HasMany["BenchPost"]] = HasMany(foreign_key="user_id", inverse_of="user")
+
+
+class BenchPost(IntegerPKMixin, ActiveRecord):
+    c: ClassVar[FieldProxy] = FieldProxy()
+    __table_name__ = "bench_posts"
+
+    id: Optional[int] = None
+    user_id: int
+    title: str
+    body: str
+    views: int = 0
+
+    user: ClassVar[BelongsTo["BenchUser"]] = BelongsTo(foreign_key="user_id", inverse_of="posts")
+
+
+# A wide model: the primary key, WIDE_SCALAR_COLUMNS scalar columns cycling
+# through int/float/str, and WIDE_JSON_COLUMNS JSON documents stored as TEXT.
+WIDE_SCALAR_COLUMNS = 51
+WIDE_JSON_COLUMNS = 8
+_WIDE_SCALAR_TYPES = ((int, "INTEGER", 0), (float, "REAL", 0.0), (str, "TEXT", ""))
+JsonDocument = Annotated[Dict[str, Any], UseAdapter(SQLiteJSONAdapter(), str)]
+
+
+def _wide_scalar(index: int):
+    return _WIDE_SCALAR_TYPES[index % len(_WIDE_SCALAR_TYPES)]
+
+
+def _build_wide_model():
+    annotations = {"c": ClassVar[FieldProxy], "id": Optional[int]}
+    namespace = {"__module__": __name__, "__table_name__": "bench_wide", "c": FieldProxy(), "id": None}
+    for index in range(WIDE_SCALAR_COLUMNS):
+        python_type, _, default = _wide_scalar(index)
+        annotations[f"s{index:02d}"] = python_type
+        namespace[f"s{index:02d}"] = default
+    for index in range(WIDE_JSON_COLUMNS):
+        annotations[f"doc{index}"] = JsonDocument
+        namespace[f"doc{index}"] = None
+    namespace["__annotations__"] = annotations
+    return type("BenchWide", (IntegerPKMixin, ActiveRecord), namespace)
+
+
+BenchWide = _build_wide_model()
+
+WIDE_SCHEMA = "CREATE TABLE bench_wide (id INTEGER PRIMARY KEY AUTOINCREMENT, {})".format(", ".join(
+    [f"s{index:02d} {_wide_scalar(index)[1]}" for index in range(WIDE_SCALAR_COLUMNS)]
+    + [f"doc{index} TEXT" for index in range(WIDE_JSON_COLUMNS)]
+))
+
+
+def configure_models(database: str) -> SQLiteBackend:
+    """Bind the benchmark models to a fresh SQLite database and create the schema."""
+    BenchUser.configure(SQLiteConnectionConfig(database=database), SQLiteBackend)
+    backend = BenchUser.backend()
+    BenchPost.__backend__ = backend
+    BenchWide.__backend__ = backend
+    for statement in SCHEMA + (WIDE_SCHEMA,):
+        backend.execute(statement)
+    return backend
+
+
+def seed_users(backend: SQLiteBackend, count: int, posts_per_user: int = 0) -> None:
+    """Insert ``count`` users (and their posts) with plain executemany, bypassing the models."""
+    backend.execute_many(
+        "INSERT INTO bench_users (username, email, age, balance, is_active, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(f"user{i}", f"user{i}@example.com", 20 + i % 60, i * 1.5, 1,
+          "2024-01-01T00:00:00+00:00", "2024-01-01T00:00:00+00:00") for i in range(count)],
+    )
+    if posts_per_user:
+        backend.execute_many(
+            "INSERT INTO bench_posts (user_id, title, body, views) VALUES (?, ?, ?, ?)",
+            [(user_id, f"post {user_id}-{p}", "lorem ipsum " * 10, p)
+             for user_id in range(1, count + 1) for p in range(posts_per_user)],
+        )
+
+
+def seed_wide(backend: SQLiteBackend, count: int, document_keys: int = 20) -> None:
+    """Insert ``count`` rows into the wide table, each JSON column holding ``document_keys`` keys."""
+    columns = [f"s{index:02d}" for index in range(WIDE_SCALAR_COLUMNS)] + [
+        f"doc{index}" for index in range(WIDE_JSON_COLUMNS)]
+    rows = []
+    for row in range(count):
+        scalars = [_wide_scalar(index)[0](row + index) for index in range(WIDE_SCALAR_COLUMNS)]
+        documents = [json.dumps({f"key{key}": [row, key, f"value {key}"] for key in range(document_keys)})
+                     for _ in range(WIDE_JSON_COLUMNS)]
+        rows.append(tuple(scalars + documents))
+    backend.execute_many(
+        f"INSERT INTO bench_wide ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
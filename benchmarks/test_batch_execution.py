@@ -0,0 +1,51 @@
+# benchmarks/test_batch_execution.py
+"""Bulk writes: execute_batch_dml() with expressions vs execute_many() with raw SQL."""
+
+from rhosocial.activerecord.backend.expression import InsertExpression, Literal, ValuesSource
+
+ROWS = 1000
+ROUNDS = 10
+
+INSERT_SQL = "INSERT INTO bench_posts (user_id, title, body, views) VALUES (?, ?, ?, ?)"
+
+
+def _rows():
+    return [(i % 50 + 1, f"post {i}", "lorem ipsum", i) for i in range(ROWS)]
+
+
+def _clear(backend):
+    backend.execute("DELETE FROM bench_posts")
+
+
+def test_execute_batch_dml_insert(benchmark, bench_backend):
+    dialect = bench_backend.dialect
+
+    def setup():
+        _clear(bench_backend)
+        expressions = [
+            InsertExpression(
+                dialect, into="bench_posts", columns=["user_id", "title", "body", "views"],
+                source=ValuesSource(dialect, values_list=[[Literal(dialect, value) for value in row]]),
+            )
+            for row in _rows()
+        ]
+        return (expressions,), {}
+
+    def run(expressions):
+        return sum(batch.total_affected_rows for batch in bench_backend.execute_batch_dml(expressions, batch_size=100))
+
+    benchmark.extra_info["rows"] = ROWS
+    affected = benchmark.pedantic(run, setup=setup, rounds=ROUNDS, warmup_rounds=1)
+
+    assert affected == ROWS
+
+
+def test_execute_many_insert(benchmark, bench_backend):
+    def setup():
+        _clear(bench_backend)
+        return (INSERT_SQL, _rows()), {}
+
+    benchmark.extra_info["rows"] = ROWS
+    result = benchmark.pedantic(bench_backend.execute_many, setup=setup, rounds=ROUNDS, warmup_rounds=1)
+
+    assert result.affected_rows == ROWS
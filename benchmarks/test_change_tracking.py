@@ -0,0 +1,81 @@
+# benchmarks/test_change_tracking.py
+"""Change tracking on a wide model (60 columns, 8 JSON documents): load, assign, save."""
+
+import gc
+import itertools
+import tracemalloc
+
+import pytest
+
+from .models import BenchWide, seed_wide
+
+WIDE_ROWS = 1000
+
+
+@pytest.fixture
+def wide_backend(bench_backend):
+    seed_wide(bench_backend, WIDE_ROWS)
+    return bench_backend
+
+
+def test_wide_load(benchmark, wide_backend):
+    """Hydrate the wide rows; extra_info records the memory held per loaded instance."""
+    query = BenchWide.query().order_by(BenchWide.c.id)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        records = query.all()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["rows"] = len(records)
+    benchmark.extra_info["bytes_per_instance"] = (after - before) // len(records)
+    del records
+
+    records = benchmark(query.all)
+
+    assert len(records) == WIDE_ROWS
+
+
+def test_wide_assign_field(benchmark, wide_backend):
+    """Assigning a scalar field of a loaded instance (the change-tracking __setattr__)."""
+    record = BenchWide.query().one()
+    values = itertools.count()
+
+    def assign():
+        record.s00 = next(values)
+
+    benchmark(assign)
+
+    assert record.dirty_fields == {"s00"}
+
+
+def test_wide_assign_document(benchmark, wide_backend):
+    """Replacing a JSON document field; its original value is copied on the first change only."""
+    record = BenchWide.query().one()
+    documents = [{"key": index} for index in range(2)]
+    index = itertools.count()
+
+    def assign():
+        record.doc0 = documents[next(index) % 2]
+
+    benchmark(assign)
+
+    assert record.dirty_fields == {"doc0"}
+
+
+def test_wide_update_one_field(benchmark, wide_backend):
+    """save() of a loaded instance with one dirty field: an UPDATE of one column."""
+    record = BenchWide.query().one()
+    values = itertools.count()
+
+    def update():
+        record.s00 = next(values)
+        record.save()
+
+    benchmark(update)
+
+    assert not record.is_dirty
@@ -0,0 +1,52 @@
+# benchmarks/test_connection_pool.py
+"""BackendPool.acquire()/release() cycles, alone and under thread contention."""
+
+import threading
+
+import pytest
+
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteBackend
+from rhosocial.activerecord.connection.pool import BackendPool, PoolConfig
+
+CYCLES_PER_THREAD = 50
+MAX_SIZE = 4
+ROUNDS = 10
+
+
+@pytest.fixture
+def pool(sqlite_database):
+    # SQLite pools run in transient mode: every acquire connects and validates,
+    # every release disconnects.
+    pool = BackendPool(PoolConfig(min_size=1, max_size=MAX_SIZE,
+                                  backend_factory=lambda: SQLiteBackend(database=sqlite_database)))
+    yield pool
+    pool.close()
+
+
+def _cycle(pool, cycles, errors):
+    try:
+        for _ in range(cycles):
+            backend = pool.acquire()
+            pool.release(backend)
+    except Exception as error:  # pragma: no cover - surfaced by the assertion below
+        errors.append(error)
+
+
+@pytest.mark.parametrize("threads", [1, 8])
+def test_acquire_release(benchmark, pool, threads):
+    errors = []
+
+    def run():
+        workers = [threading.Thread(target=_cycle, args=(pool, CYCLES_PER_THREAD, errors)) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    benchmark.extra_info.update(threads=threads, cycles=threads * CYCLES_PER_THREAD, max_size=MAX_SIZE)
+    benchmark.pedantic(run, rounds=ROUNDS, warmup_rounds=1)
+
+    assert errors == []
+    stats = pool.get_stats()
+    assert stats.current_in_use == 0
+    assert stats.total_acquired == (ROUNDS + 1) * threads * CYCLES_PER_THREAD
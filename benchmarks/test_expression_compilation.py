@@ -0,0 +1,113 @@
+# benchmarks/test_expression_compilation.py
+"""Compiling QueryExpression trees to SQL, without executing them."""
+
+import pytest
+
+from rhosocial.activerecord.backend.expression import (
+    Column,
+    ComparisonPredicate,
+    FunctionCall,
+    GroupByHavingClause,
+    InPredicate,
+    JoinExpression,
+    LikePredicate,
+    LimitOffsetClause,
+    Literal,
+    LogicalPredicate,
+    OrderByClause,
+    QueryExpression,
+    Subquery,
+    TableExpression,
+    WhereClause,
+)
+from rhosocial.activerecord.backend.impl.sqlite.dialect import SQLiteDialect
+
+from .models import BenchUser, configure_models
+
+
+def _simple_query(dialect):
+    return QueryExpression(
+        dialect,
+        select=[Column(dialect, "id"), Column(dialect, "username"), Column(dialect, "email")],
+        from_=TableExpression(dialect, "bench_users"),
+        where=WhereClause(dialect, ComparisonPredicate(dialect, "=", Column(dialect, "id"), Literal(dialect, 42))),
+    )
+
+
+def _complex_query(dialect):
+    active_authors = QueryExpression(
+        dialect,
+        select=[Column(dialect, "id")],
+        from_=TableExpression(dialect, "bench_users"),
+        where=WhereClause(dialect, ComparisonPredicate(
+            dialect, "=", Column(dialect, "is_active"), Literal(dialect, True))),
+    )
+    condition = LogicalPredicate(
+        dialect, "AND",
+        ComparisonPredicate(dialect, ">=", Column(dialect, "age", "u"), Literal(dialect, 18)),
+        LogicalPredicate(
+            dialect, "OR",
+            LikePredicate(dialect, "LIKE", Column(dialect, "title", "p"), Literal(dialect, "%orm%")),
+            InPredicate(dialect, Column(dialect, "views", "p"), Literal(dialect, [1, 2, 3, 5, 8, 13])),
+        ),
+        InPredicate(dialect, Column(dialect, "id", "u"), Subquery(dialect, active_authors)),
+    )
+    return QueryExpression(
+        dialect,
+        select=[
+            Column(dialect, "id", "u"),
+            Column(dialect, "username", "u"),
+            FunctionCall(dialect, "COUNT", Column(dialect, "id", "p"), alias="post_count"),
+            FunctionCall(dialect, "SUM", Column(dialect, "views", "p"), alias="total_views"),
+        ],
+        from_=JoinExpression(
+            dialect,
+            TableExpression(dialect, "bench_users", alias="u"),
+            TableExpression(dialect, "bench_posts", alias="p"),
+            join_type="LEFT JOIN",
+            condition=ComparisonPredicate(dialect, "=", Column(dialect, "id", "u"), Column(dialect, "user_id", "p")),
+        ),
+        where=WhereClause(dialect, condition),
+        group_by_having=GroupByHavingClause(
+            dialect,
+            group_by=[Column(dialect, "id", "u"), Column(dialect, "username", "u")],
+            having=ComparisonPredicate(
+                dialect, ">", FunctionCall(dialect, "COUNT", Column(dialect, "id", "p")), Literal(dialect, 2)),
+        ),
+        order_by=OrderByClause(dialect, [(Column(dialect, "total_views"), "DESC"), Column(dialect, "id", "u")]),
+        limit_offset=LimitOffsetClause(dialect, limit=50, offset=100),
+    )
+
+
+def test_compile_simple_query(benchmark):
+    expression = _simple_query(SQLiteDialect())
+    sql, params = benchmark(expression.to_sql)
+    assert params == (42,)
+
+
+def test_compile_complex_query(benchmark):
+    expression = _complex_query(SQLiteDialect())
+    sql, params = benchmark(expression.to_sql)
+    assert "LEFT JOIN" in sql and "HAVING" in sql
+
+
+@pytest.fixture
+def memory_models():
+    backend = configure_models(":memory:")
+    yield
+    backend.disconnect()
+
+
+def test_build_and_compile_active_query(benchmark, memory_models):
+    """Query-builder overhead: build an ActiveQuery and compile it."""
+
+    def build():
+        return (BenchUser.query()
+                .where(BenchUser.c.age >= 18)
+                .where(BenchUser.c.is_active == True)  # noqa: E712
+                .order_by(BenchUser.c.id)
+                .limit(20)
+                .to_sql())
+
+    sql, params = benchmark(build)
+    assert "LIMIT" in sql
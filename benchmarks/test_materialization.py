@@ -0,0 +1,68 @@
+# benchmarks/test_materialization.py
+"""ActiveQuery.all(): fetching rows and turning them into model instances."""
+
+import pytest
+
+from .models import BenchUser, seed_users
+
+ROW_COUNTS = (1, 100, 10000)
+
+
+@pytest.fixture
+def seeded_backend(bench_backend):
+    seed_users(bench_backend, max(ROW_COUNTS))
+    return bench_backend
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_all_materialization(benchmark, seeded_backend, rows):
+    query = BenchUser.query().order_by(BenchUser.c.id).limit(rows)
+    benchmark.extra_info["rows"] = rows
+
+    users = benchmark(query.all)
+
+    assert len(users) == rows and isinstance(users[0], BenchUser)
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_all_materialization_trusted(benchmark, seeded_backend, rows):
+    """The same query through the trusted (unvalidated) hydration path."""
+    query = BenchUser.query().order_by(BenchUser.c.id).limit(rows).trusted()
+    benchmark.extra_info["rows"] = rows
+
+    users = benchmark(query.all)
+
+    assert len(users) == rows and isinstance(users[0], BenchUser)
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_raw_fetch_baseline(benchmark, seeded_backend, rows):
+    """The same rows as plain dicts, to separate driver time from hydration time."""
+    sql = "SELECT * FROM bench_users ORDER BY id LIMIT ?"
+    benchmark.extra_info["rows"] = rows
+
+    data = benchmark(seeded_backend.fetch_all, sql, (rows,))
+
+    assert len(data) == rows
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_as_tuples(benchmark, seeded_backend, rows):
+    """The same query as adapted tuples, without model instances or per-row dicts."""
+    query = BenchUser.query().order_by(BenchUser.c.id).limit(rows)
+    benchmark.extra_info["rows"] = rows
+
+    data = benchmark(query.as_tuples)
+
+    assert len(data) == rows and isinstance(data[0], tuple)
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_pluck_column(benchmark, seeded_backend, rows):
+    """One column as a flat list."""
+    query = BenchUser.query().order_by(BenchUser.c.id).limit(rows)
+    benchmark.extra_info["rows"] = rows
+
+    ids = benchmark(query.pluck, BenchUser.c.id)
+
+    assert len(ids) == rows
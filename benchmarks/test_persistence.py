@@ -0,0 +1,31 @@
+# benchmarks/test_persistence.py
+"""save() of single records: INSERT of a new record and UPDATE of a dirty one."""
+
+from .models import BenchUser
+
+ROUNDS = 300
+
+
+def test_save_insert(benchmark, bench_backend):
+    counter = iter(range(10 ** 9))
+
+    def new_user():
+        i = next(counter)
+        return (BenchUser(username=f"user{i}", email=f"user{i}@example.com", age=30),), {}
+
+    benchmark.pedantic(lambda user: user.save(), setup=new_user, rounds=ROUNDS, warmup_rounds=5)
+
+    assert BenchUser.query().count() == ROUNDS + 5
+
+
+def test_save_update(benchmark, bench_backend):
+    user = BenchUser(username="updated", email="updated@example.com", age=30, balance=0.0)
+    user.save()
+
+    def touch():
+        user.balance += 1
+        return (user,), {}
+
+    benchmark.pedantic(lambda record: record.save(), setup=touch, rounds=ROUNDS, warmup_rounds=5)
+
+    assert BenchUser.find_one(user.id).balance == ROUNDS + 5
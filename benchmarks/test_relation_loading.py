@@ -0,0 +1,52 @@
+# benchmarks/test_relation_loading.py
+"""Batch loading of relations for a page of parent records."""
+
+import pytest
+
+from .models import BenchPost, BenchUser, seed_users
+
+USERS = 200
+POSTS_PER_USER = 5
+ROUNDS = 30
+
+
+@pytest.fixture
+def blog_backend(bench_backend):
+    seed_users(bench_backend, USERS, posts_per_user=POSTS_PER_USER)
+    return bench_backend
+
+
+def test_has_many_batch_load(benchmark, blog_backend):
+    relation = BenchUser.get_relation("posts")
+
+    def fresh_users():
+        # New instances every round, so no relation cache is warm.
+        return (BenchUser.query().all(),), {}
+
+    benchmark.extra_info.update(parents=USERS, children=USERS * POSTS_PER_USER)
+    loaded = benchmark.pedantic(lambda users: relation.batch_load(users, None), setup=fresh_users,
+                                rounds=ROUNDS, warmup_rounds=1)
+
+    assert len(loaded) == USERS
+    assert sum(len(posts) for posts in loaded.values()) == USERS * POSTS_PER_USER
+
+
+def test_belongs_to_batch_load(benchmark, blog_backend):
+    relation = BenchPost.get_relation("user")
+
+    def fresh_posts():
+        return (BenchPost.query().all(),), {}
+
+    benchmark.extra_info.update(parents=USERS * POSTS_PER_USER, children=USERS)
+    loaded = benchmark.pedantic(lambda posts: relation.batch_load(posts, None), setup=fresh_posts,
+                                rounds=ROUNDS, warmup_rounds=1)
+
+    assert len(loaded) == USERS * POSTS_PER_USER
+
+
+def test_eager_loading_query(benchmark, blog_backend):
+    """End to end: the parent query plus the with_() batch load."""
+    benchmark.extra_info.update(parents=USERS, children=USERS * POSTS_PER_USER)
+    users = benchmark.pedantic(lambda: BenchUser.query().with_("posts").all(), rounds=ROUNDS, warmup_rounds=1)
+
+    assert len(users) == USERS
@@ -0,0 +1,36 @@
+# benchmarks/test_summarizer.py
+"""DataSummarizer on payloads much larger than its limits."""
+
+import pytest
+
+from rhosocial.activerecord.logging import DataSummarizer, SummarizerConfig
+
+
+def _record(i):
+    return {
+        "id": i,
+        "username": f"user{i}",
+        "password": "secret",
+        "bio": "lorem ipsum dolor sit amet " * 40,
+        "tags": [f"tag{t}" for t in range(30)],
+        "profile": {"address": {"city": "Springfield", "lines": ["742 Evergreen Terrace"] * 5}},
+    }
+
+
+PAYLOADS = {
+    "wide_record": {f"field_{i}": "x" * 500 for i in range(1000)},
+    "record_list": [_record(i) for i in range(1000)],
+    "long_text": "y" * 1_000_000,
+}
+
+
+@pytest.mark.parametrize("payload", sorted(PAYLOADS))
+def test_summarize(benchmark, payload):
+    summarizer = DataSummarizer(SummarizerConfig())
+    benchmark(summarizer.summarize, PAYLOADS[payload])
+
+
+@pytest.mark.parametrize("payload", ["wide_record", "record_list"])
+def test_summarize_keys_only(benchmark, payload):
+    summarizer = DataSummarizer(SummarizerConfig())
+    benchmark(summarizer.summarize_keys_only, PAYLOADS[payload])
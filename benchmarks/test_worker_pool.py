@@ -0,0 +1,60 @@
+# benchmarks/test_worker_pool.py
+"""WorkerPool throughput for trivial tasks: per-item submit() vs chunked map()/imap_unordered()."""
+
+import pytest
+
+from rhosocial.activerecord.worker import TaskContext, WorkerPool
+
+TASKS = 200
+CHUNKED_TASKS = 2000
+CHUNKSIZE = 100
+ROUNDS = 5
+
+
+def echo_task(ctx: TaskContext, n: int) -> int:
+    return n
+
+
+@pytest.fixture(scope="module")
+def worker_pool():
+    with WorkerPool(n_workers=2) as pool:
+        # Start the workers before measuring.
+        pool.submit(echo_task, 0).result(timeout=60)
+        yield pool
+
+
+def test_submit_throughput(benchmark, worker_pool):
+    def run():
+        futures = [worker_pool.submit(echo_task, i) for i in range(TASKS)]
+        return [future.result(timeout=60) for future in futures]
+
+    benchmark.extra_info.update(tasks=TASKS, workers=2)
+    results = benchmark.pedantic(run, rounds=ROUNDS, warmup_rounds=1)
+
+    assert results == list(range(TASKS))
+
+
+def test_map_per_item_throughput(benchmark, worker_pool):
+    benchmark.extra_info.update(tasks=CHUNKED_TASKS, workers=2, chunksize=1)
+    results = benchmark.pedantic(worker_pool.map, args=(echo_task, range(CHUNKED_TASKS)),
+                                 kwargs={"timeout": 60}, rounds=ROUNDS, warmup_rounds=1)
+
+    assert results == list(range(CHUNKED_TASKS))
+
+
+def test_map_chunked_throughput(benchmark, worker_pool):
+    benchmark.extra_info.update(tasks=CHUNKED_TASKS, workers=2, chunksize=CHUNKSIZE)
+    results = benchmark.pedantic(worker_pool.map, args=(echo_task, range(CHUNKED_TASKS)),
+                                 kwargs={"timeout": 60, "chunksize": CHUNKSIZE}, rounds=ROUNDS, warmup_rounds=1)
+
+    assert results == list(range(CHUNKED_TASKS))
+
+
+def test_imap_unordered_throughput(benchmark, worker_pool):
+    def run():
+        return sorted(worker_pool.imap_unordered(echo_task, range(CHUNKED_TASKS), chunksize=CHUNKSIZE, timeout=60))
+
+    benchmark.extra_info.update(tasks=CHUNKED_TASKS, workers=2, chunksize=CHUNKSIZE)
+    results = benchmark.pedantic(run, rounds=ROUNDS, warmup_rounds=1)
+
+    assert results == list(range(CHUNKED_TASKS))
@@ -5,6 +5,8 @@ from typing import Optional
 
 from ..config import ConnectionConfig
 from ..dialect import SQLDialectBase
+from ..dialect.statement_cache import StatementCacheStats
+from ..row_converter import RowConverterCache
 from ..type_adapter import (
     DateTimeAdapter,
     JSONAdapter,
@@ -49,6 +51,8 @@ class StorageBackendBase(ABC):
         # It maps (Python Type, DBAPI Type) to a SQLTypeAdapter.
         self.adapter_registry = TypeRegistry()
         self._register_default_adapters()
+        # Row conversion plans per result shape (see TypeAdaptionMixin._row_converter)
+        self._row_converters = RowConverterCache()
         self.logger.info("Initialized TypeAdaptionMixin with SQLTypeAdapter registry.")
 
     def _register_default_adapters(self) -> None:
@@ -73,6 +77,18 @@ class StorageBackendBase(ABC):
         """Get SQL dialect."""
         pass
 
+    def get_statement_cache_stats(self) -> StatementCacheStats:
+        """Get hit/miss/eviction counters of the dialect's compiled statement cache.
+
+        Returns:
+            StatementCacheStats: Snapshot of the cache counters
+        """
+        return self.dialect.statement_cache.stats
+
+    def clear_statement_cache(self) -> None:
+        """Drop all compiled statements cached by the dialect."""
+        self.dialect.statement_cache.clear()
+
     @property
     def threadsafety(self) -> int:
         """Return driver threadsafety level.
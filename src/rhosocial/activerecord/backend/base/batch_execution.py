@@ -23,7 +23,6 @@ from typing import (
 )
 
 from ..result import QueryResult, BatchDMLResult, BatchDQLResult, BatchCommitMode
-from ..type_adapter import SQLTypeAdapter
 from ..expression import InsertExpression, UpdateExpression, DeleteExpression
 
 if TYPE_CHECKING:
@@ -262,7 +261,8 @@ class BatchExecutionMixin:
             expression: A DQL expression (QueryExpression, WithQueryExpression,
                        or SetOperationExpression).
             page_size: Number of rows per page. Default: 1000.
-            column_adapters: Optional type adapters for processing columns.
+            column_adapters: Optional (adapter, target_type) tuples by column name,
+                           applied column-wise to each page.
             column_mapping: Optional mapping from column names to field names.
 
         Yields:
@@ -314,10 +314,12 @@ class BatchExecutionMixin:
             # Execute query
             cursor.execute(final_sql, final_params)
 
-            # Get column names from cursor description
+            # Get column names from cursor description; the conversion plan
+            # (adapters, field names) is resolved once for every page
             column_names = []
             if cursor.description:
                 column_names = [desc[0] for desc in cursor.description]
+            converter = self._row_converter(column_names, column_adapters, column_mapping)
 
             # Pagination loop
             page_index = 0
@@ -328,21 +330,7 @@ class BatchExecutionMixin:
                 if not rows:
                     break
 
-                # Process rows
-                data = []
-                for row in rows:
-                    if hasattr(row, "keys"):
-                        # Row object with keys (e.g., sqlite3.Row)
-                        row_dict = dict(row)
-                    else:
-                        # Tuple - map to column names
-                        row_dict = dict(zip(column_names, row))
-
-                    # Apply column adapters and mapping
-                    if column_adapters or column_mapping:
-                        row_dict = self._adapt_and_map_row(row_dict, column_adapters, column_mapping)
-
-                    data.append(row_dict)
+                data = converter.to_dicts(rows)
 
                 duration = time.perf_counter() - start_time
                 has_more = len(rows) == page_size
@@ -568,31 +556,19 @@ class BatchExecutionMixin:
         """
         Apply type adapters and column mapping to a row.
 
+        ``execute_batch_dql`` converts whole pages through the backend's
+        conversion plan; this applies the same plan to a single row.
+
         Args:
             row_dict: Original row dictionary.
-            column_adapters: Type adapters by column name.
+            column_adapters: (adapter, target_type) tuples by column name.
             column_mapping: Column name to field name mapping.
 
         Returns:
             Transformed row dictionary.
         """
-        result = {}
-
-        for col_name, value in row_dict.items():
-            # Apply adapter if available
-            if column_adapters and col_name in column_adapters:
-                adapter = column_adapters[col_name]
-                if adapter and isinstance(adapter, SQLTypeAdapter):
-                    value = adapter.from_database(value)
-
-            # Apply column mapping
-            field_name = col_name
-            if column_mapping and col_name in column_mapping:
-                field_name = column_mapping[col_name]
-
-            result[field_name] = value
-
-        return result
+        converter = self._row_converter(list(row_dict), column_adapters, column_mapping)
+        return converter.to_dicts([row_dict])[0]
 
     def _get_dql_cursor(self):
         """
@@ -753,6 +729,7 @@ class AsyncBatchExecutionMixin:
             column_names = []
             if cursor.description:
                 column_names = [desc[0] for desc in cursor.description]
+            converter = self._row_converter(column_names, column_adapters, column_mapping)
 
             page_index = 0
             while True:
@@ -762,17 +739,7 @@ class AsyncBatchExecutionMixin:
                 if not rows:
                     break
 
-                data = []
-                for row in rows:
-                    if hasattr(row, "keys"):
-                        row_dict = dict(row)
-                    else:
-                        row_dict = dict(zip(column_names, row))
-
-                    if column_adapters or column_mapping:
-                        row_dict = self._adapt_and_map_row(row_dict, column_adapters, column_mapping)
-
-                    data.append(row_dict)
+                data = converter.to_dicts(rows)
 
                 duration = time.perf_counter() - start_time
                 has_more = len(rows) == page_size
@@ -942,21 +909,8 @@ class AsyncBatchExecutionMixin:
         column_mapping: Optional[Dict],
     ) -> Dict[str, Any]:
         """Apply adapters and mapping (shared with sync)."""
-        result = {}
-
-        for col_name, value in row_dict.items():
-            if column_adapters and col_name in column_adapters:
-                adapter = column_adapters[col_name]
-                if adapter and isinstance(adapter, SQLTypeAdapter):
-                    value = adapter.from_database(value)
-
-            field_name = col_name
-            if column_mapping and col_name in column_mapping:
-                field_name = column_mapping[col_name]
-
-            result[field_name] = value
-
-        return result
+        converter = self._row_converter(list(row_dict), column_adapters, column_mapping)
+        return converter.to_dicts([row_dict])[0]
 
     async def _get_dql_cursor(self):
         """Get a cursor suitable for async DQL operations."""
@@ -9,7 +9,7 @@ preparation, SQL preparation, query execution, and result processing.
 
 import logging
 import time
-from typing import Optional, Tuple, List, Union, Dict
+from typing import Callable, Optional, Tuple, List, Union, Dict
 
 from ..options import ExecutionOptions
 from ..result import QueryResult
@@ -35,6 +35,17 @@ class ExecutionMixin:
     behavior across all database operations.
     """
 
+    # Called after every successful non-query statement; set by a read/write
+    # router so reads can stay on this backend right after a write.
+    _write_observer: Optional[Callable[[], None]] = None
+
+    def _on_schema_changed(self) -> None:
+        """Hook called after a DDL statement succeeds.
+
+        Backends with cached schema information (see IntrospectorBackendMixin)
+        override this to drop it.
+        """
+
     def execute(
         self, sql: str, params: Optional[Tuple] = None, *, options: Optional[ExecutionOptions] = None
     ) -> QueryResult:
@@ -58,6 +69,7 @@ class ExecutionMixin:
                     - process_result_set: Whether to process result sets (defaults to DQL behavior)
                     - column_adapters: Type adapters for processing result columns
                     - column_mapping: Column name to field name mapping for results
+                    - as_tuples: Return rows as tuples, with the column names in result.columns
 
         Returns:
             QueryResult object containing execution results including affected rows,
@@ -68,7 +80,7 @@ class ExecutionMixin:
             ConnectionError: If there are connection-related issues
         """
         start_time = time.perf_counter()
-        self.log(logging.DEBUG, f"Executing SQL: {sql}, parameters: {params}")
+        self.log(logging.DEBUG, "Executing SQL: %s, parameters: %s", sql, params)
         try:
             if not self._connection:
                 self.connect()
@@ -111,11 +123,19 @@ class ExecutionMixin:
 
             final_sql, final_params = self._prepare_sql_and_params(sql, prepared_params)
             cursor = self._execute_query(cursor, final_sql, final_params)
-            data = self._process_result_set(cursor, is_select, options.column_adapters, options.column_mapping)
+            data = self._process_result_set(
+                cursor, is_select, options.column_adapters, options.column_mapping, options.as_tuples
+            )
             duration = time.perf_counter() - start_time
             self._log_query_completion(stmt_type, cursor, data, duration)
             result = self._build_query_result(cursor, data, duration)
+            if options.as_tuples:
+                result.columns = self._result_column_names(cursor)
             self._handle_auto_commit_if_needed()
+            if self._write_observer is not None and stmt_type != StatementType.DQL:
+                self._write_observer()
+            if stmt_type == StatementType.DDL:
+                self._on_schema_changed()
             return result
         except Exception as e:
             self.log(logging.ERROR, f"Error executing query: {str(e)}")
@@ -144,7 +164,7 @@ class ExecutionMixin:
             It does not perform individual type conversion for each parameter set.
             The caller is responsible for ensuring parameters are properly formatted.
         """
-        self.log(logging.INFO, f"Executing batch operation: {sql} with {len(params_list)} parameter sets")
+        self.log(logging.INFO, "Executing batch operation: %s with %d parameter sets", sql, len(params_list))
         start_time = time.perf_counter()
         try:
             if not self._connection:
@@ -154,6 +174,8 @@ class ExecutionMixin:
             cursor.executemany(final_sql, params_list)
             duration = time.perf_counter() - start_time
             self._handle_auto_commit_if_needed()
+            if self._write_observer is not None:
+                self._write_observer()
             return QueryResult(affected_rows=cursor.rowcount, duration=duration)
         except Exception as e:
             self.log(logging.ERROR, f"Error in batch operation: {str(e)}")
@@ -179,6 +201,17 @@ class AsyncExecutionMixin:
     in a single location to ensure consistent behavior across all async database operations.
     """
 
+    # Called after every successful non-query statement; set by a read/write
+    # router so reads can stay on this backend right after a write.
+    _write_observer: Optional[Callable[[], None]] = None
+
+    def _on_schema_changed(self) -> None:
+        """Hook called after a DDL statement succeeds.
+
+        Backends with cached schema information (see IntrospectorBackendMixin)
+        override this to drop it.
+        """
+
     async def execute(
         self, sql: str, params: Optional[Tuple] = None, *, options: Optional[ExecutionOptions] = None
     ) -> QueryResult:
@@ -202,6 +235,7 @@ class AsyncExecutionMixin:
                     - process_result_set: Whether to process result sets (defaults to DQL behavior)
                     - column_adapters: Type adapters for processing result columns
                     - column_mapping: Column name to field name mapping for results
+                    - as_tuples: Return rows as tuples, with the column names in result.columns
 
         Returns:
             QueryResult object containing execution results including affected rows,
@@ -212,7 +246,7 @@ class AsyncExecutionMixin:
             ConnectionError: If there are connection-related issues
         """
         start_time = time.perf_counter()
-        self.log(logging.DEBUG, f"Executing SQL: {sql}, parameters: {params}")
+        self.log(logging.DEBUG, "Executing SQL: %s, parameters: %s", sql, params)
         try:
             if not self._connection:
                 await self.connect()
@@ -255,11 +289,19 @@ class AsyncExecutionMixin:
 
             final_sql, final_params = self._prepare_sql_and_params(sql, prepared_params)
             cursor = await self._execute_query(cursor, final_sql, final_params)
-            data = await self._process_result_set(cursor, is_select, options.column_adapters, options.column_mapping)
+            data = await self._process_result_set(
+                cursor, is_select, options.column_adapters, options.column_mapping, options.as_tuples
+            )
             duration = time.perf_counter() - start_time
             self._log_query_completion(stmt_type, cursor, data, duration)
             result = self._build_query_result(cursor, data, duration)
+            if options.as_tuples:
+                result.columns = self._result_column_names(cursor)
             await self._handle_auto_commit_if_needed()
+            if self._write_observer is not None and stmt_type != StatementType.DQL:
+                self._write_observer()
+            if stmt_type == StatementType.DDL:
+                self._on_schema_changed()
             return result
         except Exception as e:
             self.log(logging.ERROR, f"Error executing query: {str(e)}")
@@ -286,7 +328,7 @@ class AsyncExecutionMixin:
             It does not perform individual type conversion for each parameter set.
             The caller is responsible for ensuring parameters are properly formatted.
         """
-        self.log(logging.DEBUG, f"Executing many SQL: {sql}")
+        self.log(logging.DEBUG, "Executing many SQL: %s", sql)
         start_time = time.perf_counter()
         try:
             if not self._connection:
@@ -295,6 +337,8 @@ class AsyncExecutionMixin:
             await cursor.executemany(sql, params_list)
             await self._handle_auto_commit_if_needed()
             duration = time.perf_counter() - start_time
+            if self._write_observer is not None:
+                self._write_observer()
             return QueryResult(affected_rows=cursor.rowcount, duration=duration)
         except Exception as e:
             self.log(logging.ERROR, f"Error executing many: {str(e)}")
@@ -246,6 +246,30 @@ class SQLOperationsMixin:
         result = self.execute(sql, params, options=exec_options)
         return result.data or []
 
+    def fetch_tuples(
+        self,
+        sql: str,
+        params: Optional[Tuple] = None,
+        column_adapters: Optional[Dict[str, Tuple[SQLTypeAdapter, Type]]] = None,
+    ) -> Tuple[List[str], List[Tuple]]:
+        """
+        Fetches all matching records as tuples, without building a dictionary per row.
+
+        Column adapters are matched to the result columns by name once and then
+        applied by position.
+
+        Args:
+            sql (str): The SQL query string.
+            params (Optional[Tuple]): Parameters for the SQL query.
+            column_adapters (Optional[Dict]): Type adapters for processing result columns.
+
+        Returns:
+            Tuple[List[str], List[Tuple]]: The result column names and the rows, both in SELECT order.
+        """
+        exec_options = ExecutionOptions(stmt_type=StatementType.DQL, column_adapters=column_adapters, as_tuples=True)
+        result = self.execute(sql, params, options=exec_options)
+        return result.columns or [], result.data or []
+
 
 class AsyncSQLOperationsMixin:
     """Mixin for high-level asynchronous SQL data operations (INSERT, UPDATE, DELETE, FETCH)."""
@@ -450,3 +474,27 @@ class AsyncSQLOperationsMixin:
         )
         result = await self.execute(sql, params, options=exec_options)
         return result.data or []
+
+    async def fetch_tuples(
+        self,
+        sql: str,
+        params: Optional[Tuple] = None,
+        column_adapters: Optional[Dict[str, Tuple[SQLTypeAdapter, Type]]] = None,
+    ) -> Tuple[List[str], List[Tuple]]:
+        """
+        Fetches all matching records asynchronously as tuples, without building a dictionary per row.
+
+        Column adapters are matched to the result columns by name once and then
+        applied by position.
+
+        Args:
+            sql (str): The SQL query string.
+            params (Optional[Tuple]): Parameters for the SQL query.
+            column_adapters (Optional[Dict]): Type adapters for processing result columns.
+
+        Returns:
+            Tuple[List[str], List[Tuple]]: The result column names and the rows, both in SELECT order.
+        """
+        exec_options = ExecutionOptions(stmt_type=StatementType.DQL, column_adapters=column_adapters, as_tuples=True)
+        result = await self.execute(sql, params, options=exec_options)
+        return result.columns or [], result.data or []
@@ -11,16 +11,19 @@ class ResultProcessingMixin:
     def _log_query_completion(
         self, stmt_type: StatementType, cursor, data: Optional[List[Dict]], duration: float
     ) -> None:
+        if not self.is_log_enabled(logging.INFO):
+            return
         if stmt_type == StatementType.DML:
             rowcount = getattr(cursor, "rowcount", 0)
             lastrowid = getattr(cursor, "lastrowid", None)
             self.log(
                 logging.INFO,
-                f"{stmt_type.name} affected {rowcount} rows, last_insert_id={lastrowid}, duration={duration:.3f}s",
+                "%s affected %s rows, last_insert_id=%s, duration=%.3fs",
+                stmt_type.name, rowcount, lastrowid, duration,
             )
         elif stmt_type == StatementType.DQL:
             row_count = len(data) if data is not None else 0
-            self.log(logging.INFO, f"{stmt_type.name} returned {row_count} rows, duration={duration:.3f}s")
+            self.log(logging.INFO, "%s returned %d rows, duration=%.3fs", stmt_type.name, row_count, duration)
 
     def _build_query_result(self, cursor, data: Optional[List[Dict]], duration: float) -> QueryResult:
         return QueryResult(
@@ -1,6 +1,7 @@
 # src/rhosocial/activerecord/backend/base/type_adaption.py
 from abc import abstractmethod
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+from ..row_converter import RowConverterPlan
 from ..type_adapter import (
     SQLTypeAdapter,
     DateTimeAdapter,
@@ -94,74 +95,46 @@ class TypeAdaptionMixin:
 
         raise TypeError("Unsupported types for params and param_adapters.")
 
-    def _adapt_row_types(
-        self, row_dict: Dict[str, Any], column_adapters: Dict[str, Tuple[SQLTypeAdapter, Type]]
-    ) -> Dict[str, Any]:
-        """
-        Converts database column values back to Python types using column adapters.
-
-        This method processes a single row dictionary, applying type adapters to
-        convert database-native values back to their corresponding Python types.
-        It handles both adapted and non-adapted columns appropriately.
-
-        Args:
-            row_dict: Dictionary mapping column names to database values for a single row
-            column_adapters: Dictionary mapping column names to (adapter, target_type) tuples
-                           specifying how to convert each column's value back to Python
+    @staticmethod
+    def _result_column_names(cursor) -> List[str]:
+        """Column names of the cursor's result set, in SELECT order."""
+        return [desc[0].strip('"') for desc in cursor.description] if cursor.description else []
 
-        Returns:
-            Dictionary with the same structure as input, but with values converted
-            to their appropriate Python types where adapters were specified.
+    def _row_converter(
+        self, column_names: Sequence[str],
+        column_adapters: Optional[Dict[str, Tuple[SQLTypeAdapter, Type]]] = None,
+        column_mapping: Optional[Dict[str, str]] = None,
+    ) -> RowConverterPlan:
         """
-        processed_row = {}
-        for col_name, value in row_dict.items():
-            if value is None:
-                processed_row[col_name] = None
-                continue
-            adapter_info = column_adapters.get(col_name)
-            if adapter_info:
-                adapter, py_type = adapter_info
-                processed_row[col_name] = adapter.from_database(value, py_type)
-            else:
-                processed_row[col_name] = value
-        return processed_row
-
-    def _remap_row_columns(self, row_dict: Dict[str, Any], column_mapping: Dict[str, str]) -> Dict[str, Any]:
-        """
-        Maps database column names to Python field names in a result row.
-
-        This method renames keys in the row dictionary according to the provided
-        column mapping. It's used to convert database column names back to the
-        corresponding Python field names as defined in the model.
+        Returns the conversion plan for a result shape, cached per backend.
 
         Args:
-            row_dict: Dictionary mapping column names to values for a single row
-            column_mapping: Dictionary mapping database column names to Python field names
+            column_names: Column names of the result set, in SELECT order
+            column_adapters: Dictionary mapping column names to (adapter, target_type) tuples
+            column_mapping: Dictionary mapping column names to field names
 
         Returns:
-            Dictionary with field names as keys instead of column names, preserving
-            the same values. Keys not present in the mapping are preserved as-is.
+            A RowConverterPlan that converts whole pages of rows at once.
         """
-        final_row = {}
-        for col_name, value in row_dict.items():
-            field_name = column_mapping.get(col_name, col_name)
-            final_row[field_name] = value
-        return final_row
+        return self._row_converters.get(column_names, column_adapters, column_mapping)
 
-    def _process_result_set(self, cursor, is_select, column_adapters=None, column_mapping=None) -> Optional[List[Dict]]:
+    def _process_result_set(
+        self, cursor, is_select, column_adapters=None, column_mapping=None, as_tuples=False
+    ) -> Optional[List[Dict]]:
         """
         Processes the full result set from a database cursor into Python objects.
 
-        This method orchestrates the two-step process of type adaptation and column
-        name remapping for an entire result set. It fetches all rows from the cursor,
-        applies type conversion using column adapters, and renames columns to field
-        names using the column mapping.
+        This method fetches all rows from the cursor and converts them with the
+        cached conversion plan of the result shape (see `_row_converter`): adapted
+        columns are converted column-wise, the others are copied unchanged, and
+        rows are emitted with field names as keys in a single pass.
 
         Args:
             cursor: The database cursor object after a query has been executed
             is_select: Flag indicating if it was a SELECT query
-            column_adapters: Dictionary for type conversion, passed to `_adapt_row_types`
-            column_mapping: Dictionary for key remapping, passed to `_remap_row_columns`
+            column_adapters: Dictionary mapping column names to (adapter, target_type) tuples
+            column_mapping: Dictionary mapping column names to field names
+            as_tuples: Return tuples in SELECT order; `column_mapping` is not used
 
         Returns:
             List of fully processed row dictionaries, or None if not a SELECT query.
@@ -173,16 +146,10 @@ class TypeAdaptionMixin:
             rows = cursor.fetchall()
             if not rows:
                 return []
-            column_names = [desc[0].strip('"') for desc in cursor.description]
-            final_results = []
-            adapters = column_adapters or {}
-            mapping = column_mapping or {}
-            for row in rows:
-                row_dict = dict(zip(column_names, row))
-                adapted_row = self._adapt_row_types(row_dict, adapters)
-                final_row = self._remap_row_columns(adapted_row, mapping)
-                final_results.append(final_row)
-            return final_results
+            column_names = self._result_column_names(cursor)
+            if as_tuples:
+                return self._row_converter(column_names, column_adapters).to_tuples(rows)
+            return self._row_converter(column_names, column_adapters, column_mapping).to_dicts(rows)
         except Exception as e:
             self.logger.error(f"Error processing result set: {str(e)}", exc_info=True)
             raise
@@ -208,20 +175,20 @@ class TypeAdaptionMixin:
 
 class AsyncTypeAdaptionMixin(TypeAdaptionMixin):
     async def _process_result_set(
-        self, cursor, is_select, column_adapters=None, column_mapping=None
+        self, cursor, is_select, column_adapters=None, column_mapping=None, as_tuples=False
     ) -> Optional[List[Dict]]:
         """
         Processes the full result set from an async database cursor into Python objects.
 
-        This method orchestrates the two-step process of type adaptation and column
-        name remapping for an entire result set from an async cursor. It awaits
-        the fetchall operation and then applies the same processing as the sync version.
+        This method awaits the fetchall operation and then applies the same
+        conversion plan as the sync version.
 
         Args:
             cursor: The async database cursor object after a query has been executed
             is_select: Flag indicating if it was a SELECT query
-            column_adapters: Dictionary for type conversion, passed to `_adapt_row_types`
-            column_mapping: Dictionary for key remapping, passed to `_remap_row_columns`
+            column_adapters: Dictionary mapping column names to (adapter, target_type) tuples
+            column_mapping: Dictionary mapping column names to field names
+            as_tuples: Return tuples in SELECT order; `column_mapping` is not used
 
         Returns:
             List of fully processed row dictionaries, or None if not a SELECT query.
@@ -233,16 +200,10 @@ class AsyncTypeAdaptionMixin(TypeAdaptionMixin):
             rows = await cursor.fetchall()
             if not rows:
                 return []
-            column_names = [desc[0].strip('"') for desc in cursor.description]
-            final_results = []
-            adapters = column_adapters or {}
-            mapping = column_mapping or {}
-            for row in rows:
-                row_dict = dict(zip(column_names, row))
-                adapted_row = self._adapt_row_types(row_dict, adapters)
-                final_row = self._remap_row_columns(adapted_row, mapping)
-                final_results.append(final_row)
-            return final_results
+            column_names = self._result_column_names(cursor)
+            if as_tuples:
+                return self._row_converter(column_names, column_adapters).to_tuples(rows)
+            return self._row_converter(column_names, column_adapters, column_mapping).to_dicts(rows)
         except Exception as e:
             self.logger.error(f"Error processing async result set: {str(e)}", exc_info=True)
             raise
@@ -34,6 +34,7 @@ except UnsupportedFeatureError as e:
 """
 
 from .base import SQLDialectBase
+from .statement_cache import StatementCache, StatementCacheStats
 from .exceptions import UnsupportedFeatureError, ProtocolNotImplementedError
 from .protocols import (
     WindowFunctionSupport,
@@ -107,6 +108,9 @@ from ..expression import ExplainType, ExplainFormat, ExplainOptions
 __all__ = [
     # Base classes
     "SQLDialectBase",
+    # Compiled statement cache
+    "StatementCache",
+    "StatementCacheStats",
     # Exceptions
     "UnsupportedFeatureError",
     "ProtocolNotImplementedError",
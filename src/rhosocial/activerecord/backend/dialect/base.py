@@ -9,6 +9,7 @@ implementations for standard SQL features.
 from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from .exceptions import ProtocolNotImplementedError, UnsupportedFeatureError
+from .statement_cache import StatementCache
 from ..expression import bases, ForUpdateClause
 from ..expression.bases import ToSQLProtocol
 from ..expression.statements import QueryExpression, ColumnDefinition
@@ -70,6 +71,8 @@ class SQLDialectBase:
         """Initialize SQL dialect."""
         # Add strict validation flag with default as True for safety
         self.strict_validation = True
+        # Compiled SELECT statements keyed by expression shape (see QueryExpression.to_sql)
+        self.statement_cache = StatementCache()
 
     @property
     def name(self) -> str:
@@ -95,6 +98,48 @@ class SQLDialectBase:
         """
         return "?"
 
+    def get_max_bind_parameters(self) -> int:
+        """
+        Get the maximum number of bound parameters allowed in one statement.
+
+        Callers that expand collections into placeholders (IN lists, multi-row
+        VALUES) split their input so that no statement exceeds this limit.
+
+        Returns:
+            Maximum number of parameters. The default is deliberately
+            conservative; dialects override it with their driver's real limit.
+        """
+        return 999
+
+    def last_insert_id_is_first_row(self) -> bool:
+        """
+        Whether ``last_insert_id`` after a multi-row INSERT identifies the first row.
+
+        Bulk inserts on dialects without RETURNING derive the generated keys of
+        all rows of a statement from ``last_insert_id``, which is consecutive
+        within one statement. SQLite reports the id of the last inserted row;
+        MySQL, for example, reports the id of the first one.
+
+        Returns:
+            True if ``last_insert_id`` is the id of the first inserted row,
+            False if it is the id of the last one.
+        """
+        return False
+
+    def returning_preserves_insert_order(self) -> bool:
+        """
+        Whether the RETURNING rows of a multi-row INSERT follow the VALUES order.
+
+        Bulk inserts pair returned rows with their records by position only
+        when this holds, and otherwise derive generated keys from
+        ``last_insert_id``. SQLite documents the order as unspecified, and most
+        databases make no such promise either.
+
+        Returns:
+            True if the rows are returned in VALUES order.
+        """
+        return False
+
     # Standard isolation level name mapping
     # Maps IsolationLevel enum name to SQL standard name
     ISOLATION_LEVEL_NAMES = {
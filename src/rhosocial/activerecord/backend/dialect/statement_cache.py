@@ -0,0 +1,462 @@
+# src/rhosocial/activerecord/backend/dialect/statement_cache.py
+"""
+Compiled statement cache for SQL dialects.
+
+Formatting a QueryExpression walks the whole expression tree and calls into
+the dialect for every node (plus strict validation when it is enabled).
+Applications usually issue a small set of distinct query *shapes* whose bound
+values change from call to call, so this module caches the compiled SQL string
+per shape and only re-collects the parameter values on a hit.
+
+A shape is identified by a structural fingerprint of the expression tree:
+expression classes, structural attributes (identifiers, operators, modifiers,
+aliases) and the number and Python types of the bound values. Bound values
+themselves - Literal values, raw SQL parameters and plain numbers such as
+LIMIT/OFFSET - are excluded from the fingerprint and collected as slots in
+traversal order.
+
+On a miss the statement is compiled twice: once as usual and once on a copy
+whose slots have been replaced by markers. The marker compilation reveals
+which slot feeds each placeholder. If the two SQL strings differ (the dialect
+rendered a value inline or branched on it) the shape is remembered as
+uncacheable and is always compiled normally.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+from ..expression.bases import BaseExpression, SQLQueryAndParams
+from ..expression.core import Literal
+
+# Attributes holding ready-made parameter tuples (RawSQLExpression, RawSQLPredicate, Subquery).
+_PARAMS_ATTRIBUTES = frozenset(("params", "query_params"))
+
+# Plain numbers found outside of a Literal (e.g. LimitOffsetClause.limit) are bound values too.
+_NUMERIC_TYPES = (int, float, Decimal)
+
+_COLLECTION_TYPES = (list, tuple, set, frozenset)
+
+_MAX_DEPTH = 64
+
+_MISSING = object()
+
+
+class _Uncacheable(Exception):
+    """Raised internally when an expression tree cannot be fingerprinted."""
+
+
+class _Slot:
+    """Marker substituted for a bound value while resolving parameter positions."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int):
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"_Slot({self.index})"
+
+
+# Value kinds used by the fingerprint walker. Dispatch is keyed on the exact
+# class because isinstance() checks against BaseExpression go through the
+# runtime-checkable ToSQLProtocol machinery and are comparatively slow.
+_KIND_EXPRESSION = 0
+_KIND_STRUCTURAL = 1
+_KIND_NUMERIC = 2
+_KIND_LIST = 3
+_KIND_TUPLE = 4
+_KIND_DICT = 5
+_KIND_OTHER = 6
+
+_kind_cache: dict = {type(None): _KIND_STRUCTURAL}
+
+
+def _kind_of(cls: type) -> int:
+    kind = _kind_cache.get(cls)
+    if kind is None:
+        if issubclass(cls, BaseExpression):
+            kind = _KIND_EXPRESSION
+        elif issubclass(cls, (str, bool, Enum)):
+            kind = _KIND_STRUCTURAL
+        elif issubclass(cls, _NUMERIC_TYPES):
+            kind = _KIND_NUMERIC
+        elif cls is list:
+            kind = _KIND_LIST
+        elif cls is tuple:
+            kind = _KIND_TUPLE
+        elif cls is dict:
+            kind = _KIND_DICT
+        else:
+            kind = _KIND_OTHER
+        _kind_cache[cls] = kind
+    return kind
+
+
+def _walk(node: BaseExpression, tokens: list, values: list, dialect, depth: int, substitute: bool) -> None:
+    """Append the shape tokens and bound values of ``node`` (recursively).
+
+    Written as a single flat function because it runs on every cached
+    compilation. In substitute mode, which is only ever used on a private deep
+    copy, every bound value is replaced in place by a ``_Slot`` marker.
+    """
+    if depth > _MAX_DEPTH:
+        raise _Uncacheable("expression tree too deep")
+    cls = node.__class__
+    tokens.append(cls)
+    is_literal = issubclass(cls, Literal)
+    items = list(node.__dict__.items()) if substitute else node.__dict__.items()
+    for name, value in items:
+        if name == "_dialect" or value is dialect:
+            continue
+        tokens.append(name)
+        value_cls = value.__class__
+        if is_literal and name == "value":
+            if value_cls in _COLLECTION_TYPES:
+                tokens.append((value_cls, len(value)))
+                slots = [_slot(item, tokens, values, substitute) for item in value]
+                if substitute:
+                    # Sets become lists so that marker order follows iteration order.
+                    setattr(node, name, tuple(slots) if value_cls is tuple else slots)
+            else:
+                new_value = _slot(value, tokens, values, substitute)
+                if substitute:
+                    setattr(node, name, new_value)
+            continue
+        if name in _PARAMS_ATTRIBUTES and value_cls is tuple:
+            tokens.append(len(value))
+            slots = tuple(_slot(item, tokens, values, substitute) for item in value)
+            if substitute:
+                setattr(node, name, slots)
+            continue
+        kind = _kind_cache.get(value_cls)
+        if kind is None:
+            kind = _kind_of(value_cls)
+        if kind == _KIND_STRUCTURAL:
+            tokens.append(value)
+        elif kind == _KIND_EXPRESSION:
+            _walk(value, tokens, values, dialect, depth + 1, substitute)
+        else:
+            new_value = _walk_value(value, kind, tokens, values, dialect, depth, substitute)
+            if substitute and new_value is not value:
+                setattr(node, name, new_value)
+
+
+def _slot(value: Any, tokens: list, values: list, substitute: bool) -> Any:
+    """Record ``value`` as a bound value; return its marker in substitute mode."""
+    tokens.append(value.__class__)
+    values.append(value)
+    return _Slot(len(values) - 1) if substitute else value
+
+
+def _walk_value(value: Any, kind: int, tokens: list, values: list, dialect, depth: int, substitute: bool) -> Any:
+    """Handle attribute values that are neither expressions nor structural scalars."""
+    if kind == _KIND_NUMERIC:
+        return _slot(value, tokens, values, substitute)
+    if kind == _KIND_LIST or kind == _KIND_TUPLE:
+        tokens.append((value.__class__, len(value)))
+        new_items = []
+        for item in value:
+            item_kind = _kind_cache.get(item.__class__)
+            if item_kind is None:
+                item_kind = _kind_of(item.__class__)
+            if item_kind == _KIND_STRUCTURAL:
+                tokens.append(item)
+                new_items.append(item)
+            elif item_kind == _KIND_EXPRESSION:
+                _walk(item, tokens, values, dialect, depth + 1, substitute)
+                new_items.append(item)
+            else:
+                new_items.append(_walk_value(item, item_kind, tokens, values, dialect, depth + 1, substitute))
+        if not substitute:
+            return value
+        if kind == _KIND_LIST:
+            value[:] = new_items
+            return value
+        return tuple(new_items)
+    if kind == _KIND_DICT:
+        tokens.append((dict, len(value)))
+        for key, item in list(value.items()):
+            tokens.append(key)
+            item_kind = _kind_cache.get(item.__class__)
+            if item_kind is None:
+                item_kind = _kind_of(item.__class__)
+            if item_kind == _KIND_STRUCTURAL:
+                tokens.append(item)
+            elif item_kind == _KIND_EXPRESSION:
+                _walk(item, tokens, values, dialect, depth + 1, substitute)
+            else:
+                new_item = _walk_value(item, item_kind, tokens, values, dialect, depth + 1, substitute)
+                if substitute and new_item is not item:
+                    value[key] = new_item
+        return value
+    try:
+        hash(value)
+    except TypeError:
+        raise _Uncacheable(f"unhashable attribute of type {value.__class__.__name__}") from None
+    tokens.append(value)
+    return value
+
+
+def fingerprint_expression(expr: BaseExpression) -> Optional[Tuple[Hashable, List[Any]]]:
+    """Compute the structural fingerprint of an expression tree.
+
+    Args:
+        expr: The root expression.
+
+    Returns:
+        A ``(key, values)`` tuple where ``key`` is a hashable shape key and
+        ``values`` lists the bound values in traversal order, or None if the
+        tree contains something that cannot be fingerprinted.
+    """
+    tokens: list = []
+    values: list = []
+    try:
+        _walk(expr, tokens, values, expr.dialect, 0, False)
+    except _Uncacheable:
+        return None
+    return tuple(tokens), values
+
+
+def _same_value(left: Any, right: Any) -> bool:
+    if left is right:
+        return True
+    try:
+        return bool(left == right)
+    except Exception:
+        return False
+
+
+class CompiledStatement:
+    """A cached SQL string plus the recipe for rebuilding its parameter tuple.
+
+    Attributes:
+        sql: The compiled SQL string.
+        bindings: One ``(is_slot, value)`` pair per placeholder. When ``is_slot``
+            is True, ``value`` is the index of the bound value in traversal
+            order; otherwise it is a constant parameter produced by the
+            structure itself.
+    """
+
+    __slots__ = ("sql", "bindings", "_direct")
+
+    def __init__(self, sql: str, bindings: Tuple[Tuple[bool, Any], ...], slot_count: int):
+        self.sql = sql
+        self.bindings = bindings
+        # Fast path: placeholders consume every bound value in traversal order.
+        self._direct = len(bindings) == slot_count and all(
+            is_slot and value == position for position, (is_slot, value) in enumerate(bindings)
+        )
+
+    def bind(self, values: List[Any]) -> SQLQueryAndParams:
+        """Return the cached SQL together with parameters built from ``values``."""
+        if self._direct:
+            return self.sql, tuple(values)
+        return self.sql, tuple(values[value] if is_slot else value for is_slot, value in self.bindings)
+
+
+@dataclass
+class StatementCacheStats:
+    """Statement cache counters.
+
+    Attributes:
+        hits: Compilations answered from the cache.
+        misses: Compilations of a shape not yet in the cache.
+        evictions: Entries dropped because the cache was full.
+        uncacheable: Compilations that bypassed the cache because the shape
+            could not be fingerprinted or was rendered value-dependently.
+        size: Current number of entries.
+        max_size: Maximum number of entries (0 disables the cache).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    uncacheable: int = 0
+    size: int = 0
+    max_size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cache lookups that were hits (0.0 ~ 1.0)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "uncacheable": self.uncacheable,
+            "size": self.size,
+            "max_size": self.max_size,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class StatementCache:
+    """Bounded LRU cache of compiled statements keyed by expression shape.
+
+    Each dialect instance owns one cache. Setting ``max_size`` to 0 disables
+    caching entirely.
+
+    Example:
+        sql, params = dialect.statement_cache.compile(query_expr, dialect.format_query_statement)
+        print(dialect.statement_cache.stats.hit_rate)
+    """
+
+    DEFAULT_MAX_SIZE = 256
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size < 0:
+            raise ValueError("max_size must be a non-negative integer")
+        self._max_size = max_size
+        # Shape key -> CompiledStatement, or None for shapes known to be uncacheable.
+        self._entries: "OrderedDict[Hashable, Optional[CompiledStatement]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._uncacheable = 0
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of cached shapes."""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("max_size must be a non-negative integer")
+        with self._lock:
+            self._max_size = value
+            self._evict_overflow()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self._max_size > 0
+
+    @property
+    def stats(self) -> StatementCacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return StatementCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                uncacheable=self._uncacheable,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._uncacheable = 0
+
+    def compile(
+        self, expr: BaseExpression, formatter: Callable[[BaseExpression], SQLQueryAndParams]
+    ) -> SQLQueryAndParams:
+        """Compile ``expr`` with ``formatter``, reusing the SQL of a previously seen shape.
+
+        Compilations nested inside another cached compilation (subqueries,
+        set operations) always go straight to ``formatter``.
+
+        Args:
+            expr: The statement expression to compile.
+            formatter: The dialect method that formats ``expr`` uncached.
+
+        Returns:
+            Tuple of (SQL string, parameters tuple).
+        """
+        if self._max_size <= 0 or getattr(self._local, "active", False):
+            return formatter(expr)
+
+        fingerprint = fingerprint_expression(expr)
+        if fingerprint is None:
+            with self._lock:
+                self._uncacheable += 1
+            return formatter(expr)
+        key, values = fingerprint
+
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                self._entries.move_to_end(key)
+                if entry is None:
+                    self._uncacheable += 1
+                else:
+                    self._hits += 1
+            else:
+                self._misses += 1
+
+        if entry is not _MISSING and entry is not None:
+            return entry.bind(values)
+
+        self._local.active = True
+        try:
+            sql, params = formatter(expr)
+            if entry is _MISSING:
+                entry = self._resolve(expr, formatter, sql, params, values)
+                self._store(key, entry)
+        finally:
+            self._local.active = False
+        return sql, params
+
+    def _resolve(
+        self,
+        expr: BaseExpression,
+        formatter: Callable[[BaseExpression], SQLQueryAndParams],
+        sql: str,
+        params: tuple,
+        values: List[Any],
+    ) -> Optional[CompiledStatement]:
+        """Work out which bound value feeds each placeholder of ``sql``."""
+        dialect = expr.dialect
+        try:
+            clone = copy.deepcopy(expr, {id(dialect): dialect})
+            _walk(clone, [], [], dialect, 0, True)
+            marker_sql, marker_params = formatter(clone)
+        except Exception:
+            return None
+        if marker_sql != sql or len(marker_params) != len(params):
+            return None
+
+        bindings = []
+        for position, marker in enumerate(marker_params):
+            if isinstance(marker, _Slot):
+                if not _same_value(values[marker.index], params[position]):
+                    return None
+                bindings.append((True, marker.index))
+            else:
+                # A value the structure itself produced; it must not depend on any slot.
+                if not _same_value(marker, params[position]):
+                    return None
+                bindings.append((False, marker))
+        return CompiledStatement(sql, tuple(bindings), len(values))
+
+    def _store(self, key: Hashable, entry: Optional[CompiledStatement]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict_overflow()
+
+    def _evict_overflow(self) -> None:
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
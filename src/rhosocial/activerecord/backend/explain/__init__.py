@@ -11,9 +11,11 @@ Quick start::
         SyncExplainBackendMixin,
         AsyncExplainBackendMixin,
     )
+
+BaseExplainResult is a pydantic model and is loaded on first access, so
+importing a backend does not import pydantic.
 """
 
-from .types import BaseExplainResult
 from .protocols import SyncExplainBackendProtocol, AsyncExplainBackendProtocol
 from .backend_mixin import (
     _ExplainMixinBase,
@@ -32,3 +34,12 @@ __all__ = [
     "SyncExplainBackendMixin",
     "AsyncExplainBackendMixin",
 ]
+
+
+def __getattr__(name: str):
+    """Lazily load BaseExplainResult (PEP 562)."""
+    if name == "BaseExplainResult":
+        from .types import BaseExplainResult
+
+        return BaseExplainResult
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
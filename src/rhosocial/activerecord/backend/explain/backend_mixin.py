@@ -37,9 +37,8 @@ Async backend::
 import time
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from .types import BaseExplainResult
-
 if TYPE_CHECKING:  # pragma: no cover
+    from .types import BaseExplainResult
     from ..expression.bases import BaseExpression
     from ..expression.statements import ExplainOptions
 
@@ -83,7 +82,7 @@ class _ExplainMixinBase:
         raw_rows: List[Dict[str, Any]],
         sql: str,
         duration: float,
-    ) -> BaseExplainResult:
+    ) -> "BaseExplainResult":
         """Parse raw fetch_all() rows into a structured result object.
 
         The default implementation returns a plain BaseExplainResult.
@@ -98,6 +97,9 @@ class _ExplainMixinBase:
         Returns:
             A BaseExplainResult (or subclass) instance.
         """
+        # Result types are pydantic models; import them on first EXPLAIN only
+        from .types import BaseExplainResult
+
         return BaseExplainResult(raw_rows=raw_rows, sql=sql, duration=duration)
 
 
@@ -120,7 +122,7 @@ class SyncExplainBackendMixin(_ExplainMixinBase):
         self,
         expression: "BaseExpression",
         options: Optional["ExplainOptions"] = None,
-    ) -> BaseExplainResult:
+    ) -> "BaseExplainResult":
         """Execute EXPLAIN *expression* synchronously.
 
         Args:
@@ -156,7 +158,7 @@ class AsyncExplainBackendMixin(_ExplainMixinBase):
         self,
         expression: "BaseExpression",
         options: Optional["ExplainOptions"] = None,
-    ) -> BaseExplainResult:
+    ) -> "BaseExplainResult":
         """Execute EXPLAIN *expression* asynchronously.
 
         Args:
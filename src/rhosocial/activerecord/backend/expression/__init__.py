@@ -19,278 +19,6 @@ from .bases import (
     SQLQueryAndParams,
     is_sql_query_and_params,
 )
-from .executable import Executable
-from .mixins import AliasableMixin
-from .literals import (
-    Identifier,
-)
-from .operators import (
-    SQLOperation,
-    BinaryExpression,
-    UnaryExpression,
-    RawSQLExpression,
-    RawSQLPredicate,
-    BinaryArithmeticExpression,
-)
-from .core import (
-    Column,
-    FunctionCall,
-    Subquery,
-    TableExpression,
-    Literal,
-    WildcardExpression,
-)
-from .predicates import (
-    ComparisonPredicate,
-    LogicalPredicate,
-    LikePredicate,
-    InPredicate,
-    BetweenPredicate,
-    IsNullPredicate,
-    IsBooleanPredicate,
-)
-from .aggregates import (
-    AggregateFunctionCall,
-)
-from .advanced_functions import (
-    CaseExpression,
-    ExistsExpression,
-    AnyExpression,
-    AllExpression,
-    WindowFrameSpecification,
-    WindowSpecification,
-    WindowDefinition,
-    WindowClause,
-    WindowFunctionCall,
-    JSONExpression,
-    ArrayExpression,
-    OrderedSetAggregation,
-)
-from .query_parts import (
-    GroupingExpression,
-    JoinExpression,
-    JoinType,
-    WhereClause,
-    GroupByHavingClause,
-    OrderByClause,
-    LimitOffsetClause,
-    QualifyClause,
-    ForUpdateClause,
-)
-from .query_sources import (
-    SetOperationExpression,
-    CTEExpression,
-    WithQueryExpression,
-    ValuesExpression,
-    TableFunctionExpression,
-    LateralExpression,
-    JSONTableColumn,
-    JSONTableExpression,
-)
-from .statements import (
-    QueryExpression,
-    DeleteExpression,
-    UpdateExpression,
-    InsertExpression,
-    ExplainExpression,
-    MergeActionType,
-    MergeAction,
-    MergeExpression,
-    SelectModifier,
-    ExplainType,
-    ExplainFormat,
-    ExplainOptions,
-    ReturningClause,
-    # Insert Abstractions
-    InsertDataSource,
-    ValuesSource,
-    SelectSource,
-    DefaultValuesSource,
-    OnConflictClause,
-    # DDL Expressions
-    ColumnDefinition,
-    ColumnConstraint,
-    ColumnConstraintType,
-    IndexDefinition,
-    TableConstraint,
-    TableConstraintType,
-    ForeignKeyConstraint,
-    CreateTableExpression,
-    DropTableExpression,
-    CreateViewExpression,
-    DropViewExpression,
-    ViewOptions,
-    ViewCheckOption,
-    AlterTableAction,
-    AddColumn,
-    DropColumn,
-    AlterColumn,
-    AddConstraint,
-    DropConstraint,
-    RenameObject,
-    AddIndex,
-    DropIndex,
-    AlterTableExpression,
-    TruncateExpression,
-    # New DDL Expressions
-    CreateSchemaExpression,
-    DropSchemaExpression,
-    CreateIndexExpression,
-    DropIndexExpression,
-    CreateSequenceExpression,
-    DropSequenceExpression,
-    AlterSequenceExpression,
-    # Materialized View DDL Expressions
-    CreateMaterializedViewExpression,
-    DropMaterializedViewExpression,
-    RefreshMaterializedViewExpression,
-    # Trigger DDL Expressions
-    CreateTriggerExpression,
-    DropTriggerExpression,
-    TriggerTiming,
-    TriggerEvent,
-    TriggerLevel,
-    # Function DDL Expressions
-    CreateFunctionExpression,
-    DropFunctionExpression,
-)
-from .graph import (
-    GraphEdgeDirection,
-    GraphVertex,
-    GraphEdge,
-    MatchClause,
-)
-from .introspection import (
-    IntrospectionExpression,
-    TableListExpression,
-    TableInfoExpression,
-    ColumnInfoExpression,
-    IndexInfoExpression,
-    ForeignKeyExpression,
-    ViewListExpression,
-    ViewInfoExpression,
-    TriggerListExpression,
-    TriggerInfoExpression,
-)
-from .transaction import (
-    TransactionExpression,
-    BeginTransactionExpression,
-    CommitTransactionExpression,
-    RollbackTransactionExpression,
-    SavepointExpression,
-    ReleaseSavepointExpression,
-    SetTransactionExpression,
-)
-
-# Import all function factories
-from .functions import (
-    # Aggregate function factories
-    count,
-    sum_,
-    avg,
-    min_,
-    max_,
-    # Scalar function factories
-    concat,
-    coalesce,
-    # String function factories
-    length,
-    substring,
-    trim,
-    replace,
-    initcap,
-    left,
-    right,
-    lpad,
-    rpad,
-    reverse,
-    strpos,
-    # Math function factories
-    abs_,
-    round_,
-    ceil,
-    floor,
-    sqrt,
-    power,
-    exp,
-    log,
-    sin,
-    cos,
-    tan,
-    # Date/Time function factories
-    now,
-    current_date,
-    current_time,
-    year,
-    month,
-    day,
-    hour,
-    minute,
-    second,
-    date_part,
-    date_trunc,
-    # Conditional function factories
-    case,
-    nullif,
-    greatest,
-    least,
-    # Window function factories
-    row_number,
-    rank,
-    dense_rank,
-    lag,
-    lead,
-    first_value,
-    last_value,
-    nth_value,
-    # JSON function factories
-    json_extract,
-    json_extract_text,
-    json_build_object,
-    json_array_elements,
-    json_objectagg,
-    json_arrayagg,
-    # Array function factories
-    array_agg,
-    unnest,
-    array_length,
-    # Type conversion function factories
-    cast,
-    to_char,
-    to_number,
-    to_date,
-    # Grouping function factories
-    grouping_sets,
-    rollup,
-    cube,
-    # String functions
-    lower,
-    upper,
-    # String concatenation operator
-    concat_op,
-    # SQL standard math functions
-    mod,
-    sign,
-    truncate,
-    # SQL standard string functions
-    chr_,
-    ascii,
-    octet_length,
-    bit_length,
-    position,
-    overlay,
-    translate,
-    repeat,
-    space,
-    # SQL standard datetime functions
-    current_timestamp,
-    localtimestamp,
-    extract,
-    # System information function factories
-    current_user,
-    session_user,
-    system_user,
-)
 
 __all__ = [
     # Base classes and type aliases
@@ -320,6 +48,9 @@ __all__ = [
     "TableExpression",
     "Literal",
     "WildcardExpression",
+    # Late-bound parameters
+    "Param",
+    "PreparedStatement",
     # Predicates
     "ComparisonPredicate",
     "LogicalPredicate",
@@ -542,3 +273,112 @@ __all__ = [
     "session_user",
     "system_user",
 ]
+
+# Everything except the base classes is loaded on first access, so importing
+# one submodule (e.g. expression.transaction) does not load the whole package.
+_LAZY_MODULES = {
+    ".executable": (
+        "Executable",
+    ),
+    ".mixins": (
+        "AliasableMixin",
+    ),
+    ".literals": (
+        "Identifier",
+    ),
+    ".operators": (
+        "SQLOperation", "BinaryExpression", "UnaryExpression", "RawSQLExpression",
+        "RawSQLPredicate", "BinaryArithmeticExpression",
+    ),
+    ".core": (
+        "Column", "FunctionCall", "Subquery", "TableExpression", "Literal", "WildcardExpression",
+    ),
+    ".prepared": (
+        "Param", "PreparedStatement",
+    ),
+    ".predicates": (
+        "ComparisonPredicate", "LogicalPredicate", "LikePredicate", "InPredicate",
+        "BetweenPredicate", "IsNullPredicate", "IsBooleanPredicate",
+    ),
+    ".aggregates": (
+        "AggregateFunctionCall",
+    ),
+    ".advanced_functions": (
+        "CaseExpression", "ExistsExpression", "AnyExpression", "AllExpression",
+        "WindowFrameSpecification", "WindowSpecification", "WindowDefinition", "WindowClause",
+        "WindowFunctionCall", "JSONExpression", "ArrayExpression", "OrderedSetAggregation",
+    ),
+    ".query_parts": (
+        "GroupingExpression", "JoinExpression", "JoinType", "WhereClause", "GroupByHavingClause",
+        "OrderByClause", "LimitOffsetClause", "QualifyClause", "ForUpdateClause",
+    ),
+    ".query_sources": (
+        "SetOperationExpression", "CTEExpression", "WithQueryExpression", "ValuesExpression",
+        "TableFunctionExpression", "LateralExpression", "JSONTableColumn", "JSONTableExpression",
+    ),
+    ".statements": (
+        "QueryExpression", "DeleteExpression", "UpdateExpression", "InsertExpression",
+        "ExplainExpression", "MergeActionType", "MergeAction", "MergeExpression", "SelectModifier",
+        "ExplainType", "ExplainFormat", "ExplainOptions", "ReturningClause", "InsertDataSource",
+        "ValuesSource", "SelectSource", "DefaultValuesSource", "OnConflictClause",
+        "ColumnDefinition", "ColumnConstraint", "ColumnConstraintType", "IndexDefinition",
+        "TableConstraint", "TableConstraintType", "ForeignKeyConstraint", "CreateTableExpression",
+        "DropTableExpression", "CreateViewExpression", "DropViewExpression", "ViewOptions",
+        "ViewCheckOption", "AlterTableAction", "AddColumn", "DropColumn", "AlterColumn",
+        "AddConstraint", "DropConstraint", "RenameObject", "AddIndex", "DropIndex",
+        "AlterTableExpression", "TruncateExpression", "CreateSchemaExpression",
+        "DropSchemaExpression", "CreateIndexExpression", "DropIndexExpression",
+        "CreateSequenceExpression", "DropSequenceExpression", "AlterSequenceExpression",
+        "CreateMaterializedViewExpression", "DropMaterializedViewExpression",
+        "RefreshMaterializedViewExpression", "CreateTriggerExpression", "DropTriggerExpression",
+        "TriggerTiming", "TriggerEvent", "TriggerLevel", "CreateFunctionExpression",
+        "DropFunctionExpression",
+    ),
+    ".graph": (
+        "GraphEdgeDirection", "GraphVertex", "GraphEdge", "MatchClause",
+    ),
+    ".introspection": (
+        "IntrospectionExpression", "TableListExpression", "TableInfoExpression",
+        "ColumnInfoExpression", "IndexInfoExpression", "ForeignKeyExpression",
+        "ViewListExpression", "ViewInfoExpression", "TriggerListExpression",
+        "TriggerInfoExpression",
+    ),
+    ".transaction": (
+        "TransactionExpression", "BeginTransactionExpression", "CommitTransactionExpression",
+        "RollbackTransactionExpression", "SavepointExpression", "ReleaseSavepointExpression",
+        "SetTransactionExpression",
+    ),
+    # Import all function factories
+    ".functions": (
+        "count", "sum_", "avg", "min_", "max_", "concat", "coalesce", "length", "substring",
+        "trim", "replace", "initcap", "left", "right", "lpad", "rpad", "reverse", "strpos", "abs_",
+        "round_", "ceil", "floor", "sqrt", "power", "exp", "log", "sin", "cos", "tan", "now",
+        "current_date", "current_time", "year", "month", "day", "hour", "minute", "second",
+        "date_part", "date_trunc", "case", "nullif", "greatest", "least", "row_number", "rank",
+        "dense_rank", "lag", "lead", "first_value", "last_value", "nth_value", "json_extract",
+        "json_extract_text", "json_build_object", "json_array_elements", "json_objectagg",
+        "json_arrayagg", "array_agg", "unnest", "array_length", "cast", "to_char", "to_number",
+        "to_date", "grouping_sets", "rollup", "cube", "lower", "upper", "concat_op", "mod", "sign",
+        "truncate", "chr_", "ascii", "octet_length", "bit_length", "position", "overlay",
+        "translate", "repeat", "space", "current_timestamp", "localtimestamp", "extract",
+        "current_user", "session_user", "system_user",
+    ),
+}
+
+_LAZY_ATTRIBUTES = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+
+def __getattr__(name: str):
+    """Load re-exported names on first access (PEP 562) and cache them."""
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,146 @@
+# src/rhosocial/activerecord/backend/expression/prepared.py
+"""
+Late-bound named parameters and prepared statement templates.
+
+A ``Param`` stands in for a value that is only known at execution time. It can
+be used wherever a plain value is accepted by the expression system (comparison
+operands, IN lists, LIMIT/OFFSET, raw SQL parameters, ...): the value is wrapped
+in a ``Literal`` as usual and compiles to an ordinary placeholder, with the
+``Param`` object itself in the parameter tuple.
+
+``PreparedStatement`` freezes the result of one compilation. Executing it again
+only replaces the ``Param`` entries of the parameter tuple, so the expression
+tree is neither rebuilt nor re-validated nor re-formatted.
+
+Example:
+    >>> stmt = PreparedStatement.from_expression(
+    ...     QueryExpression(dialect, select=[WildcardExpression(dialect)],
+    ...                     from_=TableExpression(dialect, "users"),
+    ...                     where=Column(dialect, "id") == Param("user_id"))
+    ... )
+    >>> stmt.bind(user_id=42)
+    ('SELECT * FROM "users" WHERE "id" = ?', (42,))
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .bases import BaseExpression, SQLQueryAndParams
+
+_NO_DEFAULT = object()
+
+
+class Param:
+    """A named placeholder whose value is supplied when a prepared statement runs.
+
+    Args:
+        name: Parameter name used as keyword when binding.
+        default: Value used when the parameter is not supplied. Parameters
+            without a default are required.
+    """
+
+    __slots__ = ("name", "default")
+
+    def __init__(self, name: str, default: Any = _NO_DEFAULT):
+        if not isinstance(name, str) or not name:
+            raise ValueError("Param name must be a non-empty string")
+        self.name = name
+        self.default = default
+
+    @property
+    def required(self) -> bool:
+        """Whether a value must be supplied when binding."""
+        return self.default is _NO_DEFAULT
+
+    def __repr__(self) -> str:
+        if self.required:
+            return f"Param({self.name!r})"
+        return f"Param({self.name!r}, default={self.default!r})"
+
+
+class PreparedStatement:
+    """A compiled SQL statement with late-bound ``Param`` slots.
+
+    Attributes:
+        sql: The compiled SQL string.
+        params: The compiled parameter tuple; ``Param`` entries are replaced
+            on every ``bind()``.
+        param_names: Names of all parameters, in order of first appearance.
+    """
+
+    __slots__ = ("sql", "params", "param_names", "_names", "_slots", "_defaults", "_required")
+
+    def __init__(self, sql: str, params: Optional[Tuple] = None):
+        self.sql = sql
+        self.params: Tuple = tuple(params or ())
+        self._slots: List[Tuple[int, str]] = []
+        self._defaults: Dict[str, Any] = {}
+        self._required: List[str] = []
+        names: List[str] = []
+        for position, value in enumerate(self.params):
+            if not isinstance(value, Param):
+                continue
+            self._slots.append((position, value.name))
+            if value.name in names:
+                if self._defaults.get(value.name, _NO_DEFAULT) != value.default:
+                    raise ValueError(f"Parameter '{value.name}' is declared with conflicting defaults")
+                continue
+            names.append(value.name)
+            if value.required:
+                self._required.append(value.name)
+            else:
+                self._defaults[value.name] = value.default
+        self.param_names: Tuple[str, ...] = tuple(names)
+        self._names = frozenset(names)
+
+    @classmethod
+    def from_expression(cls, expression: "BaseExpression") -> "PreparedStatement":
+        """Compile ``expression`` once and freeze the result.
+
+        Args:
+            expression: Any expression whose values may contain ``Param`` objects.
+
+        Returns:
+            PreparedStatement: The frozen statement.
+        """
+        sql, params = expression.to_sql()
+        return cls(sql, params)
+
+    def bind(self, values: Optional[Dict[str, Any]] = None, /, **kwargs: Any) -> "SQLQueryAndParams":
+        """Build the parameter tuple for one execution.
+
+        Values may be passed as a mapping, as keyword arguments, or both
+        (keywords win).
+
+        Returns:
+            Tuple of (SQL string, parameters tuple).
+
+        Raises:
+            ValueError: If a required parameter is missing or an unknown
+                parameter name is supplied.
+        """
+        if values:
+            values = {**values, **kwargs} if kwargs else values
+        else:
+            values = kwargs
+
+        if not self._slots:
+            if values:
+                raise ValueError(f"Unknown parameter(s): {', '.join(sorted(values))}")
+            return self.sql, self.params
+
+        missing = [name for name in self._required if name not in values]
+        if missing:
+            raise ValueError(f"Missing value for parameter(s): {', '.join(missing)}")
+        if not self._names.issuperset(values):
+            unknown = sorted(set(values) - self._names)
+            raise ValueError(f"Unknown parameter(s): {', '.join(unknown)}")
+
+        params = list(self.params)
+        defaults = self._defaults
+        for position, name in self._slots:
+            params[position] = values[name] if name in values else defaults[name]
+        return self.sql, tuple(params)
+
+    def __repr__(self) -> str:
+        return f"PreparedStatement({self.sql!r}, params={self.param_names!r})"
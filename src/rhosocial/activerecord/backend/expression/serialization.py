@@ -346,11 +346,13 @@ def _reconstruct_by_name(
 class ExpressionRegistry:
     """Maps expression FQN to their classes for deserialization.
 
-    Pre-populated with all built-in expression classes.
+    Pre-populated with all built-in expression classes on the first lookup
+    (scanning the expression package is too costly to do at import time).
     Allows registration of user-defined expression subclasses.
     """
 
     _registry: Dict[str, Type[BaseExpression]] = {}
+    _builtins_registered: bool = False
 
     @classmethod
     def register(cls, expr_class: Type[BaseExpression]) -> None:
@@ -383,6 +385,9 @@ class ExpressionRegistry:
         Raises:
             ExpressionDeserializationError: If class not found or ambiguous.
         """
+        if not cls._builtins_registered:
+            cls._auto_register_builtins()
+
         if fqn in cls._registry:
             return cls._registry[fqn]
 
@@ -460,5 +465,4 @@ class ExpressionRegistry:
                 ):
                     cls.register(obj)
 
-
-ExpressionRegistry._auto_register_builtins()
\ No newline at end of file
+        cls._builtins_registered = True
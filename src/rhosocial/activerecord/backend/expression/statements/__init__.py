@@ -8,116 +8,6 @@ for a given SQL statement and delegating the actual SQL string generation
 to a backend-specific dialect.
 """
 
-# DQL
-from .dql import SelectModifier, QueryExpression
-
-# Re-export WhereClause and ForUpdateClause from query_parts for backward compatibility
-from ..query_parts import WhereClause, ForUpdateClause
-
-# EXPLAIN
-from .explain import ExplainType, ExplainFormat, ExplainOptions, ExplainExpression
-
-# DML
-from .dml import (
-    MergeActionType,
-    MergeAction,
-    MergeExpression,
-    ReturningClause,
-    DeleteExpression,
-    UpdateExpression,
-    InsertDataSource,
-    ValuesSource,
-    SelectSource,
-    DefaultValuesSource,
-    OnConflictClause,
-    InsertExpression,
-)
-
-# Table DDL
-from .ddl_table import (
-    ColumnConstraintType,
-    ColumnConstraint,
-    GeneratedColumnType,
-    ColumnDefinition,
-    TableConstraintType,
-    ReferentialAction,
-    ConstraintValidation,
-    TableConstraint,
-    ForeignKeyConstraint,
-    IndexDefinition,
-    CreateTableExpression,
-    DropTableExpression,
-)
-
-# ALTER TABLE DDL
-from .ddl_alter import (
-    AlterTableActionType,
-    AlterTableAction,
-    AddColumn,
-    DropColumn,
-    ColumnAlterOperation,
-    AlterColumn,
-    AddTableConstraint,
-    DropTableConstraint,
-    RenameColumn,
-    RenameTable,
-    AddConstraint,
-    DropConstraint,
-    RenameObject,
-    AddIndex,
-    DropIndex,
-    AlterTableExpression,
-)
-
-# View DDL
-from .ddl_view import (
-    ColumnAlias,
-    ViewAlgorithm,
-    ViewCheckOption,
-    ViewOptions,
-    CreateViewExpression,
-    DropViewExpression,
-    CreateMaterializedViewExpression,
-    DropMaterializedViewExpression,
-    RefreshMaterializedViewExpression,
-)
-
-# Truncate DDL
-from .ddl_truncate import TruncateExpression
-
-# Schema DDL
-from .ddl_schema import CreateSchemaExpression, DropSchemaExpression
-
-# Index DDL
-from .ddl_index import (
-    CreateIndexExpression,
-    DropIndexExpression,
-    CreateFulltextIndexExpression,
-    DropFulltextIndexExpression,
-)
-
-# Sequence DDL
-from .ddl_sequence import (
-    CreateSequenceExpression,
-    DropSequenceExpression,
-    AlterSequenceExpression,
-)
-
-# Trigger DDL
-from .ddl_trigger import (
-    TriggerTiming,
-    TriggerEvent,
-    TriggerLevel,
-    CreateTriggerExpression,
-    DropTriggerExpression,
-)
-
-# Function DDL
-from .ddl_function import CreateFunctionExpression, DropFunctionExpression
-
-# Re-export shared type alias
-from ._types import FromSourceType
-
 __all__ = [
     # DQL
     "SelectModifier",
@@ -209,3 +99,93 @@ __all__ = [
     # Type aliases
     "FromSourceType",
 ]
+
+# Statement classes are loaded on first access; the DDL modules in
+# particular are not needed to build or run ordinary queries.
+_LAZY_MODULES = {
+    # DQL
+    ".dql": (
+        "SelectModifier", "QueryExpression",
+    ),
+    # Re-export WhereClause and ForUpdateClause from query_parts for backward compatibility
+    "..query_parts": (
+        "WhereClause", "ForUpdateClause",
+    ),
+    # EXPLAIN
+    ".explain": (
+        "ExplainType", "ExplainFormat", "ExplainOptions", "ExplainExpression",
+    ),
+    # DML
+    ".dml": (
+        "MergeActionType", "MergeAction", "MergeExpression", "ReturningClause", "DeleteExpression",
+        "UpdateExpression", "InsertDataSource", "ValuesSource", "SelectSource",
+        "DefaultValuesSource", "OnConflictClause", "InsertExpression",
+    ),
+    # Table DDL
+    ".ddl_table": (
+        "ColumnConstraintType", "ColumnConstraint", "GeneratedColumnType", "ColumnDefinition",
+        "TableConstraintType", "ReferentialAction", "ConstraintValidation", "TableConstraint",
+        "ForeignKeyConstraint", "IndexDefinition", "CreateTableExpression", "DropTableExpression",
+    ),
+    # ALTER TABLE DDL
+    ".ddl_alter": (
+        "AlterTableActionType", "AlterTableAction", "AddColumn", "DropColumn",
+        "ColumnAlterOperation", "AlterColumn", "AddTableConstraint", "DropTableConstraint",
+        "RenameColumn", "RenameTable", "AddConstraint", "DropConstraint", "RenameObject",
+        "AddIndex", "DropIndex", "AlterTableExpression",
+    ),
+    # View DDL
+    ".ddl_view": (
+        "ColumnAlias", "ViewAlgorithm", "ViewCheckOption", "ViewOptions", "CreateViewExpression",
+        "DropViewExpression", "CreateMaterializedViewExpression", "DropMaterializedViewExpression",
+        "RefreshMaterializedViewExpression",
+    ),
+    # Truncate DDL
+    ".ddl_truncate": (
+        "TruncateExpression",
+    ),
+    # Schema DDL
+    ".ddl_schema": (
+        "CreateSchemaExpression", "DropSchemaExpression",
+    ),
+    # Index DDL
+    ".ddl_index": (
+        "CreateIndexExpression", "DropIndexExpression", "CreateFulltextIndexExpression",
+        "DropFulltextIndexExpression",
+    ),
+    # Sequence DDL
+    ".ddl_sequence": (
+        "CreateSequenceExpression", "DropSequenceExpression", "AlterSequenceExpression",
+    ),
+    # Trigger DDL
+    ".ddl_trigger": (
+        "TriggerTiming", "TriggerEvent", "TriggerLevel", "CreateTriggerExpression",
+        "DropTriggerExpression",
+    ),
+    # Function DDL
+    ".ddl_function": (
+        "CreateFunctionExpression", "DropFunctionExpression",
+    ),
+    # Re-export shared type alias
+    "._types": (
+        "FromSourceType",
+    ),
+}
+
+_LAZY_ATTRIBUTES = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+
+def __getattr__(name: str):
+    """Load re-exported names on first access (PEP 562) and cache them."""
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -310,11 +310,18 @@ class QueryExpression(ArithmeticMixin, ComparisonMixin, SQLValueExpression):
         database-specific variations in syntax and feature support. The generated SQL
         follows the structure: SELECT ... FROM ... WHERE ... GROUP BY ... HAVING ... etc.
 
+        When the dialect owns a statement cache, queries sharing the same shape
+        reuse the previously compiled SQL string and only re-collect their
+        parameter values.
+
         Returns:
             A tuple containing:
             - str: The complete SQL query string
             - tuple: The parameter values for prepared statement execution
         """
+        statement_cache = getattr(self.dialect, "statement_cache", None)
+        if statement_cache is not None:
+            return statement_cache.compile(self, self.dialect.format_query_statement)
         return self.dialect.format_query_statement(self)
 
 
@@ -9,6 +9,10 @@ Async components (AsyncSQLiteBackend, AsyncSQLiteTransactionManager) are loaded
 to avoid requiring aiosqlite for users who only need synchronous operations.
 Install the async extra to use:
     pip install rhosocial-activerecord[async]
+
+EXPLAIN result types, the extension and pragma frameworks and the SQLite
+function factories are loaded on first access as well, so that importing the
+backend stays cheap for short-lived processes and CLI invocations.
 """
 
 from .backend.sync import SQLiteBackend
@@ -19,125 +23,6 @@ from .transaction import SQLiteTransactionManager
 from .protocols import SQLiteExtensionSupport, SQLitePragmaSupport, SQLiteVirtualTableSupport
 from .mixins import SQLitePragmaMixin, SQLiteExtensionMixin, SQLiteVirtualTableMixin
 
-# EXPLAIN result types
-from .explain import (
-    SQLiteExplainRow,
-    SQLiteExplainQueryPlanRow,
-    SQLiteExplainResult,
-    SQLiteExplainQueryPlanResult,
-)
-
-# Extension framework
-from .extension import (
-    ExtensionType,
-    SQLiteExtensionInfo,
-    SQLiteExtensionProtocol,
-    SQLiteExtensionBase,
-    SQLiteExtensionRegistry,
-    get_registry,
-    reset_registry,
-    KNOWN_EXTENSIONS,
-)
-
-# Extension implementations
-from .extension.extensions import (
-    FTS5Extension,
-    get_fts5_extension,
-    FTS3Extension,
-    FTS4Extension,
-    get_fts3_extension,
-    get_fts4_extension,
-    JSON1Extension,
-    get_json1_extension,
-    RTreeExtension,
-    get_rtree_extension,
-    GeopolyExtension,
-    get_geopoly_extension,
-)
-
-# Pragma framework
-from .pragma import (
-    PragmaCategory,
-    PragmaInfo,
-    PragmaProtocol,
-    PragmaBase,
-    ALL_PRAGMAS,
-    get_pragma_info,
-    get_all_pragma_infos,
-    get_pragma_names,
-    get_pragmas_by_category,
-)
-
-# SQLite-specific function factories
-from .functions import (
-    # String functions
-    substr,
-    instr,
-    printf,
-    unicode,
-    hex,
-    unhex,
-    soundex,
-    group_concat,
-    trim_sqlite,
-    ltrim,
-    rtrim,
-    # Date/Time functions
-    date_func,
-    time_func,
-    datetime_func,
-    julianday,
-    strftime_func,
-    # Math functions
-    random_func,
-    abs_sql,
-    sign,
-    total,
-    # Math enhanced functions
-    round_,
-    pow,
-    power,
-    sqrt,
-    mod,
-    ceil,
-    floor,
-    trunc,
-    max_,
-    min_,
-    avg,
-    # Blob functions
-    zeroblob,
-    randomblob,
-    # System functions
-    typeof,
-    quote,
-    last_insert_rowid,
-    changes,
-    # Conditional functions
-    iif,
-    # JSON functions
-    json,
-    json_array,
-    json_object,
-    json_extract,
-    json_type,
-    json_valid,
-    json_quote,
-    json_remove,
-    json_set,
-    json_insert,
-    json_replace,
-    json_patch,
-    json_array_length,
-    json_array_unpack,
-    json_object_pack,
-    json_object_retrieve,
-    json_object_length,
-    json_object_keys,
-    json_tree,
-    json_each,
-)
-
 __all__ = [
     "SQLiteBackend",
     "AsyncSQLiteBackend",
@@ -256,14 +141,58 @@ __all__ = [
 ]
 
 
+_LAZY_MODULES = {
+    # EXPLAIN result types (pydantic models)
+    ".explain": (
+        "SQLiteExplainRow", "SQLiteExplainQueryPlanRow", "SQLiteExplainResult",
+        "SQLiteExplainQueryPlanResult",
+    ),
+    # Extension framework
+    ".extension": (
+        "ExtensionType", "SQLiteExtensionInfo", "SQLiteExtensionProtocol", "SQLiteExtensionBase",
+        "SQLiteExtensionRegistry", "get_registry", "reset_registry", "KNOWN_EXTENSIONS",
+    ),
+    # Extension implementations
+    ".extension.extensions": (
+        "FTS5Extension", "get_fts5_extension", "FTS3Extension", "FTS4Extension",
+        "get_fts3_extension", "get_fts4_extension", "JSON1Extension", "get_json1_extension",
+        "RTreeExtension", "get_rtree_extension", "GeopolyExtension", "get_geopoly_extension",
+    ),
+    # Pragma framework
+    ".pragma": (
+        "PragmaCategory", "PragmaInfo", "PragmaProtocol", "PragmaBase", "ALL_PRAGMAS",
+        "get_pragma_info", "get_all_pragma_infos", "get_pragma_names", "get_pragmas_by_category",
+    ),
+    # SQLite-specific function factories
+    ".functions": (
+        "substr", "instr", "printf", "unicode", "hex", "unhex", "soundex", "group_concat",
+        "trim_sqlite", "ltrim", "rtrim", "date_func", "time_func", "datetime_func", "julianday",
+        "strftime_func", "random_func", "abs_sql", "sign", "total", "round_", "pow", "power",
+        "sqrt", "mod", "ceil", "floor", "trunc", "max_", "min_", "avg", "zeroblob", "randomblob",
+        "typeof", "quote", "last_insert_rowid", "changes", "iif", "json", "json_array",
+        "json_object", "json_extract", "json_type", "json_valid", "json_quote", "json_remove",
+        "json_set", "json_insert", "json_replace", "json_patch", "json_array_length",
+        "json_array_unpack", "json_object_pack", "json_object_retrieve", "json_object_length",
+        "json_object_keys", "json_tree", "json_each",
+    ),
+}
+
+_LAZY_ATTRIBUTES = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+
 def __getattr__(name: str):
-    """Lazily load async components to avoid forcing aiosqlite dependency.
+    """Lazily load optional and rarely used components (PEP 562).
 
-    This allows users to import SQLiteBackend and other sync components without
-    having aiosqlite installed. Only when async components are actually accessed
-    will aiosqlite be required.
+    Async components are loaded lazily to avoid forcing the aiosqlite
+    dependency: users can import SQLiteBackend without aiosqlite installed,
+    and it is only required when the async components are accessed.
 
-    Lazily loaded components:
+    The names listed in _LAZY_MODULES are loaded lazily to keep
+    ``import rhosocial.activerecord.backend.impl.sqlite`` cheap for
+    short-lived processes; the module is imported on first access and the
+    value is cached in the module namespace.
+
+    Lazily loaded async components:
     - AsyncSQLiteBackend: Async SQLite backend implementation
     - AsyncSQLiteTransactionManager: Async transaction manager
 
@@ -271,6 +200,8 @@ def __getattr__(name: str):
         ImportError: If aiosqlite is not installed when accessing async components.
         AttributeError: If the requested attribute doesn't exist.
     """
+    import importlib
+
     _lazy_imports = {
         "AsyncSQLiteBackend": (".backend.async_backend", "AsyncSQLiteBackend"),
         "AsyncSQLiteTransactionManager": (".async_transaction", "AsyncSQLiteTransactionManager"),
@@ -279,8 +210,6 @@ def __getattr__(name: str):
     if name in _lazy_imports:
         module_path, class_name = _lazy_imports[name]
         try:
-            import importlib
-
             module = importlib.import_module(module_path, __name__)
             return getattr(module, class_name)
         except ImportError as e:
@@ -290,4 +219,13 @@ def __getattr__(name: str):
                 f"or pip install aiosqlite"
             ) from e
 
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -15,7 +15,9 @@ def main():
     )
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    register_commands(subparsers)
+    # Only the first positional argument can name the subcommand
+    command = next((arg for arg in sys.argv[1:] if not arg.startswith('-')), None)
+    register_commands(subparsers, command)
 
     args = parser.parse_args()
 
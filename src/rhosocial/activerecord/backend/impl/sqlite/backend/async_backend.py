@@ -25,12 +25,6 @@ from rhosocial.activerecord.backend.explain import AsyncExplainBackendMixin
 from rhosocial.activerecord.backend.introspection.backend_mixin import IntrospectorBackendMixin
 from rhosocial.activerecord.backend.options import InsertOptions, UpdateOptions, DeleteOptions
 from rhosocial.activerecord.backend.result import QueryResult
-from ..explain import (
-    SQLiteExplainRow,
-    SQLiteExplainQueryPlanRow,
-    SQLiteExplainResult,
-    SQLiteExplainQueryPlanResult,
-)
 
 
 class AsyncSQLiteBackend(
@@ -87,6 +81,13 @@ class AsyncSQLiteBackend(
 
     def _parse_explain_result(self, raw_rows, sql, duration):
         """Return a SQLite-specific typed EXPLAIN result (shared with sync backend)."""
+        from ..explain import (
+            SQLiteExplainRow,
+            SQLiteExplainQueryPlanRow,
+            SQLiteExplainResult,
+            SQLiteExplainQueryPlanResult,
+        )
+
         if "QUERY PLAN" in sql.upper():
             rows = [SQLiteExplainQueryPlanRow(**r) for r in raw_rows]
             return SQLiteExplainQueryPlanResult(
@@ -282,6 +283,8 @@ class AsyncSQLiteBackend(
             duration = time.perf_counter() - start_time
             self.log(logging.INFO, f"Async SQL script executed successfully, duration={duration:.3f}s")
             await self._handle_auto_commit()
+            # Scripts are typically schema dumps/migrations
+            self._on_schema_changed()
 
         except Exception as e:
             self.log(logging.ERROR, f"Error executing async SQL script: {str(e)}")
@@ -312,6 +315,8 @@ class AsyncSQLiteBackend(
                 logging.INFO, f"Batch operation completed, affected {cursor.rowcount} rows, duration={duration:.3f}s"
             )
             await self._handle_auto_commit_if_needed()
+            if self._write_observer is not None:
+                self._write_observer()
 
             return QueryResult(affected_rows=cursor.rowcount, duration=duration)
         except Exception as e:
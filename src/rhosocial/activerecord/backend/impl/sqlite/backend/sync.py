@@ -24,12 +24,6 @@ from rhosocial.activerecord.backend.explain import SyncExplainBackendMixin
 from rhosocial.activerecord.backend.introspection.backend_mixin import IntrospectorBackendMixin
 from rhosocial.activerecord.backend.options import DeleteOptions, InsertOptions, UpdateOptions
 from rhosocial.activerecord.backend.result import QueryResult
-from ..explain import (
-    SQLiteExplainRow,
-    SQLiteExplainQueryPlanRow,
-    SQLiteExplainResult,
-    SQLiteExplainQueryPlanResult,
-)
 
 
 class SQLiteBackend(
@@ -87,6 +81,13 @@ class SQLiteBackend(
         Dispatches to SQLiteExplainQueryPlanResult for ``EXPLAIN QUERY PLAN``
         statements and to SQLiteExplainResult for plain ``EXPLAIN`` statements.
         """
+        from ..explain import (
+            SQLiteExplainRow,
+            SQLiteExplainQueryPlanRow,
+            SQLiteExplainResult,
+            SQLiteExplainQueryPlanResult,
+        )
+
         if "QUERY PLAN" in sql.upper():
             rows = [SQLiteExplainQueryPlanRow(**r) for r in raw_rows]
             return SQLiteExplainQueryPlanResult(
@@ -301,6 +302,8 @@ class SQLiteBackend(
             duration = time.perf_counter() - start_time
             self.log(logging.INFO, f"SQL script executed successfully, duration={duration:.3f}s")
             self._handle_auto_commit()
+            # Scripts are typically schema dumps/migrations
+            self._on_schema_changed()
         except Exception as e:
             self.log(logging.ERROR, f"Error executing SQL script: {str(e)}")
             self._handle_error(e)
@@ -322,6 +325,8 @@ class SQLiteBackend(
                 logging.INFO, f"Batch operation completed, affected {cursor.rowcount} rows, duration={duration:.3f}s"
             )
             self._handle_auto_commit_if_needed()
+            if self._write_observer is not None:
+                self._write_observer()
 
             return QueryResult(affected_rows=cursor.rowcount, duration=duration)
         except Exception as e:
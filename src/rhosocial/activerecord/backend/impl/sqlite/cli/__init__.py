@@ -10,29 +10,21 @@ COMMAND_NAMES = [
 ]
 
 
-def register_commands(subparsers):
-    """Register all subcommands.
+def register_commands(subparsers, command=None):
+    """Register subcommands.
+
+    Each subcommand module imports what its handler needs, so registering
+    only the requested command keeps CLI startup short.
 
     Args:
         subparsers: argparse.Subparsers object
+        command: Subcommand about to run; when None or unknown, all
+            subcommands are registered (needed for --help and usage errors)
     """
-    from .info import create_parser as info_parser
-    from .query import create_parser as query_parser
-    from .introspect import create_parser as introspect_parser
-    from .status import create_parser as status_parser
-    from .named_query import create_parser as nq_parser
-    from .named_procedure import create_parser as np_parser
-    from .named_procedure_graph import create_parser as npg_parser
-    from .named_connection import create_parser as nc_parser
-
-    info_parser(subparsers)
-    query_parser(subparsers)
-    introspect_parser(subparsers)
-    status_parser(subparsers)
-    nq_parser(subparsers)
-    np_parser(subparsers)
-    npg_parser(subparsers)
-    nc_parser(subparsers)
+    names = [command] if command in COMMAND_NAMES else COMMAND_NAMES
+    for name in names:
+        module = importlib.import_module(f'.{name.replace("-", "_")}', __name__)
+        module.create_parser(subparsers)
 
 
 def get_handler(command_name: str):
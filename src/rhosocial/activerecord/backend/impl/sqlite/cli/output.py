@@ -1,24 +1,27 @@
 # src/rhosocial/activerecord/backend/impl/sqlite/cli/output.py
 """Output provider factory and rich display utilities."""
 
+import importlib.util
 import json
 from typing import Dict
 
-from rhosocial.activerecord.backend.output import JsonOutputProvider, CsvOutputProvider, TsvOutputProvider
+from rhosocial.activerecord.backend.output import (
+    JsonOutputProvider,
+    NdjsonOutputProvider,
+    CsvOutputProvider,
+    TsvOutputProvider,
+)
 
-try:
-    from rhosocial.activerecord.backend.output_rich import RichOutputProvider
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    RichOutputProvider = None  # type: ignore[misc,assignment]
+# Only check that rich is installed; importing it is left to the first
+# table output so that json/csv runs do not pay for it.
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
 
 
 def create_provider(output_format: str, ascii_borders: bool = False):
     """Create an output provider based on format.
 
     Args:
-        output_format: Output format (table/json/csv/tsv)
+        output_format: Output format (table/json/ndjson/csv/tsv)
         ascii_borders: Whether to use ASCII borders (table format only)
 
     Returns:
@@ -29,9 +32,12 @@ def create_provider(output_format: str, ascii_borders: bool = False):
 
     if output_format == "table" and RICH_AVAILABLE:
         from rich.console import Console
+        from rhosocial.activerecord.backend.output_rich import RichOutputProvider
         return RichOutputProvider(console=Console(), ascii_borders=ascii_borders)
     if output_format == "json":
         return JsonOutputProvider()
+    if output_format == "ndjson":
+        return NdjsonOutputProvider()
     if output_format == "csv":
         return CsvOutputProvider()
     if output_format == "tsv":
@@ -2,6 +2,12 @@
 """query subcommand - Execute SQL queries.
 
 query requires connection arguments and --log-level (only query uses this argument).
+
+Result sets are streamed: rows are read from the cursor --page-size at a
+time with fetchmany() and handed to the output provider page by page, so
+json/ndjson/csv/tsv output starts immediately and memory use does not grow
+with the size of the result. The table format still needs every row to lay
+out its columns and buffers the result.
 """
 
 import argparse
@@ -11,13 +17,15 @@ import time
 
 from rhosocial.activerecord.backend.impl.sqlite.backend import SQLiteBackend
 from rhosocial.activerecord.backend.errors import ConnectionError, QueryError
+from rhosocial.activerecord.backend.expression.operators import RawSQLExpression
 from rhosocial.activerecord.backend.options import ExecutionOptions
 from rhosocial.activerecord.backend.schema import StatementType
 
 from .connection import add_connection_args, resolve_connection_config_from_args
 from .output import create_provider, RICH_AVAILABLE
 
-OUTPUT_CHOICES = ['table', 'json', 'csv', 'tsv']
+OUTPUT_CHOICES = ['table', 'json', 'ndjson', 'csv', 'tsv']
+DEFAULT_PAGE_SIZE = 1000
 
 
 def create_parser(subparsers):
@@ -40,6 +48,9 @@ def create_parser(subparsers):
 
   # Execute multi-statement script
   %(prog)s query --db-file mydb.sqlite --executescript -f script.sql
+
+  # Stream a large table as newline-delimited JSON, 5000 rows per fetch
+  %(prog)s query --db-file big.sqlite -o ndjson --page-size 5000 "SELECT * FROM events"
 """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -86,6 +97,12 @@ def create_parser(subparsers):
         action="store_true",
         help="Execute the input as a multi-statement script.",
     )
+    parser.add_argument(
+        "--page-size",
+        type=_positive_int,
+        default=DEFAULT_PAGE_SIZE,
+        help=f"Rows fetched per round trip when streaming query results (default: {DEFAULT_PAGE_SIZE}).",
+    )
 
     return parser
 
@@ -99,15 +116,12 @@ def handle(args):
 
     provider = create_provider(args.output, ascii_borders=args.rich_ascii)
 
-    if RICH_AVAILABLE:
-        from rhosocial.activerecord.backend.output_rich import RichOutputProvider
-        if isinstance(provider, RichOutputProvider):
-            from rich.console import Console
-            from rich.logging import RichHandler
-            handler = RichHandler(rich_tracebacks=True, show_path=False, console=Console(stderr=True))
-            logging.basicConfig(level=numeric_level, format="%(message)s", datefmt="[%X]", handlers=[handler])
-        else:
-            logging.basicConfig(level=numeric_level, format="%(asctime)s - %(levelname)s - %(message)s", stream=sys.stderr)
+    # create_provider() returns the rich table provider exactly in this case
+    if RICH_AVAILABLE and args.output == "table":
+        from rich.console import Console
+        from rich.logging import RichHandler
+        handler = RichHandler(rich_tracebacks=True, show_path=False, console=Console(stderr=True))
+        logging.basicConfig(level=numeric_level, format="%(message)s", datefmt="[%X]", handlers=[handler])
     else:
         logging.basicConfig(level=numeric_level, format="%(asctime)s - %(levelname)s - %(message)s", stream=sys.stderr)
 
@@ -138,13 +152,21 @@ def handle(args):
     if args.executescript:
         _execute_script(sql_source, backend, provider)
     else:
-        _execute_query(sql_source, backend, provider, use_ascii=args.rich_ascii)
+        _execute_query(sql_source, backend, provider, page_size=args.page_size, use_ascii=args.rich_ascii)
 
 
 # ---------------------------------------------------------------------------
 # Internal helper functions
 # ---------------------------------------------------------------------------
 
+def _positive_int(value: str) -> int:
+    """argparse type for --page-size."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
 def _guess_statement_type(sql: str) -> StatementType:
     """Guess the statement type from SQL text."""
     sql_stripped = sql.strip().upper()
@@ -158,13 +180,17 @@ def _guess_statement_type(sql: str) -> StatementType:
         return StatementType.OTHER
 
 
-def _execute_query(sql_query: str, backend: SQLiteBackend, provider, **kwargs):
+def _execute_query(sql_query: str, backend: SQLiteBackend, provider, page_size: int = DEFAULT_PAGE_SIZE, **kwargs):
     """Execute a single SQL query and display results."""
     try:
         backend.connect()
         provider.display_query(sql_query, is_async=False)
 
         stmt_type = _guess_statement_type(sql_query)
+        if stmt_type == StatementType.DQL:
+            _stream_query(sql_query, backend, provider, page_size, **kwargs)
+            return
+
         exec_options = ExecutionOptions(stmt_type=stmt_type)
 
         result = backend.execute(sql_query, options=exec_options)
@@ -193,6 +219,27 @@ def _execute_query(sql_query: str, backend: SQLiteBackend, provider, **kwargs):
         provider.display_disconnect(is_async=False)
 
 
+def _stream_query(sql_query: str, backend: SQLiteBackend, provider, page_size: int, **kwargs):
+    """Run a query and pass its rows to the provider one fetchmany() page at a time."""
+    start_time = time.perf_counter()
+    row_count = 0
+    pages = backend.execute_batch_dql(RawSQLExpression(backend.dialect, sql_query), page_size=page_size)
+    try:
+        for page in pages:
+            if row_count == 0:
+                provider.begin_results(list(page.data[0].keys()), **kwargs)
+            provider.write_rows(page.data, **kwargs)
+            row_count += page.page_size
+    finally:
+        pages.close()
+
+    if row_count:
+        provider.end_results(**kwargs)
+    provider.display_success(row_count, time.perf_counter() - start_time)
+    if not row_count:
+        provider.display_no_data()
+
+
 def _execute_script(sql_script: str, backend: SQLiteBackend, provider):
     """Execute a multi-statement SQL script."""
     try:
@@ -92,6 +92,7 @@ if TYPE_CHECKING:
     )
     from rhosocial.activerecord.backend.expression.statements import (
         ExplainExpression,
+        CreateTableExpression,
         CreateViewExpression,
         DropViewExpression,
         CreateMaterializedViewExpression,
@@ -217,9 +218,23 @@ class SQLiteDialect(
         self._runtime_params: Dict[str, Any] = {}
         super().__init__()
 
+    @property
+    def version(self) -> Tuple[int, int, int]:
+        """SQLite version this dialect generates SQL for."""
+        return self._version
+
+    @version.setter
+    def version(self, value: Tuple[int, int, int]) -> None:
+        self._version = value
+        # SQL compiled for the previous version may no longer be valid.
+        statement_cache = getattr(self, "statement_cache", None)
+        if statement_cache is not None:
+            statement_cache.clear()
+
     def set_runtime_param(self, key: str, value: Any) -> None:
         """Set a runtime parameter (detected after connection)."""
         self._runtime_params[key] = value
+        self.statement_cache.clear()
 
     def get_runtime_param(self, key: str, default: Any = None) -> Any:
         """Get a runtime parameter."""
@@ -229,6 +244,10 @@ class SQLiteDialect(
         """SQLite uses '?' for placeholders."""
         return "?"
 
+    def get_max_bind_parameters(self) -> int:
+        """SQLITE_MAX_VARIABLE_NUMBER: 999 before 3.32.0, 32766 since."""
+        return 32766 if self.version >= (3, 32, 0) else 999
+
     def get_server_version(self) -> Tuple[int, int, int]:
         """Return the SQLite version this dialect is configured for."""
         return self.version
@@ -949,6 +968,27 @@ class SQLiteDialect(
         """SQLite does not support CASCADE for DROP VIEW."""
         return False
 
+    def format_create_table_statement(self, expr: "CreateTableExpression") -> Tuple[str, tuple]:
+        """Format CREATE TABLE statement for SQLite.
+
+        SQLite's CREATE TABLE ... AS takes a bare SELECT: no column list and
+        no parentheses around the query. Other forms use the base formatter.
+        """
+        if expr.as_query is None:
+            return super().format_create_table_statement(expr)
+
+        parts = ["CREATE"]
+        if expr.temporary:
+            parts.append("TEMPORARY")
+        parts.append("TABLE")
+        if expr.if_not_exists:
+            parts.append("IF NOT EXISTS")
+        table_sql, table_params = expr.table.to_sql()
+        parts.append(table_sql)
+        query_sql, query_params = expr.as_query.to_sql()
+        parts.append(f"AS {query_sql}")
+        return " ".join(parts), tuple(table_params) + tuple(query_params)
+
     def format_create_view_statement(self, expr: "CreateViewExpression") -> Tuple[str, tuple]:
         """
         Format CREATE VIEW statement for SQLite.
@@ -10,14 +10,9 @@ Quick start::
         SQLiteExplainResult,
         SQLiteExplainQueryPlanResult,
     )
-"""
 
-from .types import (
-    SQLiteExplainRow,
-    SQLiteExplainQueryPlanRow,
-    SQLiteExplainResult,
-    SQLiteExplainQueryPlanResult,
-)
+The types are pydantic models and are loaded on first access.
+"""
 
 __all__ = [
     "SQLiteExplainRow",
@@ -25,3 +20,12 @@ __all__ = [
     "SQLiteExplainResult",
     "SQLiteExplainQueryPlanResult",
 ]
+
+
+def __getattr__(name: str):
+    """Lazily load the result types (PEP 562)."""
+    if name in __all__:
+        from . import types
+
+        return getattr(types, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -20,8 +20,9 @@ Design principle: Sync and Async are separate and cannot coexist.
 """
 
 import copy
+import os
 import sqlite3
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from rhosocial.activerecord.backend.introspection.base import (
     IntrospectorMixin,
@@ -72,6 +73,18 @@ class SQLiteIntrospectorMixin(IntrospectorMixin):
         """Return the SQLite schema name for the primary database."""
         return "main"
 
+    def _cache_share_key(self) -> Optional[str]:
+        """Share caches per database file; in-memory databases are per connection."""
+        config = self._backend.config
+        if config.is_memory_db() or config.uri:
+            return None
+        return os.path.realpath(config.database)
+
+    def _build_version_token_sql(self) -> Tuple[str, tuple]:
+        """``PRAGMA schema_version`` is read from the database header and is
+        bumped by every schema change, whichever connection makes it."""
+        return "PRAGMA schema_version", ()
+
     def _get_sqlite_version(self) -> tuple:
         """Return SQLite library version as an integer tuple."""
         parts = sqlite3.sqlite_version.split(".")
@@ -326,7 +339,7 @@ class SyncSQLiteIntrospector(SQLiteIntrospectorMixin, SyncAbstractIntrospector):
         """
         target_db = schema or self._get_default_schema()
         key = self._make_cache_key(IntrospectionScope.INDEX, table_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = self._lookup(key)
         if cached is not None:
             return cached
 
@@ -394,7 +407,7 @@ class SyncSQLiteIntrospector(SQLiteIntrospectorMixin, SyncAbstractIntrospector):
         key = self._make_cache_key(
             IntrospectionScope.TABLE, table_name, schema=schema
         )
-        cached = self._get_cached(key)
+        cached = self._lookup(key)
         if cached is not None:
             return cached
 
@@ -461,7 +474,7 @@ class AsyncSQLiteIntrospector(SQLiteIntrospectorMixin, AsyncAbstractIntrospector
         """
         target_db = schema or self._get_default_schema()
         key = self._make_cache_key(IntrospectionScope.INDEX, table_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = await self._lookup(key)
         if cached is not None:
             return cached
 
@@ -529,7 +542,7 @@ class AsyncSQLiteIntrospector(SQLiteIntrospectorMixin, AsyncAbstractIntrospector
         key = self._make_cache_key(
             IntrospectionScope.TABLE, table_name, schema=schema
         )
-        cached = self._get_cached(key)
+        cached = await self._lookup(key)
         if cached is not None:
             return cached
 
@@ -5,6 +5,9 @@ SQLite-specific mixin implementations.
 This module provides mixin classes that implement SQLite-specific features
 defined in the protocols module, including extension, pragma, and introspection
 capability declaration.
+
+The extension and pragma tables are imported inside the methods that use
+them, so importing the backend does not build them.
 """
 
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
@@ -19,25 +22,11 @@ if TYPE_CHECKING:  # pragma: no cover
         IndexInfoExpression,
         ForeignKeyExpression,
     )
+    from .extension import SQLiteExtensionRegistry, SQLiteExtensionInfo
+    from .pragma import PragmaCategory, PragmaInfo
 
 from rhosocial.activerecord.backend.dialect.exceptions import UnsupportedFeatureError
 
-from .extension import (
-    SQLiteExtensionRegistry,
-    get_registry,
-    SQLiteExtensionInfo,
-)
-from .extension.extensions import (
-    get_fts5_extension,
-)
-from .pragma import (
-    PragmaCategory,
-    PragmaInfo,
-    get_pragma_info,
-    get_all_pragma_infos,
-    get_pragmas_by_category,
-)
-
 
 class SQLiteExtensionMixin:
     """Mixin for SQLite extension support.
@@ -46,12 +35,15 @@ class SQLiteExtensionMixin:
     and feature checking.
     """
 
-    _extension_registry: SQLiteExtensionRegistry = None
+    _extension_registry: "SQLiteExtensionRegistry" = None
     _runtime_params: Dict[str, Any] = {}
 
-    def _ensure_extension_registry(self) -> SQLiteExtensionRegistry:
+    def _ensure_extension_registry(self) -> "SQLiteExtensionRegistry":
         """Ensure extension registry is initialized."""
         if self._extension_registry is None:
+            from .extension import get_registry
+            from .extension.extensions.fts5 import get_fts5_extension
+
             self._extension_registry = get_registry()
             self._extension_registry.register(get_fts5_extension())
         return self._extension_registry
@@ -64,7 +56,7 @@ class SQLiteExtensionMixin:
         """Get a runtime parameter."""
         return self._runtime_params.get(key, default)
 
-    def detect_extensions(self) -> Dict[str, SQLiteExtensionInfo]:
+    def detect_extensions(self) -> Dict[str, "SQLiteExtensionInfo"]:
         """Detect all available extensions.
 
         Returns:
@@ -87,7 +79,7 @@ class SQLiteExtensionMixin:
         version = getattr(self, "version", (3, 35, 0))
         return registry.is_extension_available(name, version)
 
-    def get_extension_info(self, name: str) -> Optional[SQLiteExtensionInfo]:
+    def get_extension_info(self, name: str) -> Optional["SQLiteExtensionInfo"]:
         """Get information about a specific extension.
 
         Args:
@@ -134,7 +126,7 @@ class SQLitePragmaMixin:
     Provides methods for pragma query and manipulation.
     """
 
-    def get_pragma_info(self, name: str) -> Optional[PragmaInfo]:
+    def get_pragma_info(self, name: str) -> Optional["PragmaInfo"]:
         """Get information about a specific PRAGMA.
 
         Args:
@@ -143,6 +135,8 @@ class SQLitePragmaMixin:
         Returns:
             PragmaInfo, or None if not found
         """
+        from .pragma import get_pragma_info
+
         info = get_pragma_info(name)
         if info is None:
             return None
@@ -205,6 +199,8 @@ class SQLitePragmaMixin:
         Returns:
             True if available
         """
+        from .pragma import get_pragma_info
+
         info = get_pragma_info(name)
         if info is None:
             return False
@@ -212,7 +208,7 @@ class SQLitePragmaMixin:
         version = getattr(self, "version", (3, 35, 0))
         return version >= info.min_version
 
-    def get_pragmas_by_category(self, category: PragmaCategory) -> List[PragmaInfo]:
+    def get_pragmas_by_category(self, category: "PragmaCategory") -> List["PragmaInfo"]:
         """Get all pragmas in a category.
 
         Args:
@@ -221,15 +217,19 @@ class SQLitePragmaMixin:
         Returns:
             List of PragmaInfo for pragmas in the category
         """
+        from .pragma import get_pragmas_by_category
+
         version = getattr(self, "version", (3, 35, 0))
         return [info for info in get_pragmas_by_category(category) if version >= info.min_version]
 
-    def get_all_pragma_infos(self) -> Dict[str, PragmaInfo]:
+    def get_all_pragma_infos(self) -> Dict[str, "PragmaInfo"]:
         """Get information for all known pragmas.
 
         Returns:
             Dictionary mapping PRAGMA names to their info
         """
+        from .pragma import get_all_pragma_infos
+
         version = getattr(self, "version", (3, 35, 0))
         return {name: info for name, info in get_all_pragma_infos().items() if version >= info.min_version}
 
@@ -514,6 +514,8 @@ class SQLiteVirtualTableMixin(SQLiteExtensionMixin):
                 getattr(self, "name", "sqlite"), "FTS5", "FTS5 full-text search requires SQLite 3.9.0 or later."
             )
 
+        from .extension.extensions.fts5 import get_fts5_extension
+
         fts5 = get_fts5_extension()
         return fts5.format_create_virtual_table(
             table_name=table_name,
@@ -544,6 +546,8 @@ class SQLiteVirtualTableMixin(SQLiteExtensionMixin):
         Returns:
             Tuple of (SQL string, parameters tuple)
         """
+        from .extension.extensions.fts5 import get_fts5_extension
+
         fts5 = get_fts5_extension()
         return fts5.format_match_expression(
             table_name=table_name,
@@ -596,6 +600,8 @@ class SQLiteVirtualTableMixin(SQLiteExtensionMixin):
         Returns:
             Tuple of (SQL string, parameters tuple)
         """
+        from .extension.extensions.fts5 import get_fts5_extension
+
         fts5 = get_fts5_extension()
         return fts5.format_rank_expression(
             table_name=table_name,
@@ -623,6 +629,8 @@ class SQLiteVirtualTableMixin(SQLiteExtensionMixin):
         Returns:
             Tuple of (SQL string, parameters tuple)
         """
+        from .extension.extensions.fts5 import get_fts5_extension
+
         fts5 = get_fts5_extension()
         return fts5.format_highlight_expression(
             table_name=table_name,
@@ -656,6 +664,8 @@ class SQLiteVirtualTableMixin(SQLiteExtensionMixin):
         Returns:
             Tuple of (SQL string, parameters tuple)
         """
+        from .extension.extensions.fts5 import get_fts5_extension
+
         fts5 = get_fts5_extension()
         return fts5.format_snippet_expression(
             table_name=table_name,
@@ -681,6 +691,8 @@ class SQLiteVirtualTableMixin(SQLiteExtensionMixin):
         Returns:
             Tuple of (SQL string, parameters tuple)
         """
+        from .extension.extensions.fts5 import get_fts5_extension
+
         fts5 = get_fts5_extension()
         return fts5.format_drop_virtual_table(
             table_name=table_name,
@@ -15,37 +15,6 @@ Quick start::
     )
 """
 
-from .types import (
-    IntrospectionScope,
-    TableType,
-    ColumnNullable,
-    IndexType,
-    ReferentialAction,
-    DatabaseInfo,
-    TableInfo,
-    ColumnInfo,
-    IndexInfo,
-    IndexColumnInfo,
-    ForeignKeyInfo,
-    ViewInfo,
-    TriggerInfo,
-)
-from .errors import (
-    IntrospectionError,
-    IntrospectionNotSupportedError,
-    IntrospectionQueryError,
-    ObjectNotFoundError,
-    IntrospectionCacheError,
-)
-from .executor import (
-    SyncIntrospectorExecutor,
-    AsyncIntrospectorExecutor,
-)
-from .base import (
-    IntrospectorMixin,
-    SyncAbstractIntrospector,
-    AsyncAbstractIntrospector,
-)
 from .backend_mixin import IntrospectorBackendMixin
 
 __all__ = [
@@ -73,9 +42,55 @@ __all__ = [
     # Executor
     "SyncIntrospectorExecutor",
     "AsyncIntrospectorExecutor",
+    # Cache
+    "CacheKey",
+    "IntrospectionCache",
+    "IntrospectionCacheStats",
+    "shared_introspection_cache",
     # Core
     "IntrospectorMixin",
     "SyncAbstractIntrospector",
     "AsyncAbstractIntrospector",
     "IntrospectorBackendMixin",
 ]
+
+# Introspection types and introspectors are loaded on first access; a
+# backend only needs IntrospectorBackendMixin until it is introspected.
+_LAZY_MODULES = {
+    ".types": (
+        "IntrospectionScope", "TableType", "ColumnNullable", "IndexType", "ReferentialAction",
+        "DatabaseInfo", "TableInfo", "ColumnInfo", "IndexInfo", "IndexColumnInfo",
+        "ForeignKeyInfo", "ViewInfo", "TriggerInfo",
+    ),
+    ".errors": (
+        "IntrospectionError", "IntrospectionNotSupportedError", "IntrospectionQueryError",
+        "ObjectNotFoundError", "IntrospectionCacheError",
+    ),
+    ".executor": (
+        "SyncIntrospectorExecutor", "AsyncIntrospectorExecutor",
+    ),
+    ".cache": (
+        "CacheKey", "IntrospectionCache", "IntrospectionCacheStats", "shared_introspection_cache",
+    ),
+    ".base": (
+        "IntrospectorMixin", "SyncAbstractIntrospector", "AsyncAbstractIntrospector",
+    ),
+}
+
+_LAZY_ATTRIBUTES = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+
+def __getattr__(name: str):
+    """Load re-exported names on first access (PEP 562) and cache them."""
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -83,6 +83,15 @@ class IntrospectorBackendMixin:
         """
         self._introspector_instance = introspector
 
+    def _on_schema_changed(self) -> None:
+        """Drop cached introspection results after DDL ran on this backend.
+
+        A shared cache (``introspector.configure_cache(shared=True)``) is
+        cleared for every introspector using it.
+        """
+        if self._introspector_instance is not None:
+            self._introspector_instance.clear_cache()
+
     def reset_introspector(self) -> None:
         """Reset to the default introspector (created on next access)."""
         self._introspector_instance = None
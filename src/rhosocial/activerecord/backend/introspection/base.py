@@ -21,8 +21,6 @@ Design principles:
   - Non-I/O methods (cache, SQL generation, parsing) are shared via mixin.
 """
 
-import threading
-import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
@@ -36,6 +34,12 @@ from .types import (
     TriggerInfo,
     IntrospectionScope,
 )
+from .cache import (
+    CacheKey,
+    IntrospectionCache,
+    IntrospectionCacheStats,
+    shared_introspection_cache,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..dialect.base import SQLDialectBase
@@ -46,7 +50,7 @@ class IntrospectorMixin:
     """Mixin providing shared non-I/O functionality for introspectors.
 
     This mixin contains:
-    - Cache management (thread-safe with TTL support)
+    - Cache management (bounded, indexed; TTL or schema-version validation)
     - SQL generation methods (delegating to Expression + Dialect)
     - Abstract _parse_* method declarations (must be implemented by subclasses)
     - Helper methods for schema handling
@@ -56,12 +60,14 @@ class IntrospectorMixin:
     """
 
     DEFAULT_CACHE_TTL: int = 300  # seconds
+    DEFAULT_CACHE_MAX_ENTRIES: int = IntrospectionCache.DEFAULT_MAX_ENTRIES
 
     def _init_introspector_state(self) -> None:
         """Initialize introspector state. Call from __init__."""
-        self._cache: Dict[str, Tuple[Any, float]] = {}
-        self._cache_lock = threading.RLock()
-        self._cache_ttl: int = self.DEFAULT_CACHE_TTL
+        self._cache = IntrospectionCache(self.DEFAULT_CACHE_MAX_ENTRIES)
+        self._cache_lock = self._cache.lock
+        self._cache_ttl: float = self.DEFAULT_CACHE_TTL
+        self._cache_validate_version: bool = False
 
     # ------------------------------------------------------------------ #
     # Dialect shortcut
@@ -85,22 +91,87 @@ class IntrospectorMixin:
     # Cache management (thread-safe, no I/O)
     # ------------------------------------------------------------------ #
 
-    def _get_cached(self, key: str) -> Optional[Any]:
-        """Get cached value if not expired."""
-        with self._cache_lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                return None
-            data, ts = entry
-            if time.time() - ts > self._cache_ttl:
-                del self._cache[key]
-                return None
-            return data
-
-    def _set_cached(self, key: str, data: Any) -> None:
-        """Store value in cache with current timestamp."""
+    def configure_cache(
+        self,
+        *,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        validate_version: Optional[bool] = None,
+        shared: Optional[bool] = None,
+    ) -> None:
+        """Adjust how introspection results are cached.
+
+        Args:
+            ttl: Maximum age of an entry in seconds (TTL mode only).
+            max_entries: LRU capacity of the cache.
+            validate_version: When True, entries stay valid until the
+                database's schema version token changes instead of expiring
+                by age. Backends without a version token keep using the TTL.
+            shared: When True, use the cache shared by every introspector of
+                the same database (e.g. sync and async backends on one SQLite
+                file); when False, switch back to a private cache.
+
+        Raises:
+            ValueError: If sharing is requested for a database that cannot be
+                identified across connections (e.g. an in-memory database).
+        """
         with self._cache_lock:
-            self._cache[key] = (data, time.time())
+            if ttl is not None:
+                self._cache_ttl = ttl
+            if validate_version is not None:
+                self._cache_validate_version = validate_version
+            capacity = max_entries if max_entries is not None else self._cache.max_entries
+            if shared:
+                share_key = self._cache_share_key()
+                if share_key is None:
+                    raise ValueError(
+                        f"{type(self).__name__} cannot share its cache: the database has no "
+                        "identity outside this connection"
+                    )
+                cache = shared_introspection_cache(share_key, capacity)
+            elif shared is False:
+                cache = IntrospectionCache(capacity)
+            else:
+                cache = self._cache
+                if max_entries is not None:
+                    cache.max_entries = max_entries
+        self._cache = cache
+        self._cache_lock = cache.lock
+
+    def get_cache_stats(self) -> IntrospectionCacheStats:
+        """Return hit/miss/eviction counters of the introspection cache."""
+        return self._cache.get_stats()
+
+    def _cache_share_key(self) -> Optional[str]:
+        """Identity of the database for cache sharing; None if not shareable.
+
+        Subclasses override this; the default does not share.
+        """
+        return None
+
+    def _build_version_token_sql(self) -> Optional[Tuple[str, tuple]]:
+        """SQL returning a token that changes whenever the schema changes.
+
+        Returns None when the database has no cheap version token, in which
+        case validate_version mode falls back to the TTL.
+        """
+        return None
+
+    def _parse_version_token(self, rows: List[Dict[str, Any]]) -> Any:
+        """Extract the version token from the token query result."""
+        return next(iter(rows[0].values())) if rows else None
+
+    def _uses_version_token(self) -> bool:
+        return self._cache_validate_version and self._build_version_token_sql() is not None
+
+    def _get_cached(self, key: CacheKey) -> Optional[Any]:
+        """Get cached value if still valid."""
+        ttl = None if self._uses_version_token() else self._cache_ttl
+        return self._cache.get(key, ttl)
+
+    def _set_cached(self, key: CacheKey, data: Any) -> None:
+        """Store value in cache."""
+        self._cache.set(key, data)
 
     def _make_cache_key(
         self,
@@ -108,15 +179,17 @@ class IntrospectorMixin:
         *args: str,
         schema: Optional[str] = None,
         extra: Optional[str] = None,
-    ) -> str:
-        """Build a cache key from scope and optional parameters."""
-        parts = [scope.value]
-        if schema:
-            parts.append(f"schema:{schema}")
-        parts.extend(str(a) for a in args)
-        if extra:
-            parts.append(extra)
-        return ":".join(parts)
+    ) -> CacheKey:
+        """Build a cache key from scope and optional parameters.
+
+        The first positional argument names the object the entry describes,
+        which is what invalidate_cache(scope, name) matches on.
+        """
+        name = str(args[0]) if args else None
+        if len(args) > 1:
+            rest = ":".join(str(a) for a in args[1:])
+            extra = f"{rest}:{extra}" if extra else rest
+        return CacheKey(scope.value, name, schema, extra)
 
     def invalidate_cache(
         self,
@@ -130,24 +203,11 @@ class IntrospectorMixin:
             name:  Object name within the scope to invalidate; None
                    invalidates all entries for the scope.
         """
-        with self._cache_lock:
-            if scope is None:
-                self._cache.clear()
-            elif name is None:
-                sv = scope.value
-                prefix = f"{sv}:"
-                for k in [k for k in self._cache if k == sv or k.startswith(prefix)]:
-                    del self._cache[k]
-            else:
-                sv = scope.value
-                prefix = f"{sv}:"
-                for k in [k for k in self._cache if (k == sv or k.startswith(prefix)) and name in k]:
-                    del self._cache[k]
+        self._cache.invalidate(scope.value if scope is not None else None, name)
 
     def clear_cache(self) -> None:
         """Clear all cached introspection results."""
-        with self._cache_lock:
-            self._cache.clear()
+        self._cache.clear()
 
     # ------------------------------------------------------------------ #
     # SQL generation — delegates to Expression + Dialect (no I/O)
@@ -320,7 +380,7 @@ class SyncAbstractIntrospector(IntrospectorMixin, ABC):
         get_foreign_key_info(), list_views(), get_view_info(), view_exists(),
         list_triggers(), get_trigger_info()
 
-        Cache: invalidate_cache(), clear_cache()
+        Cache: configure_cache(), get_cache_stats(), invalidate_cache(), clear_cache()
     """
 
     def __init__(self, backend: Any, executor: "SyncIntrospectorExecutor") -> None:
@@ -328,6 +388,14 @@ class SyncAbstractIntrospector(IntrospectorMixin, ABC):
         self._executor = executor
         self._init_introspector_state()
 
+    def _lookup(self, key: CacheKey) -> Optional[Any]:
+        """Return a cached result, first checking the database version token
+        when the cache is in validate_version mode."""
+        if self._uses_version_token():
+            sql, params = self._build_version_token_sql()
+            self._cache.validate(self._parse_version_token(self._executor.execute(sql, params)))
+        return self._get_cached(key)
+
     # ------------------------------------------------------------------ #
     # Public synchronous API
     # ------------------------------------------------------------------ #
@@ -335,7 +403,7 @@ class SyncAbstractIntrospector(IntrospectorMixin, ABC):
     def get_database_info(self) -> DatabaseInfo:
         """Return basic information about the connected database."""
         key = self._make_cache_key(IntrospectionScope.DATABASE)
-        cached = self._get_cached(key)
+        cached = self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_database_info_sql()
@@ -354,7 +422,7 @@ class SyncAbstractIntrospector(IntrospectorMixin, ABC):
             IntrospectionScope.TABLE, schema=schema,
             extra=f"{include_system}:{table_type}",
         )
-        cached = self._get_cached(key)
+        cached = self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_table_list_sql(schema, include_system, True, table_type)
@@ -368,7 +436,7 @@ class SyncAbstractIntrospector(IntrospectorMixin, ABC):
         """Return detailed information for a specific table, including columns,
         indexes, and foreign keys."""
         key = self._make_cache_key(IntrospectionScope.TABLE, table_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = self._lookup(key)
         if cached is not None:
             return cached
         table = next(
@@ -392,7 +460,7 @@ class SyncAbstractIntrospector(IntrospectorMixin, ABC):
         """List all columns of the given table."""
         target = schema if schema is not None else self._get_default_schema()
         key = self._make_cache_key(IntrospectionScope.COLUMN, table_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_column_info_sql(table_name, schema)
@@ -423,7 +491,7 @@ class SyncAbstractIntrospector(IntrospectorMixin, ABC):
         """List all indexes of the given table."""
         target = schema if schema is not None else self._get_default_schema()
         key = self._make_cache_key(IntrospectionScope.INDEX, table_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_index_info_sql(table_name, schema)
@@ -457,7 +525,7 @@ class SyncAbstractIntrospector(IntrospectorMixin, ABC):
         """List all foreign keys of the given table."""
         target = schema if schema is not None else self._get_default_schema()
         key = self._make_cache_key(IntrospectionScope.FOREIGN_KEY, table_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_foreign_key_sql(table_name, schema)
@@ -486,7 +554,7 @@ class SyncAbstractIntrospector(IntrospectorMixin, ABC):
         key = self._make_cache_key(
             IntrospectionScope.VIEW, schema=schema, extra=str(include_system)
         )
-        cached = self._get_cached(key)
+        cached = self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_view_list_sql(schema, include_system)
@@ -500,7 +568,7 @@ class SyncAbstractIntrospector(IntrospectorMixin, ABC):
         """Return detailed information for a specific view, or None if not found."""
         target = schema if schema is not None else self._get_default_schema()
         key = self._make_cache_key(IntrospectionScope.VIEW, view_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_view_info_sql(view_name, schema)
@@ -523,7 +591,7 @@ class SyncAbstractIntrospector(IntrospectorMixin, ABC):
         key = self._make_cache_key(
             IntrospectionScope.TRIGGER, table_name or "*", schema=schema
         )
-        cached = self._get_cached(key)
+        cached = self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_trigger_list_sql(table_name, schema)
@@ -554,7 +622,8 @@ class AsyncAbstractIntrospector(IntrospectorMixin, ABC):
         get_foreign_key_info(), list_views(), get_view_info(), view_exists(),
         list_triggers(), get_trigger_info()
 
-        Cache (synchronous): invalidate_cache(), clear_cache()
+        Cache (synchronous): configure_cache(), get_cache_stats(), invalidate_cache(),
+        clear_cache()
     """
 
     def __init__(self, backend: Any, executor: "AsyncIntrospectorExecutor") -> None:
@@ -562,6 +631,14 @@ class AsyncAbstractIntrospector(IntrospectorMixin, ABC):
         self._executor = executor
         self._init_introspector_state()
 
+    async def _lookup(self, key: CacheKey) -> Optional[Any]:
+        """Return a cached result, first checking the database version token
+        when the cache is in validate_version mode."""
+        if self._uses_version_token():
+            sql, params = self._build_version_token_sql()
+            self._cache.validate(self._parse_version_token(await self._executor.execute(sql, params)))
+        return self._get_cached(key)
+
     # ------------------------------------------------------------------ #
     # Public asynchronous API
     # Method names match the sync version (no _async suffix).
@@ -570,7 +647,7 @@ class AsyncAbstractIntrospector(IntrospectorMixin, ABC):
     async def get_database_info(self) -> DatabaseInfo:
         """Return basic information about the connected database."""
         key = self._make_cache_key(IntrospectionScope.DATABASE)
-        cached = self._get_cached(key)
+        cached = await self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_database_info_sql()
@@ -591,7 +668,7 @@ class AsyncAbstractIntrospector(IntrospectorMixin, ABC):
             IntrospectionScope.TABLE, schema=schema,
             extra=f"{include_system}:{table_type}",
         )
-        cached = self._get_cached(key)
+        cached = await self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_table_list_sql(schema, include_system, True, table_type)
@@ -607,7 +684,7 @@ class AsyncAbstractIntrospector(IntrospectorMixin, ABC):
         """Return detailed information for a specific table, including columns,
         indexes, and foreign keys."""
         key = self._make_cache_key(IntrospectionScope.TABLE, table_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = await self._lookup(key)
         if cached is not None:
             return cached
         table = next(
@@ -632,7 +709,7 @@ class AsyncAbstractIntrospector(IntrospectorMixin, ABC):
         """List all columns of the given table."""
         target = schema if schema is not None else self._get_default_schema()
         key = self._make_cache_key(IntrospectionScope.COLUMN, table_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = await self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_column_info_sql(table_name, schema)
@@ -667,7 +744,7 @@ class AsyncAbstractIntrospector(IntrospectorMixin, ABC):
         """List all indexes of the given table."""
         target = schema if schema is not None else self._get_default_schema()
         key = self._make_cache_key(IntrospectionScope.INDEX, table_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = await self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_index_info_sql(table_name, schema)
@@ -705,7 +782,7 @@ class AsyncAbstractIntrospector(IntrospectorMixin, ABC):
         """List all foreign keys of the given table."""
         target = schema if schema is not None else self._get_default_schema()
         key = self._make_cache_key(IntrospectionScope.FOREIGN_KEY, table_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = await self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_foreign_key_sql(table_name, schema)
@@ -738,7 +815,7 @@ class AsyncAbstractIntrospector(IntrospectorMixin, ABC):
         key = self._make_cache_key(
             IntrospectionScope.VIEW, schema=schema, extra=str(include_system)
         )
-        cached = self._get_cached(key)
+        cached = await self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_view_list_sql(schema, include_system)
@@ -754,7 +831,7 @@ class AsyncAbstractIntrospector(IntrospectorMixin, ABC):
         """Return detailed information for a specific view, or None if not found."""
         target = schema if schema is not None else self._get_default_schema()
         key = self._make_cache_key(IntrospectionScope.VIEW, view_name, schema=schema)
-        cached = self._get_cached(key)
+        cached = await self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_view_info_sql(view_name, schema)
@@ -779,7 +856,7 @@ class AsyncAbstractIntrospector(IntrospectorMixin, ABC):
         key = self._make_cache_key(
             IntrospectionScope.TRIGGER, table_name or "*", schema=schema
         )
-        cached = self._get_cached(key)
+        cached = await self._lookup(key)
         if cached is not None:
             return cached
         sql, params = self._build_trigger_list_sql(table_name, schema)
@@ -0,0 +1,261 @@
+# src/rhosocial/activerecord/backend/introspection/cache.py
+"""
+Introspection result cache.
+
+IntrospectionCache is the store behind ``IntrospectorMixin``:
+
+- Bounded: entries are evicted least-recently-used once ``max_entries``
+  is reached.
+- Indexed: every entry is registered under its scope and under its
+  ``(scope, object name)`` pair, so ``invalidate(scope, name)`` removes
+  exactly the affected entries without scanning the whole cache.
+- Two validation modes:
+    * TTL (default): an entry older than the caller's TTL is a miss.
+    * Version token: the cache remembers a cheap database-side token
+      (``PRAGMA schema_version`` on SQLite). ``validate(token)`` drops
+      every entry when the token changes; entries never expire by age.
+
+A cache is normally private to one introspector. Introspectors that look
+at the same database (a sync and an async backend opened on the same
+SQLite file, for example) can share one through
+``shared_introspection_cache()``; the registry holds caches weakly, so a
+shared cache lives as long as some introspector uses it.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterator, NamedTuple, Optional, Set, Tuple
+
+
+class CacheKey(NamedTuple):
+    """Key of one cached introspection result."""
+
+    scope: str                     # IntrospectionScope value
+    name: Optional[str] = None     # Object the entry describes (table, view, ...)
+    schema: Optional[str] = None
+    extra: Optional[str] = None    # Remaining call arguments (filters, flags)
+
+
+@dataclass
+class IntrospectionCacheStats:
+    """Counters describing cache effectiveness."""
+
+    entries: int = 0
+    max_entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0   # Entries removed by invalidate(), clear() or a token change
+    token: Optional[Hashable] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            'entries': self.entries,
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'token': self.token,
+        }
+
+
+class IntrospectionCache:
+    """
+    Thread-safe LRU cache of introspection results.
+
+    Args:
+        max_entries: Upper bound on cached results; the least recently used
+            entry is evicted when a new one would exceed it
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 1024
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.lock = threading.RLock()
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, float]]" = OrderedDict()
+        self._by_scope: Dict[str, Set[CacheKey]] = {}
+        self._by_object: Dict[Tuple[str, str], Set[CacheKey]] = {}
+        self._token: Optional[Hashable] = None
+        self._stats = IntrospectionCacheStats()
+
+    # ------------------------------------------------------------------ #
+    # Mapping-style read access (used by diagnostics and tests)
+    # ------------------------------------------------------------------ #
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[CacheKey]:
+        with self.lock:
+            return iter(list(self._entries))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def keys(self):
+        with self.lock:
+            return list(self._entries)
+
+    def __getitem__(self, key: CacheKey) -> Any:
+        return self._entries[key][0]
+
+    # ------------------------------------------------------------------ #
+    # Lookup and store
+    # ------------------------------------------------------------------ #
+
+    def get(self, key: CacheKey, ttl: Optional[float] = None) -> Optional[Any]:
+        """Return the cached value, or None on a miss.
+
+        Args:
+            key: Entry key
+            ttl: Maximum age in seconds; None disables the age check
+                (version-token mode)
+        """
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            data, stored_at = entry
+            if ttl is not None and time.time() - stored_at > ttl:
+                self._remove(key)
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return data
+
+    def set(self, key: CacheKey, data: Any) -> None:
+        """Store a value, evicting least recently used entries when full."""
+        with self.lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                while len(self._entries) >= self.max_entries:
+                    oldest = next(iter(self._entries))
+                    self._remove(oldest)
+                    self._stats.evictions += 1
+                self._by_scope.setdefault(key.scope, set()).add(key)
+                if key.name is not None:
+                    self._by_object.setdefault((key.scope, key.name), set()).add(key)
+            self._entries[key] = (data, time.time())
+
+    def _remove(self, key: CacheKey) -> None:
+        del self._entries[key]
+        keys = self._by_scope.get(key.scope)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_scope[key.scope]
+        if key.name is not None:
+            object_key = (key.scope, key.name)
+            keys = self._by_object.get(object_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_object[object_key]
+
+    # ------------------------------------------------------------------ #
+    # Invalidation
+    # ------------------------------------------------------------------ #
+
+    def invalidate(self, scope: Optional[str] = None, name: Optional[str] = None) -> int:
+        """Remove entries for a scope, or for one object within a scope.
+
+        Args:
+            scope: IntrospectionScope value; None removes everything
+            name: Object name within the scope; None removes the whole scope
+
+        Returns:
+            Number of entries removed
+        """
+        with self.lock:
+            if scope is None:
+                return self._clear()
+            if name is None:
+                keys = self._by_scope.get(scope, ())
+            else:
+                keys = self._by_object.get((scope, name), ())
+            removed = list(keys)
+            for key in removed:
+                self._remove(key)
+            self._stats.invalidations += len(removed)
+            return len(removed)
+
+    def clear(self) -> None:
+        """Remove every entry and forget the version token."""
+        with self.lock:
+            self._clear()
+            self._token = None
+
+    def _clear(self) -> int:
+        removed = len(self._entries)
+        self._entries.clear()
+        self._by_scope.clear()
+        self._by_object.clear()
+        self._stats.invalidations += removed
+        return removed
+
+    def validate(self, token: Hashable) -> bool:
+        """Check the cache against the database's current version token.
+
+        Entries stored under a different token are dropped and the new
+        token is remembered.
+
+        Returns:
+            True if the cached entries are still valid
+        """
+        with self.lock:
+            if token == self._token:
+                return True
+            self._clear()
+            self._token = token
+            return False
+
+    def get_stats(self) -> IntrospectionCacheStats:
+        """Snapshot of the cache counters."""
+        with self.lock:
+            return IntrospectionCacheStats(
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                token=self._token,
+            )
+
+
+_shared_caches: "weakref.WeakValueDictionary[str, IntrospectionCache]" = weakref.WeakValueDictionary()
+_shared_lock = threading.Lock()
+
+
+def shared_introspection_cache(
+    share_key: str, max_entries: int = IntrospectionCache.DEFAULT_MAX_ENTRIES
+) -> IntrospectionCache:
+    """Return the cache shared by every introspector of one database.
+
+    Args:
+        share_key: Identity of the database (for SQLite, the resolved file path)
+        max_entries: Capacity used when the cache is created; an existing
+            shared cache grows to the larger of the two capacities
+
+    Returns:
+        The shared IntrospectionCache for share_key
+    """
+    with _shared_lock:
+        cache = _shared_caches.get(share_key)
+        if cache is None:
+            cache = IntrospectionCache(max_entries)
+            _shared_caches[share_key] = cache
+        elif max_entries > cache.max_entries:
+            cache.max_entries = max_entries
+        return cache
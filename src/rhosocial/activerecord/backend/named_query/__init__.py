@@ -94,6 +94,13 @@ from .procedure import (
     StepKind,
     TraceEntry,
 )
+from .bindings import (
+    BindMode,
+    StreamedRows,
+    SpilledRows,
+    AsyncStreamedRows,
+    AsyncSpilledRows,
+)
 from .diagram import ProcedureDiagram
 from .procedure_graph import (
     ProcedureGraph,
@@ -152,6 +159,11 @@ __all__ = [
     "AsyncProcedureRunner",
     "StepKind",
     "TraceEntry",
+    "BindMode",
+    "StreamedRows",
+    "SpilledRows",
+    "AsyncStreamedRows",
+    "AsyncSpilledRows",
     "ProcedureDiagram",
     "ProcedureError",
     "ProcedureAbortedError",
@@ -0,0 +1,224 @@
+# src/rhosocial/activerecord/backend/named_query/bindings.py
+"""
+Bound result sets for named procedures.
+
+``ProcedureContext.execute(bind=...)`` keeps the result of a named query
+under a variable name so later steps can read it with ``ctx.rows()`` and
+``ctx.scalar()``. How the rows are kept is chosen per call with BindMode:
+
+- MATERIALIZE (default): every row is fetched into a list of dicts.
+- STREAM: nothing is fetched up front. Each ``ctx.rows()`` pass re-runs the
+  query and reads it page by page with ``fetchmany()``, so memory holds at
+  most one page.
+- SPILL: the result is written into a temporary table on the procedure's
+  connection with ``CREATE TEMPORARY TABLE ... AS <query>``; rows never
+  travel to the client unless read. Later named queries can join against
+  the table server-side via ``ctx.table(name)``.
+- AUTO: read up to ``spill_threshold + 1`` rows first; a result that fits
+  is kept as a list, and only a larger one is spilled (the query runs again
+  into the temporary table).
+
+Spilled tables are dropped when the procedure finishes (or when the
+variable is re-bound). Temporary tables are private to the connection, so
+the names only need to be unique within the process.
+"""
+
+import itertools
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from rhosocial.activerecord.backend.expression import QueryExpression, TableExpression, WildcardExpression
+from rhosocial.activerecord.backend.expression.functions.aggregate import count
+from rhosocial.activerecord.backend.expression.statements import CreateTableExpression, DropTableExpression
+from rhosocial.activerecord.backend.options import ExecutionOptions
+from rhosocial.activerecord.backend.schema import StatementType
+
+DEFAULT_FETCH_SIZE = 1000
+DEFAULT_SPILL_THRESHOLD = 10000
+
+_spill_counter = itertools.count(1)
+
+
+class BindMode(str, Enum):
+    """How ProcedureContext.execute() keeps a bound result."""
+
+    MATERIALIZE = "materialize"
+    STREAM = "stream"
+    SPILL = "spill"
+    AUTO = "auto"
+
+
+def spill_table_name(bind: str) -> str:
+    """Return a fresh temporary table name for a bound variable."""
+    if not bind.isidentifier():
+        raise ValueError(f"Variable '{bind}' cannot be spilled: bind names must be identifiers")
+    return f"_spill_{bind}_{next(_spill_counter)}"
+
+
+def _select_spilled(dialect: Any, table: str) -> Any:
+    return QueryExpression(dialect, select=[WildcardExpression(dialect)], from_=TableExpression(dialect, table))
+
+
+def _count_spilled(dialect: Any, table: str) -> Any:
+    return QueryExpression(
+        dialect, select=[count(dialect, "*").as_("row_count")], from_=TableExpression(dialect, table)
+    )
+
+
+def _create_spill(dialect: Any, table: str, expression: Any) -> Any:
+    return CreateTableExpression(dialect, table, columns=[], temporary=True, as_query=expression)
+
+
+def _drop_spill(dialect: Any, table: str) -> Any:
+    return DropTableExpression(dialect, table, if_exists=True)
+
+
+class StreamedRows:
+    """Bound result read lazily from a cursor, one page at a time.
+
+    Iterating runs the query again; use SPILL when several passes must see
+    the same rows.
+    """
+
+    def __init__(self, backend: Any, expression: Any, fetch_size: int = DEFAULT_FETCH_SIZE):
+        self.backend = backend
+        self.expression = expression
+        self.fetch_size = fetch_size
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for page in self.backend.execute_batch_dql(self.expression, page_size=self.fetch_size):
+            yield from page.data
+
+    def first(self) -> Optional[Dict[str, Any]]:
+        """Return the first row without reading the rest."""
+        pages = self.backend.execute_batch_dql(self.expression, page_size=1)
+        try:
+            for page in pages:
+                return page.data[0] if page.data else None
+            return None
+        finally:
+            pages.close()
+
+
+class SpilledRows(StreamedRows):
+    """Bound result kept in a temporary table on the procedure's connection."""
+
+    def __init__(self, backend: Any, table: str, row_count: int, fetch_size: int = DEFAULT_FETCH_SIZE):
+        self.table = table
+        self.row_count = row_count
+        super().__init__(backend, _select_spilled(backend.dialect, table), fetch_size)
+
+    def __len__(self) -> int:
+        return self.row_count
+
+
+class AsyncStreamedRows:
+    """Async version of StreamedRows."""
+
+    def __init__(self, backend: Any, expression: Any, fetch_size: int = DEFAULT_FETCH_SIZE):
+        self.backend = backend
+        self.expression = expression
+        self.fetch_size = fetch_size
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        async for page in self.backend.execute_batch_dql(self.expression, page_size=self.fetch_size):
+            for row in page.data:
+                yield row
+
+    async def first(self) -> Optional[Dict[str, Any]]:
+        """Return the first row without reading the rest."""
+        pages = self.backend.execute_batch_dql(self.expression, page_size=1)
+        try:
+            async for page in pages:
+                return page.data[0] if page.data else None
+            return None
+        finally:
+            await pages.aclose()
+
+
+class AsyncSpilledRows(AsyncStreamedRows):
+    """Async version of SpilledRows."""
+
+    def __init__(self, backend: Any, table: str, row_count: int, fetch_size: int = DEFAULT_FETCH_SIZE):
+        self.table = table
+        self.row_count = row_count
+        super().__init__(backend, _select_spilled(backend.dialect, table), fetch_size)
+
+    def __len__(self) -> int:
+        return self.row_count
+
+
+_DDL = ExecutionOptions(stmt_type=StatementType.DDL)
+_DQL = ExecutionOptions(stmt_type=StatementType.DQL)
+
+
+def spill(
+    backend: Any,
+    bind: str,
+    expression: Any,
+    mode: BindMode,
+    spill_threshold: int,
+    fetch_size: int,
+) -> Any:
+    """Spill a query result into a temporary table (sync).
+
+    Returns:
+        SpilledRows, or a list of rows when mode is AUTO and the result has
+        at most spill_threshold rows (no table is created).
+    """
+    if mode is BindMode.AUTO:
+        # One row past the threshold tells whether the result must be spilled.
+        rows = []
+        pages = backend.execute_batch_dql(expression, page_size=spill_threshold + 1)
+        try:
+            for page in pages:
+                rows = page.data
+                break
+        finally:
+            pages.close()
+        if len(rows) <= spill_threshold:
+            return rows
+    dialect = backend.dialect
+    table = spill_table_name(bind)
+    backend.execute(*_create_spill(dialect, table, expression).to_sql(), options=_DDL)
+    result = backend.execute(*_count_spilled(dialect, table).to_sql(), options=_DQL)
+    row_count = result.data[0]["row_count"] if result.data else 0
+    return SpilledRows(backend, table, row_count, fetch_size)
+
+
+async def async_spill(
+    backend: Any,
+    bind: str,
+    expression: Any,
+    mode: BindMode,
+    spill_threshold: int,
+    fetch_size: int,
+) -> Any:
+    """Async version of spill()."""
+    if mode is BindMode.AUTO:
+        rows = []
+        pages = backend.execute_batch_dql(expression, page_size=spill_threshold + 1)
+        try:
+            async for page in pages:
+                rows = page.data
+                break
+        finally:
+            await pages.aclose()
+        if len(rows) <= spill_threshold:
+            return rows
+    dialect = backend.dialect
+    table = spill_table_name(bind)
+    await backend.execute(*_create_spill(dialect, table, expression).to_sql(), options=_DDL)
+    result = await backend.execute(*_count_spilled(dialect, table).to_sql(), options=_DQL)
+    row_count = result.data[0]["row_count"] if result.data else 0
+    return AsyncSpilledRows(backend, table, row_count, fetch_size)
+
+
+def drop_spill_table(backend: Any, table: str) -> None:
+    """Drop a spill table if it still exists."""
+    backend.execute(*_drop_spill(backend.dialect, table).to_sql(), options=_DDL)
+
+
+async def async_drop_spill_table(backend: Any, table: str) -> None:
+    """Async version of drop_spill_table()."""
+    await backend.execute(*_drop_spill(backend.dialect, table).to_sql(), options=_DDL)
@@ -85,12 +85,18 @@ class _DryRunContext:
         else:
             self._bindings[name] = {"data": [data]}
 
+    def table(self, var_name: str) -> str:
+        return var_name
+
     def execute(
         self,
         qualified_name: str,
         params: Optional[Dict[str, Any]] = None,
         bind: Optional[str] = None,
         output: bool = False,
+        mode: Any = None,
+        spill_threshold: Optional[int] = None,
+        fetch_size: Optional[int] = None,
     ) -> Any:
         self._trace.append(TraceEntry(
             kind=StepKind.SINGLE,
@@ -203,12 +209,18 @@ class _AsyncDryRunContext:
         else:
             self._bindings[name] = {"data": [data]}
 
+    def table(self, var_name: str) -> str:
+        return var_name
+
     async def execute(
         self,
         qualified_name: str,
         params: Optional[Dict[str, Any]] = None,
         bind: Optional[str] = None,
         output: bool = False,
+        mode: Any = None,
+        spill_threshold: Optional[int] = None,
+        fetch_size: Optional[int] = None,
     ) -> Any:
         self._trace.append(TraceEntry(
             kind=StepKind.SINGLE,
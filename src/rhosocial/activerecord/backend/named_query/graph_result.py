@@ -35,6 +35,8 @@ class StepTraceEntry:
     error: Optional[str] = None
     elapsed_ms: float = 0.0
     reason: Optional[str] = None
+    queue_ms: float = 0.0    # Time between becoming ready and starting
+    started_ms: float = 0.0  # Start offset from the beginning of the run
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -45,6 +47,8 @@ class StepTraceEntry:
             "params": self.params,
             "error": self.error,
             "elapsed_ms": self.elapsed_ms,
+            "queue_ms": self.queue_ms,
+            "started_ms": self.started_ms,
             "reason": self.reason,
         }
 
@@ -59,7 +63,7 @@ class ProcedureGraphResult:
         steps_failed: Steps that failed.
         steps_dry_run: Steps that were dry-run.
         elapsed_ms: Total execution time in milliseconds.
-        waves_count: Number of waves executed.
+        waves_count: Depth of the graph (number of topological waves).
     """
 
     steps_done: List[StepTraceEntry] = field(default_factory=list)
@@ -100,7 +104,9 @@ class ProcedureGraphResult:
         if self.steps_done:
             lines.append("Completed steps:")
             for s in self.steps_done:
-                lines.append(f"  [{s.name}] {s.status.value} ({s.elapsed_ms:.2f}ms)")
+                lines.append(
+                    f"  [{s.name}] {s.status.value} ({s.elapsed_ms:.2f}ms, queued {s.queue_ms:.2f}ms)"
+                )
         if self.steps_skipped:
             lines.append("Skipped steps:")
             for s in self.steps_skipped:
@@ -4,8 +4,29 @@ ProcedureGraph runners for sync and async execution.
 
 This module provides runners that execute ProcedureGraphs,
 including both synchronous and asynchronous implementations.
+
+Scheduling:
+    Steps are started from a ready queue as soon as every step in their
+    ``depends_on`` has finished, so a slow step only delays its own
+    descendants instead of the whole next wave. When more steps are ready
+    than there are free workers, the step heading the longest remaining
+    chain of dependents (the critical path) starts first. A sequential run
+    (``parallel_wave=False``) keeps the order of ``ProcedureGraph.waves()``.
+
+Connections:
+    By default every step runs on the runner's backend; concurrent steps
+    take turns on it because a single connection cannot serve several
+    statements at once. Pass a connection pool (anything with a
+    ``connection()`` context manager, such as BackendPool or
+    AsyncBackendPool) to give each concurrently running step its own
+    connection. The pool is only used when the graph's transaction mode is
+    NONE, since a graph-wide transaction has to stay on one connection.
 """
+import asyncio
+import heapq
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Any, Dict, List, Optional, Tuple
 
 from .exceptions import ProcedureError
@@ -15,6 +36,7 @@ from .procedure_graph import (
     ProcedureGraph,
     StepKind,
     StepNode,
+    TransactionMode,
     _extract_path,
     _interpolate_template,
     _safe_eval_condition,
@@ -29,19 +51,98 @@ class ProcedureGraphValidationError(ProcedureError):
         super().__init__(f"Graph validation failed: {', '.join(errors)}")
 
 
+class _ReadyQueue:
+    """Dependency-driven ready queue over the steps of a graph.
+
+    A step becomes ready once all of its dependencies have completed.
+    With ``critical_path``, ready steps are handed out longest-remaining-chain
+    first, then in declaration order; otherwise in the order of ``waves()``.
+    """
+
+    def __init__(self, graph: ProcedureGraph, critical_path: bool = True):
+        waves = graph.waves()
+        nodes = [node for wave in waves for node in wave]
+        self.depth = len(waves)
+        self.width = max(len(wave) for wave in waves)
+        self._critical_path = critical_path
+        self._order = {node.name: index for index, node in enumerate(graph if critical_path else nodes)}
+        self._nodes = {node.name: node for node in nodes}
+        self._dependents: Dict[str, List[str]] = {node.name: [] for node in nodes}
+        self._waiting: Dict[str, int] = {}
+        for node in nodes:
+            self._waiting[node.name] = len(node.depends_on)
+            for dep in node.depends_on:
+                self._dependents[dep].append(node.name)
+
+        # Steps on the longest chain below a node, the node included
+        self._chain: Dict[str, int] = {}
+        for node in reversed(nodes):
+            self._chain[node.name] = 1 + max(
+                (self._chain[child] for child in self._dependents[node.name]), default=0
+            )
+
+        self._ready_at: Dict[str, float] = {}
+        self._heap: List[Tuple[int, int, str]] = []
+        for node in nodes:
+            if not node.depends_on:
+                self._push(node.name)
+
+    def _push(self, name: str) -> None:
+        self._ready_at[name] = time.monotonic()
+        urgency = -self._chain[name] if self._critical_path else 0
+        heapq.heappush(self._heap, (urgency, self._order[name], name))
+
+    def pop(self) -> Optional[StepNode]:
+        """Return the most urgent ready step, or None if none is ready."""
+        if not self._heap:
+            return None
+        return self._nodes[heapq.heappop(self._heap)[2]]
+
+    def ready_at(self, node: StepNode) -> float:
+        """Monotonic time at which the step became ready."""
+        return self._ready_at[node.name]
+
+    def complete(self, node: StepNode) -> None:
+        """Mark a step finished and release the dependents it was blocking."""
+        for child in self._dependents[node.name]:
+            self._waiting[child] -= 1
+            if self._waiting[child] == 0:
+                self._push(child)
+
+
+def _start_entry(
+    node: StepNode,
+    ready_at: Optional[float],
+    run_start: Optional[float],
+) -> StepTraceEntry:
+    """Create the trace entry of a step that is about to start."""
+    entry = StepTraceEntry(name=node.name, kind=node.kind.name)
+    now = time.monotonic()
+    if ready_at is not None:
+        entry.queue_ms = (now - ready_at) * 1000
+    if run_start is not None:
+        entry.started_ms = (now - run_start) * 1000
+    return entry
+
+
 class ProcedureGraphRunner:
     """Synchronous runner for ProcedureGraph.
 
     Executes a ProcedureGraph using a synchronous backend.
-    Steps within the same wave can be executed in parallel
-    using ThreadPoolExecutor.
+    With ``parallel_wave=True``, independent steps run concurrently on one
+    bounded ThreadPoolExecutor shared by the whole run; each step starts as
+    soon as its dependencies have finished.
 
     Attributes:
         backend: The database backend (must be sync).
         dialect: The SQL dialect. If None, obtained from backend.
         dry_run: If True, only resolve SQL without executing.
         trace: If True, record execution traces.
-        parallel_wave: If True, execute steps in parallel within waves.
+        parallel_wave: If True, execute independent steps concurrently.
+        max_concurrency: Maximum number of steps running at once. Defaults
+            to the width of the widest wave.
+        pool: Optional BackendPool; concurrent steps each acquire their own
+            connection from it when the graph's transaction mode is NONE.
 
     Example:
         >>> runner = ProcedureGraphRunner(backend, dry_run=True)
@@ -55,12 +156,19 @@ class ProcedureGraphRunner:
         dry_run: bool = False,
         trace: bool = False,
         parallel_wave: bool = False,
+        max_concurrency: Optional[int] = None,
+        pool: Optional[Any] = None,
     ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
         self._backend = backend
         self._dialect = dialect or getattr(backend, "dialect", None)
         self._dry_run = dry_run
         self._trace = trace
         self._parallel_wave = parallel_wave
+        self._max_concurrency = max_concurrency
+        self._pool = pool
+        self._backend_lock = threading.Lock()
 
     @property
     def dialect(self) -> Any:
@@ -89,16 +197,20 @@ class ProcedureGraphRunner:
 
         ctx = GraphContext(self._dialect, params or {})
         result = ProcedureGraphResult()
+        queue = _ReadyQueue(graph, critical_path=self._parallel_wave)
+        result.waves_count = queue.depth
+        pooled = self._pool is not None and graph.transaction_mode == TransactionMode.NONE
 
         with self._transaction(graph.transaction_mode):
             t0 = time.monotonic()
-            for wave_idx, wave in enumerate(graph.waves()):
-                result.waves_count = wave_idx + 1
-                if self._parallel_wave:
-                    self._run_wave_parallel(wave, ctx, result)
-                else:
-                    for node in wave:
-                        self._run_node(node, ctx, result)
+            if self._parallel_wave:
+                self._run_concurrent(queue, ctx, result, t0, pooled)
+            else:
+                node = queue.pop()
+                while node is not None:
+                    self._run_node(node, ctx, result, queue.ready_at(node), t0, pooled)
+                    queue.complete(node)
+                    node = queue.pop()
             result.elapsed_ms = (time.monotonic() - t0) * 1000
 
         return result
@@ -107,34 +219,60 @@ class ProcedureGraphRunner:
         """Context manager for transactions."""
         return _SyncTransactionContext(self._backend, mode)
 
-    def _run_wave_parallel(
+    def _run_concurrent(
         self,
-        wave: List[StepNode],
+        queue: _ReadyQueue,
         ctx: GraphContext,
         result: ProcedureGraphResult,
+        run_start: float,
+        pooled: bool,
     ) -> None:
-        """Run all nodes in a wave in parallel."""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        """Run steps on one bounded executor as their dependencies complete.
 
-        with ThreadPoolExecutor(max_workers=len(wave)) as executor:
-            futures = {
-                executor.submit(self._run_node, node, ctx, result): node
-                for node in wave
-            }
-            for future in as_completed(futures):
-                future.result()
+        Steps are submitted only when a worker is free, so the ready queue
+        (not the executor's FIFO) decides which step goes next. After a
+        failure no new steps are started; running ones are waited for and
+        the first error is re-raised.
+        """
+        limit = self._max_concurrency or queue.width
+        running: Dict[Any, StepNode] = {}
+        failure: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=limit, thread_name_prefix="procedure-graph") as executor:
+            while True:
+                while failure is None and len(running) < limit:
+                    node = queue.pop()
+                    if node is None:
+                        break
+                    future = executor.submit(
+                        self._run_node, node, ctx, result, queue.ready_at(node), run_start, pooled
+                    )
+                    running[future] = node
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        queue.complete(node)
+                    elif failure is None:
+                        failure = error
+
+        if failure is not None:
+            raise failure
 
     def _run_node(
         self,
         node: StepNode,
         ctx: GraphContext,
         result: ProcedureGraphResult,
+        ready_at: Optional[float] = None,
+        run_start: Optional[float] = None,
+        pooled: bool = False,
     ) -> None:
         """Run a single step node."""
-        entry = StepTraceEntry(
-            name=node.name,
-            kind=node.kind.name,
-        )
+        entry = _start_entry(node, ready_at, run_start)
 
         if not ctx.eval_condition(node.condition):
             entry.status = StepStatus.SKIPPED
@@ -159,7 +297,7 @@ class ProcedureGraphRunner:
                 result.steps_dry_run.append(entry)
                 return
 
-            rows = self._execute(sql, params)
+            rows = self._execute(sql, params, pooled)
             entry.result = rows
             entry.status = StepStatus.OK
 
@@ -194,17 +332,27 @@ class ProcedureGraphRunner:
         elif node.kind == StepKind.SUBGRAPH:
             raise ProcedureError("SUBGRAPH must be expanded before execution")
 
-    def _execute(self, sql: str, params: tuple) -> Any:
-        """Execute SQL on the backend."""
-        return self._backend.execute(sql, params)
+    def _execute(self, sql: str, params: tuple, pooled: bool = False) -> Any:
+        """Execute SQL on a pooled connection or on the shared backend."""
+        if pooled:
+            with self._pool.connection() as backend:
+                return backend.execute(sql, params)
+        with self._backend_lock:
+            return self._backend.execute(sql, params)
 
 
 class AsyncProcedureGraphRunner:
     """Asynchronous runner for ProcedureGraph.
 
     Executes a ProcedureGraph using an async backend.
-    Steps within the same wave are executed concurrently
-    using asyncio.gather().
+    Independent steps run as concurrent tasks; each step starts as soon
+    as its dependencies have finished.
+
+    Attributes:
+        max_concurrency: Maximum number of steps running at once. Defaults
+            to the width of the widest wave.
+        pool: Optional AsyncBackendPool; concurrent steps each acquire their
+            own connection from it when the graph's transaction mode is NONE.
 
     Example:
         >>> runner = AsyncProcedureGraphRunner(async_backend, dry_run=True)
@@ -217,11 +365,17 @@ class AsyncProcedureGraphRunner:
         dialect: Optional[Any] = None,
         dry_run: bool = False,
         trace: bool = False,
+        max_concurrency: Optional[int] = None,
+        pool: Optional[Any] = None,
     ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
         self._backend = backend
         self._dialect = dialect or getattr(backend, "dialect", None)
         self._dry_run = dry_run
         self._trace = trace
+        self._max_concurrency = max_concurrency
+        self._pool = pool
 
     @property
     def dialect(self) -> Any:
@@ -239,17 +393,42 @@ class AsyncProcedureGraphRunner:
 
         ctx = GraphContext(self._dialect, params or {})
         result = ProcedureGraphResult()
+        queue = _ReadyQueue(graph)
+        result.waves_count = queue.depth
+        pooled = self._pool is not None and graph.transaction_mode == TransactionMode.NONE
+        # Created per run: the lock belongs to the running event loop
+        backend_lock = asyncio.Lock()
 
         async with self._transaction(graph.transaction_mode):
             t0 = time.monotonic()
-            for wave_idx, wave in enumerate(graph.waves()):
-                result.waves_count = wave_idx + 1
-                import asyncio
-                tasks = [
-                    self._run_node_async(node, ctx, result)
-                    for node in wave
-                ]
-                await asyncio.gather(*tasks)
+            limit = self._max_concurrency or queue.width
+            running: Dict[asyncio.Task, StepNode] = {}
+            failure: Optional[BaseException] = None
+            try:
+                while True:
+                    while failure is None and len(running) < limit:
+                        node = queue.pop()
+                        if node is None:
+                            break
+                        task = asyncio.ensure_future(self._run_node_async(
+                            node, ctx, result, queue.ready_at(node), t0, pooled, backend_lock
+                        ))
+                        running[task] = node
+                    if not running:
+                        break
+                    done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        node = running.pop(task)
+                        error = task.exception()
+                        if error is None:
+                            queue.complete(node)
+                        elif failure is None:
+                            failure = error
+            finally:
+                for task in running:
+                    task.cancel()
+            if failure is not None:
+                raise failure
             result.elapsed_ms = (time.monotonic() - t0) * 1000
 
         return result
@@ -263,12 +442,13 @@ class AsyncProcedureGraphRunner:
         node: StepNode,
         ctx: GraphContext,
         result: ProcedureGraphResult,
+        ready_at: Optional[float] = None,
+        run_start: Optional[float] = None,
+        pooled: bool = False,
+        backend_lock: Optional[asyncio.Lock] = None,
     ) -> None:
         """Run a single step node asynchronously."""
-        entry = StepTraceEntry(
-            name=node.name,
-            kind=node.kind.name,
-        )
+        entry = _start_entry(node, ready_at, run_start)
 
         if not ctx.eval_condition(node.condition):
             entry.status = StepStatus.SKIPPED
@@ -293,7 +473,7 @@ class AsyncProcedureGraphRunner:
                 result.steps_dry_run.append(entry)
                 return
 
-            rows = await self._execute(sql, params)
+            rows = await self._execute(sql, params, pooled, backend_lock)
             entry.result = rows
             entry.status = StepStatus.OK
 
@@ -328,9 +508,21 @@ class AsyncProcedureGraphRunner:
         elif node.kind == StepKind.SUBGRAPH:
             raise ProcedureError("SUBGRAPH must be expanded before execution")
 
-    async def _execute(self, sql: str, params: tuple) -> Any:
-        """Execute SQL on the async backend."""
-        return await self._backend.execute(sql, params)
+    async def _execute(
+        self,
+        sql: str,
+        params: tuple,
+        pooled: bool = False,
+        backend_lock: Optional[asyncio.Lock] = None,
+    ) -> Any:
+        """Execute SQL on a pooled connection or on the shared async backend."""
+        if pooled:
+            async with self._pool.connection() as backend:
+                return await backend.execute(sql, params)
+        if backend_lock is None:
+            return await self._backend.execute(sql, params)
+        async with backend_lock:
+            return await self._backend.execute(sql, params)
 
 
 def _interpolate_dict(
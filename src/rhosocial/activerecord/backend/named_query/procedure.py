@@ -55,6 +55,20 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
+from ..options import ExecutionOptions
+from .bindings import (
+    DEFAULT_FETCH_SIZE,
+    DEFAULT_SPILL_THRESHOLD,
+    AsyncSpilledRows,
+    AsyncStreamedRows,
+    BindMode,
+    SpilledRows,
+    StreamedRows,
+    async_drop_spill_table,
+    async_spill,
+    drop_spill_table,
+    spill,
+)
 from .resolver import resolve_named_query
 
 
@@ -158,6 +172,19 @@ class ParallelStep:
     output: bool = False
 
 
+def _check_lazy_bind(backend: Any, mode: BindMode, bind: Optional[str], output: bool) -> None:
+    """Validate an execute() call that binds without materializing."""
+    if not bind:
+        raise ValueError(f"BindMode.{mode.name} requires a bind variable")
+    if output:
+        raise ValueError(
+            f"BindMode.{mode.name} results cannot be outputs; they are released "
+            "when the procedure ends. Use BindMode.MATERIALIZE for outputs."
+        )
+    if backend is None:
+        raise ValueError(f"BindMode.{mode.name} requires the context to have a backend")
+
+
 def _resolve_concurrency(backend: Any, user_max: Optional[int]) -> Optional[int]:
     """Resolve effective concurrency limit.
 
@@ -236,6 +263,7 @@ class ProcedureContext:
         self._in_transaction: bool = False
         self._trace: List[TraceEntry] = []
         self._trace_index: int = 0
+        self._spill_tables: Dict[str, str] = {}
 
     @property
     def dialect(self) -> Any:
@@ -253,6 +281,9 @@ class ProcedureContext:
         params: Optional[Dict[str, Any]] = None,
         bind: Optional[str] = None,
         output: bool = False,
+        mode: BindMode = BindMode.MATERIALIZE,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
     ) -> Dict[str, Any]:
         """Execute a named query and optionally bind the result.
 
@@ -264,10 +295,17 @@ class ProcedureContext:
             params: Parameters to pass to the named query.
             bind: Optional variable name to bind the result to.
             output: Mark this result as an output to be returned.
+            mode: How a bound result is kept (see BindMode). STREAM, SPILL
+                and AUTO require bind and cannot be combined with output.
+            spill_threshold: For BindMode.AUTO, the largest row count that
+                is materialized instead of staying in a temporary table.
+            fetch_size: Rows per fetchmany() page when reading a streamed or
+                spilled result.
 
         Returns:
             Dict containing:
-                - data: List of row dictionaries
+                - data: List of row dictionaries, or a lazy StreamedRows /
+                  SpilledRows for the streaming and spill modes
                 - affected_rows: Number of rows affected
                 - sql: The generated SQL
                 - params: The SQL parameters
@@ -286,10 +324,18 @@ class ProcedureContext:
                 self._begin_transaction()
 
         params = params or {}
+        mode = BindMode(mode)
+        if mode is not BindMode.MATERIALIZE:
+            _check_lazy_bind(self._backend, mode, bind, output)
         _start = time_module.monotonic()
         _status, _error = "ok", None
         try:
-            result = self._execute_callback(qualified_name, self._dialect, params)
+            if mode is BindMode.MATERIALIZE:
+                result = self._execute_callback(qualified_name, self._dialect, params)
+            else:
+                result = self._execute_unmaterialized(
+                    qualified_name, params, bind, mode, spill_threshold, fetch_size
+                )
         except Exception as exc:
             _status, _error = "error", type(exc).__name__
             raise
@@ -324,7 +370,7 @@ class ProcedureContext:
         }
 
         if bind:
-            self._bindings[bind] = result_data
+            self._store_binding(bind, result_data)
 
         return result_data
 
@@ -345,6 +391,9 @@ class ProcedureContext:
             raise ValueError(f"Variable '{var_name}' not found in bindings")
 
         data = self._bindings[var_name].get("data", [])
+        if isinstance(data, StreamedRows):
+            first_row = data.first()
+            return first_row.get(column) if first_row else None
         if not data:
             return None
 
@@ -354,6 +403,9 @@ class ProcedureContext:
     def rows(self, var_name: str) -> Iterator[Dict[str, Any]]:
         """Iterate over all rows in a bound result set.
 
+        Streamed and spilled results are read page by page, so rows are
+        not held in memory between iterations.
+
         Args:
             var_name: The variable name the result was bound to.
 
@@ -382,13 +434,62 @@ class ProcedureContext:
             >>> ctx.bind("items", [{"id": 1}, {"id": 2}])
         """
         if data is None:
-            self._bindings[name] = {"data": []}
-        elif isinstance(data, list):
-            self._bindings[name] = {"data": data}
-        elif isinstance(data, dict):
-            self._bindings[name] = {"data": [data]}
+            data = []
+        elif not isinstance(data, list):
+            data = [data]
+        self._store_binding(name, {"data": data})
+
+    def table(self, var_name: str) -> str:
+        """Return the temporary table holding a spilled binding.
+
+        Pass it to later named queries so they can join against the
+        intermediate result server-side.
+
+        Raises:
+            ValueError: If the variable is not bound or was not spilled.
+        """
+        if var_name not in self._bindings:
+            raise ValueError(f"Variable '{var_name}' not found in bindings")
+        data = self._bindings[var_name].get("data")
+        if not isinstance(data, SpilledRows):
+            raise ValueError(f"Variable '{var_name}' is not spilled to a table")
+        return data.table
+
+    def _execute_unmaterialized(
+        self,
+        qualified_name: str,
+        params: Dict[str, Any],
+        bind: str,
+        mode: BindMode,
+        spill_threshold: int,
+        fetch_size: int,
+    ) -> Dict[str, Any]:
+        """Run a named query for BindMode.STREAM / SPILL / AUTO."""
+        expression, sql, params_sql = resolve_named_query(qualified_name, self._dialect, params)
+        if mode is BindMode.STREAM:
+            data = StreamedRows(self._backend, expression, fetch_size)
         else:
-            self._bindings[name] = {"data": [data]}
+            data = spill(self._backend, bind, expression, mode, spill_threshold, fetch_size)
+        return {"sql": sql, "params_sql": params_sql, "data": data, "affected_rows": 0}
+
+    def _store_binding(self, name: str, result_data: Dict[str, Any]) -> None:
+        """Bind a result, dropping the table of a spilled result it replaces."""
+        old_table = self._spill_tables.pop(name, None)
+        if old_table is not None:
+            drop_spill_table(self._backend, old_table)
+        data = result_data.get("data")
+        if isinstance(data, SpilledRows):
+            self._spill_tables[name] = data.table
+        self._bindings[name] = result_data
+
+    def _drop_spill_tables(self) -> None:
+        """Drop every spill table; called by the runner when the procedure ends."""
+        while self._spill_tables:
+            name, table = self._spill_tables.popitem()
+            try:
+                drop_spill_table(self._backend, table)
+            except Exception as exc:
+                self.log(f"Failed to drop spill table {table} for '{name}': {exc}", "WARNING")
 
     def log(self, message: str, level: str = "INFO") -> None:
         """Log a message from the procedure.
@@ -618,6 +719,7 @@ class AsyncProcedureContext:
         self._in_transaction: bool = False
         self._trace: List[TraceEntry] = []
         self._trace_index: int = 0
+        self._spill_tables: Dict[str, str] = {}
 
     @property
     def dialect(self) -> Any:
@@ -633,8 +735,15 @@ class AsyncProcedureContext:
         params: Optional[Dict[str, Any]] = None,
         bind: Optional[str] = None,
         output: bool = False,
+        mode: BindMode = BindMode.MATERIALIZE,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
     ) -> Dict[str, Any]:
-        """Execute a named query asynchronously."""
+        """Execute a named query asynchronously.
+
+        Same arguments as ProcedureContext.execute(); streamed and spilled
+        results are read with ``async for`` through rows().
+        """
         import time as time_module
 
         if self._transaction_mode == TransactionMode.STEP:
@@ -642,10 +751,18 @@ class AsyncProcedureContext:
                 await self._begin_transaction()
 
         params = params or {}
+        mode = BindMode(mode)
+        if mode is not BindMode.MATERIALIZE:
+            _check_lazy_bind(self._backend, mode, bind, output)
         _start = time_module.monotonic()
         _status, _error = "ok", None
         try:
-            result = await self._execute_callback(qualified_name, self._dialect, params)
+            if mode is BindMode.MATERIALIZE:
+                result = await self._execute_callback(qualified_name, self._dialect, params)
+            else:
+                result = await self._execute_unmaterialized(
+                    qualified_name, params, bind, mode, spill_threshold, fetch_size
+                )
         except Exception as exc:
             _status, _error = "error", type(exc).__name__
             raise
@@ -681,7 +798,7 @@ class AsyncProcedureContext:
         }
 
         if bind:
-            self._bindings[bind] = result_data
+            await self._store_binding(bind, result_data)
 
         return result_data
 
@@ -689,6 +806,9 @@ class AsyncProcedureContext:
         if var_name not in self._bindings:
             raise ValueError(f"Variable '{var_name}' not found in bindings")
         data = self._bindings[var_name].get("data", [])
+        if isinstance(data, AsyncStreamedRows):
+            first_row = await data.first()
+            return first_row.get(column) if first_row else None
         if not data:
             return None
         first_row = data[0]
@@ -698,18 +818,62 @@ class AsyncProcedureContext:
         if var_name not in self._bindings:
             raise ValueError(f"Variable '{var_name}' not found in bindings")
         data = self._bindings[var_name].get("data", [])
-        for row in data:
-            yield row
+        if isinstance(data, AsyncStreamedRows):
+            async for row in data:
+                yield row
+        else:
+            for row in data:
+                yield row
 
     async def bind(self, name: str, data: Any) -> None:
         if data is None:
-            self._bindings[name] = {"data": []}
-        elif isinstance(data, list):
-            self._bindings[name] = {"data": data}
-        elif isinstance(data, dict):
-            self._bindings[name] = {"data": [data]}
+            data = []
+        elif not isinstance(data, list):
+            data = [data]
+        await self._store_binding(name, {"data": data})
+
+    def table(self, var_name: str) -> str:
+        """Return the temporary table holding a spilled binding."""
+        if var_name not in self._bindings:
+            raise ValueError(f"Variable '{var_name}' not found in bindings")
+        data = self._bindings[var_name].get("data")
+        if not isinstance(data, AsyncSpilledRows):
+            raise ValueError(f"Variable '{var_name}' is not spilled to a table")
+        return data.table
+
+    async def _execute_unmaterialized(
+        self,
+        qualified_name: str,
+        params: Dict[str, Any],
+        bind: str,
+        mode: BindMode,
+        spill_threshold: int,
+        fetch_size: int,
+    ) -> Dict[str, Any]:
+        """Run a named query for BindMode.STREAM / SPILL / AUTO."""
+        expression, sql, params_sql = resolve_named_query(qualified_name, self._dialect, params)
+        if mode is BindMode.STREAM:
+            data = AsyncStreamedRows(self._backend, expression, fetch_size)
         else:
-            self._bindings[name] = {"data": [data]}
+            data = await async_spill(self._backend, bind, expression, mode, spill_threshold, fetch_size)
+        return {"sql": sql, "params_sql": params_sql, "data": data, "affected_rows": 0}
+
+    async def _store_binding(self, name: str, result_data: Dict[str, Any]) -> None:
+        old_table = self._spill_tables.pop(name, None)
+        if old_table is not None:
+            await async_drop_spill_table(self._backend, old_table)
+        data = result_data.get("data")
+        if isinstance(data, AsyncSpilledRows):
+            self._spill_tables[name] = data.table
+        self._bindings[name] = result_data
+
+    async def _drop_spill_tables(self) -> None:
+        while self._spill_tables:
+            name, table = self._spill_tables.popitem()
+            try:
+                await async_drop_spill_table(self._backend, table)
+            except Exception as exc:
+                await self.log(f"Failed to drop spill table {table} for '{name}': {exc}", "WARNING")
 
     async def log(self, message: str, level: str = "INFO") -> None:
         self._logs.append(LogEntry(level=level, message=message))
@@ -1140,10 +1304,11 @@ class ProcedureRunner(_BaseProcedureRunner):
             pass
 
         def execute_callback(fqn: str, dial: Any, params: Dict[str, Any]) -> Dict[str, Any]:
-            _, sql, params_sql = resolve_named_query(fqn, dial, params)
+            expression, sql, params_sql = resolve_named_query(fqn, dial, params)
             data, affected_rows = [], 0
             if backend_execute and sql:
-                raw = backend_execute(sql, params_sql)
+                options = ExecutionOptions(stmt_type=expression.statement_type)
+                raw = backend_execute(sql, params_sql, options=options)
                 if raw and raw.data:
                     data = raw.data
                 if raw:
@@ -1202,6 +1367,7 @@ class ProcedureRunner(_BaseProcedureRunner):
             result.aborted = True
             result.abort_reason = str(e)
 
+        ctx._drop_spill_tables()
         result.logs = ctx._logs
         result.outputs = [v for v in ctx.bindings.values() if v.get("output")]
         result.static_trace = list(static_ctx._trace)
@@ -1308,10 +1474,11 @@ class AsyncProcedureRunner(_BaseProcedureRunner):
         async def execute_callback(
             fqn: str, dial: Any, params: Dict[str, Any]
         ) -> Dict[str, Any]:
-            _, sql, params_sql = resolve_named_query(fqn, dial, params)
+            expression, sql, params_sql = resolve_named_query(fqn, dial, params)
             data, affected_rows = [], 0
             if backend_execute and sql:
-                raw = await backend_execute(sql, params_sql)
+                options = ExecutionOptions(stmt_type=expression.statement_type)
+                raw = await backend_execute(sql, params_sql, options=options)
                 if raw and raw.data:
                     data = raw.data
                 if raw:
@@ -1372,6 +1539,7 @@ class AsyncProcedureRunner(_BaseProcedureRunner):
             result.aborted = True
             result.abort_reason = str(e)
 
+        await ctx._drop_spill_tables()
         result.logs = ctx._logs
         result.outputs = [v for v in ctx.bindings.values() if v.get("output")]
         result.static_trace = list(static_ctx._trace)
@@ -47,6 +47,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from rhosocial.activerecord.backend.expression.bases import BaseExpression
 from rhosocial.activerecord.backend.expression.executable import Executable
+from rhosocial.activerecord.backend.expression.prepared import Param, PreparedStatement
 from rhosocial.activerecord.backend.schema import StatementType
 
 from .exceptions import (
@@ -110,7 +111,8 @@ class NamedQueryResolver:
         1. Create resolver with qualified name
         2. Call load() to import the callable
         3. Optionally call describe() to get signature info
-        4. Call execute() to run the query
+        4. Call execute() to run the query, or prepare() to compile it once
+           and bind parameter values per call
 
     Attributes:
         qualified_name: The fully qualified name of the named query.
@@ -528,6 +530,53 @@ class NamedQueryResolver:
 
         return result
 
+    def prepare(
+        self,
+        dialect: Any,
+        fixed_params: Optional[Dict[str, Any]] = None,
+    ) -> PreparedStatement:
+        """Compile the named query once into a reusable prepared statement.
+
+        Every user parameter not listed in ``fixed_params`` is passed to the
+        callable as a ``Param`` placeholder (carrying the signature default, if
+        any), and the returned expression is compiled a single time. Values are
+        then supplied per call with ``PreparedStatement.bind()``, so the callable
+        is not invoked again. This only works for callables that use their
+        parameters as SQL values; a callable that inspects a value (e.g.
+        ``if limit > 100``) must receive it through ``fixed_params``.
+
+        Args:
+            dialect: The dialect instance.
+            fixed_params: Parameters whose values are fixed at preparation time.
+
+        Returns:
+            PreparedStatement: The compiled statement.
+
+        Raises:
+            NamedQueryNotCallableError: If callable not loaded yet.
+            NamedQueryInvalidParameterError: If an unknown parameter is fixed.
+            NamedQueryInvalidReturnTypeError: If the callable doesn't return an
+                executable expression.
+
+        Example:
+            >>> resolver = NamedQueryResolver("myapp.queries.active_users").load()
+            >>> prepared = resolver.prepare(dialect)
+            >>> sql, params = prepared.bind(limit=50)
+        """
+        resolved_params = dict(fixed_params or {})
+        for name, param in self.get_signature().parameters.items():
+            if name in ("dialect", "self") or name in resolved_params:
+                continue
+            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+                continue
+            if param.default != inspect.Parameter.empty:
+                resolved_params[name] = Param(name, default=param.default)
+            else:
+                resolved_params[name] = Param(name)
+
+        expression = self.execute(dialect, resolved_params)
+        return PreparedStatement.from_expression(expression)
+
 
 def resolve_named_query(
     qualified_name: str,
@@ -41,6 +41,11 @@ class ExecutionOptions:
     # This is useful for DML statements with RETURNING clauses
     process_result_set: Optional[bool] = None
 
+    # Return rows as tuples in SELECT order instead of dictionaries. Column
+    # adapters are applied by position and column_mapping is not used; the
+    # column names are reported in QueryResult.columns.
+    as_tuples: bool = False
+
 
 @dataclass
 class InsertOptions:
@@ -5,6 +5,7 @@ import json
 import logging
 import sys
 import csv
+import textwrap
 from typing import Any, List, Dict
 
 from .output_abc import OutputProvider
@@ -37,6 +38,24 @@ class JsonOutputProvider(OutputProvider):
             return
         sys.stdout.write(json.dumps(data, indent=2, ensure_ascii=False, default=self._json_serializer) + "\n")
 
+    # Streaming writes the same indented array as display_results(), one
+    # element per row, so output does not depend on the page size.
+
+    def begin_results(self, columns: List[str], **kwargs):
+        self._rows_written = 0
+        sys.stdout.write("[")
+
+    def write_rows(self, rows: List[Dict[str, Any]], **kwargs):
+        for row in rows:
+            element = json.dumps(row, indent=2, ensure_ascii=False, default=self._json_serializer)
+            sys.stdout.write((",\n" if self._rows_written else "\n") + textwrap.indent(element, "  "))
+            self._rows_written += 1
+        sys.stdout.flush()
+
+    def end_results(self, **kwargs):
+        sys.stdout.write("\n]\n" if self._rows_written else "]\n")
+        sys.stdout.flush()
+
     def display_no_data(self):
         logger.info("No data returned.")
 
@@ -61,6 +80,30 @@ class JsonOutputProvider(OutputProvider):
         logger.info("Output format set to JSON.")
 
 
+class NdjsonOutputProvider(JsonOutputProvider):
+    """Output provider for newline-delimited JSON (one object per line)."""
+
+    def display_results(self, data: List[Dict[str, Any]], **kwargs):
+        if not data:
+            self.display_no_data()
+            return
+        self.write_rows(data)
+
+    def begin_results(self, columns: List[str], **kwargs):
+        pass
+
+    def write_rows(self, rows: List[Dict[str, Any]], **kwargs):
+        for row in rows:
+            sys.stdout.write(json.dumps(row, ensure_ascii=False, default=self._json_serializer) + "\n")
+        sys.stdout.flush()
+
+    def end_results(self, **kwargs):
+        pass
+
+    def display_greeting(self):
+        logger.info("Output format set to NDJSON.")
+
+
 class CsvOutputProvider(OutputProvider):
     """Output provider for CSV format."""
 
@@ -83,11 +126,22 @@ class CsvOutputProvider(OutputProvider):
             self.display_no_data()
             return
 
-        headers = list(data[0].keys())
-        writer = csv.writer(sys.stdout)
-        writer.writerow(headers)
-        for row in data:
-            writer.writerow([self._format_value(row.get(header)) for header in headers])
+        self.begin_results(list(data[0].keys()))
+        self.write_rows(data)
+        self.end_results()
+
+    def begin_results(self, columns: List[str], **kwargs):
+        self._columns = columns
+        self._writer = csv.writer(sys.stdout)
+        self._writer.writerow(columns)
+
+    def write_rows(self, rows: List[Dict[str, Any]], **kwargs):
+        for row in rows:
+            self._writer.writerow([self._format_value(row.get(header)) for header in self._columns])
+        sys.stdout.flush()
+
+    def end_results(self, **kwargs):
+        self._writer = None
 
     def display_no_data(self):
         logger.info("No data returned for CSV output.")
@@ -135,11 +189,22 @@ class TsvOutputProvider(OutputProvider):
             self.display_no_data()
             return
 
-        headers = list(data[0].keys())
-        writer = csv.writer(sys.stdout, delimiter="\t")
-        writer.writerow(headers)
-        for row in data:
-            writer.writerow([self._format_value(row.get(header)) for header in headers])
+        self.begin_results(list(data[0].keys()))
+        self.write_rows(data)
+        self.end_results()
+
+    def begin_results(self, columns: List[str], **kwargs):
+        self._columns = columns
+        self._writer = csv.writer(sys.stdout, delimiter="\t")
+        self._writer.writerow(columns)
+
+    def write_rows(self, rows: List[Dict[str, Any]], **kwargs):
+        for row in rows:
+            self._writer.writerow([self._format_value(row.get(header)) for header in self._columns])
+        sys.stdout.flush()
+
+    def end_results(self, **kwargs):
+        self._writer = None
 
     def display_no_data(self):
         logger.info("No data returned for TSV output.")
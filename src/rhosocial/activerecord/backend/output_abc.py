@@ -21,6 +21,24 @@ class OutputProvider(ABC):
         """Display query results."""
         pass
 
+    # Streaming results: begin_results() once with the column names, then
+    # write_rows() once per page, then end_results(). Providers that can
+    # write incrementally override all three; the default collects the
+    # pages and hands them to display_results() at the end.
+
+    def begin_results(self, columns: List[str], **kwargs):
+        """Start a streamed result set."""
+        self._streamed_rows: List[Dict[str, Any]] = []
+
+    def write_rows(self, rows: List[Dict[str, Any]], **kwargs):
+        """Write one page of a streamed result set."""
+        self._streamed_rows.extend(rows)
+
+    def end_results(self, **kwargs):
+        """Finish a streamed result set."""
+        rows, self._streamed_rows = self._streamed_rows, []
+        self.display_results(rows, **kwargs)
+
     @abstractmethod
     def display_no_data(self):
         """Display a message when no data is returned."""
@@ -36,6 +36,8 @@ class QueryResult(Generic[T]):
             None for non-INSERT operations or when not applicable.
         duration: Query execution time in seconds. Useful for performance monitoring
             and optimization.
+        columns: Result column names, in SELECT order. Only set for results
+            fetched as tuples (``ExecutionOptions.as_tuples``).
 
     Example:
         >>> # DQL query result
@@ -57,6 +59,7 @@ class QueryResult(Generic[T]):
     affected_rows: int = 0
     last_insert_id: Optional[int] = None
     duration: float = 0.0
+    columns: Optional[List[str]] = None
 
 
 class BatchCommitMode(Enum):
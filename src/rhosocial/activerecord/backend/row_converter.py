@@ -0,0 +1,164 @@
+# src/rhosocial/activerecord/backend/row_converter.py
+"""
+Positional row conversion plans for result sets.
+
+The columns of a result set, their type adapters and their field names are
+the same for every row, so they are resolved once per result shape instead
+of once per value:
+
+- Columns without an adapter are copied as they are; no per-value work.
+- Adapted columns are converted column by column through the adapter's
+  ``from_database_batch()``, which resolves the target type once.
+- Rows are emitted in one pass, either as dictionaries keyed by field name
+  (``column_mapping`` applied) or as tuples in SELECT order.
+
+Rows are read by position. Drivers returning mapping rows (dict cursors) are
+supported: such pages are first read in ``column_names`` order.
+
+Plans are cached per backend by :class:`RowConverterCache`, keyed by the
+result column names and the identity of the adapter and mapping dictionaries.
+Models compute those dictionaries once per class, so the repeated queries of
+a model reuse one plan.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Type
+
+from .type_adapter import BaseSQLTypeAdapter, SQLTypeAdapter
+
+# Converts a whole column of database values; NULLs stay None.
+ColumnConverter = Callable[[Sequence[Any]], List[Any]]
+
+
+def _column_converter(adapter: SQLTypeAdapter, target_type: Type) -> ColumnConverter:
+    """Build the converter of one column from its ``(adapter, target_type)`` pair."""
+    if isinstance(adapter, BaseSQLTypeAdapter):
+        return partial(adapter.from_database_batch, target_type=target_type)
+    # Adapters implementing only the SQLTypeAdapter protocol are called per value.
+    from_database = adapter.from_database
+
+    def convert(values: Sequence[Any]) -> List[Any]:
+        return [None if value is None else from_database(value, target_type) for value in values]
+
+    return convert
+
+
+class RowConverterPlan:
+    """Conversion plan for one result shape.
+
+    Args:
+        column_names: Result column names, in SELECT order
+        column_adapters: Dictionary mapping column names to (adapter, target_type) tuples
+        column_mapping: Dictionary mapping column names to field names
+
+    Example:
+        plan = RowConverterPlan(["id", "created_at"], {"created_at": (DateTimeAdapter(), datetime)})
+        plan.to_dicts([(1, "2024-01-01T00:00:00")])
+        # [{'id': 1, 'created_at': datetime(2024, 1, 1, 0, 0)}]
+    """
+
+    __slots__ = ("column_names", "keys", "converters")
+
+    def __init__(
+        self,
+        column_names: Sequence[str],
+        column_adapters: Optional[Dict[str, Tuple[SQLTypeAdapter, Type]]] = None,
+        column_mapping: Optional[Dict[str, str]] = None,
+    ):
+        adapters = column_adapters or {}
+        mapping = column_mapping or {}
+        self.column_names: Tuple[str, ...] = tuple(column_names)
+        # Dictionary keys of the converted rows
+        self.keys: Tuple[str, ...] = tuple(mapping.get(name, name) for name in self.column_names)
+        converters = []
+        for index, name in enumerate(self.column_names):
+            adapter_info = adapters.get(name)
+            if adapter_info:
+                adapter, target_type = adapter_info
+                converters.append((index, _column_converter(adapter, target_type)))
+        # (position, converter) of the adapted columns only
+        self.converters: Tuple[Tuple[int, ColumnConverter], ...] = tuple(converters)
+
+    def _positional(self, rows: Sequence[Any]) -> Sequence[Sequence[Any]]:
+        """Return the rows as sequences in SELECT order; mapping rows are read by column name."""
+        if not isinstance(rows[0], Mapping):
+            return rows
+        names = self.column_names
+        return [tuple(row[name] for name in names) for row in rows]
+
+    def _converted_columns(self, rows: Sequence[Sequence[Any]]) -> List[Sequence[Any]]:
+        columns: List[Sequence[Any]] = list(zip(*rows))
+        for index, convert in self.converters:
+            columns[index] = convert(columns[index])
+        return columns
+
+    def to_dicts(self, rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+        """Convert rows to dictionaries keyed by field name."""
+        if not rows:
+            return []
+        rows = self._positional(rows)
+        keys = self.keys
+        if not self.converters:
+            return [dict(zip(keys, row)) for row in rows]
+        return [dict(zip(keys, values)) for values in zip(*self._converted_columns(rows))]
+
+    def to_tuples(self, rows: Sequence[Sequence[Any]]) -> List[Tuple[Any, ...]]:
+        """Convert rows to tuples in SELECT order."""
+        if not rows:
+            return []
+        rows = self._positional(rows)
+        if not self.converters:
+            return [tuple(row) for row in rows]
+        return list(zip(*self._converted_columns(rows)))
+
+
+class RowConverterCache:
+    """Bounded LRU cache of :class:`RowConverterPlan` per result shape.
+
+    Entries keep references to the adapter and mapping dictionaries they were
+    built from, so a key based on their identity cannot be reused by another
+    dictionary while the entry exists. Like the dictionaries returned by the
+    models, they must not be modified once they have been used for a query.
+    """
+
+    DEFAULT_MAX_SIZE = 128
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size < 0:
+            raise ValueError("max_size must be a non-negative integer")
+        self._max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Any, RowConverterPlan]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached plan."""
+        with self._lock:
+            self._entries.clear()
+
+    def get(
+        self,
+        column_names: Sequence[str],
+        column_adapters: Optional[Dict[str, Tuple[SQLTypeAdapter, Type]]] = None,
+        column_mapping: Optional[Dict[str, str]] = None,
+    ) -> RowConverterPlan:
+        """Return the plan for a result shape, building it on first use."""
+        if self._max_size <= 0:
+            return RowConverterPlan(column_names, column_adapters, column_mapping)
+        key = (tuple(column_names), id(column_adapters), id(column_mapping))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[2]
+        plan = RowConverterPlan(column_names, column_adapters, column_mapping)
+        with self._lock:
+            self._entries[key] = (column_adapters, column_mapping, plan)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return plan
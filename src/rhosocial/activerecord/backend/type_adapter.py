@@ -19,6 +19,7 @@ Defined Type Adapters:
   Does not register default types; intended for explicit use.
 """
 
+import types
 from abc import ABC, abstractmethod
 from datetime import datetime, date, time
 from enum import Enum
@@ -118,20 +119,39 @@ class BaseSQLTypeAdapter(ABC, BatchConversionMixin):
     def from_database(self, value: Any, target_type: Type, options: Optional[Dict[str, Any]] = None) -> Any:
         if value is None:
             return None
+        return self._do_from_database(value, self._unwrap_optional(target_type), options)
 
+    def from_database_batch(
+        self,
+        values: List[Any],
+        target_type: Type,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        """Batch converts database values to Python values.
+
+        The target type is resolved once for the whole batch and NULLs are
+        passed through. Subclasses that override ``from_database`` keep their
+        per-value behaviour.
+        """
+        if type(self).from_database is not BaseSQLTypeAdapter.from_database:
+            return super().from_database_batch(values, target_type, options)
+        target_type = self._unwrap_optional(target_type)
+        convert = self._do_from_database
+        return [None if value is None else convert(value, target_type, options) for value in values]
+
+    @staticmethod
+    def _unwrap_optional(target_type: Type) -> Type:
+        """Return ``X`` for ``Optional[X]`` / ``X | None``; other types are returned unchanged."""
         origin = get_origin(target_type)
         # Support both Optional (Python 3.8+) and UnionType (Python 3.10+)
-        import types
-
         is_union_type = origin is Union or (hasattr(types, "UnionType") and origin is types.UnionType)
         if is_union_type:
             args = get_args(target_type)
             # Filter out NoneType
             non_none_args = [arg for arg in args if arg is not type(None)]
             if len(non_none_args) == 1:
-                target_type = non_none_args[0]
-
-        return self._do_from_database(value, target_type, options)
+                return non_none_args[0]
+        return target_type
 
     @abstractmethod
     def _do_to_database(self, value: Any, target_type: Type, options: Optional[Dict[str, Any]]) -> Any:
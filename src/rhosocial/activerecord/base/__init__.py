@@ -3,6 +3,7 @@
 
 from .base import BaseActiveRecord, AsyncBaseActiveRecord
 from .query_mixin import QueryMixin, AsyncQueryMixin
+from .bulk import BulkPersistenceMixin, AsyncBulkPersistenceMixin
 from .field_proxy import FieldProxy
 from .column_name_mixin import ColumnNameMixin, ColumnNameAnnotationHandler
 from .field_adapter_mixin import FieldAdapterMixin, AdapterAnnotationHandler
@@ -14,6 +15,8 @@ __all__ = [
     "AsyncBaseActiveRecord",
     "QueryMixin",
     "AsyncQueryMixin",
+    "BulkPersistenceMixin",
+    "AsyncBulkPersistenceMixin",
     "FieldProxy",
     "ColumnNameMixin",
     "ColumnNameAnnotationHandler",
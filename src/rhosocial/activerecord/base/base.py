@@ -2,7 +2,6 @@
 """Core BaseActiveRecord implementation."""
 
 import logging
-from pydantic.fields import FieldInfo
 from typing import Any, Callable, Dict, List, Optional, Type, Union, get_origin, get_args, Tuple
 
 from ..backend.base import StorageBackend, AsyncStorageBackend
@@ -14,8 +13,8 @@ from ..backend.options import DeleteOptions, UpdateOptions
 from ..backend.options import InsertOptions
 from ..backend.type_adapter import SQLTypeAdapter
 from ..interface import IActiveRecord, IAsyncActiveRecord, ModelEvent
-from ..interface.update import IUpdateBehavior
 from ..logging import LoggingMixin
+from .model_metadata import get_model_metadata, invalidate_model_metadata
 
 
 class BaseActiveRecord(LoggingMixin, IActiveRecord):
@@ -62,6 +61,7 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
         cls.__backend__ = backend_instance
         if hasattr(cls, "_dummy_backend") and cls._dummy_backend is not None:
             cls._dummy_backend = None
+        cls.invalidate_model_metadata()
 
         backend_instance.introspect_and_adapt()
 
@@ -84,15 +84,38 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
         return super().backend()
 
     @classmethod
-    def create_from_database(cls, row: Dict[str, Any]) -> "BaseActiveRecord":
+    def invalidate_model_metadata(cls) -> None:
+        """Drop the cached per-class metadata (column adapters, column maps, MRO scans).
+
+        Called automatically by configure() and when a connection group assigns
+        or releases the backend. Call it manually after changing a model's
+        fields, column names or backend by other means.
+        """
+        invalidate_model_metadata(cls)
+
+    @classmethod
+    def create_from_database(cls, row: Dict[str, Any], trusted: Optional[bool] = None) -> "BaseActiveRecord":
+        """Build an instance from a row loaded from the database.
+
+        Args:
+            row: Field values keyed by field name
+            trusted: Skip Pydantic validation (see ``construct_from_database``).
+                None uses the model's ``__trusted_hydration__`` setting.
+        """
+        if trusted is None:
+            trusted = cls.__trusted_hydration__
+        if trusted:
+            return cls.construct_from_database(row)
         instance = cls(**row)
         instance._is_from_db = True
         instance.reset_tracking()
         return instance
 
     @classmethod
-    def create_collection_from_database(cls, rows: List[Dict[str, Any]]) -> List["BaseActiveRecord"]:
-        return [cls.create_from_database(row) for row in rows]
+    def create_collection_from_database(
+        cls, rows: List[Dict[str, Any]], trusted: Optional[bool] = None
+    ) -> List["BaseActiveRecord"]:
+        return [cls.create_from_database(row, trusted) for row in rows]
 
     def _insert_internal(self, data) -> Any:
         """
@@ -118,11 +141,11 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
         self.log_data(logging.DEBUG, "Raw data for insert", data)
         prepared_data = self.__class__._map_fields_to_columns(data)
         self.log_data(logging.DEBUG, "Data with database column names", prepared_data)
-        self.log(logging.INFO, f"Inserting new {self.__class__.__name__}")
+        self.log(logging.INFO, "Inserting new %s", self.__class__.__name__)
         column_mapping = self.__class__.get_column_to_field_map()
-        self.log(logging.DEBUG, f"Column mapping for result processing: {column_mapping}")
+        self.log(logging.DEBUG, "Column mapping for result processing: %s", column_mapping)
         column_adapters = self.get_column_adapters()
-        self.log(logging.DEBUG, f"Column adapters map: {column_adapters}")
+        self.log(logging.DEBUG, "Column adapters map: %s", column_adapters)
         supports_returning = self.backend().dialect.supports_returning_clause()
         returning_columns = None
         if supports_returning:
@@ -148,9 +171,9 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
             and getattr(self, pk_field_name, None) is None
         ):
             pk_retrieved = False
-            self.log(logging.DEBUG, f"Attempting to retrieve primary key '{pk_column}' for new record")
+            self.log(logging.DEBUG, "Attempting to retrieve primary key '%s' for new record", pk_column)
             pk_field_name = self.__class__._get_field_name(pk_column)
-            self.log(logging.DEBUG, f"Primary key column '{pk_column}' maps to field '{pk_field_name}'")
+            self.log(logging.DEBUG, "Primary key column '%s' maps to field '%s'", pk_column, pk_field_name)
             if result.data and isinstance(result.data, list) and len(result.data) > 0:
                 first_row = result.data[0]
                 if isinstance(first_row, dict) and pk_field_name in first_row:
@@ -158,13 +181,13 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
                     setattr(self, pk_field_name, pk_value)
                     pk_retrieved = True
                     self.log(
-                        logging.DEBUG, f"Retrieved primary key '{pk_field_name}' from RETURNING clause: {pk_value}"
+                        logging.DEBUG, "Retrieved primary key '%s' from RETURNING clause: %s", pk_field_name, pk_value
                     )
                 else:
                     self.log(
                         logging.WARNING,
-                        f"RETURNING clause data found, but primary key field '{pk_field_name}' "
-                        f"is missing in the result row: {first_row}",
+                        "RETURNING clause data found, but primary key field '%s' is missing in the result row: %s",
+                        pk_field_name, first_row,
                     )
 
             if not pk_retrieved and result.last_insert_id is not None:
@@ -182,7 +205,9 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
                     pk_value = result.last_insert_id
                     setattr(self, pk_field_name, pk_value)
                     pk_retrieved = True
-                    self.log(logging.DEBUG, f"Retrieved primary key '{pk_field_name}' from last_insert_id: {pk_value}")
+                    self.log(
+                        logging.DEBUG, "Retrieved primary key '%s' from last_insert_id: %s", pk_field_name, pk_value
+                    )
             if not pk_retrieved:
                 error_msg = f"Failed to retrieve primary key '{pk_field_name}' for new record after insert."
                 self.log(logging.ERROR, f"{error_msg}")
@@ -209,67 +234,67 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
         Returns:
             The result object from the backend update operation
         """
+        debug = self.is_log_enabled(logging.DEBUG)
         self.log(
             logging.INFO,
-            f"Starting update operation for {self.__class__.__name__} record with ID: "
-            f"{getattr(self, self.__class__.primary_key_field(), 'unknown')}",
+            "Starting update operation for %s record with ID: %s",
+            self.__class__.__name__, getattr(self, self.__class__.primary_key_field(), 'unknown'),
         )
         update_conditions = []
         update_expressions = {}
-        mro = self.__class__.__mro__
-        activerecord_idx = mro.index(IActiveRecord)
-        self.log(
-            logging.DEBUG,
-            f"Traversing MRO for IUpdateBehavior implementations: {[cls.__name__ for cls in mro[:activerecord_idx]]}",
-        )
-        for cls in mro[:activerecord_idx]:
-            if issubclass(cls, IUpdateBehavior):
-                defines_conditions_method = "get_update_conditions" in cls.__dict__
-                defines_expressions_method = "get_update_expressions" in cls.__dict__
-                if defines_conditions_method or defines_expressions_method:
-                    self.log(logging.DEBUG, f"Processing IUpdateBehavior from {cls.__name__}")
-                    if defines_conditions_method:
-                        behavior_conditions = cls.get_update_conditions(self)
-                        if behavior_conditions:
-                            self.log(
-                                logging.DEBUG, f"  Adding {len(behavior_conditions)} condition(s) from {cls.__name__}"
-                            )
-                            update_conditions.extend(behavior_conditions)
-                        else:
-                            self.log(logging.DEBUG, f"  No conditions from {cls.__name__}")
-                    if defines_expressions_method:
-                        behavior_expressions = cls.get_update_expressions(self)
-                        if behavior_expressions:
-                            self.log(
-                                logging.DEBUG,
-                                f"  Adding {len(behavior_expressions)} expression(s) from {cls.__name__}: "
-                                f"{list(behavior_expressions.keys())}",
-                            )
-                            update_expressions.update(behavior_expressions)
-                        else:
-                            self.log(logging.DEBUG, f"  No expressions from {cls.__name__}")
-                else:
-                    self.log(
-                        logging.DEBUG,
-                        f"Skipping {cls.__name__} (implements IUpdateBehavior but doesn't define methods directly)",
-                    )
+        update_behaviors = get_model_metadata(self.__class__).update_behaviors(IActiveRecord)
+        if debug:
+            self.log(
+                logging.DEBUG,
+                "IUpdateBehavior implementations in MRO: %s", [cls.__name__ for cls, _, _ in update_behaviors],
+            )
+        for cls, defines_conditions_method, defines_expressions_method in update_behaviors:
+            if defines_conditions_method or defines_expressions_method:
+                self.log(logging.DEBUG, "Processing IUpdateBehavior from %s", cls.__name__)
+                if defines_conditions_method:
+                    behavior_conditions = cls.get_update_conditions(self)
+                    if behavior_conditions:
+                        self.log(
+                            logging.DEBUG, "  Adding %d condition(s) from %s", len(behavior_conditions), cls.__name__
+                        )
+                        update_conditions.extend(behavior_conditions)
+                    else:
+                        self.log(logging.DEBUG, "  No conditions from %s", cls.__name__)
+                if defines_expressions_method:
+                    behavior_expressions = cls.get_update_expressions(self)
+                    if behavior_expressions:
+                        self.log(
+                            logging.DEBUG,
+                            "  Adding %d expression(s) from %s: %s",
+                            len(behavior_expressions), cls.__name__, list(behavior_expressions),
+                        )
+                        update_expressions.update(behavior_expressions)
+                    else:
+                        self.log(logging.DEBUG, "  No expressions from %s", cls.__name__)
+            else:
+                self.log(
+                    logging.DEBUG,
+                    "Skipping %s (implements IUpdateBehavior but doesn't define methods directly)",
+                    cls.__name__,
+                )
         self.log(
             logging.INFO,
-            f"Update operation: {len(update_conditions)} condition(s), "
-            f"{len(update_expressions)} expression(s) collected from mixins",
+            "Update operation: %d condition(s), %d expression(s) collected from mixins",
+            len(update_conditions), len(update_expressions),
         )
-        self.log(logging.DEBUG, f"Final update conditions: {len(update_conditions)} total")
-        self.log(logging.DEBUG, f"Final update expressions: {list(update_expressions.keys())}")
         complete_data = {**data, **update_expressions}
-        self.log(logging.DEBUG, f"Complete data for SET clause: {list(complete_data.keys())}")
         mapped_data = self.__class__._map_fields_to_columns(complete_data)
-        self.log(logging.DEBUG, f"Mapped data for SET clause: {list(mapped_data.keys())}")
+        if debug:
+            self.log(logging.DEBUG, "Final update conditions: %d total", len(update_conditions))
+            self.log(logging.DEBUG, "Final update expressions: %s", list(update_expressions))
+            self.log(logging.DEBUG, "Complete data for SET clause: %s", list(complete_data))
+            self.log(logging.DEBUG, "Mapped data for SET clause: %s", list(mapped_data))
         column_mapping = self.__class__.get_column_to_field_map()
         column_adapters = self.get_column_adapters()
         backend = self.backend()
         pk_name = self.primary_key()
         pk_value = getattr(self, self.__class__.primary_key_field())
-        self.log(logging.DEBUG, f"Primary key: {pk_name} = {pk_value}")
+        self.log(logging.DEBUG, "Primary key: %s = %s", pk_name, pk_value)
         where_predicate = ComparisonPredicate(
             backend.dialect, "=", Column(backend.dialect, pk_name), Literal(backend.dialect, pk_value)
         )
@@ -279,10 +304,10 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
             else:
                 self.log(
                     logging.WARNING,
-                    f"Skipping non-predicate condition in update: {condition} (type: {type(condition)})",
+                    "Skipping non-predicate condition in update: %s (type: %s)", condition, type(condition),
                 )
         self.log(
-            logging.DEBUG, f"Final WHERE clause conditions: {len(update_conditions)} additional condition(s) applied"
+            logging.DEBUG, "Final WHERE clause conditions: %d additional condition(s) applied", len(update_conditions)
         )
         supports_returning = backend.dialect.supports_returning_clause()
         returning_columns = None
@@ -299,10 +324,10 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
         )
         self.log(
             logging.INFO,
-            f"Executing update operation on table '{self.table_name()}' with {len(data)} field(s) to update",
+            "Executing update operation on table '%s' with %d field(s) to update", self.table_name(), len(data),
         )
         result = backend.update(update_options)
-        self.log(logging.INFO, f"Update operation completed. Affected rows: {result.affected_rows}")
+        self.log(logging.INFO, "Update operation completed. Affected rows: %s", result.affected_rows)
         return result
 
     def _prepare_save_data(self) -> Dict[str, Any]:
@@ -312,21 +337,18 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
         if is_new:
             data = self.model_dump(exclude={pk_field} if pk_field in self.__class__.model_fields else set())
         else:
-            all_data = self.model_dump()
-            data = {field: all_data[field] for field in self._dirty_fields if field != pk_field}
-        bases = self.__class__.__mro__
-        for base in bases:
-            if hasattr(base, "prepare_save_data") and base != BaseActiveRecord:
-                prepare_method = base.prepare_save_data
-                data = prepare_method(self, data, is_new)
+            # Serialize the dirty fields only; the rest of the model is not sent.
+            dirty = {field for field in self._dirty_fields if field != pk_field}
+            dumped = self.model_dump(include=dirty) if dirty else {}
+            data = {field: dumped[field] for field in dirty if field in dumped}
+        save_data_hooks = get_model_metadata(self.__class__).method_chain("prepare_save_data", BaseActiveRecord)
+        for prepare_method in save_data_hooks:
+            data = prepare_method(self, data, is_new)
         return data
 
     def _after_save(self, is_new: bool) -> None:
-        bases = self.__class__.__mro__
-        for base in bases:
-            if hasattr(base, "after_save") and base != BaseActiveRecord:
-                after_method = base.after_save
-                after_method(self, is_new)
+        for after_method in get_model_metadata(self.__class__).method_chain("after_save", BaseActiveRecord):
+            after_method(self, is_new)
 
     @classmethod
     def find_one(
@@ -477,14 +499,14 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
         )
         is_soft_delete = hasattr(self, "prepare_delete")
         if is_soft_delete:
-            self.log(logging.INFO, f"Soft deleting {self.__class__.__name__}#{pk_value}")
+            self.log(logging.INFO, "Soft deleting %s#%s", self.__class__.__name__, pk_value)
             data = self.prepare_delete()
             update_opts = UpdateOptions(table=self.table_name(),
                                         schema_name=self.schema_name(),
                                         data=data, where=where_predicate)
             result = backend.update(update_opts)
         else:
-            self.log(logging.INFO, f"Deleting {self.__class__.__name__}#{pk_value}")
+            self.log(logging.INFO, "Deleting %s#%s", self.__class__.__name__, pk_value)
             supports_returning = backend.dialect.supports_returning_clause()
             returning_columns = None
             if supports_returning:
@@ -515,34 +537,12 @@ class BaseActiveRecord(LoggingMixin, IActiveRecord):
 
     @classmethod
     def get_column_adapters(cls) -> Dict[str, Tuple["SQLTypeAdapter", Type]]:
-        adapters_map: Dict[str, Tuple["SQLTypeAdapter", Type]] = {}
-        model_fields: Dict[str, FieldInfo] = dict(cls.model_fields)
-        all_suggestions = cls.backend().get_default_adapter_suggestions()
-        for field_name, field_info in model_fields.items():
-            column_name = cls._get_column_name(field_name)
-            field_py_type = field_info.annotation
-            original_type = field_py_type
-            origin = get_origin(field_py_type)
-            # Support both Optional (Python 3.8+) and UnionType (Python 3.10+)
-            import types
-
-            is_union_type = origin in (Union, Optional) or (hasattr(types, "UnionType") and origin is types.UnionType)
-            if is_union_type:
-                args = [arg for arg in get_args(field_py_type) if arg is not type(None)]
-                if len(args) == 1:
-                    field_py_type = args[0]
-                else:
-                    continue
-            custom_adapter_tuple = cls._get_adapter_for_field(field_name)
-            if custom_adapter_tuple:
-                adapter_instance, _ = custom_adapter_tuple
-                adapters_map[column_name] = (adapter_instance, original_type)
-                continue
-            suggestion = all_suggestions.get(field_py_type)
-            if suggestion:
-                adapter_instance, _ = suggestion
-                adapters_map[column_name] = (adapter_instance, original_type)
-        return adapters_map
+        """Get the column name to (adapter, original type) map used for result conversion.
+
+        The map is computed once per model class and backend and cached in the
+        model metadata. The returned dictionary is shared and must not be modified.
+        """
+        return get_model_metadata(cls).column_adapters(cls.backend())
 
 
 class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
@@ -589,6 +589,7 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
         cls.__backend__ = backend_instance
         if hasattr(cls, "_dummy_backend") and cls._dummy_backend is not None:
             cls._dummy_backend = None
+        cls.invalidate_model_metadata()
 
         await backend_instance.introspect_and_adapt()
 
@@ -611,15 +612,38 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
         return super().backend()
 
     @classmethod
-    def create_from_database(cls, row: Dict[str, Any]) -> "AsyncBaseActiveRecord":
+    def invalidate_model_metadata(cls) -> None:
+        """Drop the cached per-class metadata (column adapters, column maps, MRO scans).
+
+        Called automatically by configure() and when a connection group assigns
+        or releases the backend. Call it manually after changing a model's
+        fields, column names or backend by other means.
+        """
+        invalidate_model_metadata(cls)
+
+    @classmethod
+    def create_from_database(cls, row: Dict[str, Any], trusted: Optional[bool] = None) -> "AsyncBaseActiveRecord":
+        """Build an instance from a row loaded from the database.
+
+        Args:
+            row: Field values keyed by field name
+            trusted: Skip Pydantic validation (see ``construct_from_database``).
+                None uses the model's ``__trusted_hydration__`` setting.
+        """
+        if trusted is None:
+            trusted = cls.__trusted_hydration__
+        if trusted:
+            return cls.construct_from_database(row)
         instance = cls(**row)
         instance._is_from_db = True
         instance.reset_tracking()
         return instance
 
     @classmethod
-    def create_collection_from_database(cls, rows: List[Dict[str, Any]]) -> List["AsyncBaseActiveRecord"]:
-        return [cls.create_from_database(row) for row in rows]
+    def create_collection_from_database(
+        cls, rows: List[Dict[str, Any]], trusted: Optional[bool] = None
+    ) -> List["AsyncBaseActiveRecord"]:
+        return [cls.create_from_database(row, trusted) for row in rows]
 
     async def _insert_internal(self, data) -> Any:
         """
@@ -645,11 +669,11 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
         self.log_data(logging.DEBUG, "Raw data for insert", data)
         prepared_data = self.__class__._map_fields_to_columns(data)
         self.log_data(logging.DEBUG, "Data with database column names", prepared_data)
-        self.log(logging.INFO, f"Inserting new {self.__class__.__name__}")
+        self.log(logging.INFO, "Inserting new %s", self.__class__.__name__)
         column_mapping = self.__class__.get_column_to_field_map()
-        self.log(logging.DEBUG, f"Column mapping for result processing: {column_mapping}")
+        self.log(logging.DEBUG, "Column mapping for result processing: %s", column_mapping)
         column_adapters = self.get_column_adapters()
-        self.log(logging.DEBUG, f"Column adapters map: {column_adapters}")
+        self.log(logging.DEBUG, "Column adapters map: %s", column_adapters)
         supports_returning = self.backend().dialect.supports_returning_clause()
         returning_columns = None
         if supports_returning:
@@ -675,9 +699,9 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
             and getattr(self, pk_field_name, None) is None
         ):
             pk_retrieved = False
-            self.log(logging.DEBUG, f"Attempting to retrieve primary key '{pk_column}' for new record")
+            self.log(logging.DEBUG, "Attempting to retrieve primary key '%s' for new record", pk_column)
             pk_field_name = self.__class__._get_field_name(pk_column)
-            self.log(logging.DEBUG, f"Primary key column '{pk_column}' maps to field '{pk_field_name}'")
+            self.log(logging.DEBUG, "Primary key column '%s' maps to field '%s'", pk_column, pk_field_name)
             if result.data and isinstance(result.data, list) and len(result.data) > 0:
                 first_row = result.data[0]
                 if isinstance(first_row, dict) and pk_field_name in first_row:
@@ -685,13 +709,13 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
                     setattr(self, pk_field_name, pk_value)
                     pk_retrieved = True
                     self.log(
-                        logging.DEBUG, f"Retrieved primary key '{pk_field_name}' from RETURNING clause: {pk_value}"
+                        logging.DEBUG, "Retrieved primary key '%s' from RETURNING clause: %s", pk_field_name, pk_value
                     )
                 else:
                     self.log(
                         logging.WARNING,
-                        f"RETURNING clause data found, but primary key field '{pk_field_name}' "
-                        f"is missing in the result row: {first_row}",
+                        "RETURNING clause data found, but primary key field '%s' is missing in the result row: %s",
+                        pk_field_name, first_row,
                     )
 
             if not pk_retrieved and result.last_insert_id is not None:
@@ -709,7 +733,9 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
                     pk_value = result.last_insert_id
                     setattr(self, pk_field_name, pk_value)
                     pk_retrieved = True
-                    self.log(logging.DEBUG, f"Retrieved primary key '{pk_field_name}' from last_insert_id: {pk_value}")
+                    self.log(
+                        logging.DEBUG, "Retrieved primary key '%s' from last_insert_id: %s", pk_field_name, pk_value
+                    )
             if not pk_retrieved:
                 error_msg = f"Failed to retrieve primary key '{pk_field_name}' for new record after insert."
                 self.log(logging.ERROR, f"{error_msg}")
@@ -736,67 +762,67 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
         Returns:
             The result object from the backend update operation
         """
+        debug = self.is_log_enabled(logging.DEBUG)
         self.log(
             logging.INFO,
-            f"Starting update operation for {self.__class__.__name__} record with ID: "
-            f"{getattr(self, self.__class__.primary_key_field(), 'unknown')}",
+            "Starting update operation for %s record with ID: %s",
+            self.__class__.__name__, getattr(self, self.__class__.primary_key_field(), 'unknown'),
         )
         update_conditions = []
         update_expressions = {}
-        mro = self.__class__.__mro__
-        activerecord_idx = mro.index(IAsyncActiveRecord)
-        self.log(
-            logging.DEBUG,
-            f"Traversing MRO for IUpdateBehavior implementations: {[cls.__name__ for cls in mro[:activerecord_idx]]}",
-        )
-        for cls in mro[:activerecord_idx]:
-            if issubclass(cls, IUpdateBehavior):
-                defines_conditions_method = "get_update_conditions" in cls.__dict__
-                defines_expressions_method = "get_update_expressions" in cls.__dict__
-                if defines_conditions_method or defines_expressions_method:
-                    self.log(logging.DEBUG, f"Processing IUpdateBehavior from {cls.__name__}")
-                    if defines_conditions_method:
-                        behavior_conditions = cls.get_update_conditions(self)
-                        if behavior_conditions:
-                            self.log(
-                                logging.DEBUG, f"  Adding {len(behavior_conditions)} condition(s) from {cls.__name__}"
-                            )
-                            update_conditions.extend(behavior_conditions)
-                        else:
-                            self.log(logging.DEBUG, f"  No conditions from {cls.__name__}")
-                    if defines_expressions_method:
-                        behavior_expressions = cls.get_update_expressions(self)
-                        if behavior_expressions:
-                            self.log(
-                                logging.DEBUG,
-                                f"  Adding {len(behavior_expressions)} expression(s) from {cls.__name__}: "
-                                f"{list(behavior_expressions.keys())}",
-                            )
-                            update_expressions.update(behavior_expressions)
-                        else:
-                            self.log(logging.DEBUG, f"  No expressions from {cls.__name__}")
-                else:
-                    self.log(
-                        logging.DEBUG,
-                        f"Skipping {cls.__name__} (implements IUpdateBehavior but doesn't define methods directly)",
-                    )
+        update_behaviors = get_model_metadata(self.__class__).update_behaviors(IAsyncActiveRecord)
+        if debug:
+            self.log(
+                logging.DEBUG,
+                "IUpdateBehavior implementations in MRO: %s", [cls.__name__ for cls, _, _ in update_behaviors],
+            )
+        for cls, defines_conditions_method, defines_expressions_method in update_behaviors:
+            if defines_conditions_method or defines_expressions_method:
+                self.log(logging.DEBUG, "Processing IUpdateBehavior from %s", cls.__name__)
+                if defines_conditions_method:
+                    behavior_conditions = cls.get_update_conditions(self)
+                    if behavior_conditions:
+                        self.log(
+                            logging.DEBUG, "  Adding %d condition(s) from %s", len(behavior_conditions), cls.__name__
+                        )
+                        update_conditions.extend(behavior_conditions)
+                    else:
+                        self.log(logging.DEBUG, "  No conditions from %s", cls.__name__)
+                if defines_expressions_method:
+                    behavior_expressions = cls.get_update_expressions(self)
+                    if behavior_expressions:
+                        self.log(
+                            logging.DEBUG,
+                            "  Adding %d expression(s) from %s: %s",
+                            len(behavior_expressions), cls.__name__, list(behavior_expressions),
+                        )
+                        update_expressions.update(behavior_expressions)
+                    else:
+                        self.log(logging.DEBUG, "  No expressions from %s", cls.__name__)
+            else:
+                self.log(
+                    logging.DEBUG,
+                    "Skipping %s (implements IUpdateBehavior but doesn't define methods directly)",
+                    cls.__name__,
+                )
         self.log(
             logging.INFO,
-            f"Update operation: {len(update_conditions)} condition(s), "
-            f"{len(update_expressions)} expression(s) collected from mixins",
+            "Update operation: %d condition(s), %d expression(s) collected from mixins",
+            len(update_conditions), len(update_expressions),
         )
-        self.log(logging.DEBUG, f"Final update conditions: {len(update_conditions)} total")
-        self.log(logging.DEBUG, f"Final update expressions: {list(update_expressions.keys())}")
         complete_data = {**data, **update_expressions}
-        self.log(logging.DEBUG, f"Complete data for SET clause: {list(complete_data.keys())}")
         mapped_data = self.__class__._map_fields_to_columns(complete_data)
-        self.log(logging.DEBUG, f"Mapped data for SET clause: {list(mapped_data.keys())}")
+        if debug:
+            self.log(logging.DEBUG, "Final update conditions: %d total", len(update_conditions))
+            self.log(logging.DEBUG, "Final update expressions: %s", list(update_expressions))
+            self.log(logging.DEBUG, "Complete data for SET clause: %s", list(complete_data))
+            self.log(logging.DEBUG, "Mapped data for SET clause: %s", list(mapped_data))
         column_mapping = self.__class__.get_column_to_field_map()
         column_adapters = self.get_column_adapters()
         backend = self.backend()
         pk_name = self.primary_key()
         pk_value = getattr(self, self.__class__.primary_key_field())
-        self.log(logging.DEBUG, f"Primary key: {pk_name} = {pk_value}")
+        self.log(logging.DEBUG, "Primary key: %s = %s", pk_name, pk_value)
         where_predicate = ComparisonPredicate(
             backend.dialect, "=", Column(backend.dialect, pk_name), Literal(backend.dialect, pk_value)
         )
@@ -806,10 +832,10 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
             else:
                 self.log(
                     logging.WARNING,
-                    f"Skipping non-predicate condition in update: {condition} (type: {type(condition)})",
+                    "Skipping non-predicate condition in update: %s (type: %s)", condition, type(condition),
                 )
         self.log(
-            logging.DEBUG, f"Final WHERE clause conditions: {len(update_conditions)} additional condition(s) applied"
+            logging.DEBUG, "Final WHERE clause conditions: %d additional condition(s) applied", len(update_conditions)
         )
         supports_returning = backend.dialect.supports_returning_clause()
         returning_columns = None
@@ -826,10 +852,10 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
         )
         self.log(
             logging.INFO,
-            f"Executing update operation on table '{self.table_name()}' with {len(data)} field(s) to update",
+            "Executing update operation on table '%s' with %d field(s) to update", self.table_name(), len(data),
         )
         result = await backend.update(update_options)
-        self.log(logging.INFO, f"Update operation completed. Affected rows: {result.affected_rows}")
+        self.log(logging.INFO, "Update operation completed. Affected rows: %s", result.affected_rows)
         return result
 
     def _prepare_save_data(self) -> Dict[str, Any]:
@@ -839,21 +865,18 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
         if is_new:
             data = self.model_dump(exclude={pk_field} if pk_field in self.__class__.model_fields else set())
         else:
-            all_data = self.model_dump()
-            data = {field: all_data[field] for field in self._dirty_fields if field != pk_field}
-        bases = self.__class__.__mro__
-        for base in bases:
-            if hasattr(base, "prepare_save_data") and base != AsyncBaseActiveRecord:
-                prepare_method = base.prepare_save_data
-                data = prepare_method(self, data, is_new)
+            # Serialize the dirty fields only; the rest of the model is not sent.
+            dirty = {field for field in self._dirty_fields if field != pk_field}
+            dumped = self.model_dump(include=dirty) if dirty else {}
+            data = {field: dumped[field] for field in dirty if field in dumped}
+        save_data_hooks = get_model_metadata(self.__class__).method_chain("prepare_save_data", AsyncBaseActiveRecord)
+        for prepare_method in save_data_hooks:
+            data = prepare_method(self, data, is_new)
         return data
 
     def _after_save(self, is_new: bool) -> None:
-        bases = self.__class__.__mro__
-        for base in bases:
-            if hasattr(base, "after_save") and base != AsyncBaseActiveRecord:
-                after_method = base.after_save
-                after_method(self, is_new)
+        for after_method in get_model_metadata(self.__class__).method_chain("after_save", AsyncBaseActiveRecord):
+            after_method(self, is_new)
 
     @classmethod
     async def find_one(
@@ -1004,14 +1027,14 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
         )
         is_soft_delete = hasattr(self, "prepare_delete")
         if is_soft_delete:
-            self.log(logging.INFO, f"Soft deleting {self.__class__.__name__}#{pk_value}")
+            self.log(logging.INFO, "Soft deleting %s#%s", self.__class__.__name__, pk_value)
             data = self.prepare_delete()
             update_opts = UpdateOptions(table=self.table_name(),
                                         schema_name=self.schema_name(),
                                         data=data, where=where_predicate)
             result = await backend.update(update_opts)
         else:
-            self.log(logging.INFO, f"Deleting {self.__class__.__name__}#{pk_value}")
+            self.log(logging.INFO, "Deleting %s#%s", self.__class__.__name__, pk_value)
             supports_returning = backend.dialect.supports_returning_clause()
             returning_columns = None
             if supports_returning:
@@ -1042,31 +1065,9 @@ class AsyncBaseActiveRecord(LoggingMixin, IAsyncActiveRecord):
 
     @classmethod
     def get_column_adapters(cls) -> Dict[str, Tuple["SQLTypeAdapter", Type]]:
-        adapters_map: Dict[str, Tuple["SQLTypeAdapter", Type]] = {}
-        model_fields: Dict[str, FieldInfo] = dict(cls.model_fields)
-        all_suggestions = cls.backend().get_default_adapter_suggestions()
-        for field_name, field_info in model_fields.items():
-            column_name = cls._get_column_name(field_name)
-            field_py_type = field_info.annotation
-            original_type = field_py_type
-            origin = get_origin(field_py_type)
-            # Support both Optional (Python 3.8+) and UnionType (Python 3.10+)
-            import types
-
-            is_union_type = origin in (Union, Optional) or (hasattr(types, "UnionType") and origin is types.UnionType)
-            if is_union_type:
-                args = [arg for arg in get_args(field_py_type) if arg is not type(None)]
-                if len(args) == 1:
-                    field_py_type = args[0]
-                else:
-                    continue
-            custom_adapter_tuple = cls._get_adapter_for_field(field_name)
-            if custom_adapter_tuple:
-                adapter_instance, _ = custom_adapter_tuple
-                adapters_map[column_name] = (adapter_instance, original_type)
-                continue
-            suggestion = all_suggestions.get(field_py_type)
-            if suggestion:
-                adapter_instance, _ = suggestion
-                adapters_map[column_name] = (adapter_instance, original_type)
-        return adapters_map
+        """Get the column name to (adapter, original type) map used for result conversion.
+
+        The map is computed once per model class and backend and cached in the
+        model metadata. The returned dictionary is shared and must not be modified.
+        """
+        return get_model_metadata(cls).column_adapters(cls.backend())
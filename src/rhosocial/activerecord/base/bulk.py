@@ -0,0 +1,521 @@
+# src/rhosocial/activerecord/base/bulk.py
+"""Bulk persistence: ``insert_many()``, ``upsert_many()`` and ``save_all()``.
+
+``save()`` issues one INSERT per record. The class methods below insert many
+new records with multi-row ``INSERT ... VALUES (...), (...)`` statements
+instead, sized so that no statement exceeds the dialect's bound parameter
+limit, and all statements of one call run in a single transaction.
+
+Every record still goes through the same per-instance steps as ``save()``:
+field validation, the ``prepare_save_data`` hooks (e.g. ``UUIDMixin``), the
+BEFORE_INSERT event (e.g. ``TimestampMixin``), and afterwards the
+``after_save`` hooks and the AFTER_INSERT event (e.g. ``OptimisticLockMixin``).
+Only the database round trips are batched.
+
+Generated primary keys of inserted records are derived from the statement's
+``last_insert_id``, which is consecutive within one statement. Most databases
+(SQLite included) leave the order of RETURNING rows unspecified, so RETURNING
+is used for inserts only on dialects that guarantee it follows the VALUES
+order. Upserts do not know which rows were inserted; their RETURNING rows are
+matched back to the records on the conflict target, a unique key.
+"""
+
+import logging
+import types
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, get_args, get_origin
+
+from ..backend.dialect.exceptions import UnsupportedFeatureError
+from ..backend.errors import DatabaseError, ValidationError as DBValidationError
+from ..backend.expression import BaseExpression, Column, InsertExpression, Literal, TableExpression
+from ..backend.expression.statements import OnConflictClause, ReturningClause, ValuesSource
+from ..backend.options import ExecutionOptions
+from ..backend.result import QueryResult
+from ..backend.schema import StatementType
+from ..interface import ModelEvent
+
+# (record, field data passed to the insert events)
+_PreparedRecord = Tuple[Any, Dict[str, Any]]
+
+
+class _BulkStatement:
+    """One multi-row INSERT statement and the records it inserts."""
+
+    __slots__ = ("records", "columns", "sql", "params", "has_returning", "key_fields")
+
+    def __init__(self, records: List[_PreparedRecord], columns: Tuple[str, ...], sql: str, params: tuple,
+                 has_returning: bool, key_fields: Optional[Tuple[str, ...]] = None):
+        self.records = records
+        self.columns = columns
+        self.sql = sql
+        self.params = params
+        self.has_returning = has_returning
+        # Fields matching RETURNING rows to records; None to match them by position
+        self.key_fields = key_fields
+
+
+class _BulkPersistenceBase:
+    """Statement building and result handling shared by the sync and async mixins."""
+
+    @classmethod
+    def _check_bulk_records(cls, instances: Iterable[Any]) -> List[Any]:
+        records = list(instances)
+        for record in records:
+            if not isinstance(record, cls):
+                raise TypeError(f"{cls.__name__} bulk operations expect {cls.__name__} instances, "
+                                f"got {type(record).__name__}")
+        return records
+
+    @classmethod
+    def _prepare_bulk_records(cls, records: List[Any]) -> List[_PreparedRecord]:
+        """Validate new records and run their pre-insert hooks and events, as ``save()`` does."""
+        prepared = []
+        for record in records:
+            if not record.is_new_record:
+                raise ValueError(f"{cls.__name__} record is not new; use save() or save_all() to update it")
+            try:
+                record.validate_fields()
+            except Exception as e:
+                cls.log(logging.ERROR, f"Validation error: {str(e)}")
+                raise DBValidationError(str(e)) from e
+            data = record._prepare_save_data()
+            record._trigger_event(ModelEvent.BEFORE_INSERT, data=data)
+            prepared.append((record, data))
+        return prepared
+
+    @classmethod
+    def _bulk_returning_columns(cls, extra: Iterable[str] = ()) -> Optional[List[str]]:
+        if not cls.backend().dialect.supports_returning_clause():
+            return None
+        return list(dict.fromkeys([cls.primary_key(), *extra]))
+
+    @classmethod
+    def _build_bulk_statements(
+        cls,
+        prepared: List[_PreparedRecord],
+        batch_size: Optional[int],
+        returning_columns: Optional[List[str]],
+        on_conflict_factory=None,
+        key_fields: Optional[Tuple[str, ...]] = None,
+    ) -> List[_BulkStatement]:
+        """Group records by their column set and build the multi-row INSERT statements.
+
+        Args:
+            prepared: Records with their prepared field data.
+            batch_size: Upper bound of rows per statement; None for the
+                parameter limit only.
+            returning_columns: Columns for the RETURNING clause, or None.
+            on_conflict_factory: Callable building the ON CONFLICT clause for a
+                tuple of column names, or None for plain inserts.
+            key_fields: Fields identifying the RETURNING row of each record, or
+                None if the rows come back in VALUES order.
+        """
+        dialect = cls.backend().dialect
+        field_to_column = cls.get_field_to_column_map()
+        table = TableExpression(dialect, cls.table_name(), schema_name=cls.schema_name())
+        returning = None
+        if returning_columns:
+            returning = ReturningClause(dialect, [Column(dialect, column) for column in returning_columns])
+
+        # Records whose data has the same fields share statements.
+        groups: Dict[Tuple[str, ...], List[Tuple[_PreparedRecord, List[Any]]]] = {}
+        for record, data in prepared:
+            fields = tuple(data)
+            values = [value if isinstance(value, BaseExpression) else Literal(dialect, value)
+                      for value in data.values()]
+            groups.setdefault(fields, []).append(((record, data), values))
+
+        statements = []
+        max_params = dialect.get_max_bind_parameters()
+        for fields, rows in groups.items():
+            columns = tuple(field_to_column.get(field, field) for field in fields)
+            on_conflict = on_conflict_factory(columns) if on_conflict_factory else None
+            reserved = len(on_conflict.to_sql()[1]) if on_conflict is not None else 0
+            rows_per_statement = max(1, (max_params - reserved) // max(1, len(columns)))
+            if batch_size is not None:
+                rows_per_statement = min(rows_per_statement, batch_size)
+            for start in range(0, len(rows), rows_per_statement):
+                chunk = rows[start:start + rows_per_statement]
+                expression = InsertExpression(
+                    dialect,
+                    into=table,
+                    source=ValuesSource(dialect, [values for _, values in chunk]),
+                    columns=list(columns),
+                    on_conflict=on_conflict,
+                    returning=returning,
+                )
+                sql, params = expression.to_sql()
+                statements.append(_BulkStatement([item for item, _ in chunk], columns, sql, params,
+                                                  returning is not None, key_fields))
+        return statements
+
+    @classmethod
+    def _bulk_execution_options(cls, has_returning: bool) -> ExecutionOptions:
+        return ExecutionOptions(
+            stmt_type=StatementType.DML,
+            column_adapters=cls.get_column_adapters(),
+            column_mapping=cls.get_column_to_field_map(),
+            process_result_set=has_returning,
+        )
+
+    @classmethod
+    def _primary_key_is_integer(cls) -> bool:
+        field_type = cls.model_fields[cls.primary_key_field()].annotation
+        origin = get_origin(field_type)
+        # Support both Optional (Python 3.8+) and UnionType (Python 3.10+)
+        if origin in (Union, Optional) or (hasattr(types, "UnionType") and origin is types.UnionType):
+            args = [t for t in get_args(field_type) if t is not type(None)]
+            if args:
+                field_type = args[0]
+        return field_type is int
+
+    @classmethod
+    def _match_returned_rows(cls, statement: _BulkStatement, rows: Optional[List[Dict[str, Any]]],
+                             require_keys: bool) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """Pair each record of a statement with its RETURNING row.
+
+        Returns:
+            The row of each record, None for records without one (e.g. skipped
+            by DO NOTHING), or None if the statement returned no rows.
+        """
+        if rows is None:
+            return None
+        records = statement.records
+        if statement.key_fields is None:
+            if len(rows) != len(records):
+                if require_keys:
+                    raise DatabaseError(f"Bulk insert into {cls.table_name()} returned {len(rows)} rows "
+                                        f"for {len(records)} records")
+                return None
+            return list(rows)
+        by_key = {tuple(row.get(field) for field in statement.key_fields): row for row in rows}
+        return [by_key.get(tuple(getattr(record, field) for field in statement.key_fields))
+                for record, _ in records]
+
+    @classmethod
+    def _finish_bulk_statement(cls, statement: _BulkStatement, result: QueryResult,
+                               require_keys: bool = True) -> int:
+        """Back-fill primary keys, then run the post-insert hooks and events of each record.
+
+        Args:
+            statement: The executed statement.
+            result: Its result.
+            require_keys: Whether every record must get a primary key. Plain
+                inserts require them; upserts do not, and never derive keys
+                from ``last_insert_id``, since some of their rows already existed.
+
+        Returns:
+            Number of rows affected by the statement.
+        """
+        records = statement.records
+        rows = result.data if statement.has_returning and isinstance(result.data, list) else None
+        affected_rows = len(rows) if rows is not None else result.affected_rows
+        pk_field = cls.primary_key_field()
+
+        rows = cls._match_returned_rows(statement, rows, require_keys)
+        if cls.primary_key() not in statement.columns and pk_field in cls.model_fields:
+            if rows is not None:
+                for (record, _), row in zip(records, rows):
+                    if row is not None:
+                        setattr(record, pk_field, row.get(pk_field))
+            elif require_keys and result.last_insert_id is not None and cls._primary_key_is_integer():
+                first_id = result.last_insert_id
+                if not cls.backend().dialect.last_insert_id_is_first_row():
+                    first_id -= len(records) - 1
+                for offset, (record, _) in enumerate(records):
+                    setattr(record, pk_field, first_id + offset)
+            elif require_keys:
+                error_msg = f"Failed to retrieve primary keys for new {cls.__name__} records after bulk insert."
+                cls.log(logging.ERROR, error_msg)
+                raise DatabaseError(error_msg)
+
+        for index, (record, data) in enumerate(records):
+            record._is_from_db = True
+            record.reset_tracking()
+            record._after_save(True)
+            record.reset_tracking()
+            row_data = [rows[index]] if rows is not None and rows[index] is not None else None
+            record._trigger_event(ModelEvent.AFTER_INSERT, data=data,
+                                  result=QueryResult(data=row_data, affected_rows=1))
+        return affected_rows
+
+    @staticmethod
+    def _version_of(record: Any):
+        """The ``Version`` of an ``OptimisticLockMixin`` record, or None."""
+        from ..field.version import OptimisticLockMixin
+
+        return record._version if isinstance(record, OptimisticLockMixin) else None
+
+    @classmethod
+    def _upsert_conflict_factory(cls, conflict_target: List[str], update_fields: Optional[List[str]], sample: Any):
+        """Return a factory of the ON CONFLICT DO UPDATE clause for a statement's columns.
+
+        Args:
+            conflict_target: Fields of the unique constraint that detects conflicts.
+            update_fields: Fields overwritten on conflict, or None for the default.
+            sample: One of the records, used to read the optimistic lock settings.
+        """
+        from ..field.timestamp import TimestampMixin
+
+        dialect = cls.backend().dialect
+        target_columns = [cls._get_column_name(field) for field in conflict_target]
+        update_columns = None
+        if update_fields is not None:
+            update_columns = [cls._get_column_name(field) for field in update_fields]
+        # By default, conflicting rows keep their key and, with TimestampMixin, their creation time.
+        keep = {*target_columns, cls.primary_key()}
+        if issubclass(cls, TimestampMixin):
+            keep.add(cls._get_column_name("created_at"))
+        version = cls._version_of(sample)
+
+        def build(columns: Tuple[str, ...]) -> OnConflictClause:
+            selected = update_columns if update_columns is not None else [c for c in columns if c not in keep]
+            assignments = {column: Column(dialect, column, table="excluded") for column in selected}
+            if version is not None:
+                # The stored row is modified, so its version moves on, whatever the record holds.
+                assignments[version.db_column] = (Column(dialect, version.db_column, table=cls.table_name())
+                                                  + Literal(dialect, version.increment_by))
+            if not assignments:
+                return OnConflictClause(dialect, target_columns, do_nothing=True)
+            return OnConflictClause(dialect, target_columns, update_assignments=assignments)
+
+        return build
+
+    @classmethod
+    def _prepare_upsert(cls, instances: Iterable[Any], conflict_target: List[str],
+                        update_fields: Optional[List[str]], batch_size: Optional[int]) -> List[_BulkStatement]:
+        """Check the arguments, prepare the records and build the upsert statements."""
+        dialect = cls.backend().dialect
+        if not dialect.supports_upsert():
+            raise UnsupportedFeatureError(dialect.name, "upsert (ON CONFLICT)")
+        if not conflict_target:
+            raise ValueError("upsert_many() requires at least one conflict_target field")
+        cls._check_batch_size(batch_size)
+        records = cls._check_bulk_records(instances)
+        if not records:
+            return []
+        prepared = cls._prepare_bulk_records(records)
+        conflict_factory = cls._upsert_conflict_factory(conflict_target, update_fields, records[0])
+        version = cls._version_of(records[0])
+        # The conflict target is unique, so it identifies the row returned for each record.
+        extra = [cls._get_column_name(field) for field in conflict_target]
+        if version is not None:
+            extra.append(version.db_column)
+        returning_columns = cls._bulk_returning_columns(extra)
+        cls.log(logging.INFO, f"Upserting {len(prepared)} {cls.__name__} records on {conflict_target}")
+        return cls._build_bulk_statements(prepared, batch_size, returning_columns, conflict_factory,
+                                          tuple(conflict_target))
+
+    @classmethod
+    def _prepare_insert(cls, instances: Iterable[Any], batch_size: Optional[int]) -> List[_BulkStatement]:
+        """Check the arguments, prepare the records and build the insert statements."""
+        cls._check_batch_size(batch_size)
+        records = cls._check_bulk_records(instances)
+        if not records:
+            return []
+        prepared = cls._prepare_bulk_records(records)
+        returning_columns = None
+        if cls.backend().dialect.returning_preserves_insert_order():
+            returning_columns = cls._bulk_returning_columns()
+        cls.log(logging.INFO, f"Inserting {len(prepared)} new {cls.__name__} records")
+        return cls._build_bulk_statements(prepared, batch_size, returning_columns)
+
+    @staticmethod
+    def _check_batch_size(batch_size: Optional[int]) -> None:
+        if batch_size is not None and (not isinstance(batch_size, int) or batch_size < 1):
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size!r}")
+
+
+class BulkPersistenceMixin(_BulkPersistenceBase):
+    """Bulk insert, upsert and save class methods for ActiveRecord.
+
+    Example:
+        >>> users = [User(username=f"user{i}", email=f"user{i}@example.com") for i in range(10000)]
+        >>> User.insert_many(users)  # a handful of multi-row INSERTs in one transaction
+        10000
+        >>> users[0].id is not None
+        True
+    """
+
+    @classmethod
+    def _execute_bulk_statements(cls, statements: List[_BulkStatement], require_keys: bool = True) -> int:
+        backend = cls.backend()
+        affected_rows = 0
+        for statement in statements:
+            cls.log(logging.DEBUG, f"Bulk insert of {len(statement.records)} rows: {statement.sql}")
+            result = backend.execute(statement.sql, statement.params,
+                                     options=cls._bulk_execution_options(statement.has_returning))
+            affected_rows += cls._finish_bulk_statement(statement, result, require_keys)
+        return affected_rows
+
+    @classmethod
+    def insert_many(cls, instances: Iterable[Any], batch_size: Optional[int] = None) -> int:
+        """Insert new records with multi-row INSERT statements.
+
+        The records are validated and prepared exactly as ``save()`` would do
+        (including BEFORE_INSERT/AFTER_INSERT events), then inserted in as few
+        statements as the dialect's bound parameter limit allows, all within
+        one transaction. Generated primary keys are set on the records.
+
+        Args:
+            instances: New records of this model.
+            batch_size: Maximum number of rows per statement (default: as many
+                as fit in the parameter limit).
+
+        Returns:
+            int: Number of inserted rows.
+
+        Raises:
+            TypeError: If a record is not an instance of this model.
+            ValueError: If a record is not new, or batch_size is not positive.
+            ValidationError: If a record fails validation.
+            DatabaseError: If the insert fails; no record of the call is inserted.
+        """
+        statements = cls._prepare_insert(instances, batch_size)
+        if not statements:
+            return 0
+        try:
+            with cls.transaction():
+                return cls._execute_bulk_statements(statements)
+        except Exception as e:
+            cls.log(logging.ERROR, f"Database error: {str(e)}")
+            raise DatabaseError(str(e)) from e
+
+    @classmethod
+    def upsert_many(
+        cls,
+        instances: Iterable[Any],
+        conflict_target: List[str],
+        update_fields: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """Insert records, updating the existing rows they conflict with.
+
+        Emits ``INSERT ... ON CONFLICT (conflict_target) DO UPDATE SET ...``
+        with multi-row VALUES. Records are prepared as in ``insert_many()``;
+        all of them count as inserted for events and hooks, since the database
+        does not report which rows were updated.
+
+        Primary keys are set on the records where the dialect supports
+        RETURNING; otherwise only records whose key was set beforehand (e.g.
+        by ``UUIDMixin``) have one afterwards.
+
+        Args:
+            instances: New records of this model.
+            conflict_target: Fields of the unique constraint that detects conflicts.
+            update_fields: Fields overwritten on conflict. Defaults to every
+                inserted field except the conflict target, the primary key and,
+                with ``TimestampMixin``, ``created_at``. With
+                ``OptimisticLockMixin`` the version is incremented on conflict.
+            batch_size: Maximum number of rows per statement.
+
+        Returns:
+            int: Number of inserted or updated rows, as reported by the database.
+
+        Raises:
+            UnsupportedFeatureError: If the dialect does not support upserts.
+            ValueError: If conflict_target is empty or a record is not new.
+        """
+        statements = cls._prepare_upsert(instances, conflict_target, update_fields, batch_size)
+        if not statements:
+            return 0
+        try:
+            with cls.transaction():
+                return cls._execute_bulk_statements(statements, require_keys=False)
+        except Exception as e:
+            cls.log(logging.ERROR, f"Database error: {str(e)}")
+            raise DatabaseError(str(e)) from e
+
+    @classmethod
+    def save_all(cls, instances: Iterable[Any], batch_size: Optional[int] = None) -> int:
+        """Save new and modified records in one transaction.
+
+        New records are inserted with ``insert_many()``; modified records are
+        updated one by one with ``save()``, since each update has its own
+        values and conditions. Unmodified records are skipped.
+
+        Args:
+            instances: Records of this model.
+            batch_size: Maximum number of rows per INSERT statement.
+
+        Returns:
+            int: Number of inserted and updated rows.
+        """
+        records = cls._check_bulk_records(instances)
+        new_records = [record for record in records if record.is_new_record]
+        dirty_records = [record for record in records if not record.is_new_record and record.is_dirty]
+        with cls.transaction():
+            affected_rows = cls.insert_many(new_records, batch_size=batch_size) if new_records else 0
+            for record in dirty_records:
+                affected_rows += record.save()
+        return affected_rows
+
+
+class AsyncBulkPersistenceMixin(_BulkPersistenceBase):
+    """Bulk insert, upsert and save class methods for AsyncActiveRecord.
+
+    See ``BulkPersistenceMixin``; the methods are coroutines.
+    """
+
+    @classmethod
+    async def _execute_bulk_statements(cls, statements: List[_BulkStatement], require_keys: bool = True) -> int:
+        backend = cls.backend()
+        affected_rows = 0
+        for statement in statements:
+            cls.log(logging.DEBUG, f"Bulk insert of {len(statement.records)} rows: {statement.sql}")
+            result = await backend.execute(statement.sql, statement.params,
+                                           options=cls._bulk_execution_options(statement.has_returning))
+            affected_rows += cls._finish_bulk_statement(statement, result, require_keys)
+        return affected_rows
+
+    @classmethod
+    async def insert_many(cls, instances: Iterable[Any], batch_size: Optional[int] = None) -> int:
+        """Insert new records with multi-row INSERT statements.
+
+        See ``BulkPersistenceMixin.insert_many``.
+        """
+        statements = cls._prepare_insert(instances, batch_size)
+        if not statements:
+            return 0
+        try:
+            async with cls.transaction():
+                return await cls._execute_bulk_statements(statements)
+        except Exception as e:
+            cls.log(logging.ERROR, f"Database error: {str(e)}")
+            raise DatabaseError(str(e)) from e
+
+    @classmethod
+    async def upsert_many(
+        cls,
+        instances: Iterable[Any],
+        conflict_target: List[str],
+        update_fields: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """Insert records, updating the existing rows they conflict with.
+
+        See ``BulkPersistenceMixin.upsert_many``.
+        """
+        statements = cls._prepare_upsert(instances, conflict_target, update_fields, batch_size)
+        if not statements:
+            return 0
+        try:
+            async with cls.transaction():
+                return await cls._execute_bulk_statements(statements, require_keys=False)
+        except Exception as e:
+            cls.log(logging.ERROR, f"Database error: {str(e)}")
+            raise DatabaseError(str(e)) from e
+
+    @classmethod
+    async def save_all(cls, instances: Iterable[Any], batch_size: Optional[int] = None) -> int:
+        """Save new and modified records in one transaction.
+
+        See ``BulkPersistenceMixin.save_all``.
+        """
+        records = cls._check_bulk_records(instances)
+        new_records = [record for record in records if record.is_new_record]
+        dirty_records = [record for record in records if not record.is_new_record and record.is_dirty]
+        async with cls.transaction():
+            affected_rows = await cls.insert_many(new_records, batch_size=batch_size) if new_records else 0
+            for record in dirty_records:
+                affected_rows += await record.save()
+        return affected_rows
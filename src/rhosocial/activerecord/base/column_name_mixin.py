@@ -7,6 +7,7 @@ from typing import ClassVar, Dict, Optional, Type, Any, get_type_hints
 from functools import lru_cache
 
 from .fields import UseColumn
+from .model_metadata import get_model_metadata
 
 
 class ColumnNameAnnotationHandler:
@@ -167,19 +168,12 @@ class ColumnNameMixin:
         - Values are database column names
 
         For fields without UseColumn, the field name is used as column name.
+        The mapping is computed once per class; do not modify the returned dictionary.
 
         Returns:
             Dict[str, str]: Complete field-to-column mapping
         """
-        from pydantic.fields import FieldInfo
-
-        mapping: Dict[str, str] = {}
-        model_fields: Dict[str, FieldInfo] = dict(cls.model_fields)
-
-        for field_name in model_fields.keys():
-            mapping[field_name] = cls._get_column_name(field_name)
-
-        return mapping
+        return get_model_metadata(cls).field_to_column
 
     @classmethod
     @lru_cache(maxsize=None)
@@ -287,8 +281,8 @@ class ColumnNameMixin:
             SimpleUser.primary_key()       # "id"
             SimpleUser.primary_key_field() # "id" (same)
         """
-        pk_column = cls.primary_key()  # Get column name from __primary_key__
-        return cls._get_field_name(pk_column)  # Reverse-map to field name
+        # Reverse-maps the __primary_key__ column name once per class
+        return get_model_metadata(cls).primary_key_field
 
     @classmethod
     def _map_fields_to_columns(cls, field_data: Dict[str, Any]) -> Dict[str, Any]:
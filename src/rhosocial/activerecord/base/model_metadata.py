@@ -0,0 +1,177 @@
+# src/rhosocial/activerecord/base/model_metadata.py
+"""
+Per-model-class cache of metadata derived from the class definition.
+
+Several lookups on the save and query paths only depend on the model class
+(and, for type adapters, on the backend): the field-to-column map, the primary
+key field name, the MRO scans for IUpdateBehavior implementations and for
+``prepare_save_data``/``after_save`` hooks, and the column adapter map. They are
+computed on first use and kept in a ``ModelMetadata`` object stored on the
+class itself, so that every later call is a dictionary lookup.
+
+The cache is dropped by ``invalidate_model_metadata()``, which ``configure()``
+and the connection group call whenever a model's backend changes.
+"""
+
+import types
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union, get_args, get_origin
+
+_METADATA_ATTRIBUTE = "__model_metadata__"
+
+# Optional[X] and X | None have different origins depending on the Python version.
+_UNION_ORIGINS = (Union, getattr(types, "UnionType", Union))
+
+
+class ModelMetadata:
+    """Lazily computed, class-level metadata for one model class.
+
+    Attributes:
+        model_class: The model class this metadata describes.
+    """
+
+    __slots__ = (
+        "model_class",
+        "_field_to_column",
+        "_primary_key_field",
+        "_update_behaviors",
+        "_method_chains",
+        "_column_adapters",
+        "__weakref__",
+    )
+
+    def __init__(self, model_class: Type[Any]):
+        self.model_class = model_class
+        self._field_to_column: Optional[Dict[str, str]] = None
+        self._primary_key_field: Optional[str] = None
+        self._update_behaviors: Dict[type, Tuple[Tuple[type, bool, bool], ...]] = {}
+        self._method_chains: Dict[Tuple[str, type], Tuple[Callable, ...]] = {}
+        # Keyed by backend instance so context backends and backend swaps never
+        # see adapters computed for another backend.
+        self._column_adapters: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    @property
+    def field_to_column(self) -> Dict[str, str]:
+        """Field name to column name mapping for every model field."""
+        if self._field_to_column is None:
+            model_class = self.model_class
+            self._field_to_column = {name: model_class._get_column_name(name) for name in model_class.model_fields}
+        return self._field_to_column
+
+    @property
+    def primary_key_field(self) -> str:
+        """Python field name of the primary key column."""
+        if self._primary_key_field is None:
+            model_class = self.model_class
+            self._primary_key_field = model_class._get_field_name(model_class.primary_key())
+        return self._primary_key_field
+
+    def update_behaviors(self, boundary: type) -> Tuple[Tuple[type, bool, bool], ...]:
+        """IUpdateBehavior classes found in the MRO before ``boundary``.
+
+        Args:
+            boundary: The ActiveRecord interface that ends the scan
+                (IActiveRecord or IAsyncActiveRecord).
+
+        Returns:
+            One ``(behavior_class, defines_get_update_conditions,
+            defines_get_update_expressions)`` entry per class, in MRO order.
+        """
+        behaviors = self._update_behaviors.get(boundary)
+        if behaviors is None:
+            from ..interface.update import IUpdateBehavior
+
+            mro = self.model_class.__mro__
+            behaviors = tuple(
+                (cls, "get_update_conditions" in cls.__dict__, "get_update_expressions" in cls.__dict__)
+                for cls in mro[: mro.index(boundary)]
+                if issubclass(cls, IUpdateBehavior)
+            )
+            self._update_behaviors[boundary] = behaviors
+        return behaviors
+
+    def method_chain(self, name: str, exclude: type) -> Tuple[Callable, ...]:
+        """Resolve ``getattr(base, name)`` for every MRO entry that has it.
+
+        Args:
+            name: Hook method name (e.g. ``prepare_save_data``).
+            exclude: A base class to skip.
+
+        Returns:
+            The resolved functions, in MRO order.
+        """
+        key = (name, exclude)
+        chain = self._method_chains.get(key)
+        if chain is None:
+            chain = tuple(
+                getattr(base, name) for base in self.model_class.__mro__ if hasattr(base, name) and base != exclude
+            )
+            self._method_chains[key] = chain
+        return chain
+
+    def column_adapters(self, backend: Any) -> Dict[str, Tuple[Any, Type]]:
+        """Column name to ``(adapter, original_type)`` map for ``backend``.
+
+        The returned dictionary is shared; callers must not modify it.
+        """
+        try:
+            adapters = self._column_adapters.get(backend)
+        except TypeError:  # backend does not support weak references
+            return build_column_adapters(self.model_class, backend)
+        if adapters is None:
+            adapters = build_column_adapters(self.model_class, backend)
+            self._column_adapters[backend] = adapters
+        return adapters
+
+
+def build_column_adapters(model_class: Type[Any], backend: Any) -> Dict[str, Tuple[Any, Type]]:
+    """Compute the column adapter map of ``model_class`` for ``backend``.
+
+    Field-specific adapters declared on the model take precedence over the
+    backend's default suggestions. Union fields other than ``Optional[X]`` are
+    skipped.
+    """
+    adapters_map: Dict[str, Tuple[Any, Type]] = {}
+    all_suggestions = backend.get_default_adapter_suggestions()
+    for field_name, field_info in model_class.model_fields.items():
+        column_name = model_class._get_column_name(field_name)
+        field_py_type = field_info.annotation
+        original_type = field_py_type
+        if get_origin(field_py_type) in _UNION_ORIGINS:
+            args = [arg for arg in get_args(field_py_type) if arg is not type(None)]
+            if len(args) == 1:
+                field_py_type = args[0]
+            else:
+                continue
+        custom_adapter_tuple = model_class._get_adapter_for_field(field_name)
+        if custom_adapter_tuple:
+            adapter_instance, _ = custom_adapter_tuple
+            adapters_map[column_name] = (adapter_instance, original_type)
+            continue
+        suggestion = all_suggestions.get(field_py_type)
+        if suggestion:
+            adapter_instance, _ = suggestion
+            adapters_map[column_name] = (adapter_instance, original_type)
+    return adapters_map
+
+
+def get_model_metadata(model_class: Type[Any]) -> ModelMetadata:
+    """Return the metadata of ``model_class``, creating it on first use.
+
+    Metadata is never inherited: a subclass gets its own instance.
+    """
+    metadata = model_class.__dict__.get(_METADATA_ATTRIBUTE)
+    if metadata is None:
+        metadata = ModelMetadata(model_class)
+        type.__setattr__(model_class, _METADATA_ATTRIBUTE, metadata)
+    return metadata
+
+
+def invalidate_model_metadata(model_class: Type[Any]) -> None:
+    """Drop the cached metadata of ``model_class`` and all of its subclasses."""
+    pending = [model_class]
+    while pending:
+        cls = pending.pop()
+        if _METADATA_ATTRIBUTE in cls.__dict__:
+            type.__delattr__(cls, _METADATA_ATTRIBUTE)
+        pending.extend(cls.__subclasses__())
@@ -34,6 +34,9 @@ Classes:
     PooledBackend: Wrapper for pooled Backend instances
     BackendPool: Synchronous connection pool
     AsyncBackendPool: Asynchronous connection pool
+    ReadWriteRouter: Routes group reads to read replicas
+    AsyncReadWriteRouter: Async version of ReadWriteRouter
+    RoundRobinBalancer / LeastInFlightBalancer: Replica selection strategies
 
 Example:
     # Single database
@@ -90,6 +93,14 @@ from .pool import (
     BackendPool,
     AsyncBackendPool,
 )
+from .routing import (
+    ReplicaBalancer,
+    RoundRobinBalancer,
+    LeastInFlightBalancer,
+    RouteStats,
+    ReadWriteRouter,
+    AsyncReadWriteRouter,
+)
 
 __all__ = [
     "BackendGroup",
@@ -101,4 +112,10 @@ __all__ = [
     "PooledBackend",
     "BackendPool",
     "AsyncBackendPool",
+    "ReplicaBalancer",
+    "RoundRobinBalancer",
+    "LeastInFlightBalancer",
+    "RouteStats",
+    "ReadWriteRouter",
+    "AsyncReadWriteRouter",
 ]
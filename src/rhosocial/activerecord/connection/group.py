@@ -27,6 +27,12 @@ Design Intent:
        one backend, they naturally participate in the same transaction
        scope.
 
+    A group may also be given read replicas (``readers``). Queries built
+    with ``Model.query()`` then read from a replica picked by a balancer,
+    while saves, deletes, bulk DML, ``for_update()`` queries and anything
+    inside a transaction use the shared writer backend (see
+    ``connection.routing``).
+
     Synchronous and asynchronous versions are fully parallel (same API
     with async/await), but MUST NOT be mixed: BackendGroup with
     synchronous backends, AsyncBackendGroup with asynchronous backends.
@@ -47,11 +53,13 @@ This module is independent of the Worker module and can be used in:
 """
 
 from dataclasses import dataclass, field
-from typing import Callable, Type, List, Optional, Union
+from typing import Any, Callable, Type, List, Optional, Union
 
 from ..backend.base import StorageBackend, AsyncStorageBackend
 from ..backend.config import ConnectionConfig
+from ..base.model_metadata import invalidate_model_metadata
 from ..interface import IActiveRecord, IAsyncActiveRecord
+from .routing import AsyncReadWriteRouter, ReadWriteRouter, ReplicaBalancer, RouteStats
 
 
 @dataclass
@@ -114,13 +122,38 @@ class BackendGroup:
         ) as group:
             with group.get_backend().context() as ctx:
                 user = User.find_one(1)
+
+        # With read replicas: queries read from the replicas, writes and
+        # transactions use the writer built from ``config``
+        group = BackendGroup(
+            name="main",
+            models=[User, Post],
+            config=primary_config,
+            backend_class=MySQLBackend,
+            readers=[replica_config, replica_pool],
+            balancer=LeastInFlightBalancer(),
+            sticky_window=2.0,
+        )
+
+    Read replicas:
+        ``readers`` accepts ConnectionConfig instances (or callables returning
+        one), backend instances and BackendPool instances. Backends created
+        from configs are disconnected with the group; backends and pools
+        passed in are left to the caller. Reads stay on the writer while it
+        is in a transaction and for ``sticky_window`` seconds after a write
+        in the same thread or task.
     """
 
     name: str
     models: List[Type[IActiveRecord]] = field(default_factory=list)
     config: Optional[Union[ConnectionConfig, Callable[..., ConnectionConfig]]] = None
     backend_class: Optional[Type[StorageBackend]] = None
+    readers: List[Any] = field(default_factory=list)
+    balancer: Optional[ReplicaBalancer] = None
+    sticky_window: float = 1.0
     _backend_instance: Optional[StorageBackend] = field(default=None, init=False)
+    _router: Optional[ReadWriteRouter] = field(default=None, init=False)
+    _owned_readers: List[StorageBackend] = field(default_factory=list, init=False)
     _configured: bool = field(default=False, init=False)
 
     def add_model(self, model: Type[IActiveRecord]) -> 'BackendGroup':
@@ -179,15 +212,28 @@ class BackendGroup:
         # Create a single shared backend instance (not connected)
         self._backend_instance = self.backend_class(connection_config=config)
 
+        if self.readers:
+            self._router = ReadWriteRouter(
+                self._backend_instance,
+                self._resolve_readers(),
+                balancer=self.balancer,
+                sticky_window=self.sticky_window,
+            )
+            self._router.attach()
+
         # Assign the shared backend to each model
         for model in self.models:
             model.__connection_config__ = config
             model.__backend_class__ = self.backend_class
             model.__backend__ = self._backend_instance
+            model.__read_router__ = self._router
+            invalidate_model_metadata(model)
 
         # Set logger if models are present
         if self.models:
             self._backend_instance.logger = self.models[0].get_logger()
+            for reader in self._owned_readers:
+                reader.logger = self._backend_instance.logger
 
         self._configured = True
 
@@ -204,13 +250,22 @@ class BackendGroup:
         # Clear model references
         for model in self.models:
             model.__backend__ = None
+            model.__read_router__ = None
+            invalidate_model_metadata(model)
 
-        try:
-            self._backend_instance.disconnect()
-        except Exception:
-            pass  # Ignore disconnection errors
+        if self._router is not None:
+            self._router.detach()
+            self._router = None
+
+        # Reader pools and backends passed in by the caller stay open
+        for backend in [self._backend_instance, *self._owned_readers]:
+            try:
+                backend.disconnect()
+            except Exception:
+                pass  # Ignore disconnection errors
 
         self._backend_instance = None
+        self._owned_readers = []
         self._configured = False
 
     def get_backend(self) -> Optional[StorageBackend]:
@@ -222,6 +277,37 @@ class BackendGroup:
         """
         return self._backend_instance
 
+    def get_router(self) -> Optional[ReadWriteRouter]:
+        """
+        Get the read/write router.
+
+        Returns:
+            ReadWriteRouter instance, or None if the group has no readers
+            or is not configured
+        """
+        return self._router
+
+    def get_route_stats(self) -> Optional[RouteStats]:
+        """
+        Get a snapshot of where reads and writes were routed.
+
+        Returns:
+            RouteStats instance, or None if the group has no router
+        """
+        return self._router.get_stats() if self._router is not None else None
+
+    def _resolve_readers(self) -> List[Any]:
+        """Turn ``readers`` into backends or pools, creating backends for configs."""
+        targets = []
+        for reader in self.readers:
+            if callable(reader) and not isinstance(reader, ConnectionConfig):
+                reader = reader()
+            if isinstance(reader, ConnectionConfig):
+                reader = self.backend_class(connection_config=reader)
+                self._owned_readers.append(reader)
+            targets.append(reader)
+        return targets
+
     def is_configured(self) -> bool:
         """
         Check if the backend group has been configured.
@@ -318,13 +404,21 @@ class AsyncBackendGroup:
             user = await AsyncUser.find_one(1)
 
         await group.disconnect()
+
+    Read replicas work as in BackendGroup; ``readers`` takes configs, async
+    backends or AsyncBackendPool instances.
     """
 
     name: str
     models: List[Type[IAsyncActiveRecord]] = field(default_factory=list)
     config: Optional[Union[ConnectionConfig, Callable[..., ConnectionConfig]]] = None
     backend_class: Optional[Type[AsyncStorageBackend]] = None
+    readers: List[Any] = field(default_factory=list)
+    balancer: Optional[ReplicaBalancer] = None
+    sticky_window: float = 1.0
     _backend_instance: Optional[AsyncStorageBackend] = field(default=None, init=False)
+    _router: Optional[AsyncReadWriteRouter] = field(default=None, init=False)
+    _owned_readers: List[AsyncStorageBackend] = field(default_factory=list, init=False)
     _configured: bool = field(default=False, init=False)
 
     def add_model(self, model: Type[IAsyncActiveRecord]) -> 'AsyncBackendGroup':
@@ -383,15 +477,28 @@ class AsyncBackendGroup:
         # Create a single shared backend instance (not connected)
         self._backend_instance = self.backend_class(connection_config=config)
 
+        if self.readers:
+            self._router = AsyncReadWriteRouter(
+                self._backend_instance,
+                self._resolve_readers(),
+                balancer=self.balancer,
+                sticky_window=self.sticky_window,
+            )
+            self._router.attach()
+
         # Assign the shared backend to each model
         for model in self.models:
             model.__connection_config__ = config
             model.__backend_class__ = self.backend_class
             model.__backend__ = self._backend_instance
+            model.__read_router__ = self._router
+            invalidate_model_metadata(model)
 
         # Set logger if models are present
         if self.models:
             self._backend_instance.logger = self.models[0].get_logger()
+            for reader in self._owned_readers:
+                reader.logger = self._backend_instance.logger
 
         self._configured = True
 
@@ -408,13 +515,22 @@ class AsyncBackendGroup:
         # Clear model references
         for model in self.models:
             model.__backend__ = None
+            model.__read_router__ = None
+            invalidate_model_metadata(model)
 
-        try:
-            await self._backend_instance.disconnect()
-        except Exception:
-            pass  # Ignore disconnection errors
+        if self._router is not None:
+            self._router.detach()
+            self._router = None
+
+        # Reader pools and backends passed in by the caller stay open
+        for backend in [self._backend_instance, *self._owned_readers]:
+            try:
+                await backend.disconnect()
+            except Exception:
+                pass  # Ignore disconnection errors
 
         self._backend_instance = None
+        self._owned_readers = []
         self._configured = False
 
     def get_backend(self) -> Optional[AsyncStorageBackend]:
@@ -426,6 +542,37 @@ class AsyncBackendGroup:
         """
         return self._backend_instance
 
+    def get_router(self) -> Optional[AsyncReadWriteRouter]:
+        """
+        Get the read/write router.
+
+        Returns:
+            AsyncReadWriteRouter instance, or None if the group has no readers
+            or is not configured
+        """
+        return self._router
+
+    def get_route_stats(self) -> Optional[RouteStats]:
+        """
+        Get a snapshot of where reads and writes were routed.
+
+        Returns:
+            RouteStats instance, or None if the group has no router
+        """
+        return self._router.get_stats() if self._router is not None else None
+
+    def _resolve_readers(self) -> List[Any]:
+        """Turn ``readers`` into backends or pools, creating backends for configs."""
+        targets = []
+        for reader in self.readers:
+            if callable(reader) and not isinstance(reader, ConnectionConfig):
+                reader = reader()
+            if isinstance(reader, ConnectionConfig):
+                reader = self.backend_class(connection_config=reader)
+                self._owned_readers.append(reader)
+            targets.append(reader)
+        return targets
+
     def is_configured(self) -> bool:
         """
         Check if the backend group has been configured.
@@ -28,12 +28,13 @@ Design Intent:
     synchronous groups, AsyncBackendManager with asynchronous groups.
 """
 
-from typing import Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 from ..backend.base import StorageBackend, AsyncStorageBackend
 from ..backend.config import ConnectionConfig
 from ..interface import IActiveRecord, IAsyncActiveRecord
 from .group import BackendGroup, AsyncBackendGroup
+from .routing import ReplicaBalancer
 
 
 class BackendManager:
@@ -100,6 +101,9 @@ class BackendManager:
         config: Union[ConnectionConfig, Callable[..., ConnectionConfig]],
         backend_class: Type[StorageBackend],
         models: Optional[List[Type[IActiveRecord]]] = None,
+        readers: Optional[List[Any]] = None,
+        balancer: Optional[ReplicaBalancer] = None,
+        sticky_window: float = 1.0,
     ) -> BackendGroup:
         """
         Create and register a new backend group.
@@ -110,6 +114,10 @@ class BackendManager:
                 (e.g., a named connection function)
             backend_class: Backend class to use
             models: Optional list of ActiveRecord Model classes to include
+            readers: Optional read replicas (configs, backends or pools);
+                reads from query() are routed to them
+            balancer: Replica selection strategy (round robin by default)
+            sticky_window: Seconds reads stay on the writer after a write
 
         Returns:
             The created BackendGroup instance
@@ -125,6 +133,9 @@ class BackendManager:
             models=models or [],
             config=config,
             backend_class=backend_class,
+            readers=readers or [],
+            balancer=balancer,
+            sticky_window=sticky_window,
         )
         self._groups[name] = group
         return group
@@ -273,6 +284,9 @@ class AsyncBackendManager:
         config: Union[ConnectionConfig, Callable[..., ConnectionConfig]],
         backend_class: Type[AsyncStorageBackend],
         models: Optional[List[Type[IAsyncActiveRecord]]] = None,
+        readers: Optional[List[Any]] = None,
+        balancer: Optional[ReplicaBalancer] = None,
+        sticky_window: float = 1.0,
     ) -> AsyncBackendGroup:
         """
         Create and register a new async backend group.
@@ -283,6 +297,10 @@ class AsyncBackendManager:
                 (e.g., a named connection function)
             backend_class: Async backend class to use
             models: Optional list of async ActiveRecord Model classes to include
+            readers: Optional read replicas (configs, backends or pools);
+                reads from query() are routed to them
+            balancer: Replica selection strategy (round robin by default)
+            sticky_window: Seconds reads stay on the writer after a write
 
         Returns:
             The created AsyncBackendGroup instance
@@ -298,6 +316,9 @@ class AsyncBackendManager:
             models=models or [],
             config=config,
             backend_class=backend_class,
+            readers=readers or [],
+            balancer=balancer,
+            sticky_window=sticky_window,
         )
         self._groups[name] = group
         return group
@@ -19,11 +19,14 @@ Provides connection pool implementation for managing Backend instances.
 
     For SQLite and MySQL, use ``BackendGroup`` with ``backend.context()`` instead.
     Each thread/task should manage its own connection lifecycle via context manager,
-    which naturally avoids cross-thread issues.
+    which naturally avoids cross-thread issues. Alternatively, a ``BackendPool``
+    with ``connection_mode="thread_affine"`` keeps one live connection per thread
+    and never hands it to another thread (unless ``check_same_thread=False``).
 
 Classes:
     PoolConfig: Connection pool configuration.
     PoolStats: Connection pool statistics.
+    LatencyHistogram: Latency distribution with p50/p95/p99 accessors.
     PooledBackend: Wrapper for pooled Backend instances.
     BackendPool: Synchronous connection pool (QueuePool strategy).
     AsyncBackendPool: Asynchronous connection pool.
@@ -79,7 +82,7 @@ Example:
 """
 
 from .config import PoolConfig, ConnectionMode
-from .stats import PoolStats
+from .stats import PoolStats, LatencyHistogram
 from .pooled_backend import PooledBackend
 from .sync_pool import BackendPool, PoolContext
 from .async_pool import AsyncBackendPool, AsyncPoolContext
@@ -100,6 +103,7 @@ __all__ = [
     "PoolConfig",
     "ConnectionMode",
     "PoolStats",
+    "LatencyHistogram",
     "PooledBackend",
     "BackendPool",
     "PoolContext",
@@ -8,15 +8,18 @@ Provides AsyncBackendPool class for managing connection pools of asynchronous Ba
 import asyncio
 import inspect
 import logging
+import random
 import time
+import traceback
+import weakref
 from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional, Dict, Any, AsyncGenerator
+from typing import Optional, Dict, Any, AsyncGenerator, List
 
 from .config import PoolConfig
 from .stats import PoolStats
-from .pooled_backend import PooledBackend
+from .pooled_backend import PooledBackend, _detect_leaks
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +46,10 @@ class AsyncBackendPool:
         connection issues do not apply. The connection mode primarily controls
         whether connections are maintained across operations.
 
+    With ``config.maintenance_interval`` set, a background task closes idle
+    and expired connections and refills the pool to ``min_size`` at that
+    interval; see ``run_maintenance()``.
+
     Attributes:
         config: Connection pool configuration.
         stats: Connection pool statistics.
@@ -92,6 +99,9 @@ class AsyncBackendPool:
         self._semaphore: Optional[asyncio.Semaphore] = None
         self._closed = False
         self._initialized = False
+        self._maintenance_task: Optional[asyncio.Task] = None
+        # Slots reserved by run_maintenance() for connections being created
+        self._reserved = 0
 
         # Resolve effective connection mode from config
         # For async pools, default to persistent since there's no cross-thread concern
@@ -102,7 +112,9 @@ class AsyncBackendPool:
         else:
             self._effective_mode = config.connection_mode
 
-        self._is_persistent = (self._effective_mode == "persistent")
+        # All connections of an async pool belong to the event loop's thread,
+        # so thread-affine mode is persistent mode here.
+        self._is_persistent = self._effective_mode in ("persistent", "thread_affine")
 
         logger.debug(
             f"AsyncBackendPool initialized with connection_mode={self._effective_mode} "
@@ -158,6 +170,7 @@ class AsyncBackendPool:
                 self._stats.total_errors += 1
 
         self._initialized = True
+        self._start_maintenance()
 
     async def _create_backend(self, connect: bool = True) -> Optional[PooledBackend]:
         """Create new Backend instance.
@@ -185,23 +198,29 @@ class AsyncBackendPool:
                     "to create Backend instances"
                 )
 
-            # Connect if requested
-            if connect and hasattr(backend, 'connect'):
-                if inspect.iscoroutinefunction(backend.connect):
-                    await backend.connect()
-                else:
-                    backend.connect()
-
             pooled = PooledBackend(
                 backend=backend,
-                pool_key=str(id(self))
+                pool_key=str(id(self)),
+                lifetime_jitter=random.uniform(
+                    0, self.config.max_lifetime * self.config.max_lifetime_jitter
+                ),
             )
             self._stats.total_created += 1
-            return pooled
         except Exception:
             self._stats.total_errors += 1
             raise
 
+        # Connect if requested; a backend that fails to connect is destroyed, not leaked
+        if connect:
+            try:
+                await self._async_connect(backend)
+            except Exception:
+                self._stats.total_errors += 1
+                pooled.mark_unhealthy()
+                await self._destroy_backend(pooled)
+                raise
+        return pooled
+
     async def _create_backend_from_config(self) -> Any:
         """Create Backend instance from config dictionary.
 
@@ -269,10 +288,12 @@ class AsyncBackendPool:
             from rhosocial.activerecord.backend.schema import StatementType
             options = ExecutionOptions(stmt_type=StatementType.DQL)
 
+            started = time.perf_counter()
             if inspect.iscoroutinefunction(pooled.backend.execute):
                 result = await pooled.backend.execute(self.config.validation_query, [], options=options)
             else:
                 result = pooled.backend.execute(self.config.validation_query, [], options=options)
+            self._stats.validation_time.record(time.perf_counter() - started)
             return result is not None
         except Exception:
             pooled.is_healthy = False
@@ -297,11 +318,7 @@ class AsyncBackendPool:
                     await pooled.backend.disconnect()
                 else:
                     pooled.backend.disconnect()
-            if hasattr(pooled.backend, 'connect'):
-                if inspect.iscoroutinefunction(pooled.backend.connect):
-                    await pooled.backend.connect()
-                else:
-                    pooled.backend.connect()
+            await self._async_connect(pooled.backend)
             pooled.is_healthy = True
             logger.debug("Successfully reconnected stale backend in persistent mode")
             return True
@@ -316,10 +333,25 @@ class AsyncBackendPool:
             backend: Backend instance to connect
         """
         if hasattr(backend, 'connect'):
+            started = time.perf_counter()
             if inspect.iscoroutinefunction(backend.connect):
                 await backend.connect()
             else:
                 backend.connect()
+            self._stats.total_connects += 1
+            self._stats.connect_time.record(time.perf_counter() - started)
+
+    def _record_checkout(self, pooled: PooledBackend, started: float) -> None:
+        """Record the acquire wait and, for leak detection, the acquiring stack.
+
+        Args:
+            pooled: The backend being handed out
+            started: ``time.perf_counter()`` at the start of ``acquire()``
+        """
+        self._stats.acquire_wait.record(time.perf_counter() - started)
+        if self.config.leak_detection_threshold > 0:
+            # Drop this method's own frame
+            pooled.acquired_stack = ''.join(traceback.format_stack()[:-1])
 
     async def acquire(self, timeout: Optional[float] = None) -> Any:
         """Acquire a Backend instance.
@@ -354,6 +386,8 @@ class AsyncBackendPool:
         if self._closed:
             raise RuntimeError("Pool is closed")
 
+        started = time.perf_counter()
+
         # Try to acquire semaphore with timeout
         try:
             await asyncio.wait_for(self._semaphore.acquire(), timeout=timeout)
@@ -403,7 +437,10 @@ class AsyncBackendPool:
                         await self._destroy_backend(pooled)
                         logger.error(f"Failed to connect acquired backend: {e}")
                         continue
+                else:
+                    self._stats.total_connects_avoided += 1
 
+                self._record_checkout(pooled, started)
                 return pooled.backend
 
             # Create new connection
@@ -419,6 +456,7 @@ class AsyncBackendPool:
                     self._stats.current_in_use += 1
                     self._stats.total_acquired += 1
                     self._stats.last_acquired_at = datetime.now()
+                    self._record_checkout(pooled, started)
                     return pooled.backend
             except Exception:
                 self._semaphore.release()
@@ -450,6 +488,7 @@ class AsyncBackendPool:
             self._stats.current_in_use -= 1
             self._stats.total_released += 1
             self._stats.last_released_at = datetime.now()
+            self._stats.hold_time.record(pooled.hold_time())
 
             # In transient mode, auto-disconnect if configured
             if not self._is_persistent and self.config.auto_disconnect_on_release:
@@ -487,6 +526,88 @@ class AsyncBackendPool:
 
             self._semaphore.release()
 
+    def _start_maintenance(self) -> None:
+        """Start the background maintenance task, unless disabled."""
+        interval = self.config.maintenance_interval
+        if interval <= 0 or self._maintenance_task is not None:
+            return
+        # The task only holds a weak reference, so an unreferenced pool is
+        # still garbage collected and its maintenance task then exits.
+        self._maintenance_task = asyncio.get_running_loop().create_task(
+            _maintenance_loop(weakref.ref(self), interval)
+        )
+
+    async def run_maintenance(self) -> None:
+        """Run one pool maintenance pass.
+
+        Closes available connections that exceeded their lifetime, closes
+        connections idle for longer than ``idle_timeout`` (keeping at least
+        ``min_size`` connections), and creates connections until the pool holds
+        ``min_size`` again, so replacements are ready before the next acquire.
+
+        Called periodically by the background maintenance task (every
+        ``maintenance_interval`` seconds); may also be called directly.
+
+        As in BackendPool, the lock is only held to pick the connections to
+        close and to reserve slots for new ones; disconnecting and connecting
+        happen outside it, so a slow connect does not hold up acquire().
+        """
+        async with self._lock:
+            if self._closed:
+                return
+            self._stats.total_maintenance_runs += 1
+            self._detect_leaks()
+
+            reaped = []
+            for pooled in list(self._available):
+                if pooled.is_expired(self.config.max_lifetime):
+                    self._stats.total_expired_reaped += 1
+                elif (
+                    self.config.idle_timeout > 0
+                    and pooled.is_idle(self.config.idle_timeout)
+                    and self._stats.current_total > self.config.min_size
+                ):
+                    self._stats.total_idle_reaped += 1
+                else:
+                    continue
+                self._available.remove(pooled)
+                self._stats.current_available -= 1
+                reaped.append(pooled)
+
+            missing = max(0, self.config.min_size - self._stats.current_total - self._reserved)
+            self._reserved += missing
+
+        for pooled in reaped:
+            await self._destroy_backend(pooled)
+        await self._refill(missing)
+
+    async def _refill(self, count: int) -> None:
+        """Create ``count`` connections for slots reserved by ``run_maintenance()``."""
+        for created in range(count):
+            try:
+                pooled = await self._create_backend(connect=self._is_persistent)
+            except Exception as e:
+                logger.error(f"Failed to pre-warm backend during maintenance: {e}")
+                async with self._lock:
+                    self._reserved -= count - created
+                return
+
+            async with self._lock:
+                self._reserved -= 1
+                if not self._closed:
+                    self._available.append(pooled)
+                    self._stats.current_available += 1
+                    self._stats.total_prewarmed += 1
+                    continue
+                # Closed meanwhile
+                self._reserved -= count - created - 1
+            await self._destroy_backend(pooled)
+            return
+
+    def _detect_leaks(self) -> List[Dict[str, Any]]:
+        """Report in-use connections held longer than ``leak_detection_threshold`` (lock held)."""
+        return _detect_leaks(self._in_use.values(), self.config.leak_detection_threshold, self._stats)
+
     def context(self) -> 'AsyncPoolContext':
         """Get async pool context manager.
 
@@ -671,6 +792,9 @@ class AsyncBackendPool:
                 await self._destroy_backend(pooled)
                 self._stats.current_available -= 1
 
+            if self._maintenance_task is not None:
+                self._maintenance_task.cancel()
+
     def get_stats(self) -> PoolStats:
         """Get statistics.
 
@@ -687,21 +811,34 @@ class AsyncBackendPool:
             total_timeouts=self._stats.total_timeouts,
             total_errors=self._stats.total_errors,
             total_validation_failures=self._stats.total_validation_failures,
+            total_connects=self._stats.total_connects,
+            total_connects_avoided=self._stats.total_connects_avoided,
+            total_maintenance_runs=self._stats.total_maintenance_runs,
+            total_idle_reaped=self._stats.total_idle_reaped,
+            total_expired_reaped=self._stats.total_expired_reaped,
+            total_prewarmed=self._stats.total_prewarmed,
+            total_leaks_detected=self._stats.total_leaks_detected,
             current_available=self._stats.current_available,
             current_in_use=self._stats.current_in_use,
             created_at=self._stats.created_at,
             last_acquired_at=self._stats.last_acquired_at,
             last_released_at=self._stats.last_released_at,
+            acquire_wait=self._stats.acquire_wait.copy(),
+            hold_time=self._stats.hold_time.copy(),
+            connect_time=self._stats.connect_time.copy(),
+            validation_time=self._stats.validation_time.copy(),
         )
 
     async def health_check(self) -> Dict[str, Any]:
         """Health check.
 
-        Returns pool health status.
+        Returns pool health status, including latency percentiles and the
+        connections currently held longer than ``leak_detection_threshold``.
 
         Returns:
             Dictionary containing health status
         """
+        leaks = self._detect_leaks()
         stats = self.get_stats()
         return {
             'healthy': not self._closed and stats.total_errors < stats.total_created,
@@ -713,7 +850,15 @@ class AsyncBackendPool:
                 'in_use': stats.current_in_use,
                 'total': stats.current_total,
                 'errors': stats.total_errors,
-            }
+                'leaks_detected': stats.total_leaks_detected,
+            },
+            'latency': {
+                'acquire_wait': stats.acquire_wait.to_dict(),
+                'hold_time': stats.hold_time.to_dict(),
+                'connect_time': stats.connect_time.to_dict(),
+                'validation_time': stats.validation_time.to_dict(),
+            },
+            'leaks': leaks,
         }
 
     @property
@@ -741,6 +886,20 @@ class AsyncBackendPool:
         )
 
 
+async def _maintenance_loop(pool_ref: 'weakref.ref[AsyncBackendPool]', interval: float) -> None:
+    """Body of the maintenance task: run maintenance until closed or collected."""
+    while True:
+        await asyncio.sleep(interval)
+        pool = pool_ref()
+        if pool is None or pool.is_closed:
+            return
+        try:
+            await pool.run_maintenance()
+        except Exception as e:
+            logger.error(f"Pool maintenance failed: {e}")
+        del pool
+
+
 class AsyncPoolContext:
     """Async context manager for setting pool context.
 
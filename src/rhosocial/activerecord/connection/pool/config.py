@@ -11,8 +11,9 @@ from typing import Callable, Literal, Optional, Any, Dict
 
 logger = logging.getLogger(__name__)
 
-# Connection mode type: auto-detect, persistent (long-lived), or transient (short-lived)
-ConnectionMode = Literal["auto", "persistent", "transient"]
+# Connection mode type: auto-detect, persistent (long-lived), transient (short-lived),
+# or thread_affine (long-lived, one owner thread per connection)
+ConnectionMode = Literal["auto", "persistent", "transient", "thread_affine"]
 
 
 @dataclass
@@ -31,6 +32,15 @@ class PoolConfig:
           release (controlled by ``auto_connect_on_acquire`` / ``auto_disconnect_on_release``).
           Suitable for backends with ``threadsafety < 2`` (e.g., SQLite, MySQL).
 
+        - ``"thread_affine"``: Connections stay connected across acquire/release
+          like ``"persistent"``, but each one belongs to the thread that connected
+          it and is only handed out to that thread again (or to any thread when
+          the backend's config sets ``check_same_thread=False``). A thread's idle
+          connections are closed when the thread exits. Suitable for backends
+          with ``threadsafety < 2`` under a thread-per-request server (e.g.,
+          SQLite), where transient mode would reconnect on every acquire.
+          Synchronous pools only; ``AsyncBackendPool`` treats it as ``"persistent"``.
+
         - ``"auto"`` (default): Automatically selects the mode based on backend
           ``threadsafety``. ``persistent`` for ``threadsafety >= 2``, ``transient`` otherwise.
 
@@ -38,12 +48,23 @@ class PoolConfig:
         min_size: Minimum number of connections (warmup).
         max_size: Maximum number of connections.
         timeout: Timeout for acquiring a connection (seconds).
-        idle_timeout: Idle timeout for connections (seconds), closed after timeout.
+        idle_timeout: Idle timeout for connections (seconds), closed after timeout
+            by pool maintenance as long as ``min_size`` connections remain. 0 disables.
         max_lifetime: Maximum lifetime of a connection (seconds).
+        max_lifetime_jitter: Fraction of ``max_lifetime`` (0.0 ~ 1.0) randomly taken
+            off each connection's lifetime, so connections created together do not
+            all expire (and reconnect) at the same moment.
+        maintenance_interval: Interval of the background maintenance run (seconds),
+            which reaps idle and expired connections and refills to ``min_size``.
+            0 (the default) disables it, so no thread or task is started per
+            pool; ``run_maintenance()`` can still be called directly.
         close_timeout: Timeout for graceful close - waiting for active connections (seconds).
         validate_on_borrow: Whether to validate connection when borrowing.
         validate_on_return: Whether to validate connection when returning.
         validation_query: Validation query statement (SQL string).
+        leak_detection_threshold: Hold time (seconds) after which an acquired
+            connection is reported as a possible leak, together with the stack
+            that acquired it. 0 disables leak detection (and stack capture).
         connection_mode: Connection management mode (``"auto"``, ``"persistent"``, ``"transient"``).
         auto_connect_on_acquire: Automatically connect when acquiring (transient mode only).
         auto_disconnect_on_release: Automatically disconnect when releasing (transient mode only).
@@ -77,6 +98,15 @@ class PoolConfig:
             connection_mode="persistent",
             backend_factory=lambda: PostgresBackend(host="localhost")
         )
+
+        # SQLite under a threaded server — one live connection per worker thread
+        config = PoolConfig(
+            min_size=0,
+            max_size=16,
+            connection_mode="thread_affine",
+            validate_on_borrow=False,
+            backend_factory=lambda: SQLiteBackend(database="app.db")
+        )
     """
 
     # Pool size
@@ -87,13 +117,20 @@ class PoolConfig:
     timeout: float = 30.0  # Acquire timeout (seconds)
     idle_timeout: float = 300.0  # Idle timeout (seconds), closed after timeout
     max_lifetime: float = 3600.0  # Maximum connection lifetime (seconds)
+    max_lifetime_jitter: float = 0.1  # Fraction of max_lifetime randomly taken off per connection
     close_timeout: float = 5.0  # Graceful close timeout (seconds), 0 = no wait
 
+    # Maintenance settings
+    maintenance_interval: float = 0.0  # Background maintenance interval (seconds), 0 = disabled
+
     # Validation settings
     validate_on_borrow: bool = True  # Validate connection when borrowing
     validate_on_return: bool = False  # Validate connection when returning
     validation_query: Optional[str] = "SELECT 1"  # Validation query (SQL string)
 
+    # Leak detection
+    leak_detection_threshold: float = 0.0  # Report connections held longer (seconds), 0 = disabled
+
     # Connection management mode
     connection_mode: ConnectionMode = "auto"  # auto, persistent, or transient
 
@@ -121,11 +158,17 @@ class PoolConfig:
             raise ValueError("max_lifetime must be > 0")
         if self.close_timeout < 0:
             raise ValueError("close_timeout must be >= 0")
+        if not 0 <= self.max_lifetime_jitter < 1:
+            raise ValueError("max_lifetime_jitter must be >= 0 and < 1")
+        if self.maintenance_interval < 0:
+            raise ValueError("maintenance_interval must be >= 0")
+        if self.leak_detection_threshold < 0:
+            raise ValueError("leak_detection_threshold must be >= 0")
 
         # Validate connection_mode
-        if self.connection_mode not in ("auto", "persistent", "transient"):
+        if self.connection_mode not in ("auto", "persistent", "transient", "thread_affine"):
             raise ValueError(
-                f"connection_mode must be 'auto', 'persistent', or 'transient', "
+                f"connection_mode must be 'auto', 'persistent', 'transient', or 'thread_affine', "
                 f"got {self.connection_mode!r}"
             )
 
@@ -166,10 +209,13 @@ class PoolConfig:
             'timeout': self.timeout,
             'idle_timeout': self.idle_timeout,
             'max_lifetime': self.max_lifetime,
+            'max_lifetime_jitter': self.max_lifetime_jitter,
             'close_timeout': self.close_timeout,
+            'maintenance_interval': self.maintenance_interval,
             'validate_on_borrow': self.validate_on_borrow,
             'validate_on_return': self.validate_on_return,
             'validation_query': self.validation_query,
+            'leak_detection_threshold': self.leak_detection_threshold,
             'connection_mode': self.connection_mode,
             'auto_connect_on_acquire': self.auto_connect_on_acquire,
             'auto_disconnect_on_release': self.auto_disconnect_on_release,
@@ -5,9 +5,14 @@ Pooled Backend wrapper module.
 Provides PooledBackend dataclass for wrapping Backend instances and tracking their state.
 """
 
+import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+from .stats import PoolStats
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -26,6 +31,11 @@ class PooledBackend:
         is_healthy: Health status.
         created_thread_id: Thread ID where the connection was created.
             Used for thread affinity verification when backend threadsafety < 2.
+        lifetime_jitter: Seconds taken off ``max_lifetime`` for this connection,
+            spreading out the expiry of connections created together.
+        acquired_stack: Stack that acquired the connection, captured only when
+            leak detection is enabled.
+        leak_reported: Whether the current hold was already reported as a leak.
 
     Example:
         pooled = PooledBackend(backend=my_backend, pool_key="pool-1")
@@ -42,6 +52,9 @@ class PooledBackend:
     use_count: int = 0  # Usage count
     is_healthy: bool = True  # Health status
     created_thread_id: Optional[int] = None  # Thread ID where connection was created
+    lifetime_jitter: float = 0.0  # Seconds taken off max_lifetime for this connection
+    acquired_stack: Optional[str] = None  # Acquiring stack (leak detection only)
+    leak_reported: bool = False  # Current hold already reported as a leak
 
     def __post_init__(self):
         """Initialize timestamps."""
@@ -74,6 +87,9 @@ class PooledBackend:
     def is_expired(self, max_lifetime: float) -> bool:
         """Check if maximum lifetime has been exceeded.
 
+        The lifetime of this connection is ``max_lifetime`` minus its
+        ``lifetime_jitter``.
+
         Args:
             max_lifetime: Maximum lifetime (seconds)
 
@@ -83,7 +99,7 @@ class PooledBackend:
         if self.created_at is None:
             return False
         age = (datetime.now() - self.created_at).total_seconds()
-        return age >= max_lifetime
+        return age >= max_lifetime - self.lifetime_jitter
 
     def is_idle(self, idle_timeout: float) -> bool:
         """Check if idle timeout has been exceeded.
@@ -127,6 +143,8 @@ class PooledBackend:
         """
         self.is_healthy = True
         self.acquired_at = None
+        self.acquired_stack = None
+        self.leak_reported = False
 
     def mark_unhealthy(self) -> None:
         """Mark as unhealthy."""
@@ -142,3 +160,37 @@ class PooledBackend:
             f"created_thread_id={self.created_thread_id}, "
             f"age={self.age():.1f}s)"
         )
+
+
+def _detect_leaks(in_use: Iterable[PooledBackend], threshold: float, stats: PoolStats) -> List[Dict[str, Any]]:
+    """Find in-use connections held longer than ``threshold`` seconds.
+
+    Shared by BackendPool and AsyncBackendPool, which call it while holding
+    their pool lock. Each such hold is logged once, with the stack that
+    acquired it, and counted in ``stats.total_leaks_detected``.
+
+    Returns:
+        One description per connection currently held too long
+    """
+    if threshold <= 0:
+        return []
+    leaks = []
+    for pooled in in_use:
+        held = pooled.hold_time()
+        if held < threshold:
+            continue
+        if not pooled.leak_reported:
+            pooled.leak_reported = True
+            stats.total_leaks_detected += 1
+            logger.warning(
+                f"Possible connection leak: {type(pooled.backend).__name__} held for "
+                f"{held:.1f}s (leak_detection_threshold={threshold}s), acquired at:\n"
+                f"{pooled.acquired_stack}"
+            )
+        leaks.append({
+            'backend': type(pooled.backend).__name__,
+            'hold_time': held,
+            'acquired_at': pooled.acquired_at.isoformat() if pooled.acquired_at else None,
+            'stack': pooled.acquired_stack,
+        })
+    return leaks
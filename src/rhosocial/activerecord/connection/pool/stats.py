@@ -2,12 +2,119 @@
 """
 Connection pool statistics module.
 
-Provides PoolStats dataclass for tracking connection pool runtime status and statistics.
+Provides PoolStats dataclass for tracking connection pool runtime status and statistics,
+and LatencyHistogram for the pool's latency distributions.
 """
 
-from dataclasses import dataclass
+import math
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
+
+
+# Histogram bucket upper bounds (seconds): 10us, growing by 20% per bucket, up
+# to ~100s; larger values fall into a final overflow bucket.
+_BUCKET_GROWTH = 1.2
+_BUCKET_BOUNDS = tuple(1e-5 * _BUCKET_GROWTH ** i for i in range(90))
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram.
+
+    Recording a value is a binary search over log-spaced bucket bounds plus a
+    counter increment, so it is cheap enough for every acquire. Percentiles
+    are reported as the upper bound of the bucket holding the requested rank
+    (capped at the largest recorded value), i.e. with at most 20% relative
+    error.
+
+    Not thread-safe by itself; pools record under their own lock.
+
+    Example:
+        stats = pool.get_stats()
+        print(f"acquire wait p99: {stats.acquire_wait.p99 * 1000:.1f}ms")
+    """
+
+    __slots__ = ('_counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self._counts: List[int] = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0  # Number of recorded values
+        self.total = 0.0  # Sum of recorded values (seconds)
+        self.max = 0.0  # Largest recorded value (seconds)
+
+    def record(self, seconds: float) -> None:
+        """Record one value (seconds)."""
+        self._counts[bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Value below which ``fraction`` (0.0 ~ 1.0) of the recorded values fall.
+
+        Returns:
+            Percentile in seconds, 0.0 if nothing was recorded
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index == len(_BUCKET_BOUNDS):
+                    return self.max
+                return min(_BUCKET_BOUNDS[index], self.max)
+        return self.max
+
+    @property
+    def p50(self) -> float:
+        """Median (seconds)."""
+        return self.percentile(0.50)
+
+    @property
+    def p95(self) -> float:
+        """95th percentile (seconds)."""
+        return self.percentile(0.95)
+
+    @property
+    def p99(self) -> float:
+        """99th percentile (seconds)."""
+        return self.percentile(0.99)
+
+    @property
+    def mean(self) -> float:
+        """Mean (seconds)."""
+        return self.total / self.count if self.count else 0.0
+
+    def copy(self) -> 'LatencyHistogram':
+        """Return an independent copy."""
+        other = LatencyHistogram()
+        other._counts = self._counts[:]
+        other.count = self.count
+        other.total = self.total
+        other.max = self.max
+        return other
+
+    def to_dict(self) -> dict:
+        """Convert to a summary dictionary (seconds)."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'p50': self.p50,
+            'p95': self.p95,
+            'p99': self.p99,
+            'max': self.max,
+        }
+
+    def __repr__(self) -> str:
+        """Return readable representation."""
+        return (
+            f"LatencyHistogram(count={self.count}, p50={self.p50:.6f}, "
+            f"p95={self.p95:.6f}, p99={self.p99:.6f}, max={self.max:.6f})"
+        )
 
 
 @dataclass
@@ -24,16 +131,31 @@ class PoolStats:
         total_timeouts: Total number of timeout events.
         total_errors: Total number of errors.
         total_validation_failures: Total number of validation failures.
+        total_connects: Total number of ``connect()`` calls made by the pool.
+        total_connects_avoided: Total number of acquires served by a backend
+            that was already connected (persistent and thread-affine modes).
+        total_maintenance_runs: Total number of pool maintenance runs.
+        total_idle_reaped: Total number of idle connections closed by maintenance.
+        total_expired_reaped: Total number of expired connections closed by maintenance.
+        total_prewarmed: Total number of connections created by maintenance to
+            refill the pool to ``min_size``.
+        total_leaks_detected: Total number of acquires held longer than
+            ``PoolConfig.leak_detection_threshold``.
         current_available: Current number of available connections.
         current_in_use: Current number of connections in use.
         created_at: Pool creation time.
         last_acquired_at: Last acquire time.
         last_released_at: Last release time.
+        acquire_wait: Time spent waiting in ``acquire()``.
+        hold_time: Time between acquire and release.
+        connect_time: Time spent in backend ``connect()``.
+        validation_time: Time spent running the validation query.
 
     Example:
         stats = pool.get_stats()
         print(f"Utilization: {stats.utilization_rate:.2%}")
         print(f"Current connections: {stats.current_total}")
+        print(f"Acquire wait p99: {stats.acquire_wait.p99:.3f}s")
     """
 
     # Cumulative statistics
@@ -44,6 +166,13 @@ class PoolStats:
     total_timeouts: int = 0  # Total timeout events
     total_errors: int = 0  # Total errors
     total_validation_failures: int = 0  # Total validation failures
+    total_connects: int = 0  # Total connect() calls
+    total_connects_avoided: int = 0  # Acquires that reused a live connection
+    total_maintenance_runs: int = 0  # Maintenance runs
+    total_idle_reaped: int = 0  # Idle connections closed by maintenance
+    total_expired_reaped: int = 0  # Expired connections closed by maintenance
+    total_prewarmed: int = 0  # Connections created by maintenance to reach min_size
+    total_leaks_detected: int = 0  # Acquires held beyond leak_detection_threshold
 
     # Current state
     current_available: int = 0  # Current available connections
@@ -54,6 +183,12 @@ class PoolStats:
     last_acquired_at: Optional[datetime] = None  # Last acquire time
     last_released_at: Optional[datetime] = None  # Last release time
 
+    # Latency distributions (seconds)
+    acquire_wait: LatencyHistogram = field(default_factory=LatencyHistogram)  # Wait in acquire()
+    hold_time: LatencyHistogram = field(default_factory=LatencyHistogram)  # Acquire to release
+    connect_time: LatencyHistogram = field(default_factory=LatencyHistogram)  # Backend connect()
+    validation_time: LatencyHistogram = field(default_factory=LatencyHistogram)  # Validation query
+
     def __post_init__(self):
         """Initialize creation time."""
         if self.created_at is None:
@@ -115,6 +250,13 @@ class PoolStats:
             'total_timeouts': self.total_timeouts,
             'total_errors': self.total_errors,
             'total_validation_failures': self.total_validation_failures,
+            'total_connects': self.total_connects,
+            'total_connects_avoided': self.total_connects_avoided,
+            'total_maintenance_runs': self.total_maintenance_runs,
+            'total_idle_reaped': self.total_idle_reaped,
+            'total_expired_reaped': self.total_expired_reaped,
+            'total_prewarmed': self.total_prewarmed,
+            'total_leaks_detected': self.total_leaks_detected,
             'current_available': self.current_available,
             'current_in_use': self.current_in_use,
             'current_total': self.current_total,
@@ -125,4 +267,8 @@ class PoolStats:
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'last_acquired_at': self.last_acquired_at.isoformat() if self.last_acquired_at else None,
             'last_released_at': self.last_released_at.isoformat() if self.last_released_at else None,
+            'acquire_wait': self.acquire_wait.to_dict(),
+            'hold_time': self.hold_time.to_dict(),
+            'connect_time': self.connect_time.to_dict(),
+            'validation_time': self.validation_time.to_dict(),
         }
@@ -6,16 +6,19 @@ Provides BackendPool class for managing connection pools of synchronous Backend
 """
 
 import logging
+import random
 import threading
 import time
+import traceback
+import weakref
 from collections import deque
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, Dict, Any, Generator
+from typing import Optional, Dict, Any, Generator, List, Tuple
 
 from .config import PoolConfig
 from .stats import PoolStats
-from .pooled_backend import PooledBackend
+from .pooled_backend import PooledBackend, _detect_leaks
 
 logger = logging.getLogger(__name__)
 
@@ -37,10 +40,23 @@ class BackendPool:
       disconnected on release (if ``auto_disconnect_on_release=True``).
       Suitable for backends with ``threadsafety < 2`` (e.g., SQLite, MySQL).
 
+    - **Thread-affine mode** (``connection_mode="thread_affine"``): Connections
+      stay connected like in persistent mode, but each one is owned by the
+      thread that connected it and kept on that thread's free list. A thread
+      reuses its own connection on every acquire; connections only move to
+      another thread when the backend's config sets ``check_same_thread=False``.
+      When a thread exits, its idle connections are closed.
+      Suitable for backends with ``threadsafety < 2`` (e.g., SQLite) used from
+      a thread pool.
+
     - **Auto mode** (``connection_mode="auto"``, default): Automatically
       selects persistent mode for ``threadsafety >= 2`` backends and
       transient mode for ``threadsafety < 2`` backends.
 
+    With ``config.maintenance_interval`` set, a background daemon thread
+    closes idle and expired connections and refills the pool to
+    ``min_size`` at that interval; see ``run_maintenance()``.
+
     Attributes:
         config: Connection pool configuration.
         stats: Connection pool statistics.
@@ -90,6 +106,9 @@ class BackendPool:
         self._condition = threading.Condition(self._lock)
         self._closed = False
         self._initialized = False
+        # Slots held by backends being connected, validated or released outside
+        # the lock; they count against max_size like in-use backends.
+        self._reserved = 0
 
         # Resolve effective connection mode from config
         self._effective_mode: str  # "persistent" or "transient"
@@ -99,6 +118,16 @@ class BackendPool:
             self._effective_mode = config.connection_mode
 
         self._is_persistent = (self._effective_mode == "persistent")
+        self._is_thread_affine = (self._effective_mode == "thread_affine")
+
+        # Thread-affine mode: idle connections per owner thread (thread id -> deque);
+        # _available stays empty. _thread_state marks threads whose exit is watched.
+        self._thread_available: Dict[int, deque[PooledBackend]] = {}
+        self._thread_state = threading.local()
+
+        # Background maintenance (see run_maintenance)
+        self._maintenance_stop = threading.Event()
+        self._maintenance_thread: Optional[threading.Thread] = None
 
         logger.debug(
             f"BackendPool initialized with connection_mode={self._effective_mode} "
@@ -110,7 +139,7 @@ class BackendPool:
         """Effective connection management mode.
 
         Returns:
-            ``"persistent"`` or ``"transient"``
+            ``"persistent"``, ``"transient"`` or ``"thread_affine"``
         """
         return self._effective_mode
 
@@ -143,23 +172,23 @@ class BackendPool:
 
         for _ in range(self.config.min_size):
             try:
-                pooled = self._create_backend()
+                # In persistent and thread-affine modes, connect immediately during warmup
+                pooled = self._create_connected_backend(self._is_persistent or self._is_thread_affine)
                 if pooled:
-                    # In persistent mode, connect immediately during warmup
-                    if self._is_persistent:
-                        try:
-                            pooled.backend.connect()
-                        except Exception as e:
-                            logger.error(f"Failed to connect backend during warmup: {e}")
-                            self._stats.total_errors += 1
-                            continue
-                    self._available.append(pooled)
+                    if self._is_thread_affine:
+                        # Warmed-up connections belong to the creating thread
+                        self._thread_available.setdefault(pooled.created_thread_id, deque()).append(pooled)
+                        self._watch_thread_exit()
+                    else:
+                        self._available.append(pooled)
                     self._stats.current_available += 1
-            except Exception:
+            except Exception as e:
                 # Warmup failure does not prevent pool creation
+                logger.error(f"Failed to create backend during warmup: {e}")
                 self._stats.total_errors += 1
 
         self._initialized = True
+        self._start_maintenance()
 
     def _is_thread_safe_backend(self) -> bool:
         """Determine if the backend supports cross-thread connection sharing.
@@ -208,13 +237,47 @@ class BackendPool:
                 backend=backend,
                 pool_key=str(id(self)),
                 created_thread_id=threading.current_thread().ident,
+                lifetime_jitter=self._lifetime_jitter(),
             )
-            self._stats.total_created += 1
+            with self._lock:
+                self._stats.total_created += 1
             return pooled
         except Exception:
-            self._stats.total_errors += 1
+            with self._lock:
+                self._stats.total_errors += 1
             raise
 
+    def _create_connected_backend(self, connect: bool) -> PooledBackend:
+        """Create a backend and, if ``connect``, connect it.
+
+        A backend whose connect() fails is destroyed rather than leaked.
+
+        Raises:
+            Exception: If creation or connection fails
+        """
+        pooled = self._create_backend()
+        if connect:
+            try:
+                self._connect_backend(pooled)
+            except Exception:
+                pooled.mark_unhealthy()
+                self._destroy_backend(pooled)
+                raise
+        return pooled
+
+    def _lifetime_jitter(self) -> float:
+        """Random number of seconds to take off a new connection's lifetime."""
+        return random.uniform(0, self.config.max_lifetime * self.config.max_lifetime_jitter)
+
+    def _connect_backend(self, pooled: PooledBackend) -> None:
+        """Connect a pooled backend, counting the connect in the statistics."""
+        started = time.perf_counter()
+        pooled.backend.connect()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._stats.total_connects += 1
+            self._stats.connect_time.record(elapsed)
+
     def _create_backend_from_config(self) -> Any:
         """Create Backend instance from config dictionary.
 
@@ -267,7 +330,8 @@ class BackendPool:
         except Exception as e:
             logger.error(f"Error during disconnect: {e}")
         finally:
-            self._stats.total_destroyed += 1
+            with self._lock:
+                self._stats.total_destroyed += 1
 
     def _validate_backend(self, pooled: PooledBackend) -> bool:
         """Validate if connection is valid.
@@ -279,7 +343,8 @@ class BackendPool:
             True if connection is valid
         """
         if not pooled.is_healthy:
-            self._stats.total_validation_failures += 1
+            with self._lock:
+                self._stats.total_validation_failures += 1
             return False
 
         if pooled.is_expired(self.config.max_lifetime):
@@ -294,11 +359,16 @@ class BackendPool:
             from rhosocial.activerecord.backend.options import ExecutionOptions
             from rhosocial.activerecord.backend.schema import StatementType
             options = ExecutionOptions(stmt_type=StatementType.DQL)
+            started = time.perf_counter()
             result = pooled.backend.execute(self.config.validation_query, [], options=options)
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._stats.validation_time.record(elapsed)
             return result is not None
         except Exception:
             pooled.is_healthy = False
-            self._stats.total_validation_failures += 1
+            with self._lock:
+                self._stats.total_validation_failures += 1
             return False
 
     def _reconnect_backend(self, pooled: PooledBackend) -> bool:
@@ -316,7 +386,7 @@ class BackendPool:
         try:
             if hasattr(pooled.backend, 'disconnect'):
                 pooled.backend.disconnect()
-            pooled.backend.connect()
+            self._connect_backend(pooled)
             pooled.is_healthy = True
             logger.debug("Successfully reconnected stale backend in persistent mode")
             return True
@@ -337,6 +407,11 @@ class BackendPool:
         In transient mode, if ``auto_connect_on_acquire=True``, connect() is
         called on the backend before returning it.
 
+        The pool lock is only held to pick a backend (or reserve a slot for a
+        new one) and to publish the result; connecting, validating and
+        reconnecting happen outside it, so a slow connect does not block other
+        threads' acquire and release.
+
         Args:
             timeout: Timeout (seconds), None uses config timeout
 
@@ -354,85 +429,154 @@ class BackendPool:
         if timeout is None:
             timeout = self.config.timeout
 
+        started = time.perf_counter()
         deadline = time.time() + timeout
 
+        if self._is_thread_affine:
+            return self._acquire_thread_affine(timeout, deadline, started)
+
+        while True:
+            pooled = self._reserve(timeout, deadline)
+
+            if pooled is None:
+                # A slot was reserved: create a new backend
+                try:
+                    # In persistent mode, connect immediately on creation
+                    pooled = self._create_connected_backend(
+                        self._is_persistent or self.config.auto_connect_on_acquire
+                    )
+                except Exception:
+                    # Creation or connection failed, continue waiting
+                    self._cancel_reservation()
+                    self._wait_for_release(timeout, deadline)
+                    continue
+                return self._publish_acquired(pooled, False, started)
+
+            try:
+                ready, connect_avoided = self._prepare_available(pooled)
+            except BaseException:
+                self._cancel_reservation()
+                raise
+            if ready:
+                return self._publish_acquired(pooled, connect_avoided, started)
+            self._cancel_reservation()
+
+    def _reserve(self, timeout: float, deadline: float) -> Optional[PooledBackend]:
+        """Take an available backend, or reserve a slot for a new one.
+
+        Waits until either is possible. The returned backend (or the reserved
+        slot) is counted in ``_reserved`` until it is published or the
+        reservation is cancelled.
+
+        Returns:
+            An available PooledBackend, or None if a slot for a new backend was reserved
+
+        Raises:
+            RuntimeError: If pool is closed
+            TimeoutError: If neither is possible within timeout
+        """
         with self._condition:
             while True:
                 if self._closed:
                     raise RuntimeError("Pool is closed")
 
-                # Try to get from available pool
-                while self._available:
+                if self._available:
                     pooled = self._available.popleft()
-
-                    # Validate connection
-                    if self.config.validate_on_borrow:
-                        if not self._validate_backend(pooled):
-                            # In persistent mode, try to reconnect before giving up
-                            if self._is_persistent and self._reconnect_backend(pooled):
-                                # Reconnection succeeded, continue with this backend
-                                pass
-                            else:
-                                self._destroy_backend(pooled)
-                                self._stats.current_available -= 1
-                                continue
-
-                    # Mark as in use
-                    pooled.mark_used()
-                    self._in_use[id(pooled.backend)] = pooled
                     self._stats.current_available -= 1
-                    self._stats.current_in_use += 1
-                    self._stats.total_acquired += 1
-                    self._stats.last_acquired_at = datetime.now()
-
-                    # In transient mode, auto-connect if configured
-                    if not self._is_persistent and self.config.auto_connect_on_acquire:
-                        try:
-                            pooled.backend.connect()
-                        except Exception as e:
-                            # Connect failed, destroy and try again
-                            self._in_use.pop(id(pooled.backend), None)
-                            self._stats.current_in_use -= 1
-                            pooled.mark_unhealthy()
-                            self._destroy_backend(pooled)
-                            logger.error(f"Failed to connect acquired backend: {e}")
-                            continue
+                    self._reserved += 1
+                    return pooled
 
-                    return pooled.backend
-
-                # Can create new connection
-                if self._stats.current_total < self.config.max_size:
-                    try:
-                        pooled = self._create_backend()
-                        if pooled:
-                            # In persistent mode, connect immediately on creation
-                            if self._is_persistent:
-                                pooled.backend.connect()
-                            elif self.config.auto_connect_on_acquire:
-                                pooled.backend.connect()
-
-                            pooled.mark_used()
-                            self._in_use[id(pooled.backend)] = pooled
-                            self._stats.current_in_use += 1
-                            self._stats.total_acquired += 1
-                            self._stats.last_acquired_at = datetime.now()
-
-                            return pooled.backend
-                    except Exception:
-                        # Creation or connection failed, continue waiting
-                        pass
-
-                # Wait for available connection
-                remaining = deadline - time.time()
-                if remaining <= 0:
-                    self._stats.total_timeouts += 1
-                    raise TimeoutError(
-                        f"Failed to acquire connection within {timeout} seconds. "
-                        f"Pool stats: available={self._stats.current_available}, "
-                        f"in_use={self._stats.current_in_use}"
-                    )
+                if self._total_slots() < self.config.max_size:
+                    self._reserved += 1
+                    return None
+
+                self._wait_for_release(timeout, deadline)
+
+    def _prepare_available(self, pooled: PooledBackend) -> Tuple[bool, bool]:
+        """Validate (and in transient mode connect) a backend taken from the pool.
 
-                self._condition.wait(remaining)
+        Called without holding the pool lock. A backend that cannot be used is
+        destroyed.
+
+        Returns:
+            ``(ready, connect_avoided)``: whether the backend can be handed out,
+            and whether it was handed out without calling connect()
+        """
+        # Validate connection
+        if self.config.validate_on_borrow and not self._validate_backend(pooled):
+            # In persistent mode, try to reconnect before giving up
+            if not (self._is_persistent and self._reconnect_backend(pooled)):
+                self._destroy_backend(pooled)
+                return False, False
+
+        # In transient mode, auto-connect if configured
+        if not self._is_persistent and self.config.auto_connect_on_acquire:
+            try:
+                self._connect_backend(pooled)
+            except Exception as e:
+                # Connect failed, destroy and try again
+                pooled.mark_unhealthy()
+                self._destroy_backend(pooled)
+                logger.error(f"Failed to connect acquired backend: {e}")
+                return False, False
+            return True, False
+
+        return True, True
+
+    def _publish_acquired(self, pooled: PooledBackend, connect_avoided: bool, started: float) -> Any:
+        """Turn a reserved, ready backend into an in-use one and return it.
+
+        Args:
+            pooled: The reserved backend
+            connect_avoided: Whether it is handed out without calling connect()
+            started: ``time.perf_counter()`` at the start of ``acquire()``
+
+        Raises:
+            RuntimeError: If the pool was closed while the backend was prepared
+        """
+        if self.config.leak_detection_threshold > 0:
+            # Drop this method's own frame
+            stack = ''.join(traceback.format_stack()[:-1])
+        else:
+            stack = None
+        with self._condition:
+            self._reserved -= 1
+            if not self._closed:
+                if connect_avoided:
+                    self._stats.total_connects_avoided += 1
+                self._stats.acquire_wait.record(time.perf_counter() - started)
+                pooled.acquired_stack = stack
+                return self._check_out(pooled)
+            self._condition.notify_all()
+        self._destroy_backend(pooled)
+        raise RuntimeError("Pool is closed")
+
+    def _cancel_reservation(self, count: int = 1) -> None:
+        """Give back reserved slots and wake up waiting acquirers."""
+        with self._condition:
+            self._reserved -= count
+            self._condition.notify_all()
+
+    def _wait_for_release(self, timeout: float, deadline: float) -> None:
+        """Wait (holding the lock) until notified or until the acquire deadline.
+
+        Raises:
+            TimeoutError: If the deadline has already passed
+        """
+        with self._condition:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                self._stats.total_timeouts += 1
+                raise TimeoutError(
+                    f"Failed to acquire connection within {timeout} seconds. "
+                    f"Pool stats: available={self._stats.current_available}, "
+                    f"in_use={self._stats.current_in_use}"
+                )
+            self._condition.wait(remaining)
+
+    def _total_slots(self) -> int:
+        """Connections counted against ``max_size``, including reserved ones."""
+        return self._stats.current_total + self._reserved
 
     def release(self, backend: Any) -> None:
         """Release Backend instance.
@@ -443,6 +587,9 @@ class BackendPool:
         In transient mode, if ``auto_disconnect_on_release=True``, disconnect()
         is called before returning the backend to the pool.
 
+        Disconnecting and validating happen outside the pool lock; the backend
+        keeps its slot until it is back in the pool or destroyed.
+
         Args:
             backend: Backend instance to release
         """
@@ -457,7 +604,16 @@ class BackendPool:
             self._stats.current_in_use -= 1
             self._stats.total_released += 1
             self._stats.last_released_at = datetime.now()
-
+            self._stats.hold_time.record(pooled.hold_time())
+            self._reserved += 1
+
+        if self._is_thread_affine:
+            keep = (
+                pooled.is_healthy
+                and not pooled.is_expired(self.config.max_lifetime)
+                and (not self.config.validate_on_return or self._validate_backend(pooled))
+            )
+        else:
             # In transient mode, auto-disconnect if configured
             if not self._is_persistent and self.config.auto_disconnect_on_release:
                 try:
@@ -468,22 +624,275 @@ class BackendPool:
                     pooled.mark_unhealthy()
 
             # Check if should be destroyed (not returned to pool)
-            if not pooled.is_healthy:
-                self._destroy_backend(pooled)
+            keep = pooled.is_healthy and not pooled.is_expired(self.config.max_lifetime)
+
+        with self._condition:
+            self._reserved -= 1
+            if keep and not self._closed:
+                # Return to pool for reuse
+                pooled.reset()
+                if self._is_thread_affine:
+                    # Back on the owner thread's free list, still connected
+                    self._thread_available.setdefault(pooled.created_thread_id, deque()).append(pooled)
+                else:
+                    self._available.append(pooled)
+                self._stats.current_available += 1
                 self._condition.notify()
                 return
+            self._condition.notify()
 
+        if self._is_thread_affine:
+            self._retire_backend(pooled)
+        else:
+            self._destroy_backend(pooled)
+
+    def _check_out(self, pooled: PooledBackend) -> Any:
+        """Mark ``pooled`` as in use and return its backend (lock held)."""
+        pooled.mark_used()
+        self._in_use[id(pooled.backend)] = pooled
+        self._stats.current_in_use += 1
+        self._stats.total_acquired += 1
+        self._stats.last_acquired_at = datetime.now()
+        return pooled.backend
+
+    # region Thread-affine mode
+
+    def _acquire_thread_affine(self, timeout: float, deadline: float, started: float) -> Any:
+        """Acquire a backend owned by the current thread (thread-affine mode).
+
+        Order of preference: an idle connection of this thread; a new
+        connection while below ``max_size``; at ``max_size``, an idle
+        connection of another thread, which is adopted when the backend allows
+        cross-thread use and otherwise retired to free its slot.
+        """
+        thread_id = threading.get_ident()
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Pool is closed")
+
+                    pooled = self._pop_thread_idle(thread_id)
+                    if pooled is None and self._total_slots() >= self.config.max_size:
+                        pooled = self._take_foreign_idle(thread_id)
+                    if pooled is not None or self._total_slots() < self.config.max_size:
+                        self._reserved += 1
+                        break
+
+                    self._wait_for_release(timeout, deadline)
+
+            if pooled is None:
+                try:
+                    pooled = self._create_connected_backend(True)
+                except Exception as e:
+                    logger.error(f"Failed to create thread-affine backend: {e}")
+                    self._cancel_reservation()
+                    self._wait_for_release(timeout, deadline)
+                    continue
+                self._watch_thread_exit()
+                return self._publish_acquired(pooled, False, started)
+
+            if pooled.created_thread_id != thread_id:
+                # Adopted from another thread (check_same_thread=False)
+                pooled.created_thread_id = thread_id
+                self._watch_thread_exit()
             if pooled.is_expired(self.config.max_lifetime):
+                self._retire_backend(pooled)
+                self._cancel_reservation()
+                continue
+            if (
+                not self.config.validate_on_borrow
+                or self._validate_backend(pooled)
+                or self._reconnect_backend(pooled)
+            ):
+                return self._publish_acquired(pooled, True, started)
+            self._retire_backend(pooled)
+            self._cancel_reservation()
+
+    def _pop_thread_idle(self, thread_id: int) -> Optional[PooledBackend]:
+        """Take an idle connection from ``thread_id``'s free list (lock held)."""
+        idle = self._thread_available.get(thread_id)
+        if not idle:
+            return None
+        self._stats.current_available -= 1
+        return idle.pop()  # most recently used first
+
+    def _take_foreign_idle(self, thread_id: int) -> Optional[PooledBackend]:
+        """At ``max_size``: adopt or retire an idle connection owned by another thread.
+
+        Called with the lock held.
+
+        Returns:
+            The adopted connection, or None if a slot was freed instead (or
+            there was no idle connection to take).
+        """
+        for owner_id, idle in self._thread_available.items():
+            if owner_id == thread_id or not idle:
+                continue
+            pooled = idle.popleft()  # least recently used first
+            self._stats.current_available -= 1
+            if self._allows_cross_thread(pooled):
+                return pooled
+            # Bound to its owner thread: closing it from here is not possible,
+            # so this only drops it and frees the slot
+            self._retire_backend(pooled)
+            return None
+        return None
+
+    @staticmethod
+    def _allows_cross_thread(pooled: PooledBackend) -> bool:
+        """Whether the backend's connection may be used from another thread."""
+        config = getattr(pooled.backend, 'config', None)
+        return getattr(config, 'check_same_thread', True) is False
+
+    def _retire_backend(self, pooled: PooledBackend) -> None:
+        """Destroy ``pooled``; a connection bound to another thread is dropped unclosed.
+
+        SQLite refuses to close a ``check_same_thread`` connection from a
+        foreign thread; such a connection is released to the garbage
+        collector, which closes it.
+        """
+        if pooled.created_thread_id == threading.get_ident() or self._allows_cross_thread(pooled):
+            self._destroy_backend(pooled)
+            return
+        logger.debug(
+            f"Dropping connection owned by thread {pooled.created_thread_id} "
+            f"without disconnect (check_same_thread)"
+        )
+        with self._lock:
+            self._stats.total_destroyed += 1
+
+    def _watch_thread_exit(self) -> None:
+        """Close the current thread's idle connections when the thread exits."""
+        if getattr(self._thread_state, 'sentinel', None) is not None:
+            return
+        sentinel = _ThreadSentinel()
+        self._thread_state.sentinel = sentinel
+        # The thread-local value is released at thread exit, in the exiting
+        # thread, so the finalizer can close connections bound to it.
+        weakref.finalize(sentinel, _evict_thread, weakref.ref(self), threading.get_ident())
+
+    def _evict_thread(self, thread_id: int) -> None:
+        """Close the idle connections owned by a thread that has exited."""
+        with self._condition:
+            idle = self._thread_available.pop(thread_id, None)
+            if not idle:
+                return
+            self._stats.current_available -= len(idle)
+            self._condition.notify_all()
+        for pooled in idle:
+            self._retire_backend(pooled)
+
+    # endregion
+
+    # region Maintenance
+
+    def _start_maintenance(self) -> None:
+        """Start the background maintenance thread, unless disabled."""
+        interval = self.config.maintenance_interval
+        if interval <= 0 or self._maintenance_thread is not None:
+            return
+        # The thread only holds a weak reference, so an unreferenced pool is
+        # still garbage collected and its maintenance thread then exits.
+        self._maintenance_thread = threading.Thread(
+            target=_maintenance_loop,
+            args=(weakref.ref(self), self._maintenance_stop, interval),
+            name=f"BackendPool-maintenance-{id(self):x}",
+            daemon=True,
+        )
+        self._maintenance_thread.start()
+
+    def run_maintenance(self) -> None:
+        """Run one pool maintenance pass.
+
+        Closes available connections that exceeded their lifetime, closes
+        connections idle for longer than ``idle_timeout`` (keeping at least
+        ``min_size`` connections), and creates connections until the pool holds
+        ``min_size`` again, so replacements are ready before the next acquire.
+
+        Called periodically by the background maintenance thread (every
+        ``maintenance_interval`` seconds); may also be called directly.
+
+        In thread-affine mode connections belong to the thread that created
+        them, so maintenance only reaps and does not refill.
+        """
+        missing = 0
+        with self._condition:
+            if self._closed:
+                return
+            self._stats.total_maintenance_runs += 1
+
+            if self._is_thread_affine:
+                reaped = []
+                for idle in self._thread_available.values():
+                    reaped.extend(self._reap_idle_connections(idle))
+            else:
+                reaped = self._reap_idle_connections(self._available)
+                missing = max(0, self.config.min_size - self._total_slots())
+                self._reserved += missing
+
+            self._detect_leaks()
+            self._condition.notify_all()
+
+        for pooled in reaped:
+            if self._is_persistent:
                 self._destroy_backend(pooled)
-                self._condition.notify()
+            else:
+                # Connections bound to another thread cannot be closed from here
+                self._retire_backend(pooled)
+        self._refill(missing)
+
+    def _detect_leaks(self) -> List[Dict[str, Any]]:
+        """Report in-use connections held longer than ``leak_detection_threshold`` (lock held)."""
+        return _detect_leaks(self._in_use.values(), self.config.leak_detection_threshold, self._stats)
+
+    def _reap_idle_connections(self, idle: deque) -> List[PooledBackend]:
+        """Remove expired and idle-timed-out connections from ``idle`` (lock held).
+
+        Returns:
+            The removed connections, still to be destroyed by the caller
+        """
+        reaped = []
+        for pooled in list(idle):
+            if pooled.is_expired(self.config.max_lifetime):
+                self._stats.total_expired_reaped += 1
+            elif (
+                self.config.idle_timeout > 0
+                and pooled.is_idle(self.config.idle_timeout)
+                and self._stats.current_total > self.config.min_size
+            ):
+                self._stats.total_idle_reaped += 1
+            else:
+                continue
+            idle.remove(pooled)
+            self._stats.current_available -= 1
+            reaped.append(pooled)
+        return reaped
+
+    def _refill(self, count: int) -> None:
+        """Create ``count`` connections for slots reserved by ``run_maintenance()``."""
+        for created in range(count):
+            try:
+                pooled = self._create_connected_backend(self._is_persistent)
+            except Exception as e:
+                logger.error(f"Failed to pre-warm backend during maintenance: {e}")
+                self._cancel_reservation(count - created)
                 return
 
-            # Return to pool for reuse
-            pooled.reset()
-            self._available.append(pooled)
-            self._stats.current_available += 1
+            with self._condition:
+                self._reserved -= 1
+                if not self._closed:
+                    self._available.append(pooled)
+                    self._stats.current_available += 1
+                    self._stats.total_prewarmed += 1
+                    self._condition.notify()
+                    continue
+            # Closed meanwhile
+            self._destroy_backend(pooled)
+            self._cancel_reservation(count - created - 1)
+            return
 
-            self._condition.notify()
+    # endregion
 
     def context(self) -> 'PoolContext':
         """Get pool context manager.
@@ -680,7 +1089,13 @@ class BackendPool:
                 pooled = self._available.popleft()
                 self._destroy_backend(pooled)
                 self._stats.current_available -= 1
+            for idle in self._thread_available.values():
+                while idle:
+                    self._retire_backend(idle.popleft())
+                    self._stats.current_available -= 1
+            self._thread_available.clear()
 
+            self._maintenance_stop.set()
             self._condition.notify_all()
 
     def get_stats(self) -> PoolStats:
@@ -700,21 +1115,35 @@ class BackendPool:
                 total_timeouts=self._stats.total_timeouts,
                 total_errors=self._stats.total_errors,
                 total_validation_failures=self._stats.total_validation_failures,
+                total_connects=self._stats.total_connects,
+                total_connects_avoided=self._stats.total_connects_avoided,
+                total_maintenance_runs=self._stats.total_maintenance_runs,
+                total_idle_reaped=self._stats.total_idle_reaped,
+                total_expired_reaped=self._stats.total_expired_reaped,
+                total_prewarmed=self._stats.total_prewarmed,
+                total_leaks_detected=self._stats.total_leaks_detected,
                 current_available=self._stats.current_available,
                 current_in_use=self._stats.current_in_use,
                 created_at=self._stats.created_at,
                 last_acquired_at=self._stats.last_acquired_at,
                 last_released_at=self._stats.last_released_at,
+                acquire_wait=self._stats.acquire_wait.copy(),
+                hold_time=self._stats.hold_time.copy(),
+                connect_time=self._stats.connect_time.copy(),
+                validation_time=self._stats.validation_time.copy(),
             )
 
     def health_check(self) -> Dict[str, Any]:
         """Health check.
 
-        Returns pool health status.
+        Returns pool health status, including latency percentiles and the
+        connections currently held longer than ``leak_detection_threshold``.
 
         Returns:
             Dictionary containing health status
         """
+        with self._lock:
+            leaks = self._detect_leaks()
         stats = self.get_stats()
         return {
             'healthy': not self._closed and stats.total_errors < stats.total_created,
@@ -726,7 +1155,15 @@ class BackendPool:
                 'in_use': stats.current_in_use,
                 'total': stats.current_total,
                 'errors': stats.total_errors,
-            }
+                'leaks_detected': stats.total_leaks_detected,
+            },
+            'latency': {
+                'acquire_wait': stats.acquire_wait.to_dict(),
+                'hold_time': stats.hold_time.to_dict(),
+                'connect_time': stats.connect_time.to_dict(),
+                'validation_time': stats.validation_time.to_dict(),
+            },
+            'leaks': leaks,
         }
 
     @property
@@ -755,6 +1192,33 @@ class BackendPool:
         )
 
 
+class _ThreadSentinel:
+    """Per-thread marker whose release signals that the thread has exited."""
+
+    __slots__ = ('__weakref__',)
+
+
+def _evict_thread(pool_ref: 'weakref.ref[BackendPool]', thread_id: int) -> None:
+    pool = pool_ref()
+    if pool is not None:
+        pool._evict_thread(thread_id)
+
+
+def _maintenance_loop(
+    pool_ref: 'weakref.ref[BackendPool]', stop: threading.Event, interval: float
+) -> None:
+    """Body of the maintenance thread: run maintenance until stopped or collected."""
+    while not stop.wait(interval):
+        pool = pool_ref()
+        if pool is None:
+            return
+        try:
+            pool.run_maintenance()
+        except Exception as e:
+            logger.error(f"Pool maintenance failed: {e}")
+        del pool
+
+
 class PoolContext:
     """Context manager for setting pool context.
 
@@ -0,0 +1,355 @@
+# src/rhosocial/activerecord/connection/routing.py
+"""
+Read/write routing for backend groups.
+
+A BackendGroup normally binds its models to exactly one backend. When the
+group is given reader endpoints as well, a router sits between the query
+layer and the backends:
+
+- ``ActiveQuery.all()`` / ``one()`` / aggregates / batch iteration go to a
+  reader picked by a pluggable balancer.
+- ``save()`` / ``delete()`` / bulk DML / ``for_update()`` queries and
+  everything inside a pool or transaction context go to the writer.
+- Reads are kept on the writer while the writer is inside a transaction,
+  and for ``sticky_window`` seconds after a write observed in the same
+  execution context (thread or asyncio task), so a request sees its own
+  writes even when replicas lag behind.
+
+Readers may be plain backends or connection pools. The query layer gets a
+single read proxy per router: statement building uses the writer's dialect
+(replicas run the same engine), and the reader is picked when a statement
+actually executes, so every read is routed and counted exactly once. Pooled
+readers are acquired and released around each statement.
+"""
+
+import itertools
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Sequence
+
+
+class ReplicaBalancer(ABC):
+    """
+    Strategy that picks the reader for the next read.
+
+    Subclasses implement ``choose()``; the router calls it with the list of
+    reader endpoints (never empty) and routes the read to the returned one.
+    """
+
+    @abstractmethod
+    def choose(self, replicas: Sequence['ReplicaEndpoint']) -> 'ReplicaEndpoint':
+        """Return the reader that serves the next read."""
+        pass
+
+
+class RoundRobinBalancer(ReplicaBalancer):
+    """Cycle through the readers in order."""
+
+    def __init__(self):
+        self._counter = itertools.count()
+
+    def choose(self, replicas: Sequence['ReplicaEndpoint']) -> 'ReplicaEndpoint':
+        return replicas[next(self._counter) % len(replicas)]
+
+
+class LeastInFlightBalancer(ReplicaBalancer):
+    """Pick the reader with the fewest reads currently running.
+
+    Ties go to the reader that has served the fewest reads overall, which
+    spreads sequential traffic instead of pinning it to the first reader.
+    """
+
+    def choose(self, replicas: Sequence['ReplicaEndpoint']) -> 'ReplicaEndpoint':
+        return min(replicas, key=lambda replica: (replica.in_flight, replica.reads))
+
+
+@dataclass
+class RouteStats:
+    """Counters describing where the router sent reads and writes."""
+
+    replica_reads: int = 0       # Reads served by a reader
+    writer_reads: int = 0        # Reads sent to the writer because no reader is configured
+    sticky_reads: int = 0        # Reads kept on the writer by a transaction or the sticky window
+    writes_observed: int = 0     # Writes seen on the writer backend
+    replica_errors: int = 0      # Reads that raised on a reader
+    replicas: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            'replica_reads': self.replica_reads,
+            'writer_reads': self.writer_reads,
+            'sticky_reads': self.sticky_reads,
+            'writes_observed': self.writes_observed,
+            'replica_errors': self.replica_errors,
+            'replicas': {name: dict(counters) for name, counters in self.replicas.items()},
+        }
+
+
+class ReplicaEndpoint:
+    """One reader (backend or pool) together with its routing counters."""
+
+    def __init__(self, name: str, target: Any):
+        self.name = name
+        self.target = target
+        self.is_pool = hasattr(target, 'acquire') and hasattr(target, 'release')
+        self.in_flight = 0
+        self.reads = 0
+        self.errors = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {'reads': self.reads, 'in_flight': self.in_flight, 'errors': self.errors}
+
+
+class _BaseRouter:
+    """State and routing decision shared by the sync and async routers."""
+
+    def __init__(
+        self,
+        writer: Any,
+        readers: Sequence[Any] = (),
+        balancer: Optional[ReplicaBalancer] = None,
+        sticky_window: float = 1.0,
+    ):
+        if sticky_window < 0:
+            raise ValueError("sticky_window must be >= 0")
+        self.writer = writer
+        self.balancer = balancer or RoundRobinBalancer()
+        self.sticky_window = sticky_window
+        self.replicas: List[ReplicaEndpoint] = [
+            ReplicaEndpoint(f"replica-{index}", reader) for index, reader in enumerate(readers)
+        ]
+        self._stats = RouteStats()
+        self._lock = threading.Lock()
+        # Per router, per execution context: monotonic deadline of the sticky window
+        self._sticky_until: ContextVar[float] = ContextVar(f'read_sticky_until_{id(self)}', default=0.0)
+        self._read_proxy = self._make_read_proxy()
+
+    def _make_read_proxy(self) -> Any:
+        raise NotImplementedError
+
+    def attach(self) -> None:
+        """Start observing writes executed on the writer backend."""
+        self.writer._write_observer = self.mark_write
+
+    def detach(self) -> None:
+        """Stop observing writes on the writer backend."""
+        if getattr(self.writer, '_write_observer', None) == self.mark_write:
+            self.writer._write_observer = None
+
+    def mark_write(self) -> None:
+        """Record a write in the current context and open the sticky window."""
+        with self._lock:
+            self._stats.writes_observed += 1
+        if self.sticky_window > 0:
+            self._sticky_until.set(time.monotonic() + self.sticky_window)
+
+    def is_sticky(self) -> bool:
+        """Whether reads in the current context must stay on the writer."""
+        if self.writer.in_transaction:
+            return True
+        until = self._sticky_until.get()
+        return until > 0.0 and time.monotonic() < until
+
+    def read_backend(self) -> Any:
+        """Backend handed to queries that only read."""
+        return self._read_proxy
+
+    def write_backend(self) -> Any:
+        """Backend writes should use."""
+        return self.writer
+
+    def get_stats(self) -> RouteStats:
+        """Snapshot of the routing counters."""
+        with self._lock:
+            return RouteStats(
+                replica_reads=self._stats.replica_reads,
+                writer_reads=self._stats.writer_reads,
+                sticky_reads=self._stats.sticky_reads,
+                writes_observed=self._stats.writes_observed,
+                replica_errors=self._stats.replica_errors,
+                replicas={replica.name: replica.to_dict() for replica in self.replicas},
+            )
+
+    def _begin_read(self) -> Optional[ReplicaEndpoint]:
+        """Pick the reader for a statement about to run; None means the writer."""
+        sticky = bool(self.replicas) and self.is_sticky()
+        with self._lock:
+            if not self.replicas:
+                self._stats.writer_reads += 1
+                return None
+            if sticky:
+                self._stats.sticky_reads += 1
+                return None
+            replica = self.balancer.choose(self.replicas)
+            replica.in_flight += 1
+            replica.reads += 1
+            self._stats.replica_reads += 1
+            return replica
+
+    def _end_read(self, replica: ReplicaEndpoint, failed: bool) -> None:
+        with self._lock:
+            replica.in_flight -= 1
+            if failed:
+                replica.errors += 1
+                self._stats.replica_errors += 1
+
+
+class ReadWriteRouter(_BaseRouter):
+    """
+    Routes reads of synchronous models to readers and writes to the writer.
+
+    Args:
+        writer: The group's primary backend
+        readers: Reader backends or BackendPool instances
+        balancer: Reader selection strategy (round robin by default)
+        sticky_window: Seconds reads stay on the writer after a write in the
+            same context; 0 keeps them there only inside transactions
+    """
+
+    def _make_read_proxy(self) -> 'ReadBackend':
+        return ReadBackend(self)
+
+    def _read(self, method: str, *args, **kwargs) -> Any:
+        replica = self._begin_read()
+        if replica is None:
+            return getattr(self.writer, method)(*args, **kwargs)
+        failed = True
+        try:
+            if replica.is_pool:
+                backend = replica.target.acquire()
+                try:
+                    result = getattr(backend, method)(*args, **kwargs)
+                finally:
+                    replica.target.release(backend)
+            else:
+                result = getattr(replica.target, method)(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            self._end_read(replica, failed)
+
+    def _read_batches(self, *args, **kwargs) -> Generator[Any, None, None]:
+        replica = self._begin_read()
+        if replica is None:
+            yield from self.writer.execute_batch_dql(*args, **kwargs)
+            return
+        failed = True
+        try:
+            if replica.is_pool:
+                backend = replica.target.acquire()
+                try:
+                    yield from backend.execute_batch_dql(*args, **kwargs)
+                finally:
+                    replica.target.release(backend)
+            else:
+                yield from replica.target.execute_batch_dql(*args, **kwargs)
+            failed = False
+        finally:
+            self._end_read(replica, failed)
+
+
+class AsyncReadWriteRouter(_BaseRouter):
+    """Async version of ReadWriteRouter, for async backends and AsyncBackendPool readers."""
+
+    def _make_read_proxy(self) -> 'AsyncReadBackend':
+        return AsyncReadBackend(self)
+
+    async def _read(self, method: str, *args, **kwargs) -> Any:
+        replica = self._begin_read()
+        if replica is None:
+            return await getattr(self.writer, method)(*args, **kwargs)
+        failed = True
+        try:
+            if replica.is_pool:
+                backend = await replica.target.acquire()
+                try:
+                    result = await getattr(backend, method)(*args, **kwargs)
+                finally:
+                    await replica.target.release(backend)
+            else:
+                result = await getattr(replica.target, method)(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            self._end_read(replica, failed)
+
+    async def _read_batches(self, *args, **kwargs) -> AsyncGenerator[Any, None]:
+        replica = self._begin_read()
+        if replica is None:
+            async for batch in self.writer.execute_batch_dql(*args, **kwargs):
+                yield batch
+            return
+        failed = True
+        try:
+            if replica.is_pool:
+                backend = await replica.target.acquire()
+                try:
+                    async for batch in backend.execute_batch_dql(*args, **kwargs):
+                        yield batch
+                finally:
+                    await replica.target.release(backend)
+            else:
+                async for batch in replica.target.execute_batch_dql(*args, **kwargs):
+                    yield batch
+            failed = False
+        finally:
+            self._end_read(replica, failed)
+
+
+class ReadBackend:
+    """
+    Backend stand-in handed to read-only queries.
+
+    The read methods used by ActiveQuery are routed per statement; every
+    other attribute (dialect, config, type adapters) comes from the writer.
+    """
+
+    def __init__(self, router: ReadWriteRouter):
+        self._router = router
+
+    def execute(self, *args, **kwargs) -> Any:
+        return self._router._read('execute', *args, **kwargs)
+
+    def fetch_all(self, *args, **kwargs) -> Any:
+        return self._router._read('fetch_all', *args, **kwargs)
+
+    def fetch_one(self, *args, **kwargs) -> Any:
+        return self._router._read('fetch_one', *args, **kwargs)
+
+    def fetch_tuples(self, *args, **kwargs) -> Any:
+        return self._router._read('fetch_tuples', *args, **kwargs)
+
+    def execute_batch_dql(self, *args, **kwargs) -> Generator[Any, None, None]:
+        return self._router._read_batches(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._router.writer, name)
+
+
+class AsyncReadBackend:
+    """Async version of ReadBackend."""
+
+    def __init__(self, router: AsyncReadWriteRouter):
+        self._router = router
+
+    async def execute(self, *args, **kwargs) -> Any:
+        return await self._router._read('execute', *args, **kwargs)
+
+    async def fetch_all(self, *args, **kwargs) -> Any:
+        return await self._router._read('fetch_all', *args, **kwargs)
+
+    async def fetch_one(self, *args, **kwargs) -> Any:
+        return await self._router._read('fetch_one', *args, **kwargs)
+
+    async def fetch_tuples(self, *args, **kwargs) -> Any:
+        return await self._router._read('fetch_tuples', *args, **kwargs)
+
+    def execute_batch_dql(self, *args, **kwargs) -> AsyncGenerator[Any, None]:
+        return self._router._read_batches(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._router.writer, name)
@@ -5,7 +5,13 @@ Core ActiveRecord model interface definition.
 
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextvars import ContextVar
 from copy import deepcopy
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
 from pydantic import BaseModel
 from typing import Any, Dict, ClassVar, Optional, Type, Set, Union, List, Callable
 
@@ -14,6 +20,23 @@ from ..backend.base import StorageBackend, AsyncStorageBackend
 from ..backend.config import ConnectionConfig
 from ..backend.errors import DatabaseError, RecordNotFound
 
+# Set by construct_from_database() around a single ``cls(**row)`` call. __init__
+# clears it as soon as it is read, so models built inside mixin or user
+# __init__ methods are validated as usual.
+_trusted_construction: ContextVar[bool] = ContextVar("_trusted_construction", default=False)
+
+# Values of these types cannot be changed in place, so change tracking keeps
+# them by reference instead of copying them.
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, Decimal,
+                    datetime, date, time, timedelta, UUID, Enum, frozenset)
+
+
+def _detached_value(value: Any) -> Any:
+    """Return ``value`` itself if it is immutable, otherwise a deep copy."""
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    return deepcopy(value)
+
 
 class ActiveRecordBase(BaseModel, ABC):
     """Base class for ActiveRecord models (Sync and Async).
@@ -31,11 +54,17 @@ class ActiveRecordBase(BaseModel, ABC):
         __backend__ (StorageBackend): Database storage backend
         __backend_class__ (Type[StorageBackend]): Backend implementation class
         __connection_config__ (ConnectionConfig): Connection configuration
+        __read_router__: Router sending ActiveQuery reads to read replicas;
+            set by a BackendGroup configured with readers
         __logger__ (Logger): Logger instance
         __column_types_cache__ (Dict[str, Any]): Column type cache
         _dirty_fields (Set[str]): Set of modified field names
         __no_track_fields__ (Set[str]): Fields excluded from change tracking
-        _original_values (Dict): Original field values before modification
+        _original_values (Dict): Values of the modified fields before their first
+            change since the last ``reset_tracking()``
+        __trusted_hydration__ (bool): Build rows loaded from the database without
+            Pydantic validation (see ``construct_from_database``). Off by default;
+            ``ActiveQuery.trusted()`` overrides it per query.
     """
 
     __table_name__: ClassVar[Optional[str]] = None
@@ -44,17 +73,76 @@ class ActiveRecordBase(BaseModel, ABC):
     __backend__: Optional[Union[StorageBackend, AsyncStorageBackend]] = None
     __backend_class__: ClassVar[Type[Union[StorageBackend, AsyncStorageBackend]]] = None
     __connection_config__: ClassVar[Optional[ConnectionConfig]] = None
+    __read_router__: ClassVar[Optional[Any]] = None
     __logger__: ClassVar[Optional[logging.Logger]] = None  # Uses global logging config by default
+    __trusted_hydration__: ClassVar[bool] = False
 
     def __init__(self, **data):
         """Initialize ActiveRecord instance."""
-        super().__init__(**data)
-        self._dirty_fields = set()
-        self._original_values = {}
-        self.reset_tracking()
-        # Initialize instance event handlers
-        self._is_from_db = False
-        self._event_handlers = {event: [] for event in ModelEvent}
+        if _trusted_construction.get():
+            _trusted_construction.set(False)
+            self._construct_fields(data)
+        else:
+            super().__init__(**data)
+        # Bookkeeping attributes are not model fields, so they are set directly
+        # instead of going through the change-tracking __setattr__.
+        object.__setattr__(self, "_dirty_fields", set())
+        object.__setattr__(self, "_original_values", {})
+        object.__setattr__(self, "_is_from_db", False)
+        # Allocated by on() when the first handler is registered
+        object.__setattr__(self, "_event_handlers", None)
+
+    def _construct_fields(self, data: Dict[str, Any]) -> None:
+        """Populate the model fields from ``data`` without validation.
+
+        Equivalent to ``model_construct()`` for data keyed by field name: missing
+        optional fields get their defaults, unknown keys are dropped unless the
+        model allows extra fields.
+        """
+        cls = self.__class__
+        fields = cls.__pydantic_fields__
+        values = {name: data[name] for name in fields if name in data}
+        fields_set = set(values)
+        if len(values) < len(fields):
+            # Fill in defaults, keeping the fields in declaration order
+            provided, values = values, {}
+            for name, field in fields.items():
+                if name in provided:
+                    values[name] = provided[name]
+                elif not field.is_required():
+                    values[name] = field.get_default(call_default_factory=True, validated_data=values)
+        extra = None
+        if len(data) > len(fields_set) and cls.model_config.get("extra") == "allow":
+            extra = {key: value for key, value in data.items() if key not in fields}
+        object.__setattr__(self, "__dict__", values)
+        object.__setattr__(self, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(self, "__pydantic_extra__", extra)
+        object.__setattr__(self, "__pydantic_private__", None)
+        if cls.__pydantic_post_init__:
+            self.model_post_init(None)
+
+    @classmethod
+    def construct_from_database(cls, row: Dict[str, Any]) -> "ActiveRecordBase":
+        """Build an instance from a database row without Pydantic validation.
+
+        Only for rows whose values already have the field types, i.e. rows that
+        went through the model's column adapters and ``_map_columns_to_fields()``.
+        Mixin ``__init__`` methods still run, and event handler storage is only
+        allocated when a handler is registered.
+
+        Args:
+            row: Field values keyed by field name
+
+        Returns:
+            Instance marked as loaded from the database
+        """
+        token = _trusted_construction.set(True)
+        try:
+            instance = cls(**row)
+        finally:
+            _trusted_construction.reset(token)
+        object.__setattr__(instance, "_is_from_db", True)
+        return instance
 
     def __init_subclass__(cls) -> None:
         """Initialize subclass by merging all non-tracking fields."""
@@ -203,19 +291,23 @@ class ActiveRecordBase(BaseModel, ABC):
 
     def on(self, event: ModelEvent, handler: Callable) -> None:
         """Register event handler (instance level)"""
-        if not hasattr(self, "_event_handlers"):
-            self._event_handlers = {event: [] for event in ModelEvent}
-        self._event_handlers[event].append(handler)
+        handlers = getattr(self, "_event_handlers", None)
+        if handlers is None:
+            handlers = defaultdict(list)
+            object.__setattr__(self, "_event_handlers", handlers)
+        handlers[event].append(handler)
 
     def off(self, event: ModelEvent, handler: Callable) -> None:
         """Remove event handler (instance level)"""
-        if hasattr(self, "_event_handlers") and handler in self._event_handlers[event]:
-            self._event_handlers[event].remove(handler)
+        handlers = getattr(self, "_event_handlers", None)
+        if handlers and handler in handlers.get(event, ()):
+            handlers[event].remove(handler)
 
     def _trigger_event(self, event: ModelEvent, **kwargs) -> None:
         """Trigger event (instance level)"""
-        if hasattr(self, "_event_handlers"):
-            for handler in self._event_handlers[event]:
+        handlers = getattr(self, "_event_handlers", None)
+        if handlers:
+            for handler in handlers.get(event, ()):
                 handler(self, **kwargs)
 
     def _prepare_save_data(self) -> Dict[str, Any]:
@@ -295,22 +387,35 @@ class ActiveRecordBase(BaseModel, ABC):
         return pk_value is None or not self._is_from_db
 
     def __setattr__(self, name: str, value: Any):
-        """Overridden to track field changes."""
-        if (
-            name in self.__class__.model_fields
-            and hasattr(self, "_original_values")
-            and name not in self.__class__.__no_track_fields__
-        ):
-            if name not in self._original_values:
-                self._original_values[name] = getattr(self, name, None)
-            if value != self._original_values[name]:
-                self._dirty_fields.add(name)
+        """Overridden to track field changes.
+
+        The original value of a field is recorded when it is first changed
+        (copy-on-write): immutable values are kept by reference, anything else
+        is deep-copied so later in-place changes cannot alter it.
+
+        Re-assigning the object a mutable field already holds (e.g. after
+        changing a dict in place) always counts as a change: no copy was
+        taken before the in-place change, so there is nothing to compare
+        against. The recorded original is then the already changed value.
+        """
+        cls = self.__class__
+        if name in cls.__pydantic_fields__ and name not in cls.__no_track_fields__:
+            original_values = self.__dict__.get("_original_values")
+            if original_values is not None:
+                if name in original_values:
+                    if value != original_values[name]:
+                        self._dirty_fields.add(name)
+                else:
+                    current = getattr(self, name, None)
+                    if value != current or (value is current and not isinstance(value, _IMMUTABLE_TYPES)):
+                        original_values[name] = _detached_value(current)
+                        self._dirty_fields.add(name)
         super().__setattr__(name, value)
 
     def reset_tracking(self):
-        """Reset change tracking state by clearing dirty fields and storing current values."""
+        """Reset change tracking state: the current values become the originals."""
         self._dirty_fields.clear()
-        self._original_values = self.model_dump()
+        object.__setattr__(self, "_original_values", {})
 
     @property
     def is_dirty(self) -> bool:
@@ -323,8 +428,16 @@ class ActiveRecordBase(BaseModel, ABC):
         return self._dirty_fields.copy()
 
     def get_old_attribute(self, field_name: str) -> Optional[Any]:
-        """Get old attribute value."""
-        return deepcopy(self._original_values[field_name])
+        """Get the value a field had before its first change since the last reset.
+
+        Raises:
+            KeyError: If ``field_name`` is not a model field
+        """
+        if field_name in self._original_values:
+            return _detached_value(self._original_values[field_name])
+        if field_name not in self.__class__.__pydantic_fields__:
+            raise KeyError(field_name)
+        return _detached_value(getattr(self, field_name))
 
     @property
     def is_from_db(self) -> bool:
@@ -348,6 +461,8 @@ class IActiveRecord(ActiveRecordBase):
         __backend__ (StorageBackend): Database storage backend
         __backend_class__ (Type[StorageBackend]): Backend implementation class
         __connection_config__ (ConnectionConfig): Connection configuration
+        __read_router__: Router sending ActiveQuery reads to read replicas;
+            set by a BackendGroup configured with readers
         __logger__ (Logger): Logger instance
         __column_types_cache__ (Dict[str, Any]): Column type cache
         _dirty_fields (Set[str]): Set of modified field names
@@ -568,6 +683,8 @@ class IAsyncActiveRecord(ActiveRecordBase):
         __backend__ (AsyncStorageBackend): Asynchronous database storage backend
         __backend_class__ (Type[AsyncStorageBackend]): Backend implementation class
         __connection_config__ (ConnectionConfig): Connection configuration
+        __read_router__: Router sending ActiveQuery reads to read replicas;
+            set by a BackendGroup configured with readers
         __logger__ (Logger): Logger instance
         __column_types_cache__ (Dict[str, Any]): Column type cache
         _dirty_fields (Set[str]): Set of modified field names
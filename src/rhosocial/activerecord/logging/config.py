@@ -117,12 +117,18 @@ class LoggingConfig:
     # Cached summarizers for specific loggers (by logger name)
     _logger_summarizers: Dict[str, DataSummarizer] = field(default_factory=dict, repr=False, compare=False)
 
+    # Loggers already configured by get_logger() (by logger name)
+    _configured_loggers: Dict[str, logging.Logger] = field(default_factory=dict, repr=False, compare=False)
+
     def __setattr__(self, name: str, value: Any) -> None:
-        """Override setattr to invalidate cached summarizers when config changes."""
+        """Override setattr to invalidate cached summarizers and loggers when config changes."""
         if name == 'summarizer_config':
             # Clear cached summarizers when summarizer_config is updated
             object.__setattr__(self, '_summarizer', None)
             object.__setattr__(self, '_logger_summarizers', {})
+        if not name.startswith('_'):
+            # Re-apply level, propagation and handlers on the next get_logger()
+            object.__setattr__(self, '_configured_loggers', {})
         object.__setattr__(self, name, value)
 
     def get_summarizer(self, logger_name: Optional[str] = None) -> DataSummarizer:
@@ -237,31 +243,43 @@ class LoggingConfig:
         by default (propagate=False), preventing ActiveRecord logs from
         appearing in user's root logger handlers unless explicitly configured.
 
+        Loggers are configured once and cached until a setting of this
+        configuration changes, so repeated calls on the logging hot path are a
+        dictionary lookup.
+
         Args:
             name: The name of the logger to create/get.
 
         Returns:
             Configured logging.Logger instance.
         """
+        logger = self._configured_loggers.get(name)
+        if logger is not None:
+            return logger
+
         logger = logging.getLogger(name)
-        logger.setLevel(self.default_level)
-        logger.propagate = self.propagate
+        level = self.default_level
+        propagate = self.propagate
 
         # Check if there's a specific config for this logger
-        if name in self.loggers:
-            config = self.loggers[name]
-            logger.setLevel(config.level)
-            logger.propagate = config.propagate
+        config = self.loggers.get(name)
+        if config is not None:
+            level = config.level
+            propagate = config.propagate
             for handler in config.handlers:
                 if handler not in logger.handlers:
                     logger.addHandler(handler)
 
+        logger.setLevel(level)
+        logger.propagate = propagate
+
         # Auto-setup handler if enabled and no handlers exist
         if self.auto_setup and not logger.handlers:
             handler = logging.StreamHandler()
             handler.setFormatter(self.formatter)
             logger.addHandler(handler)
 
+        self._configured_loggers[name] = logger
         return logger
 
     def add_logger_config(self, config: LoggerConfig) -> None:
@@ -271,3 +289,4 @@ class LoggingConfig:
             config: LoggerConfig instance to add.
         """
         self.loggers[config.name] = config
+        self._configured_loggers.clear()
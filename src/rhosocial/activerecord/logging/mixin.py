@@ -5,12 +5,40 @@ This module provides mixin classes that add logging functionality
 to ActiveRecord models and backend implementations.
 """
 
-import inspect
 import logging
+import sys
+from functools import lru_cache
 from typing import Optional, ClassVar, Any
 
 from .formatter import ActiveRecordFormatter
-from .manager import get_logging_manager
+from .manager import LoggingManager, get_logging_manager
+
+_LIBRARY_MODULE_PREFIX = "rhosocial.activerecord"
+
+
+@lru_cache(maxsize=None)
+def _is_library_module(module_name: str) -> bool:
+    """Return whether a module belongs to the library (cached per module name)."""
+    return module_name.startswith(_LIBRARY_MODULE_PREFIX)
+
+
+def _resolve_stacklevel() -> int:
+    """Compute the stacklevel that attributes a record to the first caller outside the library.
+
+    Must be called directly from a ``log()`` method: the walk starts at the
+    frame that called ``log()`` and skips every library frame above it.
+
+    Returns:
+        int: The ``stacklevel`` to pass to the logger call made from ``log()``.
+    """
+    frame = sys._getframe(2)
+    stack_level = 1
+    while frame is not None and _is_library_module(frame.f_globals.get("__name__", "")):
+        frame = frame.f_back
+        stack_level += 1
+    if frame is not None:
+        stack_level += 1
+    return stack_level
 
 
 class LoggingMixin:
@@ -91,8 +119,7 @@ class LoggingMixin:
         module = cls.__module__
         if module.startswith('rhosocial.activerecord'):
             # Library class: use semantic naming
-            base_name = get_logging_manager().LOGGER_MODEL
-            return f"{base_name}.{cls.__name__}"
+            return f"{LoggingManager.LOGGER_MODEL}.{cls.__name__}"
         else:
             # User-defined class: use user module namespace
             return f"{module}.{cls.__name__}"
@@ -145,10 +172,31 @@ class LoggingMixin:
         # If no handlers, the manager will add one with the correct formatter
         # when the first log is written (if auto_setup is enabled)
 
+    @classmethod
+    def is_log_enabled(cls, level: int) -> bool:
+        """Check whether a message at ``level`` would be processed by the class logger.
+
+        Use this to guard log calls whose arguments are expensive to compute.
+
+        Args:
+            level: Log level (e.g., logging.DEBUG, logging.INFO).
+
+        Returns:
+            bool: True if the logger is enabled for ``level``.
+        """
+        logger = cls.get_logger()
+        return logger is not None and logger.isEnabledFor(level)
+
     @classmethod
     def log(cls, level: int, msg: str, *args, **kwargs) -> None:
         """Log a message at the specified level.
 
+        The level is checked before anything else, so a disabled call costs
+        one logger lookup: the stack is not inspected and the message is not
+        formatted. Pass values as %-style ``args`` rather than building an
+        f-string, so that formatting is also deferred until a handler emits
+        the record.
+
         This method calculates the correct stack level so that log messages
         show the actual source location (caller's file and line number).
 
@@ -163,25 +211,11 @@ class LoggingMixin:
             for deeply nested calls.
         """
         logger = cls.get_logger()
-        if logger is None:
+        if logger is None or not logger.isEnabledFor(level):
             return
 
         # Calculate stack level for correct source attribution
-        current_frame = inspect.currentframe()
-        if current_frame is not None:
-            current_frame = current_frame.f_back
-
-        stack_level = 1
-        while current_frame:
-            frame_name = current_frame.f_globals.get("__name__", "")
-            # Skip internal frames (ActiveRecord modules)
-            if not frame_name.startswith("rhosocial.activerecord"):
-                break
-            current_frame = current_frame.f_back
-            stack_level += 1
-
-        if current_frame:
-            stack_level += 1
+        stack_level = _resolve_stacklevel()
 
         # Allow custom offset for edge cases
         if "offset" in kwargs:
@@ -240,10 +274,12 @@ class LoggingMixin:
             # Full data (use with caution)
             self.log_data(logging.DEBUG, "Full data", data, mode='full')
         """
+        if not cls.is_log_enabled(level):
+            return
         manager = get_logging_manager()
         logger_name = cls._get_logger_name()
         summarized = manager.config.summarize_data(data, mode, logger_name)
-        cls.log(level, f"{msg}: {summarized}", **kwargs)
+        cls.log(level, "%s: %s", msg, summarized, **kwargs)
 
     @classmethod
     def log_data_keys_only(cls, level: int, msg: str, data: Any, **kwargs) -> None:
@@ -291,7 +327,7 @@ class BackendLoggingMixin:
     Usage:
         class MyBackend(BackendLoggingMixin, StorageBackend):
             def execute(self, query):
-                self.log(logging.DEBUG, f"Executing: {query}")
+                self.log(logging.DEBUG, "Executing: %s", query)
     """
 
     _logger: Optional[logging.Logger] = None
@@ -349,31 +385,33 @@ class BackendLoggingMixin:
             raise ValueError("logger must be an instance of logging.Logger")
         self._logger = value
 
+    def is_log_enabled(self, level: int) -> bool:
+        """Check whether a message at ``level`` would be processed by the backend logger.
+
+        Args:
+            level: Log level (e.g., logging.DEBUG, logging.INFO).
+
+        Returns:
+            bool: True if the logger is enabled for ``level``.
+        """
+        return self.logger.isEnabledFor(level)
+
     def log(self, level: int, msg: str, *args, **kwargs) -> None:
         """Log a message at the specified level.
 
+        Disabled levels return before the stack is inspected; pass values as
+        %-style ``args`` so the message is only formatted when emitted.
+
         Args:
             level: Log level (e.g., logging.DEBUG, logging.INFO).
             msg: Log message format string.
             *args: Additional arguments for message formatting.
             **kwargs: Additional keyword arguments for logging.
         """
-        current_frame = inspect.currentframe()
-        if current_frame is not None:
-            current_frame = current_frame.f_back
-
-        stack_level = 1
-        while current_frame:
-            frame_name = current_frame.f_globals.get("__name__", "")
-            if not frame_name.startswith("rhosocial.activerecord"):
-                break
-            current_frame = current_frame.f_back
-            stack_level += 1
-
-        if current_frame:
-            stack_level += 1
-
-        self.logger.log(level, msg, *args, stacklevel=stack_level, **kwargs)
+        logger = self.logger
+        if not logger.isEnabledFor(level):
+            return
+        logger.log(level, msg, *args, stacklevel=_resolve_stacklevel(), **kwargs)
 
     def log_data(
         self,
@@ -403,10 +441,12 @@ class BackendLoggingMixin:
             # INFO level: show only field names
             self.log_data(logging.INFO, "Executing query", params, mode='keys_only')
         """
+        if not self.is_log_enabled(level):
+            return
         manager = get_logging_manager()
         logger_name = self._get_logger_name()
         summarized = manager.config.summarize_data(data, mode, logger_name)
-        self.log(level, f"{msg}: {summarized}", **kwargs)
+        self.log(level, "%s: %s", msg, summarized, **kwargs)
 
     def log_data_keys_only(self, level: int, msg: str, data: Any, **kwargs) -> None:
         """Convenience method to log data with keys_only mode."""
@@ -6,6 +6,8 @@ from .base import (
     AsyncBaseActiveRecord,
     QueryMixin,
     AsyncQueryMixin,
+    BulkPersistenceMixin,
+    AsyncBulkPersistenceMixin,
     ColumnNameMixin,
     FieldAdapterMixin,
     MetaclassMixin,
@@ -17,6 +19,7 @@ class ActiveRecord(
     RelationManagementMixin,
     # FieldMixin, # import when needed
     QueryMixin,
+    BulkPersistenceMixin,
     ColumnNameMixin,  # Added ColumnNameMixin here
     FieldAdapterMixin,
     MetaclassMixin,
@@ -29,6 +32,7 @@ class ActiveRecord(
     - BaseActiveRecord: Core CRUD operations
     - RelationManagementMixin: Relationship handling
     - QueryMixin: Synchronous query builder
+    - BulkPersistenceMixin: Bulk insert_many/upsert_many/save_all
     - ColumnNameMixin: Column name handling and quoting
     - FieldAdapterMixin: Field-specific type adapter support
     - MetaclassMixin: Metaclass-based model building support
@@ -40,6 +44,7 @@ class ActiveRecord(
 class AsyncActiveRecord(
     RelationManagementMixin,
     AsyncQueryMixin,
+    AsyncBulkPersistenceMixin,
     ColumnNameMixin,
     FieldAdapterMixin,
     MetaclassMixin,
@@ -52,6 +57,7 @@ class AsyncActiveRecord(
     - AsyncBaseActiveRecord: Async core CRUD operations
     - RelationManagementMixin: Relationship handling
     - AsyncQueryMixin: Asynchronous query builder
+    - AsyncBulkPersistenceMixin: Async bulk insert_many/upsert_many/save_all
     - ColumnNameMixin: Column name handling and quoting
     - FieldAdapterMixin: Field-specific type adapter support
     - MetaclassMixin: Metaclass-based model building support
@@ -9,8 +9,13 @@ from .aggregate import AggregateQueryMixin, AsyncAggregateQueryMixin
 from .join import JoinQueryMixin
 from .async_join import AsyncJoinQueryMixin
 from .range import RangeQueryMixin
+from .batch import BatchQueryMixin, AsyncBatchQueryMixin
+from .bulk_dml import BulkDMLQueryMixin, AsyncBulkDMLQueryMixin
+from .projection import ProjectionQueryMixin, AsyncProjectionQueryMixin
 from .relational import RelationalQueryMixin, InvalidRelationPathError, RelationNotFoundError
 from .set_operation import SetOperationQuery
+from .prepared import PreparedQuery, AsyncPreparedQuery
+from .eager_loading import EagerLoader, AsyncEagerLoader
 
 __all__ = [
     "ActiveQuery",
@@ -18,6 +23,10 @@ __all__ = [
     "CTEQuery",
     "AsyncCTEQuery",
     "SetOperationQuery",
+    "PreparedQuery",
+    "AsyncPreparedQuery",
+    "EagerLoader",
+    "AsyncEagerLoader",
     # Query Mixins
     "BaseQueryMixin",
     "AggregateQueryMixin",
@@ -25,6 +34,12 @@ __all__ = [
     "JoinQueryMixin",
     "AsyncJoinQueryMixin",
     "RangeQueryMixin",
+    "BatchQueryMixin",
+    "AsyncBatchQueryMixin",
+    "BulkDMLQueryMixin",
+    "AsyncBulkDMLQueryMixin",
+    "ProjectionQueryMixin",
+    "AsyncProjectionQueryMixin",
     "RelationalQueryMixin",
     "InvalidRelationPathError",
     "RelationNotFoundError",
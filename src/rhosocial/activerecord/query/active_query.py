@@ -10,9 +10,21 @@ from .join import JoinQueryMixin
 from .range import RangeQueryMixin
 from .relational import RelationalQueryMixin
 from .async_join import AsyncJoinQueryMixin
+from .batch import BatchQueryMixin, AsyncBatchQueryMixin
+from .bulk_dml import BulkDMLQueryMixin, AsyncBulkDMLQueryMixin
+from .eager_loading import EagerLoader, AsyncEagerLoader
+from .prepared import PreparedQuery, AsyncPreparedQuery
+from .projection import ProjectionQueryMixin, AsyncProjectionQueryMixin
 from .set_operation import SetOperationQuery
 from ..backend.base import StorageBackend, AsyncStorageBackend
-from ..backend.expression import WildcardExpression, TableExpression, statements, LimitOffsetClause, bases
+from ..backend.expression import (
+    WildcardExpression,
+    TableExpression,
+    statements,
+    LimitOffsetClause,
+    bases,
+    PreparedStatement,
+)
 from ..interface.model import IActiveRecord, IAsyncActiveRecord
 from ..interface.query import (
     IQuery,
@@ -31,6 +43,9 @@ class ActiveQuery(
     JoinQueryMixin,
     RelationalQueryMixin,
     RangeQueryMixin,
+    BatchQueryMixin,
+    BulkDMLQueryMixin,
+    ProjectionQueryMixin,
     IActiveQuery,
     ISetOperationQuery,
 ):
@@ -82,12 +97,17 @@ class ActiveQuery(
         # Initialize attributes from RelationalQueryMixin
         self._eager_loads = ThreadSafeDict()
 
+        # None defers to the model's __trusted_hydration__ setting
+        self._trusted_hydration = None
+
     def backend(self) -> StorageBackend:
         """Get the backend for this query with context awareness.
 
         Returns the appropriate backend:
         1. Sync context backend if available
-        2. Model class backend as fallback
+        2. A reader picked by the model's read router, unless the query
+           locks rows with for_update()
+        3. Model class backend as fallback
         """
         from ..connection.pool import get_current_backend
 
@@ -96,6 +116,10 @@ class ActiveQuery(
         if context_backend is not None:
             return context_backend
 
+        router = self.model_class.__read_router__
+        if router is not None and self._for_update_clause is None:
+            return router.read_backend()
+
         # Fallback to model class backend
         return self.model_class.backend()
 
@@ -106,6 +130,10 @@ class ActiveQuery(
         representing all matching records. The returned list will be empty if
         no records match the query conditions.
 
+        Relations configured with ``with_()`` are loaded right after the primary
+        query, with one batched query per relation path (nested paths included),
+        and cached on the returned instances.
+
         Note: Calling .explain() before .all() has no effect. To get execution plans,
         use .explain() with .aggregate() instead: User.query().explain().aggregate()
 
@@ -125,19 +153,23 @@ class ActiveQuery(
         # Get SQL and parameters
         sql, params = self.to_sql()
 
-        self._log(logging.INFO, f"Executing query: {sql}, parameters: {params}")
+        self._log(logging.INFO, "Executing query: %s, parameters: %s", sql, params)
 
         # Step 1: Get column adapters for processing output (DB -> Python).
         # This map specifies how database results should be converted back to Python objects.
         column_adapters = self.model_class.get_column_adapters()
-        self._log(logging.DEBUG, f"Column adapters map: {column_adapters}")
+        self._log(logging.DEBUG, "Column adapters map: %s", column_adapters)
 
         # Step 2: Fetch all records, passing the column adapters to the backend.
         rows = self.backend().fetch_all(sql, params, column_adapters=column_adapters)
 
         # Convert database column names back to Python field names before creating model instances
-        field_data_rows = [self.model_class._map_columns_to_fields(row) for row in rows]
-        records = [self.model_class.create_from_database(field_data) for field_data in field_data_rows]
+        model_class = self.model_class
+        trusted = self._trusted_hydration
+        records = [model_class.create_from_database(model_class._map_columns_to_fields(row), trusted) for row in rows]
+
+        # Step 3: Execute with_() eager loads for the whole result at once.
+        self._load_eager_relations(records)
 
         return records
 
@@ -194,12 +226,12 @@ class ActiveQuery(
         # Generate SQL using the temporary QueryExpression
         sql, params = query_expr.to_sql()
 
-        self._log(logging.INFO, f"Executing query: {sql}, parameters: {params}")
+        self._log(logging.INFO, "Executing query: %s, parameters: %s", sql, params)
 
         # Step 1: Get column adapters for processing output (DB -> Python).
         # This map specifies how database results should be converted back to Python objects.
         column_adapters = self.model_class.get_column_adapters()
-        self._log(logging.DEBUG, f"Column adapters map: {column_adapters}")
+        self._log(logging.DEBUG, "Column adapters map: %s", column_adapters)
 
         # Step 2: Fetch a single record, passing the column adapters to the backend.
         row = self.backend().fetch_one(sql, params, column_adapters=column_adapters)
@@ -209,7 +241,9 @@ class ActiveQuery(
 
         # Convert database column names back to Python field names before creating model instance
         field_data = self.model_class._map_columns_to_fields(row)
-        record = self.model_class.create_from_database(field_data)
+        record = self.model_class.create_from_database(field_data, self._trusted_hydration)
+
+        self._load_eager_relations([record])
 
         return record
 
@@ -222,27 +256,53 @@ class ActiveQuery(
         Returns:
             Tuple of (SQL string, parameters tuple)
         """
-        # Get dialect from backend
-        dialect = self.backend().dialect
+        # Generate SQL using a QueryExpression over the model's actual table name
+        return self._build_query_expression().to_sql()
 
-        # Use the model's actual table name
-        from_clause = TableExpression(dialect, self.model_class.table_name(),
-                                      schema_name=self.model_class.schema_name())
+    def prepare(self) -> "PreparedQuery":
+        """Compile this query once into a reusable template.
 
-        # Create QueryExpression with all components
-        query_expr = statements.QueryExpression(
-            dialect,
-            select=self.select_columns or [WildcardExpression(dialect)],  # Default to SELECT *
-            from_=self.join_clause if self.join_clause else from_clause,
-            where=self.where_clause,
-            group_by_having=self.group_by_having_clause,
-            order_by=self.order_by_clause,
-            limit_offset=self.limit_offset_clause,
-            for_update=self._for_update_clause,
-        )
+        Values that are only known at execution time are written as ``Param``
+        placeholders anywhere a value is accepted (``where()``, ``in_list()``,
+        ``limit()``/``offset()``, raw SQL parameters). The SQL is generated and
+        the column adapters are resolved here; each execution only binds the
+        parameter values.
 
-        # Generate SQL using the QueryExpression
-        return query_expr.to_sql()
+        Returns:
+            PreparedQuery: The compiled query
+
+        Examples:
+            by_email = User.query().where(User.c.email == Param("email")).limit(1).prepare()
+            user = by_email.one(email="alice@example.com")
+
+            page = User.query().order_by(User.c.id).limit(Param("size", default=20)).prepare()
+            users = page.execute(size=50)
+        """
+        return PreparedQuery(self, PreparedStatement(*self.to_sql()))
+
+    def trusted(self, enabled: bool = True):
+        """Build the results without Pydantic validation.
+
+        Rows are converted by the model's column adapters, so their values
+        already have the field types; validating them again costs more than
+        the query on large results. Trusted instances are built by
+        ``construct_from_database()``: field values are taken as they come
+        from the database and model validators do not run. Saving or
+        validating an instance later works as usual.
+
+        Overrides the model's ``__trusted_hydration__`` setting for this query.
+
+        Args:
+            enabled: False forces validation even if the model is trusted.
+
+        Returns:
+            Query instance for method chaining
+
+        Example:
+            rows = User.query().where(User.c.status == 'active').trusted().all()
+        """
+        self._trusted_hydration = enabled
+        return self
 
     def union(self, other: "IQuery") -> "SetOperationQuery":
         """Perform a UNION operation with another query.
@@ -283,6 +343,19 @@ class ActiveQuery(
 
         return SetOperationQuery(self, other, "EXCEPT")
 
+    def _load_eager_relations(self, records: List[IActiveRecord]) -> None:
+        """Load the relations configured with ``with_()`` into the caches of ``records``.
+
+        One batched query is issued per configured relation path, whatever the
+        number of records.
+        """
+        if records and self._eager_loads:
+            EagerLoader(self.get_relation_configs()).load(records)
+
+    def _is_log_enabled(self, level: int) -> bool:
+        """Check whether the model's logger is enabled for ``level``."""
+        return self.model_class is not None and self.model_class.is_log_enabled(level)
+
     def _log(self, level: int, msg: str, *args, **kwargs) -> None:
         """Log query-related messages using model's logger."""
         if self.model_class:
@@ -297,6 +370,9 @@ class AsyncActiveQuery(
     AsyncJoinQueryMixin,
     RelationalQueryMixin,  # Use the same RelationalQueryMixin as sync version
     RangeQueryMixin,
+    AsyncBatchQueryMixin,
+    AsyncBulkDMLQueryMixin,
+    AsyncProjectionQueryMixin,
     IAsyncActiveQuery,
     IAsyncSetOperationQuery,
 ):
@@ -348,12 +424,17 @@ class AsyncActiveQuery(
         # Initialize attributes from RelationalQueryMixin
         self._eager_loads = ThreadSafeDict()
 
+        # None defers to the model's __trusted_hydration__ setting
+        self._trusted_hydration = None
+
     def backend(self) -> AsyncStorageBackend:
         """Get the backend for this query with context awareness.
 
         Returns the appropriate backend:
         1. Async context backend if available
-        2. Model class backend as fallback
+        2. A reader picked by the model's read router, unless the query
+           locks rows with for_update()
+        3. Model class backend as fallback
         """
         from ..connection.pool import get_current_async_backend
 
@@ -362,6 +443,10 @@ class AsyncActiveQuery(
         if context_backend is not None:
             return context_backend
 
+        router = self.model_class.__read_router__
+        if router is not None and self._for_update_clause is None:
+            return router.read_backend()
+
         # Fallback to model class backend
         return self.model_class.backend()
 
@@ -372,6 +457,10 @@ class AsyncActiveQuery(
         representing all matching records. The returned list will be empty if
         no records match the query conditions.
 
+        Relations configured with ``with_()`` are loaded right after the primary
+        query, with one batched query per relation path (nested paths included),
+        and cached on the returned instances.
+
         Note: Calling .explain() before .all() has no effect. To get execution plans,
         use .explain() with .aggregate() instead: User.query().explain().aggregate()
 
@@ -391,19 +480,23 @@ class AsyncActiveQuery(
         # Get SQL and parameters
         sql, params = self.to_sql()
 
-        self._log(logging.INFO, f"Executing async query: {sql}, parameters: {params}")
+        self._log(logging.INFO, "Executing async query: %s, parameters: %s", sql, params)
 
         # Step 1: Get column adapters for processing output (DB -> Python).
         # This map specifies how database results should be converted back to Python objects.
         column_adapters = self.model_class.get_column_adapters()
-        self._log(logging.DEBUG, f"Column adapters map: {column_adapters}")
+        self._log(logging.DEBUG, "Column adapters map: %s", column_adapters)
 
         # Step 2: Fetch all records, passing the column adapters to the backend.
         rows = await self.backend().fetch_all(sql, params, column_adapters=column_adapters)
 
         # Convert database column names back to Python field names before creating model instances
-        field_data_rows = [self.model_class._map_columns_to_fields(row) for row in rows]
-        records = [self.model_class.create_from_database(field_data) for field_data in field_data_rows]
+        model_class = self.model_class
+        trusted = self._trusted_hydration
+        records = [model_class.create_from_database(model_class._map_columns_to_fields(row), trusted) for row in rows]
+
+        # Step 3: Execute with_() eager loads for the whole result at once.
+        await self._load_eager_relations(records)
 
         return records
 
@@ -460,12 +553,12 @@ class AsyncActiveQuery(
         # Generate SQL using the temporary QueryExpression
         sql, params = query_expr.to_sql()
 
-        self._log(logging.INFO, f"Executing async query: {sql}, parameters: {params}")
+        self._log(logging.INFO, "Executing async query: %s, parameters: %s", sql, params)
 
         # Step 1: Get column adapters for processing output (DB -> Python).
         # This map specifies how database results should be converted back to Python objects.
         column_adapters = self.model_class.get_column_adapters()
-        self._log(logging.DEBUG, f"Column adapters map: {column_adapters}")
+        self._log(logging.DEBUG, "Column adapters map: %s", column_adapters)
 
         # Step 2: Fetch a single record, passing the column adapters to the backend.
         row = await self.backend().fetch_one(sql, params, column_adapters=column_adapters)
@@ -475,7 +568,9 @@ class AsyncActiveQuery(
 
         # Convert database column names back to Python field names before creating model instance
         field_data = self.model_class._map_columns_to_fields(row)
-        record = self.model_class.create_from_database(field_data)
+        record = self.model_class.create_from_database(field_data, self._trusted_hydration)
+
+        await self._load_eager_relations([record])
 
         return record
 
@@ -488,27 +583,53 @@ class AsyncActiveQuery(
         Returns:
             Tuple of (SQL string, parameters tuple)
         """
-        # Get dialect from backend
-        dialect = self.backend().dialect
+        # Generate SQL using a QueryExpression over the model's actual table name
+        return self._build_query_expression().to_sql()
 
-        # Use the model's actual table name
-        from_clause = TableExpression(dialect, self.model_class.table_name(),
-                                      schema_name=self.model_class.schema_name())
+    def prepare(self) -> "AsyncPreparedQuery":
+        """Compile this query once into a reusable template.
 
-        # Create QueryExpression with all components
-        query_expr = statements.QueryExpression(
-            dialect,
-            select=self.select_columns or [WildcardExpression(dialect)],  # Default to SELECT *
-            from_=self.join_clause if self.join_clause else from_clause,
-            where=self.where_clause,
-            group_by_having=self.group_by_having_clause,
-            order_by=self.order_by_clause,
-            limit_offset=self.limit_offset_clause,
-            for_update=self._for_update_clause,
-        )
+        Values that are only known at execution time are written as ``Param``
+        placeholders anywhere a value is accepted (``where()``, ``in_list()``,
+        ``limit()``/``offset()``, raw SQL parameters). The SQL is generated and
+        the column adapters are resolved here; each execution only binds the
+        parameter values.
+
+        Returns:
+            AsyncPreparedQuery: The compiled query
 
-        # Generate SQL using the QueryExpression
-        return query_expr.to_sql()
+        Examples:
+            by_email = User.query().where(User.c.email == Param("email")).limit(1).prepare()
+            user = await by_email.one(email="alice@example.com")
+
+            page = User.query().order_by(User.c.id).limit(Param("size", default=20)).prepare()
+            users = await page.execute(size=50)
+        """
+        return AsyncPreparedQuery(self, PreparedStatement(*self.to_sql()))
+
+    def trusted(self, enabled: bool = True):
+        """Build the results without Pydantic validation.
+
+        Rows are converted by the model's column adapters, so their values
+        already have the field types; validating them again costs more than
+        the query on large results. Trusted instances are built by
+        ``construct_from_database()``: field values are taken as they come
+        from the database and model validators do not run. Saving or
+        validating an instance later works as usual.
+
+        Overrides the model's ``__trusted_hydration__`` setting for this query.
+
+        Args:
+            enabled: False forces validation even if the model is trusted.
+
+        Returns:
+            Query instance for method chaining
+
+        Example:
+            rows = User.query().where(User.c.status == 'active').trusted().all()
+        """
+        self._trusted_hydration = enabled
+        return self
 
     def union(self, other: "IAsyncQuery") -> "IAsyncSetOperationQuery":
         """Perform a UNION operation with another query.
@@ -549,6 +670,19 @@ class AsyncActiveQuery(
 
         return AsyncSetOperationQuery(self, other, "EXCEPT")
 
+    async def _load_eager_relations(self, records: List[IActiveRecord]) -> None:
+        """Load the relations configured with ``with_()`` into the caches of ``records``.
+
+        One batched query is issued per configured relation path, whatever the
+        number of records.
+        """
+        if records and self._eager_loads:
+            await AsyncEagerLoader(self.get_relation_configs()).load(records)
+
+    def _is_log_enabled(self, level: int) -> bool:
+        """Check whether the model's logger is enabled for ``level``."""
+        return self.model_class is not None and self.model_class.is_log_enabled(level)
+
     def _log(self, level: int, msg: str, *args, **kwargs) -> None:
         """Log query-related messages using model's logger."""
         if self.model_class:
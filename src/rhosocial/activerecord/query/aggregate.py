@@ -345,7 +345,7 @@ class AggregateQueryMixin:
             # Generate SQL for the EXPLAIN statement
             explain_sql, explain_params = explain_expr.to_sql()
 
-            self._log(logging.INFO, f"Executing EXPLAIN aggregate query: {explain_sql}")
+            self._log(logging.INFO, "Executing EXPLAIN aggregate query: %s", explain_sql)
 
             # Execute the EXPLAIN query using the backend
             result = backend.fetch_all(explain_sql, explain_params)
@@ -354,10 +354,10 @@ class AggregateQueryMixin:
 
         # Get SQL and parameters using the existing to_sql method
         sql, params = self.to_sql()
-        self._log(logging.INFO, f"Executing aggregate query: {sql}")
+        self._log(logging.INFO, "Executing aggregate query: %s", sql)
 
         # Execute the aggregate query
-        backend = self.model_class.backend()
+        backend = self.backend()
         result = backend.fetch_all(sql, params)
 
         # Always return a list, even if empty
@@ -729,7 +729,7 @@ class AsyncAggregateQueryMixin:
             # Generate SQL for the EXPLAIN statement
             explain_sql, explain_params = explain_expr.to_sql()
 
-            self._log(logging.INFO, f"Executing EXPLAIN aggregate query: {explain_sql}")
+            self._log(logging.INFO, "Executing EXPLAIN aggregate query: %s", explain_sql)
 
             # Execute the EXPLAIN query using the backend
             result = await backend.fetch_all(explain_sql, explain_params)
@@ -738,10 +738,10 @@ class AsyncAggregateQueryMixin:
 
         # Get SQL and parameters using the existing to_sql method
         sql, params = self.to_sql()
-        self._log(logging.INFO, f"Executing async aggregate query: {sql}")
+        self._log(logging.INFO, "Executing async aggregate query: %s", sql)
 
         # Execute the aggregate query
-        backend = self.model_class.backend()
+        backend = self.backend()
         result = await backend.fetch_all(sql, params)
 
         # Always return a list, even if empty
@@ -1,6 +1,8 @@
 # src/rhosocial/activerecord/query/base.py
 """BaseQueryMixin implementation."""
 
+import copy
+from dataclasses import replace
 from typing import List, Tuple, Optional, Union, Any, overload
 
 from ..backend.dialect.exceptions import UnsupportedFeatureError
@@ -65,6 +67,10 @@ class BaseQueryMixin(IQueryBuilding):
             # Custom class: use module namespace
             return f"{module}.{self.__class__.__name__}"
 
+    def _is_log_enabled(self, level: int) -> bool:
+        """Check whether the query's own logger is enabled for ``level``."""
+        return get_logging_manager().get_logger(self._get_logger_name()).isEnabledFor(level)
+
     def _log(self, level: int, msg: str, *args, **kwargs) -> None:
         """Log query-related messages using query's own logger."""
         logger_name = self._get_logger_name()
@@ -669,4 +675,51 @@ class BaseQueryMixin(IQueryBuilding):
 
         return self
 
+    def clone(self) -> "BaseQueryMixin":
+        """Return a copy of this query that can be refined independently.
+
+        Query-building methods modify some clauses in place (``where()`` extends
+        the WHERE condition, ``limit()`` updates the LIMIT clause, ...); those
+        clauses are copied. Expression objects inside them are immutable once
+        built and are shared.
+
+        Returns:
+            A new query of the same class
+
+        Example:
+            base = User.query().where(User.c.status == 'active')
+            adults = base.clone().where(User.c.age >= 18)
+            minors = base.clone().where(User.c.age < 18)
+        """
+        clone = copy.copy(self)
+        dialect = self.backend().dialect
+
+        if self.where_clause is not None:
+            clone.where_clause = WhereClause(dialect, condition=self.where_clause.condition)
+        if self.order_by_clause is not None:
+            clone.order_by_clause = OrderByClause(dialect, list(self.order_by_clause.expressions))
+        if self.limit_offset_clause is not None:
+            clone.limit_offset_clause = LimitOffsetClause(
+                dialect, limit=self.limit_offset_clause.limit, offset=self.limit_offset_clause.offset
+            )
+        if self.group_by_having_clause is not None:
+            clone.group_by_having_clause = GroupByHavingClause(
+                dialect,
+                group_by=list(self.group_by_having_clause.group_by),
+                having=self.group_by_having_clause.having,
+            )
+        if self.select_columns is not None:
+            clone.select_columns = list(self.select_columns)
+        if self._explain_options:
+            clone._explain_options = dict(self._explain_options)
+
+        # Eager load configurations of RelationalQueryMixin; with_() extends their nested lists.
+        eager_loads = getattr(self, "_eager_loads", None)
+        if eager_loads is not None:
+            clone._eager_loads = type(eager_loads)(
+                {path: replace(config, nested=list(config.nested)) for path, config in eager_loads.items()}
+            )
+
+        return clone
+
     # endregion
@@ -0,0 +1,259 @@
+# src/rhosocial/activerecord/query/batch.py
+"""Streaming iteration over ActiveQuery results.
+
+``all()`` materializes every row and every model instance before returning.
+The methods in this module hand out model instances page by page instead, so
+that memory use is bounded by the batch size rather than by the result size:
+
+- ``iter()`` runs the query once and pages through the open cursor with
+  ``fetchmany()`` (via the backend's ``execute_batch_dql``). The query keeps its
+  own ORDER BY / LIMIT / OFFSET.
+- ``find_in_batches()`` uses keyset pagination: every batch is a separate,
+  short statement ``WHERE <conditions> AND key > :last ORDER BY key LIMIT n``.
+  No cursor stays open between batches, so rows may be modified while
+  iterating, and later batches stay as cheap as the first one (unlike OFFSET).
+- ``find_each()`` is ``find_in_batches()`` flattened to single records.
+
+Eager loads configured with ``with_()`` are executed once per batch, through
+the query's ``_load_eager_relations()``.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from ..backend.expression import (
+    Column,
+    LimitOffsetClause,
+    Literal,
+    OrderByClause,
+    TableExpression,
+    WhereClause,
+    WildcardExpression,
+    statements,
+)
+
+_DEFAULT_BATCH_SIZE = 1000
+
+# Marks the first keyset batch, which has no lower bound.
+_NO_KEY = object()
+
+
+class _BatchQueryBase:
+    """Helpers shared by the sync and async batch iteration mixins."""
+
+    def _build_query_expression(self, where=None, order_by=None, limit_offset=None) -> "statements.QueryExpression":
+        """Build the QueryExpression for this query.
+
+        Args:
+            where: WHERE clause to use instead of the query's own.
+            order_by: ORDER BY clause to use instead of the query's own.
+            limit_offset: LIMIT/OFFSET clause to use instead of the query's own.
+        """
+        dialect = self.backend().dialect
+        model_class = self.model_class
+        from_clause = TableExpression(dialect, model_class.table_name(), schema_name=model_class.schema_name())
+        return statements.QueryExpression(
+            dialect,
+            select=self.select_columns or [WildcardExpression(dialect)],  # Default to SELECT *
+            from_=self.join_clause if self.join_clause else from_clause,
+            where=where if where is not None else self.where_clause,
+            group_by_having=self.group_by_having_clause,
+            order_by=order_by if order_by is not None else self.order_by_clause,
+            limit_offset=limit_offset if limit_offset is not None else self.limit_offset_clause,
+            for_update=self._for_update_clause,
+        )
+
+    @staticmethod
+    def _check_batch_size(batch_size: int) -> None:
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size!r}")
+
+    def _resolve_batch_key(self, key: Optional[str]) -> Tuple[str, Column]:
+        """Resolve the keyset pagination key to a field name and a column expression.
+
+        Raises:
+            ValueError: If the key is not a model field, or the query has its own
+                ORDER BY / LIMIT / OFFSET, which keyset pagination cannot honor.
+        """
+        if self.order_by_clause is not None or self.limit_offset_clause is not None:
+            raise ValueError(
+                "find_in_batches()/find_each() order and limit by the batch key; "
+                "remove order_by()/limit()/offset() or use iter() instead"
+            )
+        model_class = self.model_class
+        field_name = key if key is not None else model_class.primary_key_field()
+        if field_name not in model_class.model_fields:
+            raise ValueError(f"Batch key '{field_name}' is not a field of {model_class.__name__}")
+        dialect = self.backend().dialect
+        return field_name, Column(dialect, model_class._get_column_name(field_name), table=model_class.table_name())
+
+    def _keyset_batch_expression(self, column: Column, last_value: Any, batch_size: int):
+        """Build the statement for the batch that follows ``last_value``."""
+        dialect = self.backend().dialect
+        where = self.where_clause
+        if last_value is not _NO_KEY:
+            predicate = column > Literal(dialect, last_value)
+            # A new WhereClause: and_() would modify the query's own clause in place.
+            where = WhereClause(dialect, condition=where.condition & predicate if where else predicate)
+        return self._build_query_expression(
+            where=where,
+            order_by=OrderByClause(dialect, expressions=[(column, "ASC")]),
+            limit_offset=LimitOffsetClause(dialect, limit=batch_size),
+        )
+
+    def _hydrate_rows(self, rows: List[Dict]) -> List[Any]:
+        """Convert adapted rows from ``fetch_all`` or ``execute_batch_dql`` into model instances."""
+        model_class = self.model_class
+        trusted = self._trusted_hydration
+        return [model_class.create_from_database(model_class._map_columns_to_fields(row), trusted) for row in rows]
+
+
+class BatchQueryMixin(_BatchQueryBase):
+    """Streaming iteration for ActiveQuery.
+
+    Example:
+        >>> for user in User.query().where(User.c.status == 'active').find_each(batch_size=500):
+        ...     export(user)
+        >>> for batch in User.query().with_('orders').find_in_batches(200):
+        ...     process(batch)  # batch[i].orders() does not query again
+    """
+
+    def iter(self, batch_size: int = _DEFAULT_BATCH_SIZE) -> Iterator[Any]:
+        """Execute the query once and yield model instances as rows are fetched.
+
+        Rows are fetched ``batch_size`` at a time from a single open cursor, so
+        the query's ORDER BY, LIMIT and OFFSET are honored. The cursor stays
+        open until iteration finishes or the generator is closed.
+
+        Args:
+            batch_size: Number of rows fetched (and hydrated) at a time.
+
+        Yields:
+            IActiveRecord: One model instance per row.
+
+        Raises:
+            ValueError: If batch_size is not a positive integer.
+        """
+        self._check_batch_size(batch_size)
+        backend = self.backend()
+        expression = self._build_query_expression()
+        column_adapters = self.model_class.get_column_adapters()
+        if self._is_log_enabled(logging.INFO):
+            self._log(logging.INFO, "Streaming query in pages of %d: %s", batch_size, expression.to_sql()[0])
+
+        for page in backend.execute_batch_dql(expression, page_size=batch_size, column_adapters=column_adapters):
+            records = self._hydrate_rows(page.data)
+            self._load_eager_relations(records)
+            yield from records
+
+    def find_in_batches(self, batch_size: int = _DEFAULT_BATCH_SIZE, key: Optional[str] = None) -> Iterator[List[Any]]:
+        """Yield lists of model instances using keyset pagination.
+
+        Each batch is fetched by its own statement, ordered by ``key`` and
+        starting after the last key of the previous batch. The key must be
+        unique and not null; the primary key is used by default.
+
+        Args:
+            batch_size: Maximum number of records per batch.
+            key: Field name to paginate by (defaults to the primary key field).
+
+        Yields:
+            List[IActiveRecord]: Non-empty batches of model instances.
+
+        Raises:
+            ValueError: If batch_size is not a positive integer, the key is not a
+                model field, or the query has ORDER BY / LIMIT / OFFSET.
+        """
+        self._check_batch_size(batch_size)
+        field_name, column = self._resolve_batch_key(key)
+        column_adapters = self.model_class.get_column_adapters()
+        last_value = _NO_KEY
+
+        while True:
+            sql, params = self._keyset_batch_expression(column, last_value, batch_size).to_sql()
+            self._log(logging.INFO, "Executing batch query: %s, parameters: %s", sql, params)
+            rows = self.backend().fetch_all(sql, params, column_adapters=column_adapters)
+            if not rows:
+                return
+            records = self._hydrate_rows(rows)
+            self._load_eager_relations(records)
+            yield records
+            if len(rows) < batch_size:
+                return
+            last_value = getattr(records[-1], field_name)
+
+    def find_each(self, batch_size: int = _DEFAULT_BATCH_SIZE, key: Optional[str] = None) -> Iterator[Any]:
+        """Yield model instances one by one, fetched with ``find_in_batches()``.
+
+        Args:
+            batch_size: Number of records fetched per statement.
+            key: Field name to paginate by (defaults to the primary key field).
+
+        Yields:
+            IActiveRecord: One model instance per matching row, in key order.
+        """
+        for batch in self.find_in_batches(batch_size, key=key):
+            yield from batch
+
+
+class AsyncBatchQueryMixin(_BatchQueryBase):
+    """Streaming iteration for AsyncActiveQuery.
+
+    The async counterparts of ``BatchQueryMixin`` are async generators.
+
+    Example:
+        >>> async for user in User.query().find_each(batch_size=500):
+        ...     await export(user)
+    """
+
+    async def iter(self, batch_size: int = _DEFAULT_BATCH_SIZE) -> AsyncIterator[Any]:
+        """Execute the query once and yield model instances as rows are fetched.
+
+        See ``BatchQueryMixin.iter``.
+        """
+        self._check_batch_size(batch_size)
+        backend = self.backend()
+        expression = self._build_query_expression()
+        column_adapters = self.model_class.get_column_adapters()
+        if self._is_log_enabled(logging.INFO):
+            self._log(logging.INFO, "Streaming query in pages of %d: %s", batch_size, expression.to_sql()[0])
+
+        async for page in backend.execute_batch_dql(expression, page_size=batch_size, column_adapters=column_adapters):
+            records = self._hydrate_rows(page.data)
+            await self._load_eager_relations(records)
+            for record in records:
+                yield record
+
+    async def find_in_batches(
+        self, batch_size: int = _DEFAULT_BATCH_SIZE, key: Optional[str] = None
+    ) -> AsyncIterator[List[Any]]:
+        """Yield lists of model instances using keyset pagination.
+
+        See ``BatchQueryMixin.find_in_batches``.
+        """
+        self._check_batch_size(batch_size)
+        field_name, column = self._resolve_batch_key(key)
+        column_adapters = self.model_class.get_column_adapters()
+        last_value = _NO_KEY
+
+        while True:
+            sql, params = self._keyset_batch_expression(column, last_value, batch_size).to_sql()
+            self._log(logging.INFO, "Executing batch query: %s, parameters: %s", sql, params)
+            rows = await self.backend().fetch_all(sql, params, column_adapters=column_adapters)
+            if not rows:
+                return
+            records = self._hydrate_rows(rows)
+            await self._load_eager_relations(records)
+            yield records
+            if len(rows) < batch_size:
+                return
+            last_value = getattr(records[-1], field_name)
+
+    async def find_each(self, batch_size: int = _DEFAULT_BATCH_SIZE, key: Optional[str] = None) -> AsyncIterator[Any]:
+        """Yield model instances one by one, fetched with ``find_in_batches()``.
+
+        See ``BatchQueryMixin.find_each``.
+        """
+        async for batch in self.find_in_batches(batch_size, key=key):
+            for record in batch:
+                yield record
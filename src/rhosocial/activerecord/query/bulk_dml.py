@@ -0,0 +1,228 @@
+# src/rhosocial/activerecord/query/bulk_dml.py
+"""Set-based UPDATE and DELETE for ActiveQuery.
+
+``update_all()`` and ``delete_all()`` compile the query's WHERE clause
+straight into a single ``UpdateExpression`` / ``DeleteExpression``, without
+loading any record. Model behaviors that ``save()`` and ``delete()`` apply per
+instance are applied to the statement instead:
+
+- ``TimestampMixin``: ``updated_at`` is set to the current UTC time.
+- ``OptimisticLockMixin``: the version column is incremented, so that
+  instances loaded before the mass update fail their next ``save()``.
+- ``SoftDeleteMixin``: ``delete_all()`` sets ``deleted_at`` instead of
+  deleting rows.
+
+Model events are not triggered, and instances already in memory are not
+refreshed. The statements run on the model's current backend, so they take
+part in an enclosing ``transaction()``.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Union
+
+from ..backend.expression import (
+    BaseExpression,
+    Column,
+    DeleteExpression,
+    Literal,
+    TableExpression,
+    UpdateExpression,
+)
+from ..backend.expression.statements import ReturningClause
+from ..backend.options import ExecutionOptions
+from ..backend.result import QueryResult
+from ..backend.schema import StatementType
+
+
+class _BulkDMLBase:
+    """Statement building shared by the sync and async set-based DML mixins."""
+
+    def _check_bulk_dml_query(self, operation: str) -> None:
+        """Reject query parts that a single-table UPDATE/DELETE cannot express.
+
+        Raises:
+            ValueError: If the query has joins, grouping, or LIMIT/OFFSET.
+        """
+        if self.join_clause is not None:
+            raise ValueError(f"{operation}() does not support joins; filter with a subquery instead")
+        if self.group_by_having_clause is not None:
+            raise ValueError(f"{operation}() does not support group_by()/having()")
+        if self.limit_offset_clause is not None:
+            raise ValueError(f"{operation}() does not support limit()/offset()")
+
+    def _write_backend(self) -> Any:
+        """Backend that runs the statement: the model's writer, never a read replica."""
+        return self.model_class.backend()
+
+    def _target_table(self) -> TableExpression:
+        model_class = self.model_class
+        return TableExpression(self.backend().dialect, model_class.table_name(), schema_name=model_class.schema_name())
+
+    def _returning_clause(self, returning: bool) -> Optional[ReturningClause]:
+        if not returning:
+            return None
+        dialect = self.backend().dialect
+        return ReturningClause(dialect, [Column(dialect, self.model_class.primary_key())])
+
+    def _bulk_update_assignments(self, values: Dict[str, Any]) -> Dict[str, BaseExpression]:
+        """Map field names to columns and add the model's automatic assignments."""
+        from ..field.timestamp import TimestampMixin
+        from ..field.version import OptimisticLockMixin
+
+        model_class = self.model_class
+        dialect = self.backend().dialect
+        assignments: Dict[str, BaseExpression] = {}
+        for field, value in values.items():
+            if field not in model_class.model_fields:
+                raise ValueError(f"'{field}' is not a field of {model_class.__name__}")
+            column = model_class._get_column_name(field)
+            assignments[column] = value if isinstance(value, BaseExpression) else Literal(dialect, value)
+        if not assignments:
+            raise ValueError("update_all() requires at least one field to update")
+
+        if issubclass(model_class, TimestampMixin):
+            updated_at = model_class._get_column_name("updated_at")
+            assignments.setdefault(updated_at, Literal(dialect, datetime.now(timezone.utc)))
+        if issubclass(model_class, OptimisticLockMixin):
+            version = model_class._version
+            assignments.setdefault(
+                version.db_column, Column(dialect, version.db_column) + Literal(dialect, version.increment_by)
+            )
+        return assignments
+
+    def _build_update_all(self, values: Dict[str, Any], returning: bool) -> UpdateExpression:
+        self._check_bulk_dml_query("update_all")
+        return UpdateExpression(
+            self.backend().dialect,
+            table=self._target_table(),
+            assignments=self._bulk_update_assignments(values),
+            where=self.where_clause,
+            returning=self._returning_clause(returning),
+        )
+
+    def _build_delete_all(self, returning: bool) -> Union[UpdateExpression, DeleteExpression]:
+        from ..field.soft_delete import SoftDeleteMixin
+
+        self._check_bulk_dml_query("delete_all")
+        dialect = self.backend().dialect
+        if issubclass(self.model_class, SoftDeleteMixin):
+            deleted_at = self.model_class._get_column_name("deleted_at")
+            return UpdateExpression(
+                dialect,
+                table=self._target_table(),
+                assignments={deleted_at: Literal(dialect, datetime.now(timezone.utc))},
+                where=self.where_clause,
+                returning=self._returning_clause(returning),
+            )
+        return DeleteExpression(
+            dialect,
+            tables=self._target_table(),
+            where=self.where_clause,
+            returning=self._returning_clause(returning),
+        )
+
+    def _bulk_dml_options(self, returning: bool) -> ExecutionOptions:
+        return ExecutionOptions(
+            stmt_type=StatementType.DML,
+            column_adapters=self.model_class.get_column_adapters(),
+            column_mapping=self.model_class.get_column_to_field_map(),
+            process_result_set=returning,
+        )
+
+    def _bulk_dml_result(self, result: QueryResult, returning: bool) -> Union[int, List[Any]]:
+        if not returning:
+            return result.affected_rows
+        pk_field = self.model_class.primary_key_field()
+        return [row[pk_field] for row in (result.data or [])]
+
+
+class BulkDMLQueryMixin(_BulkDMLBase):
+    """Set-based ``update_all()`` and ``delete_all()`` for ActiveQuery.
+
+    Example:
+        >>> User.query().where(User.c.last_login < cutoff).update_all(is_active=False)
+        42
+        >>> User.query().where(User.c.is_active == False).delete_all(returning=True)
+        [3, 17, 25]
+    """
+
+    def update_all(self, values: Optional[Dict[str, Any]] = None, *, returning: bool = False,
+                   **field_values: Any) -> Union[int, List[Any]]:
+        """Update every row matched by the query with one UPDATE statement.
+
+        Args:
+            values: Field names mapped to new values or SQL expressions
+                (e.g. ``{'score': User.c.score + 1}``).
+            returning: Return the primary keys of the updated rows instead of
+                the row count (requires RETURNING support).
+            **field_values: Further field values, merged into ``values``.
+
+        Returns:
+            Union[int, List[Any]]: The number of updated rows, or their primary
+            keys if ``returning`` is True.
+
+        Raises:
+            ValueError: If no values are given, a name is not a model field, or
+                the query has joins, grouping or LIMIT/OFFSET.
+            UnsupportedFeatureError: If ``returning`` is requested but the
+                dialect does not support RETURNING.
+        """
+        expression = self._build_update_all({**(values or {}), **field_values}, returning)
+        sql, params = expression.to_sql()
+        self._log(logging.INFO, "Executing update_all: %s, parameters: %s", sql, params)
+        result = self._write_backend().execute(sql, params, options=self._bulk_dml_options(returning))
+        return self._bulk_dml_result(result, returning)
+
+    def delete_all(self, *, returning: bool = False) -> Union[int, List[Any]]:
+        """Delete every row matched by the query with one statement.
+
+        Models with ``SoftDeleteMixin`` are soft deleted: ``deleted_at`` is set
+        with one UPDATE instead.
+
+        Args:
+            returning: Return the primary keys of the deleted rows instead of
+                the row count (requires RETURNING support).
+
+        Returns:
+            Union[int, List[Any]]: The number of deleted rows, or their primary
+            keys if ``returning`` is True.
+
+        Raises:
+            ValueError: If the query has joins, grouping or LIMIT/OFFSET.
+        """
+        expression = self._build_delete_all(returning)
+        sql, params = expression.to_sql()
+        self._log(logging.INFO, "Executing delete_all: %s, parameters: %s", sql, params)
+        result = self._write_backend().execute(sql, params, options=self._bulk_dml_options(returning))
+        return self._bulk_dml_result(result, returning)
+
+
+class AsyncBulkDMLQueryMixin(_BulkDMLBase):
+    """Set-based ``update_all()`` and ``delete_all()`` for AsyncActiveQuery.
+
+    See ``BulkDMLQueryMixin``; the methods are coroutines.
+    """
+
+    async def update_all(self, values: Optional[Dict[str, Any]] = None, *, returning: bool = False,
+                         **field_values: Any) -> Union[int, List[Any]]:
+        """Update every row matched by the query with one UPDATE statement.
+
+        See ``BulkDMLQueryMixin.update_all``.
+        """
+        expression = self._build_update_all({**(values or {}), **field_values}, returning)
+        sql, params = expression.to_sql()
+        self._log(logging.INFO, "Executing update_all: %s, parameters: %s", sql, params)
+        result = await self._write_backend().execute(sql, params, options=self._bulk_dml_options(returning))
+        return self._bulk_dml_result(result, returning)
+
+    async def delete_all(self, *, returning: bool = False) -> Union[int, List[Any]]:
+        """Delete every row matched by the query with one statement.
+
+        See ``BulkDMLQueryMixin.delete_all``.
+        """
+        expression = self._build_delete_all(returning)
+        sql, params = expression.to_sql()
+        self._log(logging.INFO, "Executing delete_all: %s, parameters: %s", sql, params)
+        result = await self._write_backend().execute(sql, params, options=self._bulk_dml_options(returning))
+        return self._bulk_dml_result(result, returning)
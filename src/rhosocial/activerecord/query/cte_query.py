@@ -7,6 +7,7 @@ from typing import List, Union, Optional, Dict, Any, TYPE_CHECKING
 from .aggregate import AggregateQueryMixin, AsyncAggregateQueryMixin
 from .base import BaseQueryMixin
 from .join import JoinQueryMixin
+from .projection import ProjectionQueryMixin, AsyncProjectionQueryMixin
 from .range import RangeQueryMixin
 from .set_operation import SetOperationQuery
 from .utils import convert_qmark_placeholder
@@ -24,6 +25,7 @@ class CTEQuery(
     BaseQueryMixin,
     JoinQueryMixin,
     RangeQueryMixin,
+    ProjectionQueryMixin,
     ICTEQuery,
     ISetOperationQuery,
 ):
@@ -280,7 +282,7 @@ class CTEQuery(
             return self.backend().fetch_all(explain_sql, explain_params)
 
         sql, params = self.to_sql()
-        self._log(logging.INFO, f"Executing CTE aggregate query: {sql}, parameters: {params}")
+        self._log(logging.INFO, "Executing CTE aggregate query: %s, parameters: %s", sql, params)
 
         return self.backend().fetch_all(sql, params)
 
@@ -331,6 +333,7 @@ class AsyncCTEQuery(
     BaseQueryMixin,
     JoinQueryMixin,
     RangeQueryMixin,
+    AsyncProjectionQueryMixin,
     IAsyncCTEQuery,
     IAsyncSetOperationQuery,
 ):
@@ -584,7 +587,7 @@ class AsyncCTEQuery(
             return await self.backend().fetch_all(explain_sql, explain_params)
 
         sql, params = self.to_sql()
-        self._log(logging.INFO, f"Executing async CTE aggregate query: {sql}, parameters: {params}")
+        self._log(logging.INFO, "Executing async CTE aggregate query: %s, parameters: %s", sql, params)
 
         return await self.backend().fetch_all(sql, params)
 
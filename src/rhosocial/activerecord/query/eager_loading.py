@@ -0,0 +1,97 @@
+# src/rhosocial/activerecord/query/eager_loading.py
+"""Execution of ``with_()`` eager loads.
+
+``RelationalQueryMixin.with_()`` records one ``RelationConfig`` per relation
+path; a nested path such as ``posts.comments`` also records ``posts``. After
+the primary query has returned its records, the loaders below walk these
+paths level by level: all ``posts`` of all users are fetched with one batched
+IN query, then all ``comments`` of all those posts with one more, and so on.
+Every result is stored in the instance cache of its parent record, so that
+``user.posts()`` and ``post.comments()`` do not query the database again.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .relational import RelationConfig
+
+# (path, parent path, relation name, query modifier)
+_LoadStep = Tuple[str, str, str, Optional[Callable]]
+
+
+class EagerLoader:
+    """Loads the configured relations of a list of records, level by level.
+
+    The relation configurations are copied when the loader is created, so
+    later ``with_()`` calls on the originating query do not affect it.
+
+    Args:
+        configs: Relation configurations, as returned by ``get_relation_configs()``.
+    """
+
+    def __init__(self, configs: Dict[str, RelationConfig]):
+        # Parents are always loaded before their children: sort by depth.
+        self.steps: Tuple[_LoadStep, ...] = tuple(
+            (path, *self._split(path), config.query_modifier)
+            for path, config in sorted(configs.items(), key=lambda item: item[0].count("."))
+        )
+
+    @staticmethod
+    def _split(path: str) -> Tuple[str, str]:
+        parent_path, _, name = path.rpartition(".")
+        return parent_path, name
+
+    @staticmethod
+    def _prepare_step(name: str, modifier: Optional[Callable], parents: List[Any]):
+        """Resolve the descriptor and the base query for one relation of ``parents``."""
+        parent_class = type(parents[0])
+        descriptor = parent_class.get_relation(name)
+        base_query = descriptor.get_related_model(parent_class).query()
+        if modifier is not None:
+            base_query = modifier(base_query)
+        return descriptor, base_query
+
+    @staticmethod
+    def _collect_children(loaded: Dict[int, Any]) -> List[Any]:
+        """Flatten loaded relation data into a list of distinct related records."""
+        children: Dict[int, Any] = {}
+        for data in loaded.values():
+            if data is None:
+                continue
+            if isinstance(data, list):
+                for record in data:
+                    children[id(record)] = record
+            else:
+                # BelongsTo: many parents may share the same related record.
+                children[id(data)] = data
+        return list(children.values())
+
+    def load(self, records: List[Any]) -> None:
+        """Load every configured relation of ``records`` into the instance caches."""
+        if not records or not self.steps:
+            return
+        loaded_levels: Dict[str, List[Any]] = {"": records}
+        for path, parent_path, name, modifier in self.steps:
+            parents = loaded_levels.get(parent_path)
+            if not parents:
+                continue
+            descriptor, base_query = self._prepare_step(name, modifier, parents)
+            descriptor.log(logging.DEBUG, f"Eager loading `{path}` for {len(parents)} records")
+            loaded_levels[path] = self._collect_children(descriptor.batch_load(parents, base_query))
+
+
+class AsyncEagerLoader(EagerLoader):
+    """Async counterpart of ``EagerLoader`` for async models."""
+
+    async def load(self, records: List[Any]) -> None:
+        """Load every configured relation of ``records`` into the instance caches."""
+        if not records or not self.steps:
+            return
+        loaded_levels: Dict[str, List[Any]] = {"": records}
+        for path, parent_path, name, modifier in self.steps:
+            parents = loaded_levels.get(parent_path)
+            if not parents:
+                continue
+            descriptor, base_query = self._prepare_step(name, modifier, parents)
+            descriptor.log(logging.DEBUG, f"Eager loading `{path}` for {len(parents)} records")
+            loaded_levels[path] = self._collect_children(await descriptor.batch_load(parents, base_query))
@@ -0,0 +1,159 @@
+# src/rhosocial/activerecord/query/prepared.py
+"""Prepared ActiveQuery templates with late-bound parameters."""
+
+import logging
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from ..backend.expression import PreparedStatement
+from .eager_loading import EagerLoader, AsyncEagerLoader
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..interface.model import IActiveRecord
+    from .active_query import ActiveQuery, AsyncActiveQuery
+
+
+class _PreparedQueryBase:
+    """State shared by the sync and async prepared queries.
+
+    Everything that does not depend on the parameter values is resolved once
+    when the query is prepared: the compiled SQL, the column adapters used to
+    convert results, the model class used to hydrate rows (and whether to
+    validate them, see ``ActiveQuery.trusted()``), and the ``with_()`` eager
+    loads to run on the results.
+    """
+
+    _eager_loader_class = EagerLoader
+
+    def __init__(self, query, statement: PreparedStatement):
+        self._query = query
+        self.model_class = query.model_class
+        self.statement = statement
+        self.column_adapters = self.model_class.get_column_adapters()
+        self.trusted_hydration = query._trusted_hydration
+        configs = query.get_relation_configs()
+        self._eager_loader = self._eager_loader_class(configs) if configs else None
+
+    @property
+    def sql(self) -> str:
+        """The compiled SQL string."""
+        return self.statement.sql
+
+    @property
+    def param_names(self):
+        """Names of the late-bound parameters, in order of first appearance."""
+        return self.statement.param_names
+
+    def to_sql(self, values: Optional[Dict[str, Any]] = None, /, **kwargs: Any):
+        """Return the SQL and parameters that ``execute()`` would run.
+
+        Returns:
+            Tuple of (SQL string, parameters tuple)
+        """
+        return self.statement.bind(values, **kwargs)
+
+    def _hydrate(self, rows: List[Dict]) -> List["IActiveRecord"]:
+        model_class = self.model_class
+        trusted = self.trusted_hydration
+        return [model_class.create_from_database(model_class._map_columns_to_fields(row), trusted) for row in rows]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.model_class.__name__}, {self.statement.sql!r})"
+
+
+class PreparedQuery(_PreparedQueryBase):
+    """A reusable, compiled ActiveQuery.
+
+    Created by ``ActiveQuery.prepare()``. Values for ``Param`` placeholders are
+    supplied per call; the query is never rebuilt or re-formatted.
+
+    Example:
+        >>> by_status = User.query().where(User.c.status == Param("status")).prepare()
+        >>> active = by_status.execute(status="active")
+        >>> banned = by_status.execute(status="banned")
+    """
+
+    _query: "ActiveQuery"
+
+    def execute(self, values: Optional[Dict[str, Any]] = None, /, **kwargs: Any) -> List["IActiveRecord"]:
+        """Run the query and return all matching records as model instances.
+
+        Args:
+            values: Parameter values as a mapping (optional).
+            **kwargs: Parameter values as keywords; these override ``values``.
+
+        Returns:
+            List[IActiveRecord]: List of model instances (empty if no matches)
+
+        Raises:
+            ValueError: If a required parameter is missing or unknown parameters are given.
+        """
+        sql, params = self.statement.bind(values, **kwargs)
+        self._query._log(logging.INFO, "Executing prepared query: %s, parameters: %s", sql, params)
+        rows = self._query.backend().fetch_all(sql, params, column_adapters=self.column_adapters)
+        records = self._hydrate(rows)
+        if self._eager_loader is not None:
+            self._eager_loader.load(records)
+        return records
+
+    all = execute
+
+    def one(self, values: Optional[Dict[str, Any]] = None, /, **kwargs: Any) -> Optional["IActiveRecord"]:
+        """Run the query and return the first matching record, or None.
+
+        The compiled SQL is not altered; add ``.limit(1)`` before ``prepare()``
+        when the query may match many rows.
+        """
+        sql, params = self.statement.bind(values, **kwargs)
+        self._query._log(logging.INFO, "Executing prepared query: %s, parameters: %s", sql, params)
+        row = self._query.backend().fetch_one(sql, params, column_adapters=self.column_adapters)
+        if not row:
+            return None
+        records = self._hydrate([row])
+        if self._eager_loader is not None:
+            self._eager_loader.load(records)
+        return records[0]
+
+
+class AsyncPreparedQuery(_PreparedQueryBase):
+    """A reusable, compiled AsyncActiveQuery.
+
+    Created by ``AsyncActiveQuery.prepare()``; see ``PreparedQuery``.
+    """
+
+    _query: "AsyncActiveQuery"
+    _eager_loader_class = AsyncEagerLoader
+
+    async def execute(self, values: Optional[Dict[str, Any]] = None, /, **kwargs: Any) -> List["IActiveRecord"]:
+        """Run the query asynchronously and return all matching records as model instances.
+
+        Args:
+            values: Parameter values as a mapping (optional).
+            **kwargs: Parameter values as keywords; these override ``values``.
+
+        Returns:
+            List[IActiveRecord]: List of model instances (empty if no matches)
+
+        Raises:
+            ValueError: If a required parameter is missing or unknown parameters are given.
+        """
+        sql, params = self.statement.bind(values, **kwargs)
+        self._query._log(logging.INFO, "Executing async prepared query: %s, parameters: %s", sql, params)
+        rows = await self._query.backend().fetch_all(sql, params, column_adapters=self.column_adapters)
+        records = self._hydrate(rows)
+        if self._eager_loader is not None:
+            await self._eager_loader.load(records)
+        return records
+
+    all = execute
+
+    async def one(self, values: Optional[Dict[str, Any]] = None, /, **kwargs: Any) -> Optional["IActiveRecord"]:
+        """Run the query asynchronously and return the first matching record, or None."""
+        sql, params = self.statement.bind(values, **kwargs)
+        self._query._log(logging.INFO, "Executing async prepared query: %s, parameters: %s", sql, params)
+        row = await self._query.backend().fetch_one(sql, params, column_adapters=self.column_adapters)
+        if not row:
+            return None
+        records = self._hydrate([row])
+        if self._eager_loader is not None:
+            await self._eager_loader.load(records)
+        return records[0]
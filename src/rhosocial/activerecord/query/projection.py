@@ -0,0 +1,247 @@
+# src/rhosocial/activerecord/query/projection.py
+"""Tuple and column-oriented results for reporting queries.
+
+``all()`` builds a model instance per row and ``aggregate()`` a dictionary per
+row. When only a few values are needed, the methods in this module return
+plain tuples instead, fetched through the backend's ``fetch_tuples()``: column
+adapters are matched to the result columns once and then applied by position,
+so no per-row dictionary is allocated.
+
+- ``as_tuples()`` returns every selected column as a tuple per row.
+- ``values_list(*columns, flat=False)`` selects ``columns`` (or keeps the
+  query's own selection) and returns tuples, or bare values with ``flat=True``.
+- ``pluck(*columns)`` is ``values_list()`` that flattens a single column.
+- ``to_columns(*columns, container="list")`` returns a dictionary of columns,
+  optionally as ``array.array`` or NumPy arrays.
+
+Passing columns never modifies the query: the projection runs on a copy.
+"""
+
+import logging
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..backend.expression import BaseExpression, Column
+
+# Containers accepted by to_columns()
+COLUMN_CONTAINERS = ("list", "array", "numpy")
+
+
+def _to_array(values: List[Any]) -> Union[array, List[Any]]:
+    """Pack an integer or float column into an ``array.array``; leave other columns as lists."""
+    if not values:
+        return values
+    if all(type(value) is int for value in values):
+        typecode = "q"
+    elif all(type(value) in (int, float) for value in values):
+        typecode = "d"
+    else:
+        return values
+    try:
+        return array(typecode, values)
+    except OverflowError:
+        return values
+
+
+def build_columns(names: Sequence[str], rows: Sequence[Tuple], container: str = "list") -> Dict[str, Any]:
+    """Turn rows into a dictionary of columns.
+
+    Args:
+        names: Column names, in row order
+        rows: Result rows as tuples
+        container: ``"list"``, ``"array"`` (``array.array`` for columns whose
+            values are all int or all int/float; other columns, including empty
+            ones and ones containing NULL, stay lists) or ``"numpy"``
+            (``numpy.asarray`` per column)
+
+    Returns:
+        Dictionary mapping each column name to its values. If names repeat,
+        the last column wins.
+
+    Raises:
+        ValueError: If container is not one of COLUMN_CONTAINERS
+        ImportError: If container is "numpy" and NumPy is not installed
+    """
+    if container not in COLUMN_CONTAINERS:
+        raise ValueError(f"container must be one of {', '.join(COLUMN_CONTAINERS)}, got {container!r}")
+    columns = [list(column) for column in zip(*rows)] if rows else [[] for _ in names]
+    if container == "list":
+        return dict(zip(names, columns))
+    if container == "array":
+        return {name: _to_array(column) for name, column in zip(names, columns)}
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("to_columns(container='numpy') requires NumPy to be installed") from e
+    return {name: numpy.asarray(column) for name, column in zip(names, columns)}
+
+
+class _ProjectionQueryBase:
+    """Helpers shared by the sync and async projection mixins."""
+
+    def _projection_model(self):
+        """Model class whose column adapters convert the results, if any.
+
+        ActiveQuery uses its own model; set operations use the model of their
+        leftmost operand; CTE queries have none and return driver values.
+        """
+        query = self
+        while query is not None:
+            model_class = getattr(query, "model_class", None)
+            if model_class is not None:
+                return model_class
+            query = getattr(query, "left", None)
+        return None
+
+    def _projection_columns(self, columns: Sequence[Union[str, BaseExpression]]) -> List[BaseExpression]:
+        """Convert ``columns`` to expressions; model field names become their column names."""
+        dialect = self.backend().dialect
+        model_class = self._projection_model()
+        expressions = []
+        for column in columns:
+            if isinstance(column, str):
+                if model_class is not None and column in model_class.model_fields:
+                    column = model_class._get_column_name(column)
+                expressions.append(Column(dialect, column))
+            elif isinstance(column, BaseExpression):
+                expressions.append(column)
+            else:
+                raise TypeError(f"Column must be str or BaseExpression, got {type(column)}")
+        return expressions
+
+    def _select_projection(self, columns: List[BaseExpression]) -> Tuple[str, tuple]:
+        """SQL and parameters of a copy of this query that selects ``columns``."""
+        return self.clone().select(*columns).to_sql()
+
+    def _projection_sql(self, columns: Sequence[Union[str, BaseExpression]]) -> Tuple[str, tuple]:
+        if not columns:
+            return self.to_sql()
+        return self._select_projection(self._projection_columns(columns))
+
+    def _projection_adapters(self) -> Optional[Dict]:
+        model_class = self._projection_model()
+        return model_class.get_column_adapters() if model_class is not None else None
+
+    def _column_keys(self, names: List[str]) -> List[str]:
+        """Result column names, with model columns renamed to their field names."""
+        model_class = self._projection_model()
+        if model_class is None:
+            return names
+        column_to_field = model_class.get_column_to_field_map()
+        return [column_to_field.get(name, name) for name in names]
+
+    @staticmethod
+    def _check_flat(columns: Sequence[Any], flat: bool) -> None:
+        if flat and columns and len(columns) != 1:
+            raise ValueError("values_list(flat=True) requires exactly one column")
+
+    @staticmethod
+    def _flatten(names: List[str], rows: List[Tuple], flat: bool) -> List[Any]:
+        if not flat:
+            return rows
+        if len(names) > 1:
+            raise ValueError("values_list(flat=True) requires exactly one column")
+        return [row[0] for row in rows]
+
+
+class ProjectionQueryMixin(_ProjectionQueryBase):
+    """Tuple and column-oriented results for synchronous queries.
+
+    Example:
+        >>> User.query().where(User.c.status == 'active').pluck(User.c.id)
+        [1, 4, 7]
+        >>> User.query().order_by(User.c.id).values_list('id', 'email')
+        [(1, 'a@example.com'), (4, 'd@example.com'), (7, 'g@example.com')]
+        >>> Order.query().to_columns('amount', container='numpy')['amount'].sum()
+    """
+
+    def _fetch_tuples(self, columns: Sequence[Union[str, BaseExpression]]) -> Tuple[List[str], List[Tuple]]:
+        sql, params = self._projection_sql(columns)
+        self._log(logging.INFO, "Executing projection query: %s, parameters: %s", sql, params)
+        return self.backend().fetch_tuples(sql, params, column_adapters=self._projection_adapters())
+
+    def as_tuples(self) -> List[Tuple]:
+        """Execute the query and return each row as a tuple, in SELECT order.
+
+        Returns:
+            List of tuples (empty if no matches)
+        """
+        return self._fetch_tuples(())[1]
+
+    def values_list(self, *columns: Union[str, BaseExpression], flat: bool = False) -> List[Any]:
+        """Execute the query for ``columns`` and return tuples.
+
+        Args:
+            *columns: Field names, column names or expressions to select; the
+                query's own selection is used when none are given
+            flat: Return bare values instead of 1-tuples; the result must have
+                exactly one column
+
+        Returns:
+            List of tuples, or of values when ``flat`` is True
+
+        Raises:
+            ValueError: If ``flat`` is True and the result has more than one column
+        """
+        self._check_flat(columns, flat)
+        names, rows = self._fetch_tuples(columns)
+        return self._flatten(names, rows, flat)
+
+    def pluck(self, *columns: Union[str, BaseExpression]) -> List[Any]:
+        """Execute the query for ``columns``: bare values for one column, tuples for several.
+
+        Raises:
+            ValueError: If no column is given
+        """
+        if not columns:
+            raise ValueError("pluck() requires at least one column")
+        return self.values_list(*columns, flat=len(columns) == 1)
+
+    def to_columns(self, *columns: Union[str, BaseExpression], container: str = "list") -> Dict[str, Any]:
+        """Execute the query and return the result column by column.
+
+        Args:
+            *columns: Columns to select; the query's own selection is used when
+                none are given
+            container: ``"list"``, ``"array"`` or ``"numpy"``, see ``build_columns()``
+
+        Returns:
+            Dictionary mapping column names (field names for model columns) to values
+        """
+        names, rows = self._fetch_tuples(columns)
+        return build_columns(self._column_keys(names), rows, container)
+
+
+class AsyncProjectionQueryMixin(_ProjectionQueryBase):
+    """Tuple and column-oriented results for asynchronous queries.
+
+    Example:
+        >>> await User.query().where(User.c.status == 'active').pluck(User.c.id)
+        [1, 4, 7]
+    """
+
+    async def _fetch_tuples(self, columns: Sequence[Union[str, BaseExpression]]) -> Tuple[List[str], List[Tuple]]:
+        sql, params = self._projection_sql(columns)
+        self._log(logging.INFO, "Executing projection query: %s, parameters: %s", sql, params)
+        return await self.backend().fetch_tuples(sql, params, column_adapters=self._projection_adapters())
+
+    async def as_tuples(self) -> List[Tuple]:
+        """Execute the query and return each row as a tuple, in SELECT order."""
+        return (await self._fetch_tuples(()))[1]
+
+    async def values_list(self, *columns: Union[str, BaseExpression], flat: bool = False) -> List[Any]:
+        """Execute the query for ``columns`` and return tuples, or bare values with ``flat``."""
+        self._check_flat(columns, flat)
+        names, rows = await self._fetch_tuples(columns)
+        return self._flatten(names, rows, flat)
+
+    async def pluck(self, *columns: Union[str, BaseExpression]) -> List[Any]:
+        """Execute the query for ``columns``: bare values for one column, tuples for several."""
+        if not columns:
+            raise ValueError("pluck() requires at least one column")
+        return await self.values_list(*columns, flat=len(columns) == 1)
+
+    async def to_columns(self, *columns: Union[str, BaseExpression], container: str = "list") -> Dict[str, Any]:
+        """Execute the query and return the result column by column."""
+        names, rows = await self._fetch_tuples(columns)
+        return build_columns(self._column_keys(names), rows, container)
@@ -4,12 +4,13 @@
 from typing import Union, List, Dict, Any, Optional
 
 from ..backend.base import StorageBackend, AsyncStorageBackend
-from ..backend.expression import SetOperationExpression, bases
+from ..backend.expression import QueryExpression, SetOperationExpression, Subquery, bases
 from ..interface import IQuery, IAsyncQuery, ISetOperationQuery, IAsyncSetOperationQuery
 from ..logging.manager import get_logging_manager
+from .projection import ProjectionQueryMixin, AsyncProjectionQueryMixin
 
 
-class SetOperationQuery(ISetOperationQuery):
+class SetOperationQuery(ProjectionQueryMixin, ISetOperationQuery):
     """SetOperationQuery implementation for UNION, INTERSECT, and EXCEPT queries.
 
     This class allows combining results from multiple queries using set operations.
@@ -42,6 +43,10 @@ class SetOperationQuery(ISetOperationQuery):
         base_name = get_logging_manager().LOGGER_QUERY
         return f"{base_name}.{self.__class__.__name__}"
 
+    def _is_log_enabled(self, level: int) -> bool:
+        """Check whether the query's own logger is enabled for ``level``."""
+        return get_logging_manager().get_logger(self._get_logger_name()).isEnabledFor(level)
+
     def _log(self, level: int, msg: str, *args, **kwargs) -> None:
         """Log query-related messages using query's own logger."""
         logger_name = self._get_logger_name()
@@ -119,6 +124,13 @@ class SetOperationQuery(ISetOperationQuery):
         # Use the SetOperationExpression's to_sql method
         return self._set_op_expr.to_sql()
 
+    def _select_projection(self, columns: List[bases.BaseExpression]) -> "bases.SQLQueryAndParams":
+        """Select ``columns`` from the combined result, wrapped as a derived table."""
+        dialect = self.backend().dialect
+        return QueryExpression(
+            dialect, select=columns, from_=Subquery(dialect, self._set_op_expr, alias="set_operation")
+        ).to_sql()
+
     def union(self, other: "IQuery") -> "SetOperationQuery":
         """Perform a UNION operation with another query."""
         return SetOperationQuery(self, other, "UNION")
@@ -196,7 +208,7 @@ class SetOperationQuery(ISetOperationQuery):
             # Generate SQL for the EXPLAIN statement
             explain_sql, explain_params = explain_expr.to_sql()
 
-            self._log(logging.DEBUG, f"Executing EXPLAIN set operation: {explain_sql}, parameters: {explain_params}")
+            self._log(logging.DEBUG, "Executing EXPLAIN set operation: %s, parameters: %s", explain_sql, explain_params)
 
             # Execute the EXPLAIN query using the backend
             result = backend.fetch_all(explain_sql, explain_params)
@@ -206,7 +218,7 @@ class SetOperationQuery(ISetOperationQuery):
         # Get SQL and parameters using the existing to_sql method
         sql, params = self.to_sql()
 
-        self._log(logging.DEBUG, f"Executing set operation: {sql}, parameters: {params}")
+        self._log(logging.DEBUG, "Executing set operation: %s, parameters: %s", sql, params)
 
         # Execute the aggregate query
         backend = self.backend()
@@ -233,7 +245,7 @@ class SetOperationQuery(ISetOperationQuery):
         return self.left.backend()
 
 
-class AsyncSetOperationQuery(IAsyncSetOperationQuery):
+class AsyncSetOperationQuery(AsyncProjectionQueryMixin, IAsyncSetOperationQuery):
     """AsyncSetOperationQuery implementation for asynchronous UNION, INTERSECT, and EXCEPT queries.
 
     This class allows combining results from multiple async queries using set operations.
@@ -266,6 +278,10 @@ class AsyncSetOperationQuery(IAsyncSetOperationQuery):
         base_name = get_logging_manager().LOGGER_QUERY
         return f"{base_name}.{self.__class__.__name__}"
 
+    def _is_log_enabled(self, level: int) -> bool:
+        """Check whether the query's own logger is enabled for ``level``."""
+        return get_logging_manager().get_logger(self._get_logger_name()).isEnabledFor(level)
+
     def _log(self, level: int, msg: str, *args, **kwargs) -> None:
         """Log query-related messages using query's own logger."""
         logger_name = self._get_logger_name()
@@ -348,6 +364,13 @@ class AsyncSetOperationQuery(IAsyncSetOperationQuery):
         # Use the SetOperationExpression's to_sql method
         return self._set_op_expr.to_sql()
 
+    def _select_projection(self, columns: List[bases.BaseExpression]) -> "bases.SQLQueryAndParams":
+        """Select ``columns`` from the combined result, wrapped as a derived table."""
+        dialect = self.backend().dialect
+        return QueryExpression(
+            dialect, select=columns, from_=Subquery(dialect, self._set_op_expr, alias="set_operation")
+        ).to_sql()
+
     def union(self, other: "IAsyncQuery") -> "AsyncSetOperationQuery":
         """Perform a UNION operation with another async query."""
         return AsyncSetOperationQuery(self, other, "UNION")
@@ -425,7 +448,9 @@ class AsyncSetOperationQuery(IAsyncSetOperationQuery):
             # Generate SQL for the EXPLAIN statement
             explain_sql, explain_params = explain_expr.to_sql()
 
-            self._log(logging.DEBUG, f"Executing async EXPLAIN set operation: {explain_sql}, parameters: {explain_params}")
+            self._log(
+                logging.DEBUG, "Executing async EXPLAIN set operation: %s, parameters: %s", explain_sql, explain_params
+            )
 
             # Execute the EXPLAIN query using the async backend
             result = await backend.fetch_all(explain_sql, explain_params)
@@ -435,7 +460,7 @@ class AsyncSetOperationQuery(IAsyncSetOperationQuery):
         # Get SQL and parameters using the existing to_sql method
         sql, params = self.to_sql()
 
-        self._log(logging.DEBUG, f"Executing async set operation: {sql}, parameters: {params}")
+        self._log(logging.DEBUG, "Executing async set operation: %s, parameters: %s", sql, params)
 
         # Execute the aggregate query
         backend = self.backend()
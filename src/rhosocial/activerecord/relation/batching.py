@@ -0,0 +1,123 @@
+# src/rhosocial/activerecord/relation/batching.py
+"""
+Chunked IN-list queries for relation batch loading.
+
+A batch load fetches the related records of many parents with
+``WHERE key IN (...)``. Every key is a bound parameter, and drivers limit the
+number of parameters per statement (SQLite's SQLITE_MAX_VARIABLE_NUMBER, for
+example). The helpers below split the key set into chunks that fit the
+dialect's limit, leaving room for the parameters of the base query (e.g. from
+a ``with_()`` query modifier), and concatenate the results.
+
+On the async path, chunks run concurrently when an async connection pool is
+active and no transaction is in progress: each chunk then acquires its own
+pooled connection, up to the pool's ``max_size`` less the connection the
+caller holds. Otherwise (or when that leaves no connection) chunks run one
+after another on the current connection.
+"""
+
+import asyncio
+import logging
+from typing import Any, Collection, Iterator, List
+
+from ..backend.expression import Column, InPredicate, Literal
+
+
+def in_list_chunk_size(query: Any) -> int:
+    """Number of keys that fit in one IN list of ``query``.
+
+    Args:
+        query: The base query the IN predicate is added to.
+
+    Returns:
+        The dialect's bound parameter limit minus the parameters already used
+        by the query (at least 1).
+    """
+    dialect = query.backend().dialect
+    _, params = query.to_sql()
+    return max(1, dialect.get_max_bind_parameters() - len(params))
+
+
+def chunk_keys(keys: Collection[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Split ``keys`` into lists of at most ``chunk_size`` keys."""
+    keys = list(keys)
+    for start in range(0, len(keys), chunk_size):
+        yield keys[start : start + chunk_size]
+
+
+def _in_query(query: Any, column_name: str, keys: List[Any]) -> Any:
+    """Return a copy of ``query`` restricted to ``column_name IN keys``."""
+    # Without clone() the predicate is added to the caller's query itself; the
+    # chunking functions only call this once in that case.
+    chunk_query = query.clone() if hasattr(query, "clone") else query
+    dialect = chunk_query.backend().dialect
+    in_predicate = InPredicate(dialect, Column(dialect, column_name), Literal(dialect, keys))
+    chunk_query.where(in_predicate)
+    if chunk_query._is_log_enabled(logging.DEBUG):
+        chunk_query._log(logging.DEBUG, "Batch load SQL: %s", chunk_query.to_sql())
+    return chunk_query
+
+
+def _plan_chunks(query: Any, keys: Collection[Any]) -> List[List[Any]]:
+    chunk_size = in_list_chunk_size(query) if hasattr(query, "clone") else len(keys)
+    return list(chunk_keys(keys, max(1, chunk_size)))
+
+
+def fetch_in_chunks(query: Any, column_name: str, keys: Collection[Any]) -> List[Any]:
+    """Fetch all records of ``query`` whose ``column_name`` is in ``keys``.
+
+    Args:
+        query: Base query of the related model (not modified if it supports ``clone()``).
+        column_name: Column compared against the keys.
+        keys: Key values; must not be empty.
+
+    Returns:
+        The records of all chunks, in chunk order.
+    """
+    records: List[Any] = []
+    for chunk in _plan_chunks(query, keys):
+        records.extend(_in_query(query, column_name, chunk).all())
+    return records
+
+
+async def async_fetch_in_chunks(query: Any, column_name: str, keys: Collection[Any]) -> List[Any]:
+    """Async version of ``fetch_in_chunks``; chunks may run concurrently.
+
+    Chunks are gathered concurrently when an async connection pool is in
+    context and no transaction is active, each on its own pooled connection.
+    """
+    chunks = _plan_chunks(query, keys)
+    if len(chunks) == 1:
+        return await _in_query(query, column_name, chunks[0]).all()
+
+    from ..connection.pool import context as pool_context
+
+    pool = pool_context.get_current_async_pool()
+    concurrency = 0
+    if pool is not None and pool_context.get_current_async_transaction_backend() is None:
+        # Leave the connection the caller may hold out of the concurrency budget.
+        holding = 1 if pool_context.get_current_async_connection_backend() is not None else 0
+        concurrency = pool.config.max_size - holding
+    if concurrency < 1:
+        # No pool, a transaction, or no connection left besides the caller's:
+        # run the chunks one after another on the current connection.
+        records: List[Any] = []
+        for chunk in chunks:
+            records.extend(await _in_query(query, column_name, chunk).all())
+        return records
+
+    limiter = asyncio.Semaphore(concurrency)
+
+    async def fetch_on_pooled_connection(chunk: List[Any]) -> List[Any]:
+        # Runs in its own task, so the connection context does not leak to the caller.
+        async with limiter:
+            backend = await pool.acquire()
+            token = pool_context._set_async_connection_backend(backend)
+            try:
+                return await _in_query(query, column_name, chunk).all()
+            finally:
+                pool_context._reset_async_connection_backend(token)
+                await pool.release(backend)
+
+    results = await asyncio.gather(*(fetch_on_pooled_connection(chunk) for chunk in chunks))
+    return [record for chunk_records in results for record in chunk_records]
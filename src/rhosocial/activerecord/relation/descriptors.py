@@ -7,6 +7,7 @@ Provides BelongsTo, HasOne, and HasMany relationship types.
 import logging
 from typing import Type, Any, Generic, TypeVar, Union, ForwardRef, Optional, get_type_hints, ClassVar, List, Dict
 
+from .batching import fetch_in_chunks
 from .cache import CacheConfig, InstanceCache
 from .interfaces import IRelationValidation, IRelationManagement, IRelationLoader
 from ..backend.expression.core import Column
@@ -439,11 +440,11 @@ class RelationDescriptor(Generic[T]):
             loaded_data = self._loader.batch_load(records_to_load, base_query)
             if loaded_data:
                 # Cache and add to result
+                records_by_id = {id(record): record for record in records_to_load}
                 for record_id, data in loaded_data.items():
-                    for record in records_to_load:
-                        if id(record) == record_id:
-                            InstanceCache.set(record, self.name, data, self._cache_config)
-                            break
+                    record = records_by_id.get(record_id)
+                    if record is not None:
+                        InstanceCache.set(record, self.name, data, self._cache_config)
                 result.update(loaded_data)
         except Exception as e:
             self.log(logging.ERROR, f"Error in batch loading `{self.name}` relations: {e}")
@@ -770,19 +771,8 @@ class DefaultIRelationLoader(IRelationLoader[R]):
             if not foreign_keys:
                 return result
 
-            # Load all related records using base_query with new expression system
-            from ..backend.expression import Column, Literal, InPredicate
-
-            # Create IN predicate using expression system
-            pk_column = Column(query.backend().dialect, model_class.primary_key())
-            # Create a literal with the list of foreign keys
-            values_literal = Literal(query.backend().dialect, list(foreign_keys))
-            in_predicate = InPredicate(query.backend().dialect, pk_column, values_literal)
-
-            # Get the SQL to see what's generated
-            query._log(logging.DEBUG, f"Batch load SQL: {query.where(in_predicate).to_sql()}")
-
-            related_records = query.all()
+            # Load all related records with IN queries sized to the dialect's parameter limit
+            related_records = fetch_in_chunks(query, model_class.primary_key(), foreign_keys)
 
             # Build lookup map
             related_map = {getattr(record, model_class.primary_key()): record for record in related_records}
@@ -805,24 +795,9 @@ class DefaultIRelationLoader(IRelationLoader[R]):
                 # Return empty list for HasMany, None for HasOne for all instances
                 return {id(instance): [] if isinstance(self.descriptor, HasMany) else None for instance in instances}
 
-            # Load all related records using base_query with new expression system
-            # Keep existing conditions from base_query, only add IN condition
-            # Create a clone of the query to avoid modifying the original
-            if hasattr(query, "clone"):
-                query = query.clone()
-
-            from ..backend.expression import Column, Literal, InPredicate
-
-            # Create IN predicate using expression system
-            fk_column = Column(query.backend().dialect, self.descriptor.foreign_key)
-            # Create a literal with the list of primary keys
-            values_literal = Literal(query.backend().dialect, list(primary_keys))
-            in_predicate = InPredicate(query.backend().dialect, fk_column, values_literal)
-
-            # Get the SQL to see what's generated
-            query._log(logging.DEBUG, f"Batch load SQL: {query.where(in_predicate).to_sql()}")
-
-            related_records = query.all()
+            # Load all related records using base_query, keeping its conditions and adding
+            # IN conditions sized to the dialect's parameter limit (base_query is not modified)
+            related_records = fetch_in_chunks(query, self.descriptor.foreign_key, primary_keys)
 
             # Group by foreign key
             related_map: Dict[Any, List[Any]] = {}
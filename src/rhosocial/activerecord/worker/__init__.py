@@ -104,6 +104,15 @@ Usage Example (Async Mode):
             futures = [pool.submit(my_task, user_id=i) for i in range(10)]
             results = [f.result(timeout=10) for f in futures]
 
+Usage Example (Large Fan-out):
+    # One task per chunk of 500 items instead of one per item; results are
+    # streamed with at most 2 × n_workers chunks outstanding
+    with WorkerPool(n_workers=4) as pool:
+        totals = pool.map(score_row, rows, chunksize=500)
+
+        for result in pool.imap_unordered(score_row, row_iterator(), chunksize=500):
+            handle(result)
+
 Usage Example (Hook with Arguments):
     # Hook that takes additional arguments
     def init_with_config(ctx: WorkerContext, db_name: str, pool_size: int):
@@ -10,11 +10,14 @@ DRAINING → STOPPING → KILLING → STOPPED.
 from __future__ import annotations
 
 import asyncio
+import collections
 import importlib
 import inspect
+import itertools
 import logging
 import multiprocessing as mp
 import os
+import queue
 import select
 import sys
 import threading
@@ -23,7 +26,7 @@ import traceback
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 # Resource monitoring support
 try:
@@ -880,6 +883,52 @@ def _run_async_worker(
         ctx.event_loop = None
 
 
+# ── Chunked Execution ─────────────────────────────────────────────────────────
+
+class _ChunkRunner:
+    """
+    Task function that applies ``fn`` to every item of a chunk within one task.
+
+    map(chunksize=N) / imap() / imap_unordered() submit one chunk per task, so
+    dispatch, the __dequeued__/__started__/result messages, TASK_START/TASK_END
+    hooks and memory sampling happen once per chunk instead of once per item.
+    Hooks see the chunk's TaskContext; ``fn`` receives it as ``ctx`` for every
+    item. The first failing item fails the whole chunk with its exception.
+
+    Module-level class so that spawn can pickle it (``fn`` must be pickle-able).
+    """
+
+    def __init__(self, fn: Callable) -> None:
+        self.fn = fn
+        name = getattr(fn, '__qualname__', repr(fn))
+        # Read by the Worker (TaskContext.fn_name) and by submit() logging
+        self.__name__ = self.__qualname__ = f"chunk[{name}]"
+
+    def __call__(self, ctx: TaskContext, items: List[Any]) -> List[Any]:
+        fn = self.fn
+        if not inspect.iscoroutinefunction(fn):
+            return [fn(ctx, item) for item in items]
+        # Async mode Workers keep a loop for their lifetime; sync mode Workers
+        # get one loop per chunk rather than one asyncio.run() per item
+        loop = ctx.worker_ctx.event_loop
+        if loop is not None:
+            return loop.run_until_complete(self._run_async(ctx, items))
+        return asyncio.run(self._run_async(ctx, items))
+
+    async def _run_async(self, ctx: TaskContext, items: List[Any]) -> List[Any]:
+        return [await self.fn(ctx, item) for item in items]
+
+
+def _iter_chunks(iterable: Iterable[Any], chunksize: int) -> Iterator[List[Any]]:
+    """Split ``iterable`` lazily into lists of up to ``chunksize`` items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
 # ── Future ────────────────────────────────────────────────────────────────────
 
 class Future:
@@ -909,9 +958,23 @@ class Future:
         self._end_time: Optional[float] = None
         self._memory_start: int = 0
         self._memory_end: int = 0
+        # Completion callbacks; None once the Future is done
+        self._callbacks: Optional[List[Callable[['Future'], None]]] = []
+        self._callbacks_lock = threading.Lock()
 
     # ── Internal methods (called by Supervisor thread) ────────────────────────
 
+    def _finish(self) -> None:
+        """Wake waiters and run completion callbacks."""
+        with self._callbacks_lock:
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, None
+        for callback in callbacks or ():
+            try:
+                callback(self)
+            except Exception:
+                logger.exception("Future callback failed | task=%s", self.task_id[:8])
+
     def _resolve(
         self,
         value: Any,
@@ -928,7 +991,7 @@ class Future:
         self._end_time = end_time
         self._memory_start = memory_start
         self._memory_end = memory_end
-        self._event.set()
+        self._finish()
 
     def _reject(
         self,
@@ -948,7 +1011,7 @@ class Future:
         self._end_time = end_time
         self._memory_start = memory_start
         self._memory_end = memory_end
-        self._event.set()
+        self._finish()
 
     # ── Public API ──────────────────────────────────────────────────────────
 
@@ -972,6 +1035,19 @@ class Future:
             raise self._exc
         return self._value
 
+    def add_done_callback(self, fn: Callable[['Future'], None]) -> None:
+        """
+        Call ``fn(future)`` once the task completes (success or failure).
+
+        Runs immediately in the calling thread if the Future is already done,
+        otherwise in the Supervisor thread, so callbacks should be quick.
+        """
+        with self._callbacks_lock:
+            if self._callbacks is not None:
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
     @property
     def done(self) -> bool:
         """Whether task has completed (success or failure)"""
@@ -2021,24 +2097,161 @@ class WorkerPool:
         logger.debug("Task[%s] submitted | fn=%s | Worker-%d", task_id[:8], fn.__name__, wid)
         return fut
 
-    def map(self, fn: Callable, iterable, timeout: Optional[float] = None) -> list:
+    def map(
+        self,
+        fn: Callable,
+        iterable,
+        timeout: Optional[float] = None,
+        chunksize: int = 1,
+    ) -> list:
         """
         Batch submit, collect results in order.
 
+        With ``chunksize`` > 1 items are sent to Workers in chunks (see
+        imap()): one task, one Future and one set of control messages per
+        chunk. Hooks and memory sampling then run per chunk, not per item.
+
         Args:
             fn: Task function
             iterable: Argument iterator
-            timeout: Timeout in seconds for each task
+            timeout: Timeout in seconds for each task (each chunk when chunked)
+            chunksize: Number of items per task (default 1: one task per item)
 
         Returns:
             list: Result list (same order as input)
 
         Raises:
+            ValueError: chunksize is less than 1
             Exception: Raised if any task fails
         """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be >= 1, got {chunksize}")
+        if chunksize > 1:
+            return list(self.imap(fn, iterable, chunksize=chunksize, timeout=timeout))
         futs = [self.submit(fn, item) for item in iterable]
         return [f.result(timeout=timeout) for f in futs]
 
+    def imap(
+        self,
+        fn: Callable,
+        iterable,
+        chunksize: int = 1,
+        max_in_flight: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Any]:
+        """
+        Lazy map: yield results in input order as they become available.
+
+        ``iterable`` is consumed lazily and split into chunks of ``chunksize``
+        items; each chunk runs as a single task. At most ``max_in_flight``
+        chunks are submitted but not yet consumed, so huge or unbounded inputs
+        never build up unbounded Futures or pipe buffers.
+
+        Args:
+            fn: Task function, called as fn(ctx, item) for every item
+            iterable: Argument iterator
+            chunksize: Number of items per task
+            max_in_flight: Maximum outstanding chunks (default 2 × n_workers)
+            timeout: Timeout in seconds waiting for each chunk
+
+        Returns:
+            Iterator over the results, same order as input
+
+        Raises:
+            ValueError: chunksize or max_in_flight is less than 1
+            TimeoutError: A chunk did not complete within timeout (on iteration)
+            Exception: The first failing item's exception (on iteration)
+        """
+        window = self._chunk_window(chunksize, max_in_flight)
+        return self._imap_ordered(_ChunkRunner(fn), iterable, chunksize, window, timeout)
+
+    def imap_unordered(
+        self,
+        fn: Callable,
+        iterable,
+        chunksize: int = 1,
+        max_in_flight: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Any]:
+        """
+        Lazy map yielding results in completion order.
+
+        Same chunking and backpressure as imap(), but a slow chunk does not
+        hold back results of chunks that finished after it. Items within a
+        chunk keep their relative order.
+
+        Args:
+            fn: Task function, called as fn(ctx, item) for every item
+            iterable: Argument iterator
+            chunksize: Number of items per task
+            max_in_flight: Maximum outstanding chunks (default 2 × n_workers)
+            timeout: Timeout in seconds waiting for the next chunk to complete
+
+        Returns:
+            Iterator over the results, in completion order
+
+        Raises:
+            ValueError: chunksize or max_in_flight is less than 1
+            TimeoutError: No chunk completed within timeout (on iteration)
+            Exception: The first failing item's exception (on iteration)
+        """
+        window = self._chunk_window(chunksize, max_in_flight)
+        return self._imap_unordered(_ChunkRunner(fn), iterable, chunksize, window, timeout)
+
+    def _chunk_window(self, chunksize: int, max_in_flight: Optional[int]) -> int:
+        """Validate chunked-map arguments and return the in-flight chunk limit."""
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be >= 1, got {chunksize}")
+        if max_in_flight is None:
+            return 2 * self._n
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+        return max_in_flight
+
+    def _imap_ordered(
+        self,
+        runner: _ChunkRunner,
+        iterable,
+        chunksize: int,
+        window: int,
+        timeout: Optional[float],
+    ) -> Iterator[Any]:
+        pending: collections.deque = collections.deque()
+        for chunk in _iter_chunks(iterable, chunksize):
+            pending.append(self.submit(runner, chunk))
+            if len(pending) >= window:
+                yield from pending.popleft().result(timeout=timeout)
+        while pending:
+            yield from pending.popleft().result(timeout=timeout)
+
+    def _imap_unordered(
+        self,
+        runner: _ChunkRunner,
+        iterable,
+        chunksize: int,
+        window: int,
+        timeout: Optional[float],
+    ) -> Iterator[Any]:
+        completed: queue.Queue = queue.Queue()
+        outstanding = 0
+        for chunk in _iter_chunks(iterable, chunksize):
+            self.submit(runner, chunk).add_done_callback(completed.put)
+            outstanding += 1
+            if outstanding >= window:
+                outstanding -= 1
+                yield from self._next_completed(completed, timeout)
+        while outstanding:
+            outstanding -= 1
+            yield from self._next_completed(completed, timeout)
+
+    @staticmethod
+    def _next_completed(completed: queue.Queue, timeout: Optional[float]) -> List[Any]:
+        try:
+            fut = completed.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No chunk completed within {timeout}s") from None
+        return fut.result()
+
     def shutdown(
         self,
         graceful_timeout: float = 10.0,
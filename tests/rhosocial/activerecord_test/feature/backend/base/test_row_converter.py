@@ -0,0 +1,173 @@
+# tests/rhosocial/activerecord_test/feature/backend/base/test_row_converter.py
+"""Tests for positional row conversion plans and their per-backend cache."""
+import json
+from datetime import datetime
+from typing import Optional
+
+import pytest
+
+from rhosocial.activerecord.backend.expression import Column, QueryExpression, TableExpression
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteBackend
+from rhosocial.activerecord.backend.row_converter import RowConverterCache, RowConverterPlan
+from rhosocial.activerecord.backend.type_adapter import BooleanAdapter, DateTimeAdapter, JSONAdapter
+
+
+class CountingAdapter(JSONAdapter):
+    """JSONAdapter recording how it is called."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = 0
+        self.values = 0
+
+    def from_database_batch(self, values, target_type, options=None):
+        self.batches += 1
+        return super().from_database_batch(values, target_type, options)
+
+    def _do_from_database(self, value, target_type, options):
+        self.values += 1
+        return super()._do_from_database(value, target_type, options)
+
+
+class ProtocolOnlyAdapter:
+    """Adapter implementing only the SQLTypeAdapter protocol."""
+
+    supported_types = {}
+
+    def from_database(self, value, target_type=None):
+        return f"adapted:{value}"
+
+    def to_database(self, value, target_type=None):
+        return value
+
+
+ROWS = [
+    (1, "2024-01-02T03:04:05", '{"a": 1}', 1),
+    (2, None, '{"b": 2}', 0),
+]
+
+
+def test_plan_converts_adapted_columns_and_maps_keys():
+    plan = RowConverterPlan(
+        ["id", "created", "doc", "flag"],
+        {
+            "created": (DateTimeAdapter(), Optional[datetime]),
+            "doc": (JSONAdapter(), dict),
+            "flag": (BooleanAdapter(), bool),
+        },
+        {"created": "created_at"},
+    )
+
+    assert plan.keys == ("id", "created_at", "doc", "flag")
+    assert [index for index, _ in plan.converters] == [1, 2, 3]
+    assert plan.to_dicts(ROWS) == [
+        {"id": 1, "created_at": datetime(2024, 1, 2, 3, 4, 5), "doc": {"a": 1}, "flag": True},
+        {"id": 2, "created_at": None, "doc": {"b": 2}, "flag": False},
+    ]
+    assert plan.to_tuples(ROWS) == [
+        (1, datetime(2024, 1, 2, 3, 4, 5), {"a": 1}, True),
+        (2, None, {"b": 2}, False),
+    ]
+
+
+def test_plan_without_adapters_copies_rows():
+    plan = RowConverterPlan(["id", "name"])
+
+    assert plan.converters == ()
+    assert plan.to_dicts([(1, "a")]) == [{"id": 1, "name": "a"}]
+    assert plan.to_tuples([[1, "a"]]) == [(1, "a")]
+    assert plan.to_dicts([]) == [] and plan.to_tuples([]) == []
+
+
+def test_plan_reads_mapping_rows_by_column_name():
+    plan = RowConverterPlan(["id", "doc"], {"doc": (JSONAdapter(), dict)}, {"doc": "document"})
+    # Dict cursors may return keys in any order
+    rows = [{"doc": '{"a": 1}', "id": 1}, {"id": 2, "doc": None}]
+
+    assert plan.to_dicts(rows) == [{"id": 1, "document": {"a": 1}}, {"id": 2, "document": None}]
+    assert plan.to_tuples(rows) == [(1, {"a": 1}), (2, None)]
+    assert RowConverterPlan(["id", "name"]).to_dicts([{"name": "a", "id": 1}]) == [{"id": 1, "name": "a"}]
+
+
+def test_columns_are_converted_in_one_batch():
+    adapter = CountingAdapter()
+    plan = RowConverterPlan(["doc"], {"doc": (adapter, dict)})
+
+    rows = [(json.dumps({"n": n}),) for n in range(5)] + [(None,)]
+    result = plan.to_dicts(rows)
+
+    assert result[-1] == {"doc": None}
+    assert adapter.batches == 1
+    assert adapter.values == 5
+
+
+def test_protocol_only_adapters_are_called_per_value():
+    plan = RowConverterPlan(["name"], {"name": (ProtocolOnlyAdapter(), str)})
+
+    assert plan.to_tuples([("x",), (None,)]) == [("adapted:x",), (None,)]
+
+
+def test_cache_reuses_plans_per_shape():
+    cache = RowConverterCache(max_size=2)
+    adapters = {"doc": (JSONAdapter(), dict)}
+
+    plan = cache.get(["id", "doc"], adapters)
+    assert cache.get(["id", "doc"], adapters) is plan
+    # Different columns or a different adapter dictionary are a different shape
+    assert cache.get(["doc"], adapters) is not plan
+    assert cache.get(["id", "doc"], dict(adapters)) is not plan
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert RowConverterCache(max_size=0).get(["id"]) is not None
+    with pytest.raises(ValueError):
+        RowConverterCache(max_size=-1)
+
+
+def test_batch_dql_applies_adapters_and_mapping():
+    backend = SQLiteBackend(database=":memory:")
+    backend.connect()
+    backend.execute("CREATE TABLE docs (id INTEGER, body TEXT)")
+    backend.execute_many("INSERT INTO docs VALUES (?, ?)", [(n, json.dumps({"n": n})) for n in range(5)])
+    dialect = backend.dialect
+    query = QueryExpression(
+        dialect, select=[Column(dialect, "id"), Column(dialect, "body")], from_=TableExpression(dialect, "docs")
+    )
+
+    pages = list(
+        backend.execute_batch_dql(
+            query, page_size=2, column_adapters={"body": (JSONAdapter(), dict)}, column_mapping={"body": "document"}
+        )
+    )
+
+    rows = [row for page in pages for row in page.data]
+    assert [page.page_size for page in pages] == [2, 2, 1]
+    assert rows[3] == {"id": 3, "document": {"n": 3}}
+    backend.disconnect()
+
+
+def test_batch_dql_accepts_dict_rows(monkeypatch):
+    backend = SQLiteBackend(database=":memory:")
+    backend.connect()
+    backend.execute("CREATE TABLE docs (id INTEGER, body TEXT)")
+    backend.execute_many("INSERT INTO docs VALUES (?, ?)", [(n, json.dumps({"n": n})) for n in range(3)])
+    dialect = backend.dialect
+    query = QueryExpression(
+        dialect, select=[Column(dialect, "id"), Column(dialect, "body")], from_=TableExpression(dialect, "docs")
+    )
+    get_cursor = backend._get_dql_cursor
+
+    def dict_cursor():
+        # Like the dict cursors of other drivers
+        cursor = get_cursor()
+        cursor.row_factory = lambda cur, row: {desc[0]: value for desc, value in zip(cur.description, row)}
+        return cursor
+
+    monkeypatch.setattr(backend, "_get_dql_cursor", dict_cursor)
+
+    pages = list(backend.execute_batch_dql(query, page_size=2, column_adapters={"body": (JSONAdapter(), dict)}))
+
+    rows = [row for page in pages for row in page.data]
+    assert rows == [{"id": n, "body": {"n": n}} for n in range(3)]
+    backend.disconnect()
@@ -0,0 +1,135 @@
+# tests/rhosocial/activerecord_test/feature/backend/dummy2/test_statement_cache.py
+import pytest
+
+from rhosocial.activerecord.backend.dialect import StatementCache, StatementCacheStats
+from rhosocial.activerecord.backend.expression import (
+    Column, Literal, TableExpression, QueryExpression, RawSQLPredicate,
+)
+from rhosocial.activerecord.backend.expression.query_parts import WhereClause, LimitOffsetClause
+from rhosocial.activerecord.backend.impl.dummy.dialect import DummyDialect
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteDialect
+
+
+def _build_query(dialect, name, limit=10, ids=(1, 2, 3)):
+    return QueryExpression(
+        dialect,
+        select=[Column(dialect, "id"), Column(dialect, "name")],
+        from_=TableExpression(dialect, "users"),
+        where=WhereClause(
+            dialect,
+            (Column(dialect, "name") == Literal(dialect, name)) & Column(dialect, "id").in_(list(ids)),
+        ),
+        limit_offset=LimitOffsetClause(dialect, limit=limit, offset=0),
+    )
+
+
+def _uncached(query):
+    return query.dialect.format_query_statement(query)
+
+
+class TestStatementCache:
+    """Tests for the shape-keyed compiled statement cache."""
+
+    def test_same_shape_reuses_compiled_sql(self, dummy_dialect: DummyDialect):
+        first = _build_query(dummy_dialect, "alice").to_sql()
+        second = _build_query(dummy_dialect, "bob", limit=5, ids=(7, 8, 9)).to_sql()
+
+        assert first[0] == second[0]
+        assert first[1] == ("alice", 1, 2, 3, 10, 0)
+        assert second[1] == ("bob", 7, 8, 9, 5, 0)
+
+        stats = dummy_dialect.statement_cache.stats
+        assert stats.misses == 1
+        assert stats.hits == 1
+        assert stats.size == 1
+
+    def test_cached_result_matches_uncached_compilation(self, dummy_dialect: DummyDialect):
+        _build_query(dummy_dialect, "warmup").to_sql()
+        query = _build_query(dummy_dialect, "carol", limit=3, ids=(4, 5, 6))
+        assert query.to_sql() == _uncached(query)
+        assert dummy_dialect.statement_cache.stats.hits == 1
+
+    def test_different_shapes_are_cached_separately(self, dummy_dialect: DummyDialect):
+        sql_three, _ = _build_query(dummy_dialect, "a", ids=(1, 2, 3)).to_sql()
+        sql_two, params = _build_query(dummy_dialect, "a", ids=(1, 2)).to_sql()
+
+        assert sql_three != sql_two
+        assert params == ("a", 1, 2, 10, 0)
+        assert dummy_dialect.statement_cache.stats.misses == 2
+
+    def test_value_type_is_part_of_shape(self, dummy_dialect: DummyDialect):
+        _build_query(dummy_dialect, "a").to_sql()
+        _build_query(dummy_dialect, None).to_sql()
+        assert dummy_dialect.statement_cache.stats.hits == 0
+
+    def test_raw_sql_params_are_rebound(self, dummy_dialect: DummyDialect):
+        def build(value):
+            return QueryExpression(
+                dummy_dialect,
+                select=[Column(dummy_dialect, "id")],
+                from_=TableExpression(dummy_dialect, "users"),
+                where=WhereClause(dummy_dialect, RawSQLPredicate(dummy_dialect, "age > ?", (value,))),
+            )
+
+        assert build(18).to_sql()[1] == (18,)
+        sql, params = build(65).to_sql()
+        assert params == (65,)
+        assert sql == _uncached(build(65))[0]
+        assert dummy_dialect.statement_cache.stats.hits == 1
+
+    def test_lru_eviction(self, dummy_dialect: DummyDialect):
+        dummy_dialect.statement_cache.max_size = 2
+        _build_query(dummy_dialect, "a", ids=(1,)).to_sql()
+        _build_query(dummy_dialect, "a", ids=(1, 2)).to_sql()
+        _build_query(dummy_dialect, "a", ids=(1,)).to_sql()  # refresh the first shape
+        _build_query(dummy_dialect, "a", ids=(1, 2, 3)).to_sql()  # evicts the second shape
+
+        stats = dummy_dialect.statement_cache.stats
+        assert stats.evictions == 1
+        assert stats.size == 2
+
+        _build_query(dummy_dialect, "a", ids=(1,)).to_sql()
+        assert dummy_dialect.statement_cache.stats.hits == 2
+
+    def test_disabled_cache_bypasses_everything(self, dummy_dialect: DummyDialect):
+        dummy_dialect.statement_cache.max_size = 0
+        assert not dummy_dialect.statement_cache.enabled
+        query = _build_query(dummy_dialect, "a")
+        assert query.to_sql() == _uncached(query)
+        query.to_sql()
+
+        stats = dummy_dialect.statement_cache.stats
+        assert stats.hits == stats.misses == 0
+        assert stats.size == 0
+
+    def test_clear_and_reset_stats(self, dummy_dialect: DummyDialect):
+        _build_query(dummy_dialect, "a").to_sql()
+        _build_query(dummy_dialect, "b").to_sql()
+        cache = dummy_dialect.statement_cache
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats.hits == 1
+
+        cache.reset_stats()
+        assert cache.stats == StatementCacheStats(max_size=cache.max_size)
+
+    def test_stats_to_dict(self):
+        stats = StatementCacheStats(hits=3, misses=1, evictions=0, uncacheable=0, size=1, max_size=8)
+        assert stats.hit_rate == pytest.approx(0.75)
+        assert stats.to_dict()["hits"] == 3
+
+    def test_negative_max_size_rejected(self):
+        with pytest.raises(ValueError):
+            StatementCache(max_size=-1)
+
+    def test_sqlite_version_change_clears_cache(self):
+        dialect = SQLiteDialect()
+        _build_query(dialect, "a").to_sql()
+        assert len(dialect.statement_cache) == 1
+
+        dialect.version = (3, 45, 0)
+        assert len(dialect.statement_cache) == 0
+
+        _build_query(dialect, "a").to_sql()
+        dialect.set_runtime_param("json1_available", True)
+        assert len(dialect.statement_cache) == 0
@@ -0,0 +1,240 @@
+# tests/rhosocial/activerecord_test/feature/backend/named_query/test_procedure_bindings.py
+"""
+Tests for streamed and spilled procedure bindings (BindMode).
+
+These run against a real in-memory SQLite backend because spilling relies
+on temporary tables living on the procedure's connection.
+"""
+import types
+from unittest.mock import patch
+
+import pytest
+
+from rhosocial.activerecord.backend.expression import (
+    Column,
+    Literal,
+    QueryExpression,
+    TableExpression,
+)
+from rhosocial.activerecord.backend.expression.functions.aggregate import count
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteBackend
+from rhosocial.activerecord.backend.impl.sqlite.backend.async_backend import AsyncSQLiteBackend
+from rhosocial.activerecord.backend.named_query import (
+    AsyncProcedure,
+    AsyncProcedureContext,
+    AsyncProcedureRunner,
+    BindMode,
+    Procedure,
+    ProcedureContext,
+    ProcedureRunner,
+    SpilledRows,
+    StreamedRows,
+    TransactionMode,
+    resolve_named_query,
+)
+from rhosocial.activerecord.backend.options import ExecutionOptions
+
+ROW_COUNT = 250
+
+
+def items_above(dialect, min_id: int = 0):
+    """Rows of the items table with id > min_id."""
+    return QueryExpression(
+        dialect,
+        select=[Column(dialect, "id"), Column(dialect, "v")],
+        from_=TableExpression(dialect, "items"),
+        where=Column(dialect, "id") > Literal(dialect, min_id),
+    )
+
+
+def count_rows(dialect, source: str):
+    """Count the rows of a (spilled) table."""
+    return QueryExpression(
+        dialect, select=[count(dialect, "*").as_("n")], from_=TableExpression(dialect, source)
+    )
+
+
+def _module(**procedures) -> types.ModuleType:
+    module = types.ModuleType("binding_procs")
+    module.items_above = items_above
+    module.count_rows = count_rows
+    for name, proc in procedures.items():
+        setattr(module, name, proc)
+    return module
+
+
+def _temp_tables(backend) -> list:
+    rows = backend.fetch_all("SELECT name FROM sqlite_temp_master WHERE type = 'table'")
+    return [row["name"] for row in rows]
+
+
+@pytest.fixture
+def backend():
+    backend = SQLiteBackend(database=":memory:")
+    backend.connect()
+    backend.executescript(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, v INTEGER);"
+        + "".join(f"INSERT INTO items (id, v) VALUES ({i}, {i * 10});" for i in range(1, ROW_COUNT + 1))
+    )
+    yield backend
+    backend.disconnect()
+
+
+@pytest.fixture
+def ctx(backend):
+    def execute_callback(fqn, dialect, params):
+        expression, sql, params_sql = resolve_named_query(fqn, dialect, params)
+        raw = backend.execute(sql, params_sql, options=ExecutionOptions(stmt_type=expression.statement_type))
+        return {"sql": sql, "params_sql": params_sql, "data": raw.data or [], "affected_rows": raw.affected_rows}
+
+    return ProcedureContext(backend.dialect, execute_callback, TransactionMode.NONE, backend)
+
+
+class TestStreamBinding:
+    """BindMode.STREAM reads lazily, one page at a time."""
+
+    def test_rows_are_read_in_pages(self, ctx, backend):
+        with patch("importlib.import_module", return_value=_module()):
+            result = ctx.execute("binding_procs.items_above", bind="items", mode=BindMode.STREAM, fetch_size=100)
+
+        assert isinstance(result["data"], StreamedRows)
+        with patch.object(backend, "execute_batch_dql", wraps=backend.execute_batch_dql) as batches:
+            ids = [row["id"] for row in ctx.rows("items")]
+        assert ids == list(range(1, ROW_COUNT + 1))
+        assert batches.call_args.kwargs["page_size"] == 100
+
+    def test_scalar_reads_first_row(self, ctx):
+        with patch("importlib.import_module", return_value=_module()):
+            ctx.execute("binding_procs.items_above", {"min_id": 10}, bind="items", mode="stream")
+        assert ctx.scalar("items", "id") == 11
+
+    def test_requires_bind_and_rejects_output(self, ctx):
+        with pytest.raises(ValueError):
+            ctx.execute("binding_procs.items_above", mode=BindMode.STREAM)
+        with pytest.raises(ValueError):
+            ctx.execute("binding_procs.items_above", bind="items", output=True, mode=BindMode.STREAM)
+
+
+class TestSpillBinding:
+    """BindMode.SPILL / AUTO keep intermediates in temporary tables."""
+
+    def test_spill_to_temp_table(self, ctx, backend):
+        with patch("importlib.import_module", return_value=_module()):
+            ctx.execute("binding_procs.items_above", bind="items", mode=BindMode.SPILL)
+            table = ctx.table("items")
+            assert table in _temp_tables(backend)
+
+            # Later steps join against the spilled table server-side
+            ctx.execute("binding_procs.count_rows", {"source": table}, bind="total")
+
+        assert len(ctx.bindings["items"]["data"]) == ROW_COUNT
+        assert ctx.scalar("total", "n") == ROW_COUNT
+        assert sum(1 for _ in ctx.rows("items")) == ROW_COUNT
+
+    def test_rebinding_drops_previous_table(self, ctx, backend):
+        with patch("importlib.import_module", return_value=_module()):
+            ctx.execute("binding_procs.items_above", bind="items", mode=BindMode.SPILL)
+            first = ctx.table("items")
+            ctx.execute("binding_procs.items_above", {"min_id": 200}, bind="items", mode=BindMode.SPILL)
+
+        assert _temp_tables(backend) == [ctx.table("items")]
+        assert first not in _temp_tables(backend)
+
+    def test_auto_materializes_small_results(self, ctx, backend):
+        with patch("importlib.import_module", return_value=_module()):
+            with patch.object(backend, "execute", wraps=backend.execute) as statements:
+                small = ctx.execute(
+                    "binding_procs.items_above", {"min_id": 240}, bind="small", mode=BindMode.AUTO, spill_threshold=50
+                )
+                # Exactly at the threshold still fits
+                edge = ctx.execute(
+                    "binding_procs.items_above", {"min_id": 200}, bind="edge", mode=BindMode.AUTO, spill_threshold=50
+                )
+            large = ctx.execute("binding_procs.items_above", bind="large", mode=BindMode.AUTO, spill_threshold=50)
+
+        # Results that fit are read once; no temporary table is created for them
+        assert statements.call_count == 0
+        assert isinstance(small["data"], list) and len(small["data"]) == 10
+        assert [row["id"] for row in edge["data"]] == list(range(201, ROW_COUNT + 1))
+        assert isinstance(large["data"], SpilledRows)
+        assert _temp_tables(backend) == [ctx.table("large")]
+        with pytest.raises(ValueError):
+            ctx.table("small")
+
+    def test_runner_drops_tables_at_end(self, backend):
+        class SpillProc(Procedure):
+            def run(self, ctx: ProcedureContext) -> None:
+                ctx.execute("binding_procs.items_above", bind="items", mode=BindMode.SPILL)
+                ctx.execute("binding_procs.count_rows", {"source": ctx.table("items")}, bind="total", output=True)
+
+        with patch("importlib.import_module", return_value=_module(SpillProc=SpillProc)):
+            result = ProcedureRunner("binding_procs.SpillProc").load().run(backend)
+
+        assert result.success, result.abort_reason
+        assert result.outputs[0]["data"] == [{"n": ROW_COUNT}]
+        assert _temp_tables(backend) == []
+
+    def test_runner_drops_tables_after_abort(self, backend):
+        class FailingProc(Procedure):
+            def run(self, ctx: ProcedureContext) -> None:
+                ctx.execute("binding_procs.items_above", bind="items", mode=BindMode.SPILL)
+                ctx.abort("binding_procs.FailingProc", "stop")
+
+        with patch("importlib.import_module", return_value=_module(FailingProc=FailingProc)):
+            result = ProcedureRunner("binding_procs.FailingProc").load().run(
+                backend, transaction_mode=TransactionMode.NONE
+            )
+
+        assert result.aborted
+        assert _temp_tables(backend) == []
+
+
+class TestAsyncBindings:
+    """AsyncProcedureContext supports the same modes."""
+
+    @pytest.mark.asyncio
+    async def test_async_stream_and_spill(self):
+        backend = AsyncSQLiteBackend(database=":memory:")
+        await backend.connect()
+        try:
+            await backend.executescript(
+                "CREATE TABLE items (id INTEGER PRIMARY KEY, v INTEGER);"
+                + "".join(f"INSERT INTO items (id, v) VALUES ({i}, {i});" for i in range(1, 31))
+            )
+
+            class AsyncSpillProc(AsyncProcedure):
+                async def run(self, ctx: AsyncProcedureContext) -> None:
+                    await ctx.execute("binding_procs.items_above", bind="streamed", mode=BindMode.STREAM, fetch_size=7)
+                    ids = [row["id"] async for row in ctx.rows("streamed")]
+                    await ctx.log(f"streamed={len(ids)}")
+
+                    await ctx.execute("binding_procs.items_above", {"min_id": 20}, bind="spilled", mode=BindMode.SPILL)
+                    await ctx.log(f"first={await ctx.scalar('spilled', 'id')}")
+                    await ctx.execute(
+                        "binding_procs.count_rows", {"source": ctx.table("spilled")}, bind="total", output=True
+                    )
+
+                    small = await ctx.execute(
+                        "binding_procs.items_above", {"min_id": 25}, bind="small", mode=BindMode.AUTO, spill_threshold=5
+                    )
+                    large = await ctx.execute(
+                        "binding_procs.items_above", {"min_id": 24}, bind="large", mode=BindMode.AUTO, spill_threshold=5
+                    )
+                    await ctx.log(f"small={small['data']!r}")
+                    await ctx.log(f"large={len(large['data'])}:{type(large['data']).__name__}")
+
+            with patch("importlib.import_module", return_value=_module(AsyncSpillProc=AsyncSpillProc)):
+                result = await AsyncProcedureRunner("binding_procs.AsyncSpillProc").load().run(backend)
+
+            assert result.success, result.abort_reason
+            assert [log.message for log in result.logs] == [
+                "streamed=30",
+                "first=21",
+                f"small={[{'id': i, 'v': i} for i in range(26, 31)]!r}",
+                "large=6:AsyncSpilledRows",
+            ]
+            assert result.outputs[0]["data"] == [{"n": 10}]
+            temp = await backend.fetch_all("SELECT name FROM sqlite_temp_master WHERE type = 'table'")
+            assert temp == []
+        finally:
+            await backend.disconnect()
@@ -1232,4 +1232,256 @@ class TestStepTraceEntry:
         assert entry.status == StepStatus.PENDING
         assert entry.sql == ""
         assert entry.elapsed_ms == 0.0
-        assert entry.error is None
\ No newline at end of file
+        assert entry.error is None
+
+
+class _TimedExpr:
+    """Expression stand-in whose SQL names the step, for timed fake backends."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def to_sql(self):
+        return self.name, ()
+
+
+class _FakePool:
+    """Pool stand-in handing out one fresh backend per connection() call."""
+
+    def __init__(self, execute):
+        import threading
+
+        self._execute = execute
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.peak = 0
+        self.acquired = 0
+
+    def _enter(self):
+        with self._lock:
+            self.in_use += 1
+            self.acquired += 1
+            self.peak = max(self.peak, self.in_use)
+
+    def _exit(self):
+        with self._lock:
+            self.in_use -= 1
+
+    def connection(self):
+        from contextlib import contextmanager
+
+        @contextmanager
+        def _connection():
+            self._enter()
+            try:
+                yield MagicMock(execute=self._execute)
+            finally:
+                self._exit()
+
+        return _connection()
+
+
+class _AsyncFakePool(_FakePool):
+    """Async version of _FakePool."""
+
+    def connection(self):
+        from contextlib import asynccontextmanager
+
+        @asynccontextmanager
+        async def _connection():
+            self._enter()
+            try:
+                yield MagicMock(execute=self._execute)
+            finally:
+                self._exit()
+
+        return _connection()
+
+
+_DELAYS = {"slow": 0.3}
+
+
+def _sleepy_execute(sql, params):
+    import time as _time
+
+    _time.sleep(_DELAYS.get(sql, 0.02))
+    return MagicMock(data=[], affected_rows=0)
+
+
+async def _async_sleepy_execute(sql, params):
+    import asyncio
+
+    await asyncio.sleep(_DELAYS.get(sql, 0.02))
+    return MagicMock(data=[], affected_rows=0)
+
+
+class _BlockingSteps:
+    """Step executor holding "slow" until "after_fast" has started.
+
+    Records start/end events, so ordering is asserted without timing. If
+    after_fast waited for slow, slow would be released only by the timeout.
+    """
+
+    def __init__(self):
+        import threading
+
+        self.after_fast_started = threading.Event()
+        self.released = None
+        self.events = []
+
+    def execute(self, sql, params):
+        self.events.append(f"start {sql}")
+        if sql == "slow":
+            self.released = self.after_fast_started.wait(timeout=5)
+        elif sql == "after_fast":
+            self.after_fast_started.set()
+        self.events.append(f"end {sql}")
+        return MagicMock(data=[], affected_rows=0)
+
+    def assert_fast_branch_did_not_wait(self):
+        assert self.released
+        assert self.events.index("start after_fast") < self.events.index("end slow")
+        assert self.events.index("start after_slow") > self.events.index("end slow")
+
+
+class _AsyncBlockingSteps(_BlockingSteps):
+    """Async version of _BlockingSteps; create it inside the running loop."""
+
+    def __init__(self):
+        import asyncio
+
+        super().__init__()
+        self.after_fast_started = asyncio.Event()
+
+    async def execute(self, sql, params):
+        import asyncio
+
+        self.events.append(f"start {sql}")
+        if sql == "slow":
+            try:
+                await asyncio.wait_for(self.after_fast_started.wait(), timeout=5)
+                self.released = True
+            except asyncio.TimeoutError:
+                self.released = False
+        elif sql == "after_fast":
+            self.after_fast_started.set()
+        self.events.append(f"end {sql}")
+        return MagicMock(data=[], affected_rows=0)
+
+
+def _branching_graph(transaction_mode=None) -> ProcedureGraph:
+    """A slow branch (slow -> after_slow) next to a fast chain (fast -> after_fast)."""
+    from rhosocial.activerecord.backend.named_query.procedure_graph import TransactionMode
+
+    return (
+        ProcedureGraph(transaction_mode=transaction_mode or TransactionMode.NONE, strict=False)
+        | StepNode.expr("slow", _TimedExpr("slow"))
+        | StepNode.expr("fast", _TimedExpr("fast"))
+        | StepNode.expr("after_fast", _TimedExpr("after_fast"), depends_on=["fast"])
+        | StepNode.expr("after_slow", _TimedExpr("after_slow"), depends_on=["slow"])
+    )
+
+
+def _entries(result: ProcedureGraphResult) -> dict:
+    return {entry.name: entry for entry in result.steps_done}
+
+
+class TestReadyQueueScheduling:
+    """Steps start when their own dependencies finish, not per wave."""
+
+    def test_downstream_of_fast_branch_does_not_wait_for_slow_step(self, mock_dialect, mock_backend):
+        steps = _BlockingSteps()
+        pool = _FakePool(steps.execute)
+        runner = ProcedureGraphRunner(mock_backend, dialect=mock_dialect, parallel_wave=True, pool=pool)
+        result = runner.run(_branching_graph())
+
+        steps.assert_fast_branch_did_not_wait()
+        assert result.waves_count == 2
+        assert pool.peak == 2 and pool.acquired == 4
+        mock_backend.execute.assert_not_called()
+
+    def test_critical_path_starts_first(self, mock_dialect, mock_backend):
+        from rhosocial.activerecord.backend.named_query.procedure_graph import TransactionMode
+
+        order = []
+        mock_backend.execute.side_effect = lambda sql, params: order.append(sql)
+        graph = (
+            ProcedureGraph(transaction_mode=TransactionMode.NONE, strict=False)
+            | StepNode.expr("leaf", _TimedExpr("leaf"))
+            | StepNode.expr("head", _TimedExpr("head"))
+            | StepNode.expr("middle", _TimedExpr("middle"), depends_on=["head"])
+            | StepNode.expr("tail", _TimedExpr("tail"), depends_on=["middle"])
+        )
+        runner = ProcedureGraphRunner(mock_backend, dialect=mock_dialect, parallel_wave=True, max_concurrency=1)
+        runner.run(graph)
+
+        # head leads the longest chain, so it goes before the earlier-declared leaf
+        assert order == ["head", "middle", "leaf", "tail"]
+
+        # A sequential run keeps wave order
+        order.clear()
+        ProcedureGraphRunner(mock_backend, dialect=mock_dialect).run(graph)
+        assert order == ["leaf", "head", "middle", "tail"]
+
+    def test_failure_stops_new_steps(self, mock_dialect, mock_backend):
+        def execute(sql, params):
+            if sql == "fast":
+                raise RuntimeError("boom")
+            return _sleepy_execute(sql, params)
+
+        runner = ProcedureGraphRunner(
+            mock_backend, dialect=mock_dialect, parallel_wave=True, pool=_FakePool(execute)
+        )
+        with pytest.raises(RuntimeError, match="boom"):
+            runner.run(_branching_graph())
+
+    def test_pool_not_used_inside_graph_transaction(self, mock_dialect, mock_backend):
+        from rhosocial.activerecord.backend.named_query.procedure_graph import TransactionMode
+
+        pool = _FakePool(_sleepy_execute)
+        runner = ProcedureGraphRunner(mock_backend, dialect=mock_dialect, parallel_wave=True, pool=pool)
+        result = runner.run(_branching_graph(TransactionMode.AUTO))
+
+        assert result.success
+        assert pool.acquired == 0
+        assert mock_backend.execute.call_count == 4
+        mock_backend.begin_transaction.assert_called_once()
+
+    def test_sequential_run_records_queue_time(self, mock_dialect, mock_backend):
+        mock_backend.execute.side_effect = _sleepy_execute
+        runner = ProcedureGraphRunner(mock_backend, dialect=mock_dialect)
+        result = runner.run(_branching_graph())
+
+        steps = _entries(result)
+        assert [entry.name for entry in result.steps_done] == [
+            node.name for wave in _branching_graph().waves() for node in wave
+        ]
+        assert steps["fast"].queue_ms >= steps["slow"].elapsed_ms
+        assert "queue_ms" in steps["fast"].to_dict()
+
+    def test_invalid_max_concurrency(self, mock_dialect, mock_backend):
+        with pytest.raises(ValueError):
+            ProcedureGraphRunner(mock_backend, dialect=mock_dialect, max_concurrency=0)
+        with pytest.raises(ValueError):
+            AsyncProcedureGraphRunner(mock_backend, dialect=mock_dialect, max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_async_ready_queue_with_pool(self, mock_dialect, mock_backend):
+        steps = _AsyncBlockingSteps()
+        pool = _AsyncFakePool(steps.execute)
+        runner = AsyncProcedureGraphRunner(mock_backend, dialect=mock_dialect, pool=pool)
+        await runner.run(_branching_graph())
+
+        steps.assert_fast_branch_did_not_wait()
+        assert pool.peak == 2 and pool.acquired == 4
+
+    @pytest.mark.asyncio
+    async def test_async_failure_raises(self, mock_dialect, mock_backend):
+        async def execute(sql, params):
+            if sql == "fast":
+                raise RuntimeError("boom")
+            return await _async_sleepy_execute(sql, params)
+
+        runner = AsyncProcedureGraphRunner(mock_backend, dialect=mock_dialect, pool=_AsyncFakePool(execute))
+        with pytest.raises(RuntimeError, match="boom"):
+            await runner.run(_branching_graph())
@@ -24,6 +24,14 @@ from rhosocial.activerecord.backend.named_query.exceptions import (
     NamedQueryNotCallableError,
 )
 from rhosocial.activerecord.backend.schema import StatementType
+from rhosocial.activerecord.backend.expression import (
+    Column,
+    LimitOffsetClause,
+    PreparedStatement,
+    QueryExpression,
+    TableExpression,
+)
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteDialect
 
 
 class DummyCallable:
@@ -220,6 +228,50 @@ class TestNamedQueryResolverExecute:
             resolver.execute(mock_dialect, {})
 
 
+class TestNamedQueryResolverPrepare:
+    """Tests for NamedQueryResolver.prepare()."""
+
+    @staticmethod
+    def _users_by_status(dialect, status: str, limit: int = 10):
+        return QueryExpression(
+            dialect,
+            select=[Column(dialect, "id")],
+            from_=TableExpression(dialect, "users"),
+            where=Column(dialect, "status") == status,
+            limit_offset=LimitOffsetClause(dialect, limit=limit),
+        )
+
+    def _resolver(self):
+        module = types.ModuleType("test_prepared")
+        module.users_by_status = self._users_by_status
+        with patch("importlib.import_module", return_value=module):
+            return NamedQueryResolver("test_prepared.users_by_status").load()
+
+    def test_prepare_binds_params_per_call(self):
+        """The callable runs once; values are bound on every call."""
+        dialect = SQLiteDialect()
+        prepared = self._resolver().prepare(dialect)
+
+        assert isinstance(prepared, PreparedStatement)
+        assert prepared.param_names == ("status", "limit")
+
+        expected_sql, _ = self._users_by_status(dialect, "active").to_sql()
+        assert prepared.bind(status="active") == (expected_sql, ("active", 10))
+        assert prepared.bind(status="banned", limit=3) == (expected_sql, ("banned", 3))
+
+    def test_prepare_with_fixed_params(self):
+        """Fixed parameters are compiled into the statement."""
+        prepared = self._resolver().prepare(SQLiteDialect(), {"limit": 5})
+        assert prepared.param_names == ("status",)
+        assert prepared.bind(status="active")[1] == ("active", 5)
+
+    def test_prepare_before_load(self, mock_dialect):
+        """Test prepare before loading fails."""
+        resolver = NamedQueryResolver("myapp.queries.func")
+        with pytest.raises(NamedQueryNotCallableError):
+            resolver.prepare(mock_dialect)
+
+
 class TestValidateExpression:
     """Tests for validate_expression function."""
 
@@ -0,0 +1,162 @@
+# tests/rhosocial/activerecord_test/feature/backend/sqlite/test_cli_query_streaming.py
+"""
+Tests for streamed output of the SQLite CLI query subcommand.
+
+SELECT results are read with fetchmany() --page-size rows at a time and
+written page by page through the output provider's begin/write/end API.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import tempfile
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteBackend
+from rhosocial.activerecord.backend.impl.sqlite.cli import query as query_cli
+from rhosocial.activerecord.backend.output import (
+    CsvOutputProvider,
+    JsonOutputProvider,
+    NdjsonOutputProvider,
+    TsvOutputProvider,
+)
+
+ROW_COUNT = 20000
+PAYLOAD = "x" * 200
+
+
+class _CountingSink(io.TextIOBase):
+    """stdout stand-in that counts what is written without keeping it."""
+
+    def __init__(self):
+        self.chars = 0
+        self.flushes = 0
+
+    def write(self, text):
+        self.chars += len(text)
+        return len(text)
+
+    def flush(self):
+        self.flushes += 1
+
+
+@pytest.fixture(scope="module")
+def db_path():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    backend = SQLiteBackend(database=path)
+    backend.connect()
+    backend.executescript(
+        "CREATE TABLE events (id INTEGER PRIMARY KEY, payload TEXT);"
+        f"WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < {ROW_COUNT}) "
+        f"INSERT INTO events (id, payload) SELECT i, '{PAYLOAD}' FROM n;"
+    )
+    backend.disconnect()
+    yield path
+    os.unlink(path)
+
+
+def _run(db_path, provider, sql="SELECT id, payload FROM events", page_size=1000):
+    query_cli._execute_query(sql, SQLiteBackend(database=db_path), provider, page_size=page_size)
+
+
+class TestStreamingProviders:
+    """begin_results / write_rows / end_results of the text providers."""
+
+    def test_streamed_json_matches_buffered(self, capsys):
+        rows = [{"id": 1, "name": "a"}, {"id": 2, "name": {"nested": [1, 2]}}]
+        JsonOutputProvider().display_results(rows)
+        buffered = capsys.readouterr().out
+
+        provider = JsonOutputProvider()
+        provider.begin_results(["id", "name"])
+        provider.write_rows(rows[:1])
+        provider.write_rows(rows[1:])
+        provider.end_results()
+        assert capsys.readouterr().out == buffered
+
+    def test_ndjson_writes_one_object_per_line(self, capsys):
+        provider = NdjsonOutputProvider()
+        provider.begin_results(["id"])
+        provider.write_rows([{"id": 1}, {"id": 2}])
+        provider.end_results()
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [{"id": 1}, {"id": 2}]
+
+    def test_csv_and_tsv_flush_each_page(self):
+        for provider_class in (CsvOutputProvider, TsvOutputProvider):
+            sink = _CountingSink()
+            with patch("sys.stdout", sink):
+                provider = provider_class()
+                provider.begin_results(["id"])
+                provider.write_rows([{"id": 1}])
+                provider.write_rows([{"id": 2}])
+                provider.end_results()
+            assert sink.flushes == 2
+
+    def test_table_provider_buffers_until_end(self):
+        from rich.console import Console
+        from rhosocial.activerecord.backend.output_rich import RichOutputProvider
+
+        out = io.StringIO()
+        provider = RichOutputProvider(console=Console(file=out, width=80))
+        provider.begin_results(["id"])
+        provider.write_rows([{"id": 1}])
+        provider.write_rows([{"id": 2}])
+        assert out.getvalue() == ""
+        provider.end_results()
+        assert "1" in out.getvalue() and "2" in out.getvalue()
+
+
+class TestQueryStreaming:
+    """The query subcommand streams SELECT results page by page."""
+
+    def test_pages_use_requested_size(self, db_path, capsys):
+        with patch.object(SQLiteBackend, "execute_batch_dql", autospec=True,
+                          side_effect=SQLiteBackend.execute_batch_dql) as batches:
+            _run(db_path, NdjsonOutputProvider(), page_size=250)
+        assert batches.call_args.kwargs["page_size"] == 250
+        assert len(capsys.readouterr().out.splitlines()) == ROW_COUNT
+
+    def test_csv_output(self, db_path, capsys):
+        _run(db_path, CsvOutputProvider(), sql="SELECT id, payload FROM events WHERE id <= 3", page_size=2)
+        rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+        assert rows == [["id", "payload"], ["1", PAYLOAD], ["2", PAYLOAD], ["3", PAYLOAD]]
+
+    def test_empty_result(self, db_path, capsys):
+        provider = CsvOutputProvider()
+        with patch.object(provider, "display_no_data") as no_data:
+            _run(db_path, provider, sql="SELECT id FROM events WHERE id < 0")
+        no_data.assert_called_once()
+        assert capsys.readouterr().out == ""
+
+    def test_memory_stays_bounded(self, db_path):
+        """Peak allocation is a small fraction of the result, not the result itself."""
+        result_size = ROW_COUNT * len(PAYLOAD)
+        sink = _CountingSink()
+        tracemalloc.start()
+        try:
+            with patch("sys.stdout", sink):
+                _run(db_path, NdjsonOutputProvider(), page_size=200)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert sink.chars > result_size
+        assert peak < result_size / 4
+
+    def test_non_query_statement_uses_execute(self, db_path, capsys):
+        provider = JsonOutputProvider()
+        with patch.object(provider, "begin_results") as begin:
+            _run(db_path, provider, sql="UPDATE events SET payload = payload WHERE id = 1")
+        begin.assert_not_called()
+
+    def test_page_size_must_be_positive(self):
+        parser = argparse.ArgumentParser()
+        query_cli.create_parser(parser.add_subparsers())
+        with pytest.raises(SystemExit):
+            parser.parse_args(["query", "--page-size", "0", "SELECT 1"])
+        assert parser.parse_args(["query", "SELECT 1"]).page_size == query_cli.DEFAULT_PAGE_SIZE
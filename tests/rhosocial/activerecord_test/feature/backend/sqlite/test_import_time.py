@@ -0,0 +1,145 @@
+# tests/rhosocial/activerecord_test/feature/backend/sqlite/test_import_time.py
+"""
+Startup budget for the SQLite backend package and CLI.
+
+Each check runs a fresh interpreter with ``-X importtime``. The module
+checks read the child's ``sys.modules`` (``-X importtime`` does not report
+modules loaded through ``importlib.import_module``) and are exact.
+
+Import time is checked relative to ``import asyncio`` measured in the same
+child, so the check holds on any machine and under load (e.g. pytest -n 8).
+An absolute wall-clock budget only runs when RHOSOCIAL_IMPORT_BUDGET_MS sets
+one, e.g. 250.
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+PACKAGE = "rhosocial.activerecord.backend.impl.sqlite"
+SQLITE = PACKAGE + "."
+
+# Loaded only on first use of the corresponding feature
+DEFERRED_MODULES = [
+    "pydantic",
+    "rich",
+    "rhosocial.activerecord.backend.explain.types",
+    "rhosocial.activerecord.backend.introspection.types",
+    "rhosocial.activerecord.backend.expression.statements.ddl_alter",
+    SQLITE + "explain.types",
+    SQLITE + "extension",
+    SQLITE + "pragma",
+    SQLITE + "functions",
+]
+
+MAX_RHOSOCIAL_MODULES = 80
+# Stdlib import the package time is compared with; the eager package took
+# about 7x as long, the lazy one takes about 1.3x.
+REFERENCE_MODULE = "asyncio"
+MAX_IMPORT_RATIO = 3.0
+IMPORT_BUDGET_MS = os.environ.get("RHOSOCIAL_IMPORT_BUDGET_MS")
+
+_IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+_MODULES_MARKER = "LOADED MODULES: "
+
+_CLI_SCRIPT = f"""
+import runpy, sys
+sys.argv = ["sqlite", "query", "--db-file", ":memory:", "-o", "json", "SELECT 1"]
+runpy.run_module("{PACKAGE}", run_name="__main__")
+"""
+
+
+def _run(code):
+    """Run code in a fresh interpreter with -X importtime.
+
+    Returns:
+        ({module: cumulative import time in ms}, set of loaded module names)
+    """
+    code = (
+        "try:\n" + textwrap.indent(code.strip(), "    ") + "\nfinally:\n"
+        f"    import json, sys; print({_MODULES_MARKER!r} + json.dumps(sorted(sys.modules)))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    times = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORT_TIME.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2)) / 1000
+    line = next(line for line in proc.stdout.splitlines() if line.startswith(_MODULES_MARKER))
+    return times, set(json.loads(line[len(_MODULES_MARKER):]))
+
+
+def _loaded(modules, module):
+    return any(name == module or name.startswith(module + ".") for name in modules)
+
+
+class TestPackageImport:
+    """import rhosocial.activerecord.backend.impl.sqlite"""
+
+    @pytest.fixture(scope="class")
+    def modules(self):
+        return _run(f"import {PACKAGE}")[1]
+
+    @pytest.mark.parametrize("module", DEFERRED_MODULES)
+    def test_module_is_deferred(self, modules, module):
+        assert not _loaded(modules, module)
+
+    def test_module_count(self, modules):
+        rhosocial = [name for name in modules if name.startswith("rhosocial")]
+        assert len(rhosocial) <= MAX_RHOSOCIAL_MODULES, sorted(rhosocial)
+
+    def test_time_relative_to_reference(self):
+        # The reference is imported first, so the modules both need are
+        # charged to it and the package is measured on its own modules.
+        ratios = []
+        for _ in range(3):
+            times = _run(f"import {REFERENCE_MODULE}\nimport {PACKAGE}")[0]
+            ratios.append(times[PACKAGE] / times[REFERENCE_MODULE])
+        # Best of three runs, to keep scheduler noise out of the measurement
+        best = min(ratios)
+        assert best <= MAX_IMPORT_RATIO, (
+            f"import took {best:.1f}x as long as import {REFERENCE_MODULE} (limit {MAX_IMPORT_RATIO}x)"
+        )
+
+    @pytest.mark.skipif(IMPORT_BUDGET_MS is None, reason="RHOSOCIAL_IMPORT_BUDGET_MS is not set")
+    def test_time_budget(self):
+        budget = float(IMPORT_BUDGET_MS)
+        # Best of three runs, to keep scheduler noise out of the measurement
+        best = min(_run(f"import {PACKAGE}")[0][PACKAGE] for _ in range(3))
+        assert best <= budget, f"import took {best:.1f} ms (budget {budget} ms)"
+
+    def test_lazy_names_resolve(self):
+        import rhosocial.activerecord.backend.impl.sqlite as sqlite
+        from rhosocial.activerecord.backend.impl.sqlite.functions import json_extract
+        from rhosocial.activerecord.backend.impl.sqlite.pragma import PragmaCategory
+
+        assert sqlite.json_extract is json_extract
+        assert sqlite.PragmaCategory is PragmaCategory
+        assert set(sqlite.__all__) <= set(dir(sqlite))
+        with pytest.raises(AttributeError):
+            sqlite.no_such_name  # noqa: B018
+
+
+class TestCliImport:
+    """python -m rhosocial.activerecord.backend.impl.sqlite query ..."""
+
+    @pytest.fixture(scope="class")
+    def modules(self):
+        return _run(_CLI_SCRIPT)[1]
+
+    @pytest.mark.parametrize("module", ["pydantic", "rich", SQLITE + "extension", SQLITE + "pragma"])
+    def test_module_is_deferred(self, modules, module):
+        assert not _loaded(modules, module)
+
+    def test_only_requested_subcommand_is_loaded(self, modules):
+        commands = {name for name in modules if name.startswith(SQLITE + "cli.")}
+        assert commands == {SQLITE + "cli.query", SQLITE + "cli.connection", SQLITE + "cli.output"}
@@ -3,12 +3,20 @@
 Tests for SQLite introspection cache management.
 
 This module tests the cache management methods on the introspector object,
-including invalidate_cache and clear_cache.
+including invalidate_cache and clear_cache, LRU bounds, DDL invalidation,
+schema-version validation and sharing between sync and async introspectors.
 """
 
+import asyncio
+import sqlite3
 import time
 
+import pytest
+
+from rhosocial.activerecord.backend.impl.sqlite.backend.async_backend import AsyncSQLiteBackend
 from rhosocial.activerecord.backend.introspection.types import IntrospectionScope
+from rhosocial.activerecord.backend.options import ExecutionOptions
+from rhosocial.activerecord.backend.schema import StatementType
 
 
 class TestCacheManagement:
@@ -243,3 +251,110 @@ class TestCacheKeys:
         assert key1 != key2
         assert key1 != key3
         assert key2 != key3
+
+
+class TestBoundedIndexedCache:
+    """Tests for LRU bounds and indexed invalidation."""
+
+    def test_lru_eviction(self, backend_with_tables):
+        """Least recently used entries are evicted at capacity."""
+        intro = backend_with_tables.introspector
+        intro.configure_cache(max_entries=2)
+        users = intro.list_columns("users")
+        intro.list_columns("posts")
+        assert intro.list_columns("users") is users  # touch: posts is now LRU
+        intro.list_columns("tags")
+
+        assert len(intro._cache) == 2
+        assert intro.list_columns("users") is users
+        assert intro.get_cache_stats().evictions == 1
+
+    def test_invalidate_name_is_exact(self, backend_with_tables):
+        """Invalidating a name does not hit names that merely contain it."""
+        intro = backend_with_tables.introspector
+        posts = intro.list_columns("posts")
+        post_tags = intro.list_columns("post_tags")
+
+        intro.invalidate_cache(scope=IntrospectionScope.COLUMN, name="posts")
+
+        assert intro.list_columns("post_tags") is post_tags
+        assert intro.list_columns("posts") is not posts
+
+    def test_ddl_invalidates_cache(self, backend_with_tables):
+        """Executing DDL through the backend clears cached schema."""
+        intro = backend_with_tables.introspector
+        tables = intro.list_tables()
+        backend_with_tables.execute("CREATE TABLE audit (id INTEGER PRIMARY KEY)")
+
+        assert len(intro._cache) == 0
+        names = {t.name for t in intro.list_tables()}
+        assert "audit" in names
+        assert len(names) == len(tables) + 1
+
+    def test_dml_keeps_cache(self, backend_with_tables):
+        """Data changes do not touch cached schema."""
+        intro = backend_with_tables.introspector
+        tables = intro.list_tables()
+        backend_with_tables.execute(
+            "INSERT INTO tags (name) VALUES ('x')",
+            options=ExecutionOptions(stmt_type=StatementType.DML),
+        )
+        assert intro.list_tables() is tables
+
+
+class TestVersionValidation:
+    """Tests for schema-version validated caching."""
+
+    def test_entries_do_not_expire_by_age(self, backend_with_tables):
+        """In version mode the TTL is ignored while the schema is unchanged."""
+        intro = backend_with_tables.introspector
+        intro.configure_cache(ttl=0.01, validate_version=True)
+        tables = intro.list_tables()
+        time.sleep(0.05)
+        assert intro.list_tables() is tables
+        assert intro.get_cache_stats().token is not None
+
+    def test_external_schema_change_detected(self, sqlite_file_backend):
+        """A schema change made by another connection invalidates the cache."""
+        intro = sqlite_file_backend.introspector
+        intro.configure_cache(validate_version=True)
+        assert intro.list_tables() == []
+
+        other = sqlite3.connect(sqlite_file_backend.config.database)
+        other.execute("CREATE TABLE external (id INTEGER)")
+        other.commit()
+        other.close()
+
+        assert [t.name for t in intro.list_tables()] == ["external"]
+
+
+class TestSharedCache:
+    """Tests for sharing a cache between introspectors of one database file."""
+
+    def test_memory_database_cannot_share(self, sqlite_backend):
+        """In-memory databases have no identity outside their connection."""
+        with pytest.raises(ValueError):
+            sqlite_backend.introspector.configure_cache(shared=True)
+
+    def test_sync_and_async_share(self, sqlite_file_backend):
+        """Sync and async introspectors of one file use one cache."""
+        sqlite_file_backend.execute("CREATE TABLE shared_t (id INTEGER)")
+        sync_intro = sqlite_file_backend.introspector
+        sync_intro.configure_cache(shared=True, validate_version=True)
+        tables = sync_intro.list_tables()
+
+        async def run():
+            backend = AsyncSQLiteBackend(database=sqlite_file_backend.config.database)
+            await backend.connect()
+            try:
+                backend.introspector.configure_cache(shared=True, validate_version=True)
+                assert backend.introspector._cache is sync_intro._cache
+                assert await backend.introspector.list_tables() is tables
+
+                # DDL on the async backend clears the shared cache
+                await backend.execute("CREATE TABLE shared_u (id INTEGER)")
+            finally:
+                await backend.disconnect()
+
+        asyncio.run(run())
+        assert {t.name for t in sync_intro.list_tables()} == {"shared_t", "shared_u"}
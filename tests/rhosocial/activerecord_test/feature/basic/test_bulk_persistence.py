@@ -0,0 +1,294 @@
+# tests/rhosocial/activerecord_test/feature/basic/test_bulk_persistence.py
+"""Tests for insert_many(), upsert_many() and save_all()."""
+import uuid
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+from typing_extensions import Annotated
+
+from rhosocial.activerecord.backend.errors import DatabaseError, ValidationError
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteBackend, AsyncSQLiteBackend
+from rhosocial.activerecord.backend.impl.sqlite.config import SQLiteConnectionConfig
+from rhosocial.activerecord.base import bulk
+from rhosocial.activerecord.base.fields import UseColumn
+from rhosocial.activerecord.field import IntegerPKMixin, OptimisticLockMixin, TimestampMixin, UUIDMixin
+from rhosocial.activerecord.model import ActiveRecord, AsyncActiveRecord
+
+USERS_DDL = ("CREATE TABLE bulk_users (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL UNIQUE, "
+             "email TEXT NOT NULL, score INTEGER, created_at TEXT, updated_at TEXT)")
+
+
+class BulkUser(IntegerPKMixin, TimestampMixin, ActiveRecord):
+    __table_name__ = "bulk_users"
+
+    id: Optional[int] = None
+    user_name: Annotated[str, UseColumn("name")]
+    email: str
+    score: int = 0
+
+
+class BulkToken(UUIDMixin, ActiveRecord):
+    __table_name__ = "bulk_tokens"
+
+    label: str
+
+
+class BulkItem(IntegerPKMixin, OptimisticLockMixin, ActiveRecord):
+    __table_name__ = "bulk_items"
+
+    id: Optional[int] = None
+    sku: str
+    quantity: int = 0
+
+
+class AsyncBulkUser(IntegerPKMixin, TimestampMixin, AsyncActiveRecord):
+    __table_name__ = "bulk_users"
+
+    id: Optional[int] = None
+    user_name: Annotated[str, UseColumn("name")]
+    email: str
+    score: int = 0
+
+
+@pytest.fixture
+def bulk_models():
+    config = SQLiteConnectionConfig(database=":memory:")
+    BulkUser.configure(config, SQLiteBackend)
+    backend = BulkUser.backend()
+    BulkToken.__backend__ = backend
+    BulkItem.__backend__ = backend
+    backend.execute(USERS_DDL)
+    backend.execute("CREATE TABLE bulk_tokens (id TEXT PRIMARY KEY, label TEXT NOT NULL)")
+    backend.execute("CREATE TABLE bulk_items (id INTEGER PRIMARY KEY AUTOINCREMENT, sku TEXT NOT NULL UNIQUE, "
+                    "quantity INTEGER NOT NULL, version INTEGER NOT NULL DEFAULT 1)")
+    yield BulkUser, BulkToken, BulkItem
+    backend.disconnect()
+
+
+def _users(count, start=0):
+    return [BulkUser(user_name=f"user{i}", email=f"user{i}@example.com", score=i) for i in range(start, start + count)]
+
+
+def _record_statements(monkeypatch, backend):
+    statements = []
+    original = backend.execute
+
+    def execute(sql, *args, **kwargs):
+        if sql.startswith("INSERT"):
+            statements.append(sql)
+        return original(sql, *args, **kwargs)
+
+    monkeypatch.setattr(backend, "execute", execute)
+    return statements
+
+
+def _stored_ids(model, name_column="name"):
+    rows = model.backend().fetch_all(f"SELECT id, {name_column} FROM {model.table_name()}")
+    return {row[name_column]: row["id"] for row in rows}
+
+
+def test_insert_many_backfills_keys_and_timestamps(bulk_models, monkeypatch):
+    User, _, _ = bulk_models
+    # Five columns per row: two rows per statement.
+    monkeypatch.setattr(User.backend().dialect, "get_max_bind_parameters", lambda: 12)
+    statements = _record_statements(monkeypatch, User.backend())
+    users = _users(9)
+
+    assert User.insert_many(users) == 9
+
+    assert len(statements) == 5
+    assert "RETURNING" not in statements[0]
+    stored = _stored_ids(User)
+    for user in users:
+        assert user.id == stored[user.user_name]
+        assert not user.is_new_record and not user.is_dirty
+        assert user.created_at is not None and user.created_at == user.updated_at
+    assert User.find_one(users[4].id).score == 4
+
+
+def test_insert_many_without_returning_uses_last_insert_id(bulk_models, monkeypatch):
+    User, _, _ = bulk_models
+    User.insert_many(_users(3))
+    monkeypatch.setattr(User.backend().dialect, "supports_returning_clause", lambda: False)
+    statements = _record_statements(monkeypatch, User.backend())
+    users = _users(7, start=3)
+
+    assert User.insert_many(users, batch_size=3) == 7
+
+    assert len(statements) == 3
+    assert "RETURNING" not in statements[0]
+    stored = _stored_ids(User)
+    assert [user.id for user in users] == [stored[user.user_name] for user in users]
+
+
+def _reverse_returned_rows(monkeypatch, backend):
+    """Return RETURNING rows in reverse, which databases are free to do."""
+    original = backend.execute
+
+    def execute(sql, *args, **kwargs):
+        result = original(sql, *args, **kwargs)
+        if isinstance(result.data, list):
+            result.data.reverse()
+        return result
+
+    monkeypatch.setattr(backend, "execute", execute)
+
+
+def test_insert_many_uses_returning_only_in_guaranteed_order(bulk_models, monkeypatch):
+    User, _, _ = bulk_models
+    dialect = User.backend().dialect
+    monkeypatch.setattr(dialect, "returning_preserves_insert_order", lambda: True)
+    statements = _record_statements(monkeypatch, User.backend())
+    users = _users(4)
+
+    assert User.insert_many(users) == 4
+
+    assert "RETURNING" in statements[0]
+    stored = _stored_ids(User)
+    assert [user.id for user in users] == [stored[user.user_name] for user in users]
+
+    monkeypatch.setattr(dialect, "returning_preserves_insert_order", lambda: False)
+    _reverse_returned_rows(monkeypatch, User.backend())
+    users = _users(4, start=4)
+    User.insert_many(users)
+    stored = _stored_ids(User)
+    assert [user.id for user in users] == [stored[user.user_name] for user in users]
+
+
+def test_upsert_many_matches_returned_rows_by_conflict_target(bulk_models, monkeypatch):
+    User, _, Item = bulk_models
+    existing = _users(3)
+    User.insert_many(existing)
+    original = Item(sku="A", quantity=1)
+    Item.insert_many([original])
+    _reverse_returned_rows(monkeypatch, User.backend())
+
+    users = [BulkUser(user_name=f"user{i}", email=f"new{i}@example.com", score=i) for i in (1, 7, 2, 8)]
+    assert User.upsert_many(users, conflict_target=["user_name"]) == 4
+
+    stored = _stored_ids(User)
+    assert [user.id for user in users] == [stored[user.user_name] for user in users]
+    items = [Item(sku="B", quantity=1), Item(sku="A", quantity=5)]
+    Item.upsert_many(items, conflict_target=["sku"])
+    assert [item.version for item in items] == [1, 2]
+    assert items[1].id == original.id
+
+
+def test_insert_many_uuid_keys_and_optimistic_lock(bulk_models):
+    _, Token, Item = bulk_models
+    tokens = [Token(label=f"token {i}") for i in range(4)]
+    ids = [token.id for token in tokens]
+
+    assert Token.insert_many(tokens) == 4
+    assert [token.id for token in tokens] == ids
+    assert isinstance(Token.find_one(ids[2]).id, uuid.UUID)
+
+    items = [Item(sku=f"SKU-{i}", quantity=i) for i in range(3)]
+    Item.insert_many(items)
+    assert [item.version for item in items] == [1, 1, 1]
+    items[0].quantity = 10
+    items[0].save()
+    assert items[0].version == 2
+
+
+def test_insert_many_is_atomic(bulk_models, monkeypatch):
+    User, _, _ = bulk_models
+    monkeypatch.setattr(User.backend().dialect, "get_max_bind_parameters", lambda: 12)
+    users = _users(4) + [BulkUser(user_name="user0", email="dup@example.com")]
+
+    with pytest.raises(DatabaseError):
+        User.insert_many(users)
+    assert User.query().count() == 0
+
+
+def test_primary_key_type_check_without_union_type(monkeypatch):
+    # types.UnionType only exists on Python 3.10+
+    monkeypatch.setattr(bulk, "types", SimpleNamespace())
+
+    assert BulkUser._primary_key_is_integer()
+    assert not BulkToken._primary_key_is_integer()
+
+
+def test_insert_many_argument_errors(bulk_models):
+    User, Token, _ = bulk_models
+    [saved] = _users(1)
+    saved.save()
+
+    with pytest.raises(ValueError, match="not new"):
+        User.insert_many([saved])
+    with pytest.raises(TypeError):
+        User.insert_many([Token(label="x")])
+    with pytest.raises(ValueError, match="batch_size"):
+        User.insert_many(_users(1, start=5), batch_size=0)
+    invalid = BulkUser(user_name="invalid", email="invalid@example.com")
+    invalid.score = "not a number"
+    with pytest.raises(ValidationError):
+        User.insert_many([invalid])
+    assert User.insert_many([]) == 0
+
+
+def test_upsert_many_updates_conflicting_rows(bulk_models):
+    User, _, Item = bulk_models
+    existing = _users(2)
+    User.insert_many(existing)
+    created_at = User.find_one(existing[0].id).created_at
+
+    changed = BulkUser(user_name="user0", email="new0@example.com", score=50)
+    added = BulkUser(user_name="user9", email="user9@example.com", score=9)
+    assert User.upsert_many([changed, added], conflict_target=["user_name"]) == 2
+
+    assert changed.id == existing[0].id
+    assert added.id not in (None, existing[0].id, existing[1].id)
+    stored = User.find_one(existing[0].id)
+    assert (stored.email, stored.score) == ("new0@example.com", 50)
+    assert stored.created_at == created_at
+    assert User.query().count() == 3
+
+    User.upsert_many([BulkUser(user_name="user1", email="ignored@example.com", score=70)],
+                     conflict_target=["user_name"], update_fields=["score"])
+    stored = User.find_one(existing[1].id)
+    assert (stored.email, stored.score) == ("user1@example.com", 70)
+
+    Item.insert_many([Item(sku="A", quantity=1)])
+    [item] = [Item(sku="A", quantity=5)]
+    Item.upsert_many([item], conflict_target=["sku"])
+    assert item.version == 2
+    assert Item.find_one(item.id).quantity == 5
+
+
+def test_save_all_inserts_new_and_updates_dirty(bulk_models):
+    User, _, _ = bulk_models
+    saved = _users(3)
+    User.insert_many(saved)
+    saved[1].score = 100
+
+    new = _users(2, start=3)
+    assert User.save_all(saved + new) == 3
+
+    assert all(user.id is not None for user in new)
+    assert User.find_one(saved[1].id).score == 100
+    assert User.query().count() == 5
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_persistence(tmp_path):
+    await AsyncBulkUser.configure(SQLiteConnectionConfig(database=str(tmp_path / "bulk.sqlite")), AsyncSQLiteBackend)
+    try:
+        await AsyncBulkUser.backend().execute(USERS_DDL)
+        users = [AsyncBulkUser(user_name=f"async{i}", email=f"async{i}@example.com", score=i) for i in range(5)]
+
+        assert await AsyncBulkUser.insert_many(users, batch_size=2) == 5
+        assert sorted(user.id for user in users) == [1, 2, 3, 4, 5]
+
+        changed = AsyncBulkUser(user_name="async2", email="changed@example.com", score=20)
+        await AsyncBulkUser.upsert_many([changed], conflict_target=["user_name"])
+        assert changed.id == users[2].id
+
+        users[0].score = 10
+        added = AsyncBulkUser(user_name="async9", email="async9@example.com")
+        assert await AsyncBulkUser.save_all([users[0], users[1], added]) == 2
+        assert (await AsyncBulkUser.find_one(users[0].id)).score == 10
+        assert await AsyncBulkUser.query().count() == 6
+    finally:
+        await AsyncBulkUser.backend().disconnect()
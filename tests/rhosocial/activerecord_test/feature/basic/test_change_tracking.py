@@ -0,0 +1,108 @@
+# tests/rhosocial/activerecord_test/feature/basic/test_change_tracking.py
+"""Tests for copy-on-write change tracking."""
+from decimal import Decimal
+from typing import Any, ClassVar, Dict, Optional, Set
+
+import pytest
+from typing_extensions import Annotated
+
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteBackend
+from rhosocial.activerecord.backend.impl.sqlite.adapters import SQLiteJSONAdapter
+from rhosocial.activerecord.backend.impl.sqlite.config import SQLiteConnectionConfig
+from rhosocial.activerecord.base.fields import UseAdapter
+from rhosocial.activerecord.field import IntegerPKMixin
+from rhosocial.activerecord.model import ActiveRecord
+
+
+class TrackedDocument(IntegerPKMixin, ActiveRecord):
+    __table_name__ = "tracked_documents"
+    __no_track_fields__: ClassVar[Set[str]] = {"hits"}
+
+    id: Optional[int] = None
+    title: str
+    price: Decimal = Decimal("0")
+    hits: int = 0
+    body: Annotated[Dict[str, Any], UseAdapter(SQLiteJSONAdapter(), str)] = None
+
+
+@pytest.fixture
+def document():
+    TrackedDocument.configure(SQLiteConnectionConfig(database=":memory:"), SQLiteBackend)
+    TrackedDocument.backend().execute(
+        "CREATE TABLE tracked_documents (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, price TEXT, "
+        "hits INTEGER, body TEXT)"
+    )
+    record = TrackedDocument(title="draft", price=Decimal("1.50"), body={"tags": ["a"]})
+    record.save()
+    yield TrackedDocument.find_one(record.id)
+    TrackedDocument.backend().disconnect()
+
+
+def test_loaded_record_has_no_snapshot(document):
+    assert not document.is_dirty
+    assert document._original_values == {}
+
+
+def test_assigning_the_same_value_is_not_a_change(document):
+    document.title = "draft"
+    assert not document.is_dirty
+    assert document._original_values == {}
+
+
+def test_original_value_is_recorded_on_first_change(document):
+    document.title = "second"
+    document.title = "third"
+    assert document.dirty_fields == {"title"}
+    assert document.get_old_attribute("title") == "draft"
+    # Unchanged fields report their current value
+    assert document.get_old_attribute("price") == Decimal("1.50")
+
+
+def test_immutable_originals_are_kept_by_reference(document):
+    price = document.price
+    document.price = Decimal("2.00")
+    assert document._original_values["price"] is price
+
+
+def test_mutable_originals_are_copied(document):
+    body = document.body
+    document.body = {"tags": ["b"]}
+    body["tags"].append("changed elsewhere")
+
+    assert document.get_old_attribute("body") == {"tags": ["a"]}
+    document.get_old_attribute("body")["tags"].clear()
+    assert document.get_old_attribute("body") == {"tags": ["a"]}
+
+
+def test_reassigning_in_place_change_is_saved(document):
+    document.body["tags"].append("b")
+    document.body = document.body
+    assert document.dirty_fields == {"body"}
+    document.save()
+
+    assert TrackedDocument.find_one(document.id).body == {"tags": ["a", "b"]}
+
+
+def test_unknown_field_raises_key_error(document):
+    with pytest.raises(KeyError):
+        document.get_old_attribute("missing")
+
+
+def test_no_track_fields_are_ignored(document):
+    document.hits = 10
+    assert not document.is_dirty
+
+
+def test_update_sends_dirty_fields_only(document):
+    TrackedDocument.backend().execute(
+        "UPDATE tracked_documents SET price = '9.99' WHERE id = ?", (document.id,)
+    )
+    document.title = "published"
+    document.save()
+
+    assert not document.is_dirty
+    assert document._original_values == {}
+    reloaded = TrackedDocument.find_one(document.id)
+    assert reloaded.title == "published"
+    assert reloaded.price == Decimal("9.99")
+    assert reloaded.body == {"tags": ["a"]}
@@ -0,0 +1,118 @@
+# tests/rhosocial/activerecord_test/feature/basic/test_model_metadata.py
+"""Tests for the per-model-class metadata cache."""
+from datetime import datetime
+from typing import Optional
+
+import pytest
+from typing_extensions import Annotated
+
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteBackend
+from rhosocial.activerecord.backend.impl.sqlite.config import SQLiteConnectionConfig
+from rhosocial.activerecord.base.fields import UseColumn
+from rhosocial.activerecord.base.model_metadata import ModelMetadata, get_model_metadata
+from rhosocial.activerecord.connection.group import BackendGroup
+from rhosocial.activerecord.field import IntegerPKMixin, TimestampMixin
+from rhosocial.activerecord.interface import IActiveRecord
+from rhosocial.activerecord.model import ActiveRecord
+
+
+class MetadataUser(IntegerPKMixin, TimestampMixin, ActiveRecord):
+    __table_name__ = "metadata_users"
+
+    id: Optional[int] = None
+    user_name: Annotated[str, UseColumn("name")]
+    joined_at: Optional[datetime] = None
+
+
+class MetadataAdmin(MetadataUser):
+    __table_name__ = "metadata_admins"
+
+
+@pytest.fixture
+def configured_user():
+    MetadataUser.configure(SQLiteConnectionConfig(database=":memory:"), SQLiteBackend)
+    MetadataUser.backend().execute(
+        "CREATE TABLE metadata_users (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, joined_at TEXT, "
+        "created_at TEXT, updated_at TEXT)"
+    )
+    yield MetadataUser
+    MetadataUser.backend().disconnect()
+
+
+def test_metadata_is_per_class():
+    metadata = get_model_metadata(MetadataUser)
+    assert isinstance(metadata, ModelMetadata)
+    assert get_model_metadata(MetadataUser) is metadata
+    assert get_model_metadata(MetadataAdmin) is not metadata
+
+
+def test_field_maps_are_cached():
+    mapping = MetadataUser.get_field_to_column_map()
+    assert mapping["user_name"] == "name"
+    assert mapping["id"] == "id"
+    assert MetadataUser.get_field_to_column_map() is mapping
+    assert MetadataUser.primary_key_field() == "id"
+
+
+def test_column_adapters_cached_per_backend(configured_user):
+    adapters = configured_user.get_column_adapters()
+    assert "joined_at" in adapters
+    assert configured_user.get_column_adapters() is adapters
+
+    other_backend = SQLiteBackend(connection_config=SQLiteConnectionConfig(database=":memory:"))
+    other_adapters = get_model_metadata(configured_user).column_adapters(other_backend)
+    assert other_adapters is not adapters
+    assert other_adapters.keys() == adapters.keys()
+
+
+def test_configure_invalidates_metadata(configured_user):
+    metadata = get_model_metadata(configured_user)
+    admin_metadata = get_model_metadata(MetadataAdmin)
+    adapters = configured_user.get_column_adapters()
+
+    configured_user.configure(SQLiteConnectionConfig(database=":memory:"), SQLiteBackend)
+
+    assert get_model_metadata(configured_user) is not metadata
+    assert get_model_metadata(MetadataAdmin) is not admin_metadata
+    assert configured_user.get_column_adapters() is not adapters
+
+
+def test_backend_group_invalidates_metadata():
+    metadata = get_model_metadata(MetadataUser)
+    group = BackendGroup(
+        name="metadata",
+        models=[MetadataUser],
+        config=SQLiteConnectionConfig(database=":memory:"),
+        backend_class=SQLiteBackend,
+    )
+    group.configure()
+    try:
+        assert get_model_metadata(MetadataUser) is not metadata
+        metadata = get_model_metadata(MetadataUser)
+    finally:
+        group.disconnect()
+    assert get_model_metadata(MetadataUser) is not metadata
+
+
+def test_update_behaviors_and_hooks_are_cached():
+    metadata = get_model_metadata(MetadataUser)
+    behaviors = metadata.update_behaviors(IActiveRecord)
+    assert (TimestampMixin, True, True) in behaviors
+    assert all(cls is not IActiveRecord for cls, _, _ in behaviors)
+    assert metadata.update_behaviors(IActiveRecord) is behaviors
+
+    chain = metadata.method_chain("prepare_save_data", ActiveRecord)
+    assert metadata.method_chain("prepare_save_data", ActiveRecord) is chain
+
+
+def test_save_and_query_use_cached_metadata(configured_user):
+    user = configured_user(user_name="alice")
+    user.save()
+    assert user.id is not None
+    assert user.created_at is not None
+
+    user.user_name = "bob"
+    user.save()
+
+    found = configured_user.find_one(user.id)
+    assert found.user_name == "bob"
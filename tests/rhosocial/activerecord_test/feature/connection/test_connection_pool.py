@@ -39,6 +39,8 @@ process exit across **all** Python versions.  The root cause was a two-part bug:
    first if ``self._connection is not None``.
 """
 
+import math
+import time
 from datetime import datetime, timedelta
 
 import pytest
@@ -3473,3 +3475,663 @@ class TestHealthCheckConnectionMode:
             assert health['connection_mode'] == 'persistent'
         finally:
             await pool.close(timeout=0.1)
+
+
+class TestThreadAffineMode:
+    """Tests for connection_mode="thread_affine": one live connection per thread."""
+
+    @staticmethod
+    def _pool(max_size=4, **backend_kwargs):
+        config = PoolConfig(
+            min_size=0,
+            max_size=max_size,
+            connection_mode="thread_affine",
+            validate_on_borrow=False,
+            backend_factory=lambda: SQLiteBackend(database=":memory:", **backend_kwargs)
+        )
+        return BackendPool.create(config)
+
+    @staticmethod
+    def _run_in_thread(target):
+        import threading
+        result = {}
+
+        def run():
+            result['value'] = target()
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        return result.get('value')
+
+    def test_same_thread_reuses_connection(self):
+        """Test that a thread gets its own live connection back on every acquire."""
+        pool = self._pool()
+        try:
+            assert pool.connection_mode == "thread_affine"
+            backends = []
+            for _ in range(5):
+                with pool.connection() as backend:
+                    assert execute_sql(backend, "SELECT 1").data is not None
+                    backends.append(backend)
+
+            assert all(backend is backends[0] for backend in backends)
+            assert backends[0].is_connected()
+            stats = pool.get_stats()
+            assert stats.total_created == 1
+            assert stats.total_connects == 1
+            assert stats.total_connects_avoided == 4
+            assert stats.current_available == 1
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_connections_are_not_shared_between_threads(self):
+        """Test that another thread gets a connection of its own."""
+        pool = self._pool()
+        try:
+            with pool.connection() as main_backend:
+                pass
+
+            def acquire_in_thread():
+                with pool.connection() as backend:
+                    execute_sql(backend, "SELECT 1")
+                    return backend
+
+            other_backend = self._run_in_thread(acquire_in_thread)
+            assert other_backend is not None and other_backend is not main_backend
+            with pool.connection() as backend:
+                assert backend is main_backend
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_idle_connections_closed_on_thread_exit(self):
+        """Test that a thread's idle connections are closed when it exits."""
+        import time
+        pool = self._pool()
+        try:
+            def use_pool():
+                with pool.connection() as backend:
+                    execute_sql(backend, "SELECT 1")
+                    return backend
+
+            backend = self._run_in_thread(use_pool)
+            deadline = time.time() + 2
+            while pool.get_stats().total_destroyed == 0 and time.time() < deadline:
+                time.sleep(0.01)
+
+            stats = pool.get_stats()
+            assert stats.total_destroyed == 1
+            assert stats.current_available == 0
+            assert not backend.is_connected()
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_check_same_thread_false_allows_migration(self):
+        """Test that idle connections move between threads when the backend allows it."""
+        pool = self._pool(max_size=1, check_same_thread=False)
+        try:
+            with pool.connection() as main_backend:
+                pass
+
+            def acquire_in_thread():
+                with pool.connection(timeout=1) as backend:
+                    execute_sql(backend, "SELECT 1")
+                    return backend
+
+            assert self._run_in_thread(acquire_in_thread) is main_backend
+            assert pool.get_stats().total_connects == 1
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_foreign_idle_connection_retired_at_max_size(self):
+        """Test that a thread-bound idle connection frees its slot for another thread."""
+        pool = self._pool(max_size=1)
+        try:
+            with pool.connection() as main_backend:
+                pass
+
+            def acquire_in_thread():
+                with pool.connection(timeout=1) as backend:
+                    execute_sql(backend, "SELECT 1")
+                    return backend
+
+            other_backend = self._run_in_thread(acquire_in_thread)
+            assert other_backend is not main_backend
+            assert pool.get_stats().total_connects == 2
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_close_disconnects_idle_connections(self):
+        """Test that close() disconnects the idle connections of the current thread."""
+        pool = self._pool()
+        with pool.connection() as backend:
+            pass
+        assert backend.is_connected()
+
+        pool.close(timeout=0.1)
+        assert not backend.is_connected()
+        assert pool.get_stats().current_available == 0
+
+    def test_transient_mode_counts_connects(self):
+        """Test that transient mode connects on every acquire and avoids none."""
+        config = PoolConfig(
+            min_size=0,
+            max_size=2,
+            connection_mode="transient",
+            validate_on_borrow=False,
+            backend_factory=lambda: SQLiteBackend(database=":memory:")
+        )
+        pool = BackendPool.create(config)
+        try:
+            for _ in range(3):
+                with pool.connection():
+                    pass
+            stats = pool.get_stats()
+            assert stats.total_connects == 3
+            assert stats.total_connects_avoided == 0
+            assert stats.to_dict()['total_connects'] == 3
+        finally:
+            pool.close(timeout=0.1)
+
+
+class TestPoolMaintenance:
+    """Tests for pool maintenance: idle/expired reaping, min_size refill, lifetime jitter."""
+
+    @staticmethod
+    def _config(**kwargs):
+        defaults = dict(
+            min_size=1,
+            max_size=4,
+            connection_mode="persistent",
+            validate_on_borrow=False,
+            maintenance_interval=0,
+            backend_factory=lambda: SQLiteBackend(database=":memory:", check_same_thread=False),
+        )
+        defaults.update(kwargs)
+        return PoolConfig(**defaults)
+
+    def test_config_validation(self):
+        """Test validation of the maintenance settings."""
+        with pytest.raises(ValueError, match="maintenance_interval"):
+            PoolConfig(maintenance_interval=-1)
+        with pytest.raises(ValueError, match="max_lifetime_jitter"):
+            PoolConfig(max_lifetime_jitter=1.0)
+        cloned = PoolConfig(maintenance_interval=5, max_lifetime_jitter=0.2).clone(min_size=0)
+        assert cloned.maintenance_interval == 5
+        assert cloned.max_lifetime_jitter == 0.2
+
+    def test_background_maintenance_off_by_default(self):
+        """Test that no maintenance thread is started unless an interval is set."""
+        assert PoolConfig().maintenance_interval == 0
+        pool = BackendPool.create(PoolConfig(
+            min_size=1, backend_factory=lambda: SQLiteBackend(database=":memory:", check_same_thread=False)
+        ))
+        try:
+            assert pool._maintenance_thread is None
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_lifetime_jitter_shortens_lifetime(self):
+        """Test that jitter is bounded by max_lifetime * max_lifetime_jitter and shortens expiry."""
+        pool = BackendPool.create(self._config(min_size=3, max_lifetime=100, max_lifetime_jitter=0.5))
+        try:
+            for pooled in pool._available:
+                assert 0 <= pooled.lifetime_jitter <= 50
+        finally:
+            pool.close(timeout=0.1)
+
+        pooled = PooledBackend(backend=None, pool_key="test", lifetime_jitter=10)
+        pooled.created_at = datetime.now() - timedelta(seconds=95)
+        assert pooled.is_expired(100)
+        assert not pooled.is_expired(110)
+
+    def test_idle_connections_reaped_down_to_min_size(self):
+        """Test that idle connections are closed while min_size connections are kept."""
+        pool = BackendPool.create(self._config(min_size=1, idle_timeout=60))
+        try:
+            backends = [pool.acquire() for _ in range(3)]
+            for backend in backends:
+                pool.release(backend)
+            for pooled in pool._available:
+                pooled.last_used_at = datetime.now() - timedelta(seconds=120)
+
+            pool.run_maintenance()
+
+            stats = pool.get_stats()
+            assert stats.total_maintenance_runs == 1
+            assert stats.total_idle_reaped == 2
+            assert stats.current_available == 1
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_expired_connections_replaced_up_to_min_size(self):
+        """Test that expired connections are closed and replaced by pre-warmed ones."""
+        pool = BackendPool.create(self._config(min_size=2))
+        try:
+            expired = list(pool._available)
+            for pooled in expired:
+                pooled.created_at = datetime.now() - timedelta(hours=2)
+
+            pool.run_maintenance()
+
+            stats = pool.get_stats()
+            assert stats.total_expired_reaped == 2
+            assert stats.total_prewarmed == 2
+            assert stats.current_available == 2
+            assert all(pooled not in pool._available for pooled in expired)
+            assert all(pooled.backend.is_connected() for pooled in pool._available)
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_idle_timeout_zero_disables_idle_reaping(self):
+        """Test that idle_timeout=0 keeps idle connections."""
+        pool = BackendPool.create(self._config(min_size=0, idle_timeout=0))
+        try:
+            pool.release(pool.acquire())
+            pool.run_maintenance()
+            assert pool.get_stats().current_available == 1
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_background_thread_runs_and_stops_on_close(self):
+        """Test that the maintenance thread refills the pool and exits on close."""
+        import time
+        pool = BackendPool.create(self._config(min_size=2, maintenance_interval=0.02))
+        try:
+            pooled = pool._available.popleft()
+            pool._stats.current_available -= 1
+            pool._destroy_backend(pooled)
+
+            deadline = time.time() + 2
+            while pool.get_stats().total_prewarmed == 0 and time.time() < deadline:
+                time.sleep(0.01)
+            assert pool.get_stats().total_prewarmed == 1
+            assert pool.size == 2
+        finally:
+            pool.close(timeout=0.1)
+
+        pool._maintenance_thread.join(timeout=2)
+        assert not pool._maintenance_thread.is_alive()
+
+    def test_maintenance_after_close_is_noop(self):
+        """Test that run_maintenance() does nothing on a closed pool."""
+        pool = BackendPool.create(self._config())
+        pool.close(timeout=0.1)
+        pool.run_maintenance()
+        assert pool.get_stats().total_maintenance_runs == 0
+
+    async def test_async_expired_connections_replaced(self):
+        """Test async maintenance reaps expired connections and refills to min_size."""
+        config = self._config(min_size=2, backend_factory=lambda: AsyncSQLiteBackend(database=":memory:"))
+        pool = await AsyncBackendPool.create(config)
+        try:
+            for pooled in pool._available:
+                pooled.created_at = datetime.now() - timedelta(hours=2)
+
+            await pool.run_maintenance()
+
+            stats = pool.get_stats()
+            assert stats.total_expired_reaped == 2
+            assert stats.total_prewarmed == 2
+            assert stats.current_available == 2
+        finally:
+            await pool.close(timeout=0.1)
+
+    async def test_async_refill_connects_outside_lock(self):
+        """Test that async maintenance connects without the pool lock and honours reservations."""
+        import asyncio
+        pool = None
+        locked_during_connect = []
+
+        class SlowBackend:
+            async def connect(self):
+                locked_during_connect.append(pool._lock.locked())
+                await asyncio.sleep(0.01)
+
+            async def disconnect(self):
+                pass
+
+        pool = AsyncBackendPool(self._config(min_size=2, backend_factory=SlowBackend))
+        try:
+            await asyncio.gather(pool.run_maintenance(), pool.run_maintenance())
+
+            assert locked_during_connect == [False, False]
+            assert pool.get_stats().current_available == 2
+            assert pool._reserved == 0
+        finally:
+            await pool.close(timeout=0.1)
+
+    async def test_async_background_task_cancelled_on_close(self):
+        """Test that the async maintenance task is started and cancelled on close."""
+        import asyncio
+        config = self._config(
+            min_size=0, maintenance_interval=0.01,
+            backend_factory=lambda: AsyncSQLiteBackend(database=":memory:")
+        )
+        pool = await AsyncBackendPool.create(config)
+        await asyncio.sleep(0.05)
+        assert pool.get_stats().total_maintenance_runs > 0
+        await pool.close(timeout=0.1)
+        await asyncio.sleep(0)
+        assert pool._maintenance_task.done()
+
+
+class _SlowConnectBackend:
+    """Stand-in backend whose connect() sleeps for ``connect_delay`` seconds."""
+
+    threadsafety = 2
+    connect_delay = 0.0
+
+    def __init__(self):
+        self.connected = False
+
+    def connect(self):
+        time.sleep(self.connect_delay)
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def is_connected(self):
+        return self.connected
+
+
+class TestPoolLockScope:
+    """Tests that connect and validation run outside the pool lock."""
+
+    def test_failed_connect_on_create_destroys_backend(self):
+        """Test that a new backend whose connect() fails is disconnected, not leaked."""
+        created = []
+
+        class FailingBackend(_SlowConnectBackend):
+            disconnects = 0
+
+            def connect(self):
+                raise ConnectionError("refused")
+
+            def disconnect(self):
+                self.disconnects += 1
+
+        def factory():
+            created.append(FailingBackend())
+            return created[-1]
+
+        pool = BackendPool.create(PoolConfig(
+            min_size=0, max_size=1, connection_mode="persistent", maintenance_interval=0,
+            backend_factory=factory,
+        ))
+        try:
+            with pytest.raises(TimeoutError):
+                pool.acquire(timeout=0.05)
+            assert created and all(backend.disconnects == 1 for backend in created)
+            stats = pool.get_stats()
+            assert stats.total_destroyed == stats.total_created == len(created)
+            assert pool._reserved == 0
+        finally:
+            pool.close(timeout=0.1)
+
+    async def test_async_failed_connect_on_create_destroys_backend(self):
+        """Test that the async pool disconnects a new backend whose connect() fails."""
+        created = []
+
+        class FailingBackend:
+            disconnects = 0
+
+            async def connect(self):
+                raise ConnectionError("refused")
+
+            async def disconnect(self):
+                self.disconnects += 1
+
+        def factory():
+            created.append(FailingBackend())
+            return created[-1]
+
+        pool = await AsyncBackendPool.create(PoolConfig(
+            min_size=0, max_size=1, connection_mode="persistent", backend_factory=factory,
+        ))
+        try:
+            with pytest.raises(ConnectionError):
+                await pool.acquire(timeout=0.05)
+            assert [backend.disconnects for backend in created] == [1]
+            assert pool.get_stats().total_destroyed == 1
+        finally:
+            await pool.close(timeout=0.1)
+
+    def test_slow_connect_does_not_block_other_acquires(self):
+        """Test that acquire latency stays flat while another thread connects slowly."""
+        import threading
+
+        class SlowBackend(_SlowConnectBackend):
+            pass
+
+        config = PoolConfig(
+            min_size=1,
+            max_size=4,
+            connection_mode="persistent",
+            validate_on_borrow=False,
+            maintenance_interval=0,
+            backend_factory=SlowBackend,
+        )
+        pool = BackendPool.create(config)
+        try:
+            warm = pool.acquire()
+            SlowBackend.connect_delay = 0.5
+
+            slow_started = threading.Event()
+
+            def acquire_slow():
+                slow_started.set()
+                pool.release(pool.acquire())
+
+            slow_thread = threading.Thread(target=acquire_slow)
+            slow_thread.start()
+            slow_started.wait()
+            time.sleep(0.05)  # let the new backend's connect() start
+
+            # Cycle the warm backend while the other thread is still connecting
+            latencies = []
+            backend = warm
+            for _ in range(50):
+                start = time.perf_counter()
+                pool.release(backend)
+                backend = pool.acquire(timeout=5)
+                latencies.append(time.perf_counter() - start)
+            pool.release(backend)
+
+            assert slow_thread.is_alive()
+            slow_thread.join()
+            latencies.sort()
+            p99 = latencies[math.ceil(len(latencies) * 0.99) - 1]  # nearest-rank
+            assert p99 < 0.1
+            assert pool.get_stats().current_total == 2
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_reserved_slots_respect_max_size(self):
+        """Test that slots held by connecting backends count against max_size."""
+        import threading
+
+        class SlowBackend(_SlowConnectBackend):
+            connect_delay = 0.2
+
+        config = PoolConfig(
+            min_size=0,
+            max_size=2,
+            connection_mode="persistent",
+            validate_on_borrow=False,
+            maintenance_interval=0,
+            backend_factory=SlowBackend,
+        )
+        pool = BackendPool.create(config)
+        try:
+            acquired = []
+            threads = [
+                threading.Thread(target=lambda: acquired.append(pool.acquire(timeout=5)))
+                for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.05)  # both threads are connecting
+
+            with pytest.raises(TimeoutError):
+                pool.acquire(timeout=0.05)
+
+            for thread in threads:
+                thread.join()
+            assert len(acquired) == 2
+            for backend in acquired:
+                pool.release(backend)
+            assert pool.get_stats().total_created == 2
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_acquire_fails_if_closed_while_connecting(self):
+        """Test that a backend connected after close() is destroyed, not handed out."""
+        import threading
+
+        class SlowBackend(_SlowConnectBackend):
+            connect_delay = 0.2
+
+        config = PoolConfig(
+            min_size=0,
+            max_size=2,
+            connection_mode="persistent",
+            validate_on_borrow=False,
+            maintenance_interval=0,
+            backend_factory=SlowBackend,
+        )
+        pool = BackendPool.create(config)
+        errors = []
+
+        def acquire():
+            try:
+                pool.acquire(timeout=5)
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        time.sleep(0.05)
+        pool.close(timeout=0)
+        thread.join()
+
+        assert len(errors) == 1
+        stats = pool.get_stats()
+        assert stats.total_destroyed == 1
+        assert stats.current_total == 0
+
+
+class TestPoolLatencyStats:
+    """Tests for latency histograms and leak detection."""
+
+    @staticmethod
+    def _config(**kwargs):
+        defaults = dict(
+            min_size=1,
+            max_size=2,
+            connection_mode="persistent",
+            maintenance_interval=0,
+            backend_factory=lambda: SQLiteBackend(database=":memory:", check_same_thread=False),
+        )
+        defaults.update(kwargs)
+        return PoolConfig(**defaults)
+
+    def test_histogram_percentiles(self):
+        """Test that percentiles fall within one bucket of the exact value."""
+        from rhosocial.activerecord.connection.pool import LatencyHistogram
+
+        histogram = LatencyHistogram()
+        assert histogram.p99 == 0.0
+        for i in range(1, 1001):
+            histogram.record(i / 1000)  # 1ms .. 1s
+
+        assert histogram.count == 1000
+        assert histogram.max == 1.0
+        assert 0.5 <= histogram.p50 <= 0.5 * 1.2
+        assert 0.95 <= histogram.p95 <= 0.95 * 1.2
+        assert 0.99 <= histogram.p99 <= 1.0
+        assert histogram.mean == pytest.approx(0.5005)
+        assert histogram.to_dict()['count'] == 1000
+
+        copy = histogram.copy()
+        copy.record(500.0)  # overflow bucket
+        assert histogram.count == 1000
+        assert copy.percentile(1.0) == 500.0
+
+    def test_sync_pool_records_latencies(self):
+        """Test that acquire wait, hold, connect and validation times are recorded."""
+        pool = BackendPool.create(self._config())
+        try:
+            for _ in range(3):
+                with pool.connection():
+                    pass
+            stats = pool.get_stats()
+            assert stats.acquire_wait.count == 3
+            assert stats.hold_time.count == 3
+            assert stats.connect_time.count == 1
+            assert stats.validation_time.count == 3
+            assert stats.to_dict()['hold_time']['count'] == 3
+
+            # get_stats() returns a snapshot
+            with pool.connection():
+                pass
+            assert stats.acquire_wait.count == 3
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_sync_leak_detection(self):
+        """Test that a connection held past the threshold is reported once, with its stack."""
+        pool = BackendPool.create(self._config(leak_detection_threshold=0.05))
+        backend = pool.acquire()
+        try:
+            assert pool.health_check()['leaks'] == []
+            time.sleep(0.1)
+
+            pool.run_maintenance()
+            health = pool.health_check()
+            assert len(health['leaks']) == 1
+            assert 'test_sync_leak_detection' in health['leaks'][0]['stack']
+            assert health['leaks'][0]['hold_time'] >= 0.05
+            assert health['stats']['leaks_detected'] == 1
+            assert pool.get_stats().total_leaks_detected == 1
+        finally:
+            pool.release(backend)
+            pool.close(timeout=0.1)
+
+    def test_leak_detection_disabled_by_default(self):
+        """Test that no stack is captured without leak_detection_threshold."""
+        pool = BackendPool.create(self._config())
+        try:
+            backend = pool.acquire()
+            assert all(pooled.acquired_stack is None for pooled in pool._in_use.values())
+            assert pool.health_check()['leaks'] == []
+            pool.release(backend)
+        finally:
+            pool.close(timeout=0.1)
+
+    async def test_async_pool_records_latencies_and_leaks(self):
+        """Test latency histograms and leak detection in the async pool."""
+        import asyncio
+        config = self._config(
+            leak_detection_threshold=0.05,
+            backend_factory=lambda: AsyncSQLiteBackend(database=":memory:"),
+        )
+        pool = await AsyncBackendPool.create(config)
+        try:
+            backend = await pool.acquire()
+            await asyncio.sleep(0.1)
+            health = await pool.health_check()
+            assert len(health['leaks']) == 1
+            assert 'test_async_pool_records_latencies_and_leaks' in health['leaks'][0]['stack']
+            await pool.release(backend)
+
+            stats = pool.get_stats()
+            assert stats.total_leaks_detected == 1
+            assert stats.acquire_wait.count == 1
+            assert stats.hold_time.count == 1
+            assert stats.hold_time.max >= 0.05
+            assert stats.connect_time.count == 1
+            assert health['latency']['connect_time']['count'] == 1
+        finally:
+            await pool.close(timeout=0.1)
@@ -0,0 +1,322 @@
+# tests/rhosocial/activerecord_test/feature/connection/test_read_write_routing.py
+"""
+Tests for read/write routing in BackendGroup and AsyncBackendGroup.
+
+The writer and the replicas are separate SQLite files seeded with different
+rows, so the name a query returns tells which database served it.
+"""
+
+import os
+import tempfile
+import time
+from typing import Optional
+
+import pytest
+
+from rhosocial.activerecord.model import ActiveRecord, AsyncActiveRecord
+from rhosocial.activerecord.field import IntegerPKMixin
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteBackend
+from rhosocial.activerecord.backend.impl.sqlite.backend.async_backend import AsyncSQLiteBackend
+from rhosocial.activerecord.backend.impl.sqlite.config import SQLiteConnectionConfig
+from rhosocial.activerecord.backend.options import ExecutionOptions
+from rhosocial.activerecord.backend.schema import StatementType
+from rhosocial.activerecord.connection import (
+    AsyncBackendGroup,
+    AsyncBackendPool,
+    BackendGroup,
+    BackendManager,
+    BackendPool,
+    LeastInFlightBalancer,
+    PoolConfig,
+    ReplicaBalancer,
+    RoundRobinBalancer,
+)
+from rhosocial.activerecord.connection.routing import ReplicaEndpoint
+
+
+class RoutedUser(IntegerPKMixin, ActiveRecord):
+    __table_name__ = 'routed_users'
+
+    id: Optional[int] = None
+    name: str
+
+
+class AsyncRoutedUser(IntegerPKMixin, AsyncActiveRecord):
+    __table_name__ = 'routed_users'
+
+    id: Optional[int] = None
+    name: str
+
+
+DDL = ExecutionOptions(stmt_type=StatementType.DDL)
+
+
+def _seed(path: str, name: str) -> None:
+    backend = SQLiteBackend(database=path)
+    backend.connect()
+    backend.execute(
+        "CREATE TABLE routed_users (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL)", options=DDL
+    )
+    backend.execute(f"INSERT INTO routed_users (name) VALUES ('{name}')",
+                    options=ExecutionOptions(stmt_type=StatementType.DML))
+    backend.disconnect()
+
+
+@pytest.fixture
+def databases():
+    """Writer plus two replica database files, each seeded with its own row."""
+    paths = {}
+    for role in ('writer', 'replica-a', 'replica-b'):
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        _seed(path, role)
+        paths[role] = path
+    yield paths
+    for path in paths.values():
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def _names(model) -> set:
+    return {user.name for user in model.query().all()}
+
+
+@pytest.fixture
+def routed_group(databases):
+    group = BackendGroup(
+        name="routed",
+        models=[RoutedUser],
+        config=SQLiteConnectionConfig(database=databases['writer']),
+        backend_class=SQLiteBackend,
+        readers=[SQLiteConnectionConfig(database=databases['replica-a'])],
+        sticky_window=60.0,
+    )
+    group.configure()
+    yield group
+    group.disconnect()
+
+
+class TestReadWriteRouting:
+    """Routing decisions of a group with read replicas."""
+
+    def test_reads_go_to_replica(self, routed_group):
+        assert _names(RoutedUser) == {'replica-a'}
+        assert RoutedUser.query().count() == 1
+        stats = routed_group.get_route_stats()
+        assert stats.replica_reads == 2
+        assert stats.replicas['replica-0']['reads'] == 2
+        assert stats.replicas['replica-0']['in_flight'] == 0
+
+    def test_save_goes_to_writer_and_sticks(self, routed_group):
+        RoutedUser(name='new').save()
+
+        # The save opened the sticky window, so reads now see the writer
+        assert _names(RoutedUser) == {'writer', 'new'}
+        stats = routed_group.get_route_stats()
+        assert stats.writes_observed >= 1
+        assert stats.sticky_reads == 1
+        assert stats.replica_reads == 0
+
+    def test_sticky_window_expires(self, routed_group):
+        router = routed_group.get_router()
+        router.sticky_window = 0.05
+        RoutedUser(name='new').save()
+        assert _names(RoutedUser) == {'writer', 'new'}
+        time.sleep(0.1)
+        assert _names(RoutedUser) == {'replica-a'}
+
+    def test_zero_window_only_sticks_in_transactions(self, databases):
+        with BackendGroup(
+            name="routed",
+            models=[RoutedUser],
+            config=SQLiteConnectionConfig(database=databases['writer']),
+            backend_class=SQLiteBackend,
+            readers=[SQLiteConnectionConfig(database=databases['replica-a'])],
+            sticky_window=0,
+        ) as group:
+            RoutedUser(name='new').save()
+            assert _names(RoutedUser) == {'replica-a'}
+
+            with group.get_backend().transaction():
+                assert _names(RoutedUser) == {'writer', 'new'}
+            assert group.get_route_stats().sticky_reads == 1
+
+    def test_sticky_window_is_per_thread(self, routed_group):
+        import threading
+
+        RoutedUser(name='new').save()
+        seen = {}
+        worker = threading.Thread(target=lambda: seen.update(names=_names(RoutedUser)))
+        worker.start()
+        worker.join()
+        assert seen['names'] == {'replica-a'}
+
+    def test_bulk_dml_uses_writer(self, routed_group):
+        writer = routed_group.get_backend()
+        routed_group.get_router().sticky_window = 0
+        assert RoutedUser.query().where('name = ?', ('writer',)).update_all({'name': 'renamed'}) == 1
+        assert _names(RoutedUser) == {'replica-a'}
+        assert {row['name'] for row in writer.fetch_all("SELECT name FROM routed_users")} == {'renamed'}
+
+    def test_round_robin_over_replicas(self, databases):
+        with BackendGroup(
+            name="routed",
+            models=[RoutedUser],
+            config=SQLiteConnectionConfig(database=databases['writer']),
+            backend_class=SQLiteBackend,
+            readers=[
+                SQLiteConnectionConfig(database=databases['replica-a']),
+                SQLiteConnectionConfig(database=databases['replica-b']),
+            ],
+            balancer=RoundRobinBalancer(),
+        ) as group:
+            names = [RoutedUser.query().one().name for _ in range(4)]
+            assert names == ['replica-a', 'replica-b', 'replica-a', 'replica-b']
+            replicas = group.get_route_stats().replicas
+            assert replicas['replica-0']['reads'] == replicas['replica-1']['reads'] == 2
+
+    def test_pool_reader(self, databases):
+        pool = BackendPool(PoolConfig(
+            min_size=1,
+            max_size=2,
+            backend_factory=lambda: SQLiteBackend(database=databases['replica-b']),
+        ))
+        try:
+            with BackendGroup(
+                name="routed",
+                models=[RoutedUser],
+                config=SQLiteConnectionConfig(database=databases['writer']),
+                backend_class=SQLiteBackend,
+                readers=[pool],
+            ):
+                assert _names(RoutedUser) == {'replica-b'}
+                assert [user.name for user in RoutedUser.query().iter(batch_size=10)] == ['replica-b']
+                assert pool.get_stats().current_in_use == 0
+            # The group leaves caller-owned pools open
+            assert not pool.is_closed
+        finally:
+            pool.close()
+
+    def test_disconnect_clears_router(self, databases):
+        group = BackendGroup(
+            name="routed",
+            models=[RoutedUser],
+            config=SQLiteConnectionConfig(database=databases['writer']),
+            backend_class=SQLiteBackend,
+            readers=[SQLiteConnectionConfig(database=databases['replica-a'])],
+        )
+        group.configure()
+        writer = group.get_backend()
+        assert RoutedUser.__read_router__ is group.get_router()
+        assert writer._write_observer is not None
+
+        group.disconnect()
+        assert RoutedUser.__read_router__ is None
+        assert writer._write_observer is None
+        assert group.get_route_stats() is None
+
+    def test_group_without_readers_has_no_router(self, databases):
+        with BackendGroup(
+            name="plain",
+            models=[RoutedUser],
+            config=SQLiteConnectionConfig(database=databases['writer']),
+            backend_class=SQLiteBackend,
+        ) as group:
+            assert group.get_router() is None
+            assert RoutedUser.__read_router__ is None
+            assert _names(RoutedUser) == {'writer'}
+
+    def test_manager_passes_readers(self, databases):
+        manager = BackendManager()
+        group = manager.create_group(
+            name="routed",
+            config=SQLiteConnectionConfig(database=databases['writer']),
+            backend_class=SQLiteBackend,
+            models=[RoutedUser],
+            readers=[SQLiteConnectionConfig(database=databases['replica-a'])],
+            sticky_window=0.5,
+        )
+        manager.configure_all()
+        try:
+            assert group.get_router().sticky_window == 0.5
+            assert _names(RoutedUser) == {'replica-a'}
+        finally:
+            manager.disconnect_all()
+
+
+class TestBalancers:
+    """Balancer selection rules."""
+
+    def test_least_in_flight(self):
+        replicas = [ReplicaEndpoint(f"replica-{i}", object()) for i in range(3)]
+        replicas[0].in_flight = 2
+        replicas[1].in_flight = 1
+        replicas[2].in_flight = 1
+        replicas[1].reads = 5
+        assert LeastInFlightBalancer().choose(replicas) is replicas[2]
+
+    def test_balancer_must_implement_choose(self):
+        class NoChoice(ReplicaBalancer):
+            pass
+
+        with pytest.raises(TypeError):
+            NoChoice()
+
+    def test_negative_sticky_window_rejected(self, databases):
+        from rhosocial.activerecord.connection import ReadWriteRouter
+
+        with pytest.raises(ValueError):
+            ReadWriteRouter(SQLiteBackend(database=databases['writer']), sticky_window=-1)
+
+
+class TestAsyncReadWriteRouting:
+    """Async parity for AsyncBackendGroup readers."""
+
+    @pytest.mark.asyncio
+    async def test_async_reads_go_to_replica(self, databases):
+        group = AsyncBackendGroup(
+            name="routed",
+            models=[AsyncRoutedUser],
+            config=SQLiteConnectionConfig(database=databases['writer']),
+            backend_class=AsyncSQLiteBackend,
+            readers=[SQLiteConnectionConfig(database=databases['replica-a'])],
+        )
+        await group.configure()
+        try:
+            users = await AsyncRoutedUser.query().all()
+            assert {user.name for user in users} == {'replica-a'}
+
+            await AsyncRoutedUser(name='new').save()
+            users = await AsyncRoutedUser.query().all()
+            assert {user.name for user in users} == {'writer', 'new'}
+
+            stats = group.get_route_stats()
+            assert stats.replica_reads == 1
+            assert stats.sticky_reads == 1
+        finally:
+            await group.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_async_pool_reader(self, databases):
+        pool = AsyncBackendPool(PoolConfig(
+            min_size=1,
+            max_size=2,
+            backend_factory=lambda: AsyncSQLiteBackend(database=databases['replica-b']),
+        ))
+        try:
+            group = AsyncBackendGroup(
+                name="routed",
+                models=[AsyncRoutedUser],
+                config=SQLiteConnectionConfig(database=databases['writer']),
+                backend_class=AsyncSQLiteBackend,
+                readers=[pool],
+                balancer=LeastInFlightBalancer(),
+            )
+            await group.configure()
+            try:
+                users = await AsyncRoutedUser.query().all()
+                assert {user.name for user in users} == {'replica-b'}
+            finally:
+                await group.disconnect()
+        finally:
+            await pool.close()
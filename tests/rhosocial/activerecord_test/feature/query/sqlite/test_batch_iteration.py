@@ -0,0 +1,148 @@
+# tests/rhosocial/activerecord_test/feature/query/sqlite/test_batch_iteration.py
+"""Tests for ActiveQuery.iter(), find_each() and find_in_batches()."""
+from decimal import Decimal
+
+import pytest
+
+from rhosocial.activerecord.relation.cache import InstanceCache
+from rhosocial.activerecord.testsuite.feature.query.conftest import order_fixtures, async_order_fixtures
+
+
+def _create_users(User, count=7):
+    users = []
+    for i in range(count):
+        user = User(username=f"batch_user_{i}", email=f"batch{i}@example.com", age=20 + i)
+        user.save()
+        users.append(user)
+    return users
+
+
+def _count_fetch_all(monkeypatch, backend):
+    calls = []
+    original = backend.fetch_all
+
+    def counting_fetch_all(sql, *args, **kwargs):
+        calls.append(sql)
+        return original(sql, *args, **kwargs)
+
+    monkeypatch.setattr(backend, "fetch_all", counting_fetch_all)
+    return calls
+
+
+def test_iter_streams_in_query_order(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    users = _create_users(User)
+
+    iterator = User.query().where(User.c.age >= 21).order_by((User.c.age, "DESC")).iter(batch_size=2)
+    found = list(iterator)
+
+    assert [u.age for u in found] == [26, 25, 24, 23, 22, 21]
+    assert all(isinstance(u, User) for u in found)
+    assert found[-1].id == users[1].id
+    assert list(User.query().order_by(User.c.id).limit(3).offset(1).iter(batch_size=2)) == users[1:4]
+
+
+def test_iter_can_stop_early(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    iterator = User.query().order_by(User.c.id).iter(batch_size=3)
+    first = next(iterator)
+    iterator.close()
+
+    assert first.username == "batch_user_0"
+    assert User.query().count() == 7
+
+
+def test_find_in_batches_uses_keyset_pagination(order_fixtures, monkeypatch):
+    User, Order, OrderItem = order_fixtures
+    users = _create_users(User)
+    calls = _count_fetch_all(monkeypatch, User.backend())
+
+    batches = list(User.query().where(User.c.age > 20).find_in_batches(batch_size=3))
+
+    assert [len(batch) for batch in batches] == [3, 3]
+    assert [u.id for batch in batches for u in batch] == [u.id for u in users[1:]]
+    # A full last batch needs one more (empty) query to detect the end.
+    assert len(calls) == 3
+    assert "OFFSET" not in calls[1].upper()
+    assert "ORDER BY" in calls[1].upper()
+
+
+def test_find_in_batches_exact_multiple_and_custom_key(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User, count=6)
+
+    batches = list(User.query().find_in_batches(batch_size=3, key="username"))
+    assert [len(batch) for batch in batches] == [3, 3]
+    usernames = [u.username for batch in batches for u in batch]
+    assert usernames == sorted(usernames)
+
+
+def test_find_in_batches_does_not_modify_query(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    query = User.query().where(User.c.age < 25)
+    sql_before = query.to_sql()
+    assert len(list(query.find_each(batch_size=2))) == 5
+    assert query.to_sql() == sql_before
+    assert len(query.all()) == 5
+
+
+def test_find_each_allows_updates_while_iterating(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    for user in User.query().find_each(batch_size=2):
+        user.age += 50
+        user.save()
+
+    assert User.query().where(User.c.age < 70).count() == 0
+
+
+def test_batch_iteration_argument_errors(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+
+    with pytest.raises(ValueError, match="batch_size"):
+        list(User.query().iter(batch_size=0))
+    with pytest.raises(ValueError, match="not a field"):
+        list(User.query().find_in_batches(key="missing"))
+    with pytest.raises(ValueError, match="order_by"):
+        list(User.query().order_by(User.c.age).find_each())
+
+
+def test_batches_honor_eager_loads(order_fixtures, monkeypatch):
+    User, Order, OrderItem = order_fixtures
+    users = _create_users(User, count=4)
+    for user in users:
+        for n in range(2):
+            Order(user_id=user.id, order_number=f"B-{user.id}-{n}", total_amount=Decimal("1.00")).save()
+
+    calls = _count_fetch_all(monkeypatch, User.backend())
+    batches = list(User.query().with_("orders").find_in_batches(batch_size=2))
+
+    # Three keyset queries for users plus one batched query per batch for orders.
+    assert len(calls) == 5
+    for batch in batches:
+        for user in batch:
+            cached = InstanceCache.get(user, "orders", User.get_relation("orders")._cache_config)
+            assert [o.order_number for o in cached] == [f"B-{user.id}-0", f"B-{user.id}-1"]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_iteration(async_order_fixtures):
+    AsyncUser, AsyncOrder, AsyncOrderItem = async_order_fixtures
+
+    for i in range(5):
+        user = AsyncUser(username=f"async_batch_{i}", email=f"async_batch{i}@example.com", age=40 + i)
+        await user.save()
+
+    streamed = [u.age async for u in AsyncUser.query().order_by((AsyncUser.c.age, "DESC")).iter(batch_size=2)]
+    assert streamed == [44, 43, 42, 41, 40]
+
+    batches = [batch async for batch in AsyncUser.query().find_in_batches(batch_size=2)]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    each = [u.username async for u in AsyncUser.query().where(AsyncUser.c.age > 41).find_each(batch_size=2)]
+    assert each == ["async_batch_2", "async_batch_3", "async_batch_4"]
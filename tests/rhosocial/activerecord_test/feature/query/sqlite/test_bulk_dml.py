@@ -0,0 +1,117 @@
+# tests/rhosocial/activerecord_test/feature/query/sqlite/test_bulk_dml.py
+"""Tests for set-based ActiveQuery.update_all() and delete_all()."""
+import pytest
+
+from rhosocial.activerecord.backend.errors import DatabaseError
+from rhosocial.activerecord.testsuite.feature.query.conftest import order_fixtures, async_order_fixtures
+from rhosocial.activerecord.testsuite.feature.mixins.conftest import task_model, versioned_product_model
+
+
+def _create_users(User, count=6):
+    users = []
+    for i in range(count):
+        user = User(username=f"dml_user_{i}", email=f"dml{i}@example.com", age=20 + i)
+        user.save()
+        users.append(user)
+    return users
+
+
+def _record_statements(monkeypatch, backend):
+    statements = []
+    original = backend.execute
+
+    def execute(sql, *args, **kwargs):
+        statements.append(sql)
+        return original(sql, *args, **kwargs)
+
+    monkeypatch.setattr(backend, "execute", execute)
+    return statements
+
+
+def test_update_all_is_one_statement(order_fixtures, monkeypatch):
+    User, Order, OrderItem = order_fixtures
+    users = _create_users(User)
+    before = User.find_one(users[0].id).updated_at
+    statements = _record_statements(monkeypatch, User.backend())
+
+    affected = User.query().where(User.c.age >= 23).update_all(is_active=False, balance=User.c.balance + 10)
+
+    assert affected == 3
+    assert len(statements) == 1 and statements[0].startswith("UPDATE")
+    inactive = User.query().where(User.c.is_active == False).order_by(User.c.age).all()  # noqa: E712
+    assert [u.age for u in inactive] == [23, 24, 25]
+    assert all(u.balance == 10.0 for u in inactive)
+    assert User.find_one(users[3].id).updated_at > before
+    assert User.find_one(users[0].id).updated_at == before
+
+
+def test_update_all_returning_and_errors(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    users = _create_users(User)
+
+    ids = User.query().where(User.c.age < 22).update_all({"balance": 5.0}, returning=True)
+    assert sorted(ids) == [users[0].id, users[1].id]
+
+    with pytest.raises(ValueError, match="at least one field"):
+        User.query().update_all()
+    with pytest.raises(ValueError, match="not a field"):
+        User.query().update_all(missing=1)
+    with pytest.raises(ValueError, match="limit"):
+        User.query().limit(2).update_all(balance=1.0)
+
+
+def test_delete_all_and_transaction(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    users = _create_users(User)
+
+    with User.transaction():
+        assert User.query().where(User.c.age > 23).delete_all() == 2
+        assert User.query().count() == 4
+    assert User.query().count() == 4
+
+    try:
+        with User.transaction():
+            User.query().delete_all()
+            raise RuntimeError("rollback")
+    except RuntimeError:
+        pass
+    assert User.query().count() == 4
+
+    assert User.query().where(User.c.id == users[0].id).delete_all(returning=True) == [users[0].id]
+
+
+def test_delete_all_soft_deletes(task_model):
+    Task = task_model
+    for i in range(4):
+        Task(title=f"task {i}", is_completed=i % 2 == 0).save()
+
+    assert Task.query().where("is_completed = ?", (True,)).delete_all() == 2
+
+    assert Task.query().count() == 2
+    assert Task.query_with_deleted().count() == 4
+    assert all(t.deleted_at is not None for t in Task.query_only_deleted().all())
+
+
+def test_update_all_increments_version(versioned_product_model):
+    Product = versioned_product_model
+    product = Product(name="widget", price=1.0)
+    product.save()
+
+    Product.query().update_all(price=2.0)
+
+    assert Product.find_one(product.id).version == 2
+    product.price = 3.0
+    with pytest.raises(DatabaseError):
+        product.save()
+
+
+@pytest.mark.asyncio
+async def test_async_update_and_delete_all(async_order_fixtures):
+    AsyncUser, AsyncOrder, AsyncOrderItem = async_order_fixtures
+    for i in range(4):
+        await AsyncUser(username=f"async_dml_{i}", email=f"async_dml{i}@example.com", age=30 + i).save()
+
+    assert await AsyncUser.query().where(AsyncUser.c.age > 31).update_all(is_active=False) == 2
+    assert await AsyncUser.query().where(AsyncUser.c.is_active == False).count() == 2  # noqa: E712
+    assert await AsyncUser.query().where(AsyncUser.c.is_active == False).delete_all() == 2  # noqa: E712
+    assert await AsyncUser.query().count() == 2
@@ -0,0 +1,185 @@
+# tests/rhosocial/activerecord_test/feature/query/sqlite/test_chunked_batch_loading.py
+"""Tests for splitting relation batch loads into IN lists that fit the parameter limit."""
+import pytest
+
+from rhosocial.activerecord.backend.impl.sqlite import AsyncSQLiteBackend
+from rhosocial.activerecord.backend.impl.sqlite.dialect import SQLiteDialect
+from rhosocial.activerecord.connection.pool import AsyncBackendPool, PoolConfig
+from rhosocial.activerecord.relation.batching import chunk_keys
+from rhosocial.activerecord.relation.cache import InstanceCache
+from rhosocial.activerecord.testsuite.feature.query.conftest import blog_fixtures, async_blog_fixtures
+
+
+def _create_blog(User, Post, Comment, users=7):
+    for u in range(users):
+        user = User(username=f"chunk_user_{u}", email=f"chunk{u}@example.com", age=20 + u)
+        user.save()
+        for p in range(2):
+            post = Post(user_id=user.id, title=f"post {u}-{p}", content="...",
+                        status="published" if p == 0 else "draft")
+            post.save()
+            Comment(user_id=user.id, post_id=post.id, content=f"comment {u}-{p}").save()
+
+
+def _record_queries(monkeypatch, backend):
+    statements = []
+    original = backend.fetch_all
+
+    def fetch_all(sql, *args, **kwargs):
+        statements.append(sql)
+        return original(sql, *args, **kwargs)
+
+    monkeypatch.setattr(backend, "fetch_all", fetch_all)
+    return statements
+
+
+def _cached(record, name):
+    return InstanceCache.get(record, name, type(record).get_relation(name)._cache_config)
+
+
+def test_sqlite_max_bind_parameters_by_version():
+    assert SQLiteDialect(version=(3, 31, 0)).get_max_bind_parameters() == 999
+    assert SQLiteDialect(version=(3, 35, 0)).get_max_bind_parameters() == 32766
+
+
+def test_chunk_keys():
+    assert list(chunk_keys(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(chunk_keys([1, 2], 5)) == [[1, 2]]
+
+
+def test_has_many_batch_load_is_chunked(blog_fixtures, monkeypatch):
+    User, Post, Comment = blog_fixtures
+    _create_blog(User, Post, Comment)
+    monkeypatch.setattr(User.backend().dialect, "get_max_bind_parameters", lambda: 3)
+    statements = _record_queries(monkeypatch, User.backend())
+
+    users = User.query().with_("posts").order_by(User.c.id).all()
+
+    # One query for users, then ceil(7 / 3) queries for posts.
+    assert len([s for s in statements if '"posts"' in s]) == 3
+    for user in users:
+        n = user.username.rsplit("_", 1)[1]
+        assert [p.title for p in _cached(user, "posts")] == [f"post {n}-0", f"post {n}-1"]
+
+
+def test_modifier_parameters_reduce_chunk_size(blog_fixtures, monkeypatch):
+    User, Post, Comment = blog_fixtures
+    _create_blog(User, Post, Comment)
+    monkeypatch.setattr(User.backend().dialect, "get_max_bind_parameters", lambda: 3)
+    statements = _record_queries(monkeypatch, User.backend())
+
+    users = User.query().with_(("posts", lambda q: q.where(Post.c.status == "published"))).all()
+
+    # The status parameter leaves room for two keys per statement.
+    assert len([s for s in statements if '"posts"' in s]) == 4
+    for user in users:
+        assert [p.status for p in _cached(user, "posts")] == ["published"]
+
+
+def test_belongs_to_batch_load_is_chunked(blog_fixtures, monkeypatch):
+    User, Post, Comment = blog_fixtures
+    _create_blog(User, Post, Comment, users=4)
+    monkeypatch.setattr(User.backend().dialect, "get_max_bind_parameters", lambda: 5)
+    statements = _record_queries(monkeypatch, User.backend())
+
+    comments = Comment.query().with_("post").all()
+
+    # Eight distinct posts in chunks of five.
+    assert len([s for s in statements if '"posts"' in s]) == 2
+    for comment in comments:
+        assert _cached(comment, "post").id == comment.post_id
+
+
+def test_clone_is_independent(blog_fixtures):
+    User, Post, Comment = blog_fixtures
+    _create_blog(User, Post, Comment, users=3)
+
+    query = User.query().where(User.c.age > 20).order_by(User.c.id)
+    sql_before = query.to_sql()
+    clone = query.clone()
+    clone.where(User.c.age < 22).order_by(User.c.username).limit(1).with_("posts")
+
+    assert query.to_sql() == sql_before
+    assert query.get_relation_configs() == {}
+    assert [u.age for u in query.all()] == [21, 22]
+    assert [u.age for u in clone.all()] == [21]
+
+
+async def _create_async_blog(AsyncUser, AsyncPost, users=5):
+    for u in range(users):
+        user = AsyncUser(username=f"async_chunk_{u}", email=f"async_chunk{u}@example.com", age=30 + u)
+        await user.save()
+        for p in range(2):
+            await AsyncPost(user_id=user.id, title=f"post {u}-{p}", content="...").save()
+
+
+@pytest.mark.asyncio
+async def test_async_batch_load_is_chunked(async_blog_fixtures, monkeypatch):
+    AsyncUser, AsyncPost, AsyncComment = async_blog_fixtures
+    await _create_async_blog(AsyncUser, AsyncPost)
+    monkeypatch.setattr(AsyncUser.backend().dialect, "get_max_bind_parameters", lambda: 2)
+
+    users = await AsyncUser.query().with_("posts").all()
+
+    for user in users:
+        posts = _cached(user, "posts")
+        assert len(posts) == 2
+        assert all(p.user_id == user.id for p in posts)
+
+
+@pytest.mark.asyncio
+async def test_async_chunks_run_on_pooled_connections(async_blog_fixtures, monkeypatch):
+    AsyncUser, AsyncPost, AsyncComment = async_blog_fixtures
+    await _create_async_blog(AsyncUser, AsyncPost)
+    monkeypatch.setattr(AsyncUser.backend().dialect, "get_max_bind_parameters", lambda: 2)
+    database = AsyncUser.backend().config.database
+
+    backends = []
+
+    def backend_factory():
+        backend = AsyncSQLiteBackend(database=database)
+        backends.append(backend)
+        return backend
+
+    pool = AsyncBackendPool(PoolConfig(min_size=1, max_size=3, backend_factory=backend_factory))
+    try:
+        async with pool.context():
+            users = await AsyncUser.query().with_("posts").all()
+        stats = pool.get_stats()
+    finally:
+        await pool.close()
+
+    assert len(users) == 5
+    for user in users:
+        assert len(_cached(user, "posts")) == 2
+    # The three chunks borrowed pooled connections and returned them all.
+    assert len(backends) >= 1
+    assert stats.total_acquired == 3
+    assert stats.current_in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_async_chunks_reuse_held_connection_when_pool_is_exhausted(async_blog_fixtures, monkeypatch):
+    AsyncUser, AsyncPost, AsyncComment = async_blog_fixtures
+    await _create_async_blog(AsyncUser, AsyncPost)
+    # Patched on the class: queries inside pool.connection() use the pooled backend's dialect.
+    monkeypatch.setattr(SQLiteDialect, "get_max_bind_parameters", lambda self: 2)
+    database = AsyncUser.backend().config.database
+
+    pool = AsyncBackendPool(PoolConfig(
+        min_size=1, max_size=1, timeout=1.0, backend_factory=lambda: AsyncSQLiteBackend(database=database)
+    ))
+    try:
+        async with pool.context():
+            async with pool.connection():
+                # The only connection is held here, so the three chunks must not wait for another.
+                users = await AsyncUser.query().with_("posts").all()
+        stats = pool.get_stats()
+    finally:
+        await pool.close()
+
+    assert len(users) == 5
+    for user in users:
+        assert len(_cached(user, "posts")) == 2
+    assert stats.total_acquired == 1
+    assert stats.total_timeouts == 0
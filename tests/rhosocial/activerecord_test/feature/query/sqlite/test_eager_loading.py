@@ -0,0 +1,129 @@
+# tests/rhosocial/activerecord_test/feature/query/sqlite/test_eager_loading.py
+"""Tests for executing with_() eager loads in all(), one() and prepared queries."""
+import pytest
+
+from rhosocial.activerecord.backend.expression import Param
+from rhosocial.activerecord.relation.cache import InstanceCache
+from rhosocial.activerecord.testsuite.feature.query.conftest import blog_fixtures, async_blog_fixtures
+
+
+def _create_blog(User, Post, Comment, users=3, posts=2, comments=2):
+    for u in range(users):
+        user = User(username=f"eager_user_{u}", email=f"eager{u}@example.com", age=30 + u)
+        user.save()
+        for p in range(posts):
+            post = Post(user_id=user.id, title=f"post {u}-{p}", content="...",
+                        status="published" if p % 2 == 0 else "draft")
+            post.save()
+            for c in range(comments):
+                Comment(user_id=user.id, post_id=post.id, content=f"comment {u}-{p}-{c}").save()
+
+
+def _record_queries(monkeypatch, *models):
+    statements = []
+    for backend in {id(m.backend()): m.backend() for m in models}.values():
+        original = backend.fetch_all
+
+        def fetch_all(sql, *args, _original=original, **kwargs):
+            statements.append(sql)
+            return _original(sql, *args, **kwargs)
+
+        monkeypatch.setattr(backend, "fetch_all", fetch_all)
+    return statements
+
+
+def test_all_loads_nested_relations_level_by_level(blog_fixtures, monkeypatch):
+    User, Post, Comment = blog_fixtures
+    _create_blog(User, Post, Comment)
+    statements = _record_queries(monkeypatch, User, Post, Comment)
+
+    users = User.query().with_("posts.comments").order_by(User.c.id).all()
+
+    assert len(users) == 3
+    assert len(statements) == 3
+    for user in users:
+        posts = user.posts()
+        assert len(posts) == 2
+        for post in posts:
+            assert post.user_id == user.id
+            assert [c.post_id for c in post.comments()] == [post.id, post.id]
+    # Every relation access above was served from the instance caches.
+    assert len(statements) == 3
+
+
+def test_query_modifier_applies_to_target_relation(blog_fixtures):
+    User, Post, Comment = blog_fixtures
+    _create_blog(User, Post, Comment)
+
+    users = User.query().with_(("posts", lambda q: q.where(Post.c.status == "published"))).all()
+
+    for user in users:
+        assert [p.status for p in user.posts()] == ["published"]
+
+
+def test_belongs_to_and_multiple_relations(blog_fixtures, monkeypatch):
+    User, Post, Comment = blog_fixtures
+    _create_blog(User, Post, Comment, users=2)
+    statements = _record_queries(monkeypatch, User, Post, Comment)
+
+    comments = Comment.query().with_("post.user", "user").all()
+
+    # comments, posts, users of posts, users of comments
+    assert len(statements) == 4
+    for comment in comments:
+        assert comment.post().id == comment.post_id
+        assert comment.post().user().id == comment.user_id
+        assert comment.user().id == comment.user_id
+    assert len(statements) == 4
+
+
+def test_one_and_prepared_queries_eager_load(blog_fixtures, monkeypatch):
+    User, Post, Comment = blog_fixtures
+    _create_blog(User, Post, Comment)
+
+    prepared = User.query().with_("posts").where(User.c.username == Param("name")).prepare()
+    statements = _record_queries(monkeypatch, User, Post, Comment)
+
+    user = User.query().with_("posts").where(User.c.username == "eager_user_1").one()
+    assert len(user.posts()) == 2
+
+    [found] = prepared.execute(name="eager_user_2")
+    assert len(found.posts()) == 2
+    assert prepared.one(name="eager_user_0").posts()[0].title == "post 0-0"
+
+    # one() and execute() each issue one primary query and one query for posts;
+    # fetch_one is not recorded, so only the posts queries of one() appear.
+    assert len([s for s in statements if '"posts"' in s]) == 3
+
+
+def test_without_with_no_relation_queries(blog_fixtures, monkeypatch):
+    User, Post, Comment = blog_fixtures
+    _create_blog(User, Post, Comment, users=2)
+    statements = _record_queries(monkeypatch, User, Post, Comment)
+
+    User.query().all()
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_all_eager_loads_nested(async_blog_fixtures):
+    AsyncUser, AsyncPost, AsyncComment = async_blog_fixtures
+
+    for u in range(2):
+        user = AsyncUser(username=f"async_eager_{u}", email=f"async_eager{u}@example.com", age=30 + u)
+        await user.save()
+        for p in range(2):
+            post = AsyncPost(user_id=user.id, title=f"post {u}-{p}", content="...")
+            await post.save()
+            await AsyncComment(user_id=user.id, post_id=post.id, content=f"comment {u}-{p}").save()
+
+    users = await AsyncUser.query().with_("posts.comments").all()
+    user = await AsyncUser.query().with_("posts").where(AsyncUser.c.id == users[0].id).one()
+
+    for loaded in users:
+        posts = InstanceCache.get(loaded, "posts", AsyncUser.get_relation("posts")._cache_config)
+        assert len(posts) == 2
+        for post in posts:
+            comments = InstanceCache.get(post, "comments", AsyncPost.get_relation("comments")._cache_config)
+            assert [c.post_id for c in comments] == [post.id]
+    assert len(InstanceCache.get(user, "posts", AsyncUser.get_relation("posts")._cache_config)) == 2
@@ -0,0 +1,130 @@
+# tests/rhosocial/activerecord_test/feature/query/sqlite/test_prepared_query.py
+"""Tests for ActiveQuery.prepare() and late-bound Param placeholders."""
+from decimal import Decimal
+
+import pytest
+
+from rhosocial.activerecord.backend.expression import Param, PreparedStatement
+from rhosocial.activerecord.query import PreparedQuery, AsyncPreparedQuery
+from rhosocial.activerecord.testsuite.feature.query.conftest import order_fixtures, async_order_fixtures
+
+
+def _create_users(User, count=5):
+    users = []
+    for i in range(count):
+        user = User(username=f"prep_user_{i}", email=f"prep{i}@example.com", age=20 + i)
+        user.save()
+        users.append(user)
+    return users
+
+
+def test_prepare_where_param(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    users = _create_users(User)
+
+    prepared = User.query().where(User.c.username == Param("name")).prepare()
+    assert isinstance(prepared, PreparedQuery)
+    assert prepared.param_names == ("name",)
+
+    for user in users:
+        found = prepared.execute(name=user.username)
+        assert [u.id for u in found] == [user.id]
+
+    assert prepared.execute(name="nobody") == []
+
+
+def test_prepare_in_list_and_limit(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    users = _create_users(User)
+
+    prepared = (
+        User.query()
+        .in_list(User.c.age, [Param("a"), Param("b"), Param("c")])
+        .order_by(User.c.age)
+        .limit(Param("size", default=10))
+        .prepare()
+    )
+
+    found = prepared.execute(a=20, b=22, c=24)
+    assert [u.age for u in found] == [20, 22, 24]
+
+    found = prepared.execute({"a": 20, "b": 22, "c": 24}, size=2)
+    assert [u.age for u in found] == [20, 22]
+    assert all(isinstance(u, User) for u in found)
+    assert found[0].id == users[0].id
+
+
+def test_prepare_raw_sql_param_and_one(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    prepared = User.query().where("age >= ?", (Param("min_age"),)).order_by(User.c.age).limit(1).prepare()
+    user = prepared.one(min_age=23)
+    assert user is not None
+    assert user.age == 23
+    assert prepared.one(min_age=100) is None
+
+
+def test_prepared_query_matches_regular_query(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    sql, params = User.query().where(User.c.age > 21).to_sql()
+    prepared = User.query().where(User.c.age > Param("age")).prepare()
+    assert prepared.to_sql(age=21) == (sql, params)
+
+
+def test_prepared_query_is_isolated_from_later_changes(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    query = User.query().where(User.c.age >= Param("age"))
+    prepared = query.prepare()
+    query.where(User.c.age < 0)
+
+    assert len(prepared.execute(age=22)) == 3
+
+
+def test_prepared_query_parameter_errors(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    prepared = User.query().where(User.c.username == Param("name")).prepare()
+
+    with pytest.raises(ValueError, match="Missing value"):
+        prepared.execute()
+    with pytest.raises(ValueError, match="Unknown parameter"):
+        prepared.execute(name="x", other=1)
+
+
+def test_prepared_statement_conflicting_defaults():
+    with pytest.raises(ValueError, match="conflicting defaults"):
+        PreparedStatement("SELECT ?, ?", (Param("a", default=1), Param("a", default=2)))
+    with pytest.raises(ValueError):
+        Param("")
+
+    stmt = PreparedStatement("SELECT ?, ?, ?", (Param("a"), 5, Param("a")))
+    assert stmt.bind(a=1) == ("SELECT ?, ?, ?", (1, 5, 1))
+    assert repr(Param("a", default=3)) == "Param('a', default=3)"
+
+
+@pytest.mark.asyncio
+async def test_async_prepare(async_order_fixtures):
+    AsyncUser, AsyncOrder, AsyncOrderItem = async_order_fixtures
+
+    for i in range(3):
+        user = AsyncUser(username=f"async_prep_{i}", email=f"async_prep{i}@example.com", age=30 + i)
+        await user.save()
+
+    prepared = AsyncUser.query().where(AsyncUser.c.age >= Param("age")).order_by(AsyncUser.c.age).prepare()
+    assert isinstance(prepared, AsyncPreparedQuery)
+
+    found = await prepared.execute(age=31)
+    assert [u.age for u in found] == [31, 32]
+
+    first = await prepared.one(age=32)
+    assert first.username == "async_prep_2"
+    assert await prepared.one(age=99) is None
+
+    order = AsyncOrder(user_id=found[0].id, order_number="PREP-001", total_amount=Decimal("10.00"))
+    await order.save()
+    by_number = AsyncOrder.query().where(AsyncOrder.c.order_number == Param("number")).prepare()
+    assert len(await by_number.all(number="PREP-001")) == 1
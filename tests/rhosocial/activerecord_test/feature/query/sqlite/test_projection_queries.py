@@ -0,0 +1,150 @@
+# tests/rhosocial/activerecord_test/feature/query/sqlite/test_projection_queries.py
+"""Tests for tuple and column-oriented results: pluck(), values_list(), as_tuples() and to_columns()."""
+from array import array
+from datetime import datetime
+
+import pytest
+
+from rhosocial.activerecord.backend.expression import count as count_function
+from rhosocial.activerecord.query import CTEQuery
+from rhosocial.activerecord.testsuite.feature.query.conftest import order_fixtures, async_order_fixtures
+
+
+def _create_users(User, count=3):
+    users = []
+    for i in range(count):
+        user = User(username=f"projection_{i}", email=f"projection{i}@example.com", age=20 + i)
+        user.save()
+        users.append(user)
+    return users
+
+
+def test_pluck_single_column_is_flat(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    query = User.query().order_by(User.c.id)
+    assert query.pluck(User.c.username) == ["projection_0", "projection_1", "projection_2"]
+    assert query.pluck("age") == [20, 21, 22]
+    # The projection runs on a copy; the query itself still selects every column
+    assert query.select_columns is None
+
+
+def test_pluck_several_columns_and_values_list(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User, 2)
+
+    query = User.query().order_by(User.c.id)
+    assert query.pluck("username", "age") == [("projection_0", 20), ("projection_1", 21)]
+    assert query.values_list(User.c.age) == [(20,), (21,)]
+    assert query.values_list(User.c.age, flat=True) == [20, 21]
+    assert query.select(User.c.username).values_list(flat=True) == ["projection_0", "projection_1"]
+
+
+def test_flat_requires_one_column(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User, 1)
+
+    with pytest.raises(ValueError):
+        User.query().values_list("username", "age", flat=True)
+    with pytest.raises(ValueError):
+        User.query().values_list(flat=True)
+    with pytest.raises(ValueError):
+        User.query().pluck()
+
+
+def test_column_adapters_are_applied_positionally(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    users = _create_users(User, 2)
+
+    rows = User.query().order_by(User.c.id).as_tuples()
+    assert len(rows) == 2
+    assert all(isinstance(row, tuple) for row in rows)
+
+    created = User.query().order_by(User.c.id).pluck(User.c.created_at)
+    assert all(isinstance(value, datetime) for value in created)
+    assert created == [user.created_at for user in users]
+
+
+def test_expressions_and_empty_results(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+    dialect = User.backend().dialect
+
+    assert User.query().pluck(count_function(dialect, "*", alias="n")) == [3]
+    assert User.query().where(User.c.age > 99).pluck("id") == []
+    assert User.query().where(User.c.age > 99).to_columns("id", "age") == {"id": [], "age": []}
+
+
+def test_to_columns_containers(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+    query = User.query().order_by(User.c.id)
+
+    columns = query.to_columns("id", "username", "age")
+    assert list(columns) == ["id", "username", "age"]
+    assert columns["age"] == [20, 21, 22]
+
+    packed = query.to_columns("age", "username", container="array")
+    assert packed["age"] == array("q", [20, 21, 22])
+    assert isinstance(packed["username"], list)
+
+    with pytest.raises(ValueError):
+        query.to_columns("age", container="tuple")
+
+
+def test_to_columns_numpy(order_fixtures):
+    numpy = pytest.importorskip("numpy")
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    columns = User.query().order_by(User.c.id).to_columns("age", container="numpy")
+    assert isinstance(columns["age"], numpy.ndarray)
+    assert columns["age"].sum() == 63
+
+
+def test_set_operation_projection(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    young = User.query().where(User.c.age < 21)
+    old = User.query().where(User.c.age > 21)
+    union = young.union(old)
+
+    assert sorted(union.pluck("username")) == ["projection_0", "projection_2"]
+    assert all(isinstance(value, datetime) for value in union.pluck("created_at"))
+    assert sorted(union.values_list("age", flat=True)) == [20, 22]
+    assert len(union.as_tuples()) == 2
+
+
+def test_cte_projection(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    query = CTEQuery(User.backend())
+    query.with_cte("adults", User.query().where(User.c.age >= 21))
+    query.from_cte("adults").order_by("age")
+
+    assert query.pluck("username") == ["projection_1", "projection_2"]
+    assert query.to_columns("age") == {"age": [21, 22]}
+
+
+@pytest.mark.asyncio
+async def test_async_projection(async_order_fixtures):
+    AsyncUser, AsyncOrder, AsyncOrderItem = async_order_fixtures
+    for i in range(3):
+        user = AsyncUser(username=f"async_projection_{i}", email=f"async_projection{i}@example.com", age=30 + i)
+        await user.save()
+
+    query = AsyncUser.query().order_by(AsyncUser.c.id)
+    assert await query.pluck("age") == [30, 31, 32]
+    assert await query.values_list("username", "age") == [
+        ("async_projection_0", 30),
+        ("async_projection_1", 31),
+        ("async_projection_2", 32),
+    ]
+    assert len(await query.as_tuples()) == 3
+    assert (await query.to_columns("age", container="array"))["age"] == array("q", [30, 31, 32])
+
+    union = AsyncUser.query().where(AsyncUser.c.age == 30).union(AsyncUser.query().where(AsyncUser.c.age == 32))
+    assert sorted(await union.pluck("age")) == [30, 32]
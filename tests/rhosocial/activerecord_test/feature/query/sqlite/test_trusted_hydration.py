@@ -0,0 +1,161 @@
+# tests/rhosocial/activerecord_test/feature/query/sqlite/test_trusted_hydration.py
+"""Tests for trusted hydration: ActiveQuery.trusted() and __trusted_hydration__."""
+from typing import ClassVar, Optional
+
+import pytest
+from pydantic import field_validator
+
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteBackend
+from rhosocial.activerecord.backend.impl.sqlite.config import SQLiteConnectionConfig
+from rhosocial.activerecord.base.field_proxy import FieldProxy
+from rhosocial.activerecord.field import IntegerPKMixin
+from rhosocial.activerecord.interface import ModelEvent
+from rhosocial.activerecord.model import ActiveRecord
+from rhosocial.activerecord.testsuite.feature.query.conftest import order_fixtures, async_order_fixtures
+
+
+def _create_users(User, count=3):
+    users = []
+    for i in range(count):
+        user = User(username=f"trusted_{i}", email=f"trusted{i}@example.com", age=20 + i)
+        user.save()
+        users.append(user)
+    return users
+
+
+class Tag(IntegerPKMixin, ActiveRecord):
+    c: ClassVar[FieldProxy] = FieldProxy()
+    __table_name__ = "tags"
+
+    validated: ClassVar[int] = 0
+
+    id: Optional[int] = None
+    name: str
+    weight: int = 1
+
+    @field_validator("name")
+    @classmethod
+    def _count_validation(cls, value):
+        Tag.validated += 1
+        return value
+
+
+@pytest.fixture
+def tag_model():
+    Tag.configure(SQLiteConnectionConfig(database=":memory:"), SQLiteBackend)
+    backend = Tag.backend()
+    backend.execute("CREATE TABLE tags (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, weight INTEGER)")
+    backend.execute("INSERT INTO tags (name, weight) VALUES ('a', 1), ('b', 2), ('c', 3)")
+    Tag.validated = 0
+    yield Tag
+    backend.disconnect()
+
+
+def test_trusted_query_matches_validated_query(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    validated = User.query().order_by(User.c.id).all()
+    trusted = User.query().order_by(User.c.id).trusted().all()
+
+    assert [u.model_dump() for u in trusted] == [u.model_dump() for u in validated]
+    for user in trusted:
+        assert isinstance(user, User)
+        assert user.is_from_db
+        assert not user.is_new_record
+        assert not user.is_dirty
+
+
+def test_trusted_instances_track_changes_and_save(order_fixtures):
+    User, Order, OrderItem = order_fixtures
+    _create_users(User)
+
+    user = User.query().where(User.c.username == "trusted_1").trusted().one()
+    old_updated_at = user.updated_at
+    user.age = 50
+    assert user.dirty_fields == {"age"}
+    assert user.get_old_attribute("age") == 21
+
+    user.save()
+    assert not user.is_dirty
+    assert user.updated_at > old_updated_at
+    assert User.find_one(user.id).age == 50
+
+
+def test_trusted_skips_validation(tag_model):
+    tags = tag_model.query().trusted().all()
+    assert [tag.name for tag in tags] == ["a", "b", "c"]
+    assert tag_model.validated == 0
+
+    tag_model.query().all()
+    assert tag_model.validated == 3
+
+
+def test_model_level_setting_and_query_override(tag_model, monkeypatch):
+    monkeypatch.setattr(tag_model, "__trusted_hydration__", True)
+
+    tag_model.query().all()
+    assert tag_model.validated == 0
+
+    tag_model.query().trusted(False).all()
+    assert tag_model.validated == 3
+
+
+def test_trusted_fills_defaults_for_unselected_columns(tag_model):
+    tag = tag_model.query().select(tag_model.c.id, tag_model.c.name).where(tag_model.c.name == "b").trusted().one()
+    assert tag.weight == 1
+    assert tag.model_fields_set == {"id", "name"}
+
+
+def test_trusted_flag_propagates(tag_model):
+    query = tag_model.query().order_by(tag_model.c.id).trusted()
+
+    assert [tag.name for tag in query.clone().all()] == ["a", "b", "c"]
+    assert [tag.name for tag in query.iter(batch_size=2)] == ["a", "b", "c"]
+    assert [tag.name for tag in tag_model.query().trusted().find_each(batch_size=2)] == ["a", "b", "c"]
+    assert [tag.name for tag in query.prepare().execute()] == ["a", "b", "c"]
+    assert tag_model.validated == 0
+
+
+def test_event_storage_is_allocated_on_first_handler(tag_model):
+    tag = tag_model.query().trusted().one()
+    assert tag._event_handlers is None
+
+    calls = []
+
+    def handler(instance, **kwargs):
+        calls.append(instance)
+
+    tag.on(ModelEvent.BEFORE_UPDATE, handler)
+    tag.weight = 10
+    tag.save()
+    assert calls == [tag]
+
+    tag.off(ModelEvent.BEFORE_UPDATE, handler)
+    tag.off(ModelEvent.AFTER_UPDATE, handler)
+    tag.weight = 11
+    tag.save()
+    assert calls == [tag]
+
+
+def test_direct_construction_is_still_validated(tag_model):
+    tag_model.construct_from_database({"id": 1, "name": "x"})
+    assert tag_model.validated == 0
+    tag_model(name="y")
+    assert tag_model.validated == 1
+
+
+@pytest.mark.asyncio
+async def test_async_trusted_query(async_order_fixtures):
+    AsyncUser, AsyncOrder, AsyncOrderItem = async_order_fixtures
+    for i in range(3):
+        user = AsyncUser(username=f"async_trusted_{i}", email=f"async_trusted{i}@example.com", age=30 + i)
+        await user.save()
+
+    validated = await AsyncUser.query().order_by(AsyncUser.c.id).all()
+    trusted = await AsyncUser.query().order_by(AsyncUser.c.id).trusted().all()
+    assert [u.model_dump() for u in trusted] == [u.model_dump() for u in validated]
+    assert all(u.is_from_db and not u.is_dirty for u in trusted)
+
+    first = await AsyncUser.query().order_by(AsyncUser.c.id).trusted().one()
+    assert first.username == "async_trusted_0"
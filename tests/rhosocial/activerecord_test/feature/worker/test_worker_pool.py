@@ -155,6 +155,19 @@ class TestFuture:
         with pytest.raises(ValueError, match="test error"):
             fut.result()
 
+    def test_done_callback(self):
+        """Test callbacks run on completion, or immediately when already done"""
+        fut = Future("test-id")
+        seen = []
+        fut.add_done_callback(seen.append)
+        assert seen == []
+
+        fut._resolve(42)
+        assert seen == [fut]
+
+        fut.add_done_callback(seen.append)
+        assert seen == [fut, fut]
+
 
 class TestWorkerHandle:
     """Test WorkerHandle"""
@@ -1008,3 +1021,63 @@ class TestAsyncTaskSupport:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestChunkedMap:
+    """Test chunked map(), imap() and imap_unordered()"""
+
+    def test_map_chunked(self):
+        """Test map with chunksize submits one task per chunk"""
+        with WorkerPool(n_workers=2) as pool:
+            results = pool.map(simple_task, range(10), chunksize=3)
+            assert results == [n * 2 for n in range(10)]
+            assert pool.get_stats().tasks_submitted == 4
+
+    def test_invalid_arguments(self):
+        """Test chunksize and max_in_flight validation"""
+        with WorkerPool(n_workers=1) as pool:
+            with pytest.raises(ValueError):
+                pool.map(simple_task, [1], chunksize=0)
+            with pytest.raises(ValueError):
+                pool.imap(simple_task, [1], chunksize=0)
+            with pytest.raises(ValueError):
+                pool.imap_unordered(simple_task, [1], max_in_flight=0)
+
+    def test_imap_is_lazy(self):
+        """Test imap only pulls max_in_flight chunks ahead of the consumer"""
+        pulled = []
+
+        def items():
+            for n in range(100):
+                pulled.append(n)
+                yield n
+
+        with WorkerPool(n_workers=2) as pool:
+            results = pool.imap(simple_task, items(), chunksize=5, max_in_flight=2, timeout=10)
+            assert pulled == []
+            assert next(results) == 0
+            assert len(pulled) <= 15
+            assert list(results) == [n * 2 for n in range(1, 100)]
+
+    def test_imap_unordered_completion_order(self):
+        """Test a slow chunk does not hold back chunks that finished after it"""
+        with WorkerPool(n_workers=2) as pool:
+            # Both workers must be idle, otherwise one worker may run both chunks in order
+            deadline = time.monotonic() + 10
+            while pool.ready_workers < 2 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            results = list(pool.imap_unordered(slow_task, [1.0, 0.0], timeout=10))
+            assert results == [0.0, 1.0]
+
+    def test_chunk_failure(self):
+        """Test a failing item raises its exception from the iterator"""
+        with WorkerPool(n_workers=2) as pool:
+            with pytest.raises(ValueError, match="n must be non-negative"):
+                pool.map(failing_task, [1, 2, -1, 3], chunksize=2)
+            with pytest.raises(ValueError, match="n must be non-negative"):
+                list(pool.imap_unordered(failing_task, [1, -1], chunksize=1, timeout=10))
+
+    def test_async_task_chunked(self):
+        """Test async task functions run inside chunks"""
+        with WorkerPool(n_workers=2) as pool:
+            assert pool.map(async_simple_task, range(6), chunksize=3) == [0, 2, 4, 6, 8, 10]
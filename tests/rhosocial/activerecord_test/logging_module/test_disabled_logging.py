@@ -0,0 +1,168 @@
+# tests/rhosocial/activerecord_test/logging_module/test_disabled_logging.py
+"""Tests that disabled log levels cost nothing on the query and execution paths."""
+
+import logging
+import timeit
+from typing import Optional
+
+import pytest
+
+from rhosocial.activerecord.backend.impl.sqlite import SQLiteBackend
+from rhosocial.activerecord.backend.impl.sqlite.config import SQLiteConnectionConfig
+from rhosocial.activerecord.logging import get_logging_manager
+from rhosocial.activerecord.logging import mixin as logging_mixin
+from rhosocial.activerecord.model import ActiveRecord
+
+
+class Gadget(ActiveRecord):
+    __table_name__ = "gadgets"
+
+    id: Optional[int] = None
+    name: str
+    weight: int = 0
+
+
+class ExpensiveRepr:
+    """Counts how many times it is rendered into a log message."""
+
+    def __init__(self):
+        self.rendered = 0
+
+    def __repr__(self):
+        self.rendered += 1
+        return "<expensive>"
+
+    __str__ = __repr__
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def log_level():
+    """Set the global ActiveRecord log level for the duration of a test."""
+    manager = get_logging_manager()
+    original = manager.config.default_level
+
+    def set_level(level):
+        manager.configure(level=level)
+
+    yield set_level
+    manager.configure(level=original)
+
+
+@pytest.fixture
+def gadget_model(log_level):
+    log_level(logging.WARNING)
+    Gadget.configure(SQLiteConnectionConfig(database=":memory:"), SQLiteBackend)
+    backend = Gadget.backend()
+    backend.execute("CREATE TABLE gadgets (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, weight INTEGER)")
+    yield Gadget
+    backend.disconnect()
+
+
+@pytest.fixture
+def stack_walks(monkeypatch):
+    """Count the calls that got past the level check and resolved a stacklevel."""
+    calls = []
+    original = logging_mixin._resolve_stacklevel
+
+    def resolve():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(logging_mixin, "_resolve_stacklevel", resolve)
+    return calls
+
+
+class TestDisabledLogging:
+    """Level-gated fast path of LoggingMixin and BackendLoggingMixin."""
+
+    def test_disabled_log_skips_formatting_and_stack_walk(self, log_level, stack_walks):
+        log_level(logging.WARNING)
+        payload = ExpensiveRepr()
+
+        Gadget.log(logging.DEBUG, "Executing SQL: %s, parameters: %s", "SELECT 1", payload)
+        Gadget.log(logging.INFO, "Payload: %r", payload)
+
+        assert payload.rendered == 0
+        assert stack_walks == []
+        assert not Gadget.is_log_enabled(logging.INFO)
+        assert Gadget.is_log_enabled(logging.WARNING)
+
+    def test_disabled_log_data_skips_summarization(self, log_level, monkeypatch):
+        log_level(logging.WARNING)
+        config = get_logging_manager().config
+        summarized = []
+        monkeypatch.setattr(config, "summarize_data", lambda *args, **kwargs: summarized.append(args))
+
+        Gadget.log_data(logging.DEBUG, "Raw data for insert", {"name": "x" * 10000})
+        SQLiteBackend(database=":memory:").log_data(logging.INFO, "Parameters", {"p": 1})
+
+        assert summarized == []
+
+    def test_crud_at_warning_level_never_reaches_a_logger(self, gadget_model, stack_walks):
+        Gadget = gadget_model
+        gadget = Gadget(name="sprocket", weight=3)
+        gadget.save()
+        gadget.weight = 4
+        gadget.save()
+        assert [g.weight for g in Gadget.query().where("weight > ?", (1,)).all()] == [4]
+        Gadget.query().update_all(weight=5)
+        gadget.delete()
+
+        assert stack_walks == []
+
+    def test_enabled_level_still_formats_messages(self, gadget_model, log_level):
+        Gadget = gadget_model
+        log_level(logging.DEBUG)
+        handler = RecordingHandler()
+        logger = Gadget.get_logger()
+        logger.addHandler(handler)
+        try:
+            Gadget(name="widget", weight=7).save()
+            Gadget.log_data(logging.DEBUG, "Data", {"weight": 7})
+        finally:
+            logger.removeHandler(handler)
+
+        assert "Inserting new Gadget" in handler.messages
+        assert "Data: {'weight': 7}" in handler.messages
+        assert any(m.startswith("Column adapters map:") for m in handler.messages)
+
+    def test_logger_level_is_only_reset_when_it_changes(self, log_level, monkeypatch):
+        log_level(logging.WARNING)
+        logger = Gadget.get_logger()
+        calls = []
+        monkeypatch.setattr(logger, "setLevel", lambda level: calls.append(level))
+
+        Gadget.log(logging.DEBUG, "ignored")
+        Gadget.get_logger()
+
+        assert calls == []
+
+
+@pytest.mark.benchmark
+def test_benchmark_disabled_logging_overhead(log_level):
+    """At WARNING level a DEBUG call with a large payload costs the same as one without."""
+    log_level(logging.WARNING)
+    large_params = tuple(range(10000))
+    number = 20000
+
+    def timed(stmt):
+        return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+    baseline = timed(lambda: Gadget.is_log_enabled(logging.DEBUG))
+    empty = timed(lambda: Gadget.log(logging.DEBUG, "Executing SQL: %s, parameters: %s", "SELECT 1", ()))
+    large = timed(lambda: Gadget.log(logging.DEBUG, "Executing SQL: %s, parameters: %s", "SELECT 1", large_params))
+    print(f"\nis_log_enabled: {baseline * 1e9:.0f} ns, disabled log (empty params): {empty * 1e9:.0f} ns, "
+          f"disabled log (10k params): {large * 1e9:.0f} ns")
+
+    # The payload is never formatted, and the call adds little over the level check itself.
+    assert large < empty * 1.5
+    assert empty < baseline * 2
@@ -10,6 +10,7 @@ from rhosocial.activerecord.logging import (
     configure_logging,
     get_logger,
     LoggingConfig,
+    LoggerConfig,
 )
 
 
@@ -122,6 +123,22 @@ class TestLoggingConfig:
 
         assert logger.propagate is True
 
+    def test_logger_config_create_logger(self):
+        """Test that LoggerConfig.create_logger applies its settings."""
+        handler = logging.NullHandler()
+        config = LoggerConfig(name='test_logger_config', level=logging.WARNING, propagate=True,
+                              handlers=[handler])
+        logger = config.create_logger()
+
+        assert logger is logging.getLogger('test_logger_config')
+        assert logger.level == logging.WARNING
+        assert logger.propagate is True
+        assert logger.handlers.count(handler) == 1
+
+        # Calling it again does not attach the handler twice
+        config.create_logger()
+        assert logger.handlers.count(handler) == 1
+
     def test_auto_setup_adds_handler(self):
         """Test that auto_setup adds a StreamHandler."""
         config = LoggingConfig(auto_setup=True)